@@ -2,6 +2,7 @@
 
 from abc import ABCMeta, abstractmethod
 import numpy as np 
+from scipy.sparse import issparse
 
 from sklearn.base import BaseEstimator
 from sklearn.utils._param_validation import Interval, StrOptions, Real, Integral
@@ -56,6 +57,13 @@ class BaseAdalineStochastic(BaseEstimator, metaclass=ABCMeta):
         Whether to shuffle the training data before each epoch to prevent 
         cycles.
 
+    batch_size : int, default=1
+        Number of training instances per weight update. With ``batch_size=1`` 
+        the weights are updated after every instance (pure stochastic 
+        gradient descent). Larger values update the weights of all outputs at 
+        once from the averaged error of each mini-batch, which turns the 
+        per-sample Python loop into a few matrix products per epoch.
+
     random_state : int or None, default=None
         Seed used by the random number generator for shuffling and 
         initializing weights.
@@ -71,6 +79,13 @@ class BaseAdalineStochastic(BaseEstimator, metaclass=ABCMeta):
     cost_ : list of float
         Average cost (mean squared error) per epoch.
 
+    eta_ : float
+        Current learning rate. Starts at `eta0` and is multiplied by 
+        `eta0_decay` after each epoch when ``learning_rate='adaptive'``.
+
+    n_iter_ : int
+        Number of epochs run, accumulated over `partial_fit` calls.
+
     Notes
     -----
     Adaline (ADAptive LInear NEuron) is a single-layer artificial neural 
@@ -153,6 +168,7 @@ class BaseAdalineStochastic(BaseEstimator, metaclass=ABCMeta):
             "learning_rate": [StrOptions({"constant", "adaptive"})],
             "eta0_decay": [Interval(Real, 0., 1., closed="neither")],
             "shuffle": [bool],
+            "batch_size": [Interval(Integral, 1, None, closed="left")],
             "random_state": [Integral, None],
             "verbose": [bool]
         }
@@ -169,6 +185,7 @@ class BaseAdalineStochastic(BaseEstimator, metaclass=ABCMeta):
         learning_rate='constant', 
         eta0_decay=0.99, 
         shuffle=True,
+        batch_size=1, 
         random_state=None, 
         verbose=False
         ):
@@ -181,6 +198,7 @@ class BaseAdalineStochastic(BaseEstimator, metaclass=ABCMeta):
         self.learning_rate = learning_rate
         self.eta0_decay = eta0_decay
         self.shuffle = shuffle
+        self.batch_size = batch_size
         self.random_state = random_state
         self.verbose = verbose
         
@@ -201,10 +219,17 @@ class BaseAdalineStochastic(BaseEstimator, metaclass=ABCMeta):
         -----
         The weights are initialized using a normal distribution with mean 0 
         and standard deviation 0.01. This initialization includes an extra 
-        weight for the bias term.
+        weight for the bias term. Classifiers keep one column of weights per 
+        output. The optimizer state (current learning rate ``eta_``, number 
+        of epochs ``n_iter_`` and ``cost_`` history) is reset as well.
         """
         rgen = np.random.RandomState(self.random_state)
-        self.weights_ = rgen.normal(loc=0.0, scale=0.01, size=1 + n_features)
+        size = ((1 + n_features, n_outputs) if self._is_classifier() 
+                else 1 + n_features)
+        self.weights_ = rgen.normal(loc=0.0, scale=0.01, size=size)
+        self.eta_ = self.eta0
+        self.n_iter_ = 0
+        self.cost_ = []
     
     
     def _update_weights(self, xi, target, idx):
@@ -244,6 +269,89 @@ class BaseAdalineStochastic(BaseEstimator, metaclass=ABCMeta):
         return error
     
     
+    def _run_epoch(self, X, y):
+        """
+        Run one pass of mini-batch gradient descent over the training data.
+    
+        Parameters
+        ----------
+        X : array-like or sparse matrix, shape (n_samples, n_features)
+            Training vectors, in the order they are visited.
+    
+        y : array-like, shape (n_samples,) or (n_samples, n_outputs)
+            Target values. All outputs are updated at once.
+    
+        Returns
+        -------
+        cost : float
+            Mean of the halved squared errors over the samples and outputs 
+            seen during the epoch.
+        
+        Notes
+        -----
+        For a mini-batch :math:`B` the weights of every output are updated 
+        with the averaged Adaline rule:
+    
+        .. math::
+            \Delta W = \frac{\eta_0}{|B|} X_B^T (Y_B - X_B W)
+    
+        where the errors are computed with the weights available at the 
+        start of the batch. With ``batch_size=1`` this is exactly the 
+        per-instance update of stochastic gradient descent.
+        """
+        # 2D view so that single and multi-output weights share the update.
+        weights = self.weights_.reshape(self.weights_.shape[0], -1)
+        y = np.asarray(y).reshape(X.shape[0], -1)
+        if issparse(X):
+            X = X.tocsr()
+            
+        n_samples = X.shape[0]
+        batch_size = min(self.batch_size, n_samples)
+        cost = np.empty((n_samples, weights.shape[1]))
+        for start in range(0, n_samples, batch_size):
+            stop = min(start + batch_size, n_samples)
+            xb, yb = X[start:stop], y[start:stop]
+            errors = yb - (xb @ weights[1:] + weights[0])
+            step = self.eta_ / (stop - start)
+            weights[1:] += (xb.T * step) @ errors
+            weights[0] += step * errors.sum(axis=0)
+            cost[start:stop] = errors ** 2 / 2.0
+            
+        return cost.mean()
+    
+    def _partial_fit_epoch(self, X, y):
+        """
+        Run one epoch over a chunk of data and advance the optimizer state.
+    
+        Parameters
+        ----------
+        X : array-like or sparse matrix, shape (n_samples, n_features)
+            Validated chunk of training vectors, in the order they are 
+            visited.
+    
+        y : array-like, shape (n_samples,) or (n_samples, n_outputs)
+            Encoded target values of the chunk.
+    
+        Returns
+        -------
+        self : object
+            Returns self.
+        
+        Notes
+        -----
+        The weights, the current learning rate ``eta_`` (decayed by 
+        `eta0_decay` after each call when ``learning_rate='adaptive'``), the 
+        epoch counter ``n_iter_`` and the ``cost_`` history persist between 
+        calls, so a model trained on successive chunks continues exactly 
+        where the previous chunk stopped.
+        """
+        self.cost_.append(self._run_epoch(X, y))
+        self.n_iter_ += 1
+        if self.learning_rate == 'adaptive':
+            self.eta_ *= self.eta0_decay
+            
+        return self
+    
     def net_input(self, X, idx=None):
         """
         Calculate the net input.
@@ -110,6 +110,13 @@ class BaseKMF(BaseEstimator, metaclass=ABCMeta):
            during fit. This assigns the mean of the target variable for each 
            category.
 
+    batch_size : int, optional
+        Size of the mini-batches of the streaming mode of the featurizer. If 
+        set, the clustering uses `MiniBatchKMeans` and the projection 
+        `IncrementalPCA`, whose memory does not grow with the number of 
+        samples, for data sets of tens of millions of rows. None uses the 
+        full-batch `KMeans` and `PCA`.
+
     Notes
     -----
     The k-means clustering algorithm involves minimizing the inertia, or 
@@ -205,6 +212,7 @@ class BaseKMF(BaseEstimator, metaclass=ABCMeta):
         "encoding": [ StrOptions(
             {'onehot', 'bin-counting', 'label', 'frequency', 'mean_target'}), 
             None],
+        "batch_size": [Interval(Integral, 1, None, closed="left"), None], 
         }
     
     @abstractmethod
@@ -223,7 +231,8 @@ class BaseKMF(BaseEstimator, metaclass=ABCMeta):
         algorithm='lloyd',
         estimator=None,
         to_sparse=False,
-        encoding=None
+        encoding=None, 
+        batch_size=None
     ):
         self.n_clusters = n_clusters
         self.target_scale = target_scale
@@ -239,6 +248,7 @@ class BaseKMF(BaseEstimator, metaclass=ABCMeta):
         self.estimator = estimator
         self.to_sparse = to_sparse
         self.encoding=encoding 
+        self.batch_size=batch_size
         
     def fit(self, X, y, sample_weight=None):
         """
@@ -482,7 +492,8 @@ class BaseKMF(BaseEstimator, metaclass=ABCMeta):
             verbose=self.verbose,
             algorithm=self.algorithm,
             to_sparse=self.to_sparse,
-            encoding= self.encoding
+            encoding= self.encoding, 
+            batch_size=self.batch_size
         )
         return self.featurizer_.fit_transform(X, y)
 
@@ -3,6 +3,8 @@ from __future__ import annotations
 
 from abc import ABCMeta
 from abc import abstractmethod
+from contextlib import nullcontext
+from joblib import parallel_backend
 from sklearn.base import BaseEstimator
 
 from sklearn.ensemble import BaggingClassifier, GradientBoostingClassifier
@@ -76,6 +78,12 @@ class BaseEnsemble(BaseEstimator, metaclass=ABCMeta):
         The number of jobs to run in parallel for both `fit` and `predict`. 
         `None` means 1 unless in a `joblib.parallel_backend` context.
         
+    backend : {'threads', 'processes'}, default=None
+        The joblib backend the bagging members are dispatched to when 
+        `n_jobs` is not 1. 'threads' avoids copying the data to the workers, 
+        'processes' isolates pure-Python estimators from the GIL. `None` 
+        keeps the scikit-learn default.
+        
     min_impurity_decrease : float, default=0.0
         A node will be split if this split induces a decrease of the 
         impurity greater than or equal to this value. Used to control 
@@ -248,6 +256,7 @@ class BaseEnsemble(BaseEstimator, metaclass=ABCMeta):
         "tol": [Interval(Real, 0.0, None, closed="left")],
         "ccp_alpha": [Interval(Real, 0.0, None, closed="left")],
         "verbose": [Interval(Integral, 0, None, closed="left"), "boolean"],
+        "backend": [StrOptions({"threads", "processes"}), None],
     }
     
     @abstractmethod
@@ -276,7 +285,8 @@ class BaseEnsemble(BaseEstimator, metaclass=ABCMeta):
         tol=1e-4,
         ccp_alpha=0.0,
         estimator=None,
-        verbose=0
+        verbose=0, 
+        backend=None
     ):
         self.estimator = estimator
         self.n_estimators = n_estimators
@@ -302,6 +312,7 @@ class BaseEnsemble(BaseEstimator, metaclass=ABCMeta):
         self.tol = tol
         self.ccp_alpha = ccp_alpha
         self.verbose = verbose
+        self.backend = backend
 
     def fit(self, X, y, sample_weight=None):
         """
@@ -420,15 +431,16 @@ class BaseEnsemble(BaseEstimator, metaclass=ABCMeta):
             self.estimator_ = self.default_estimator(max_depth=self.max_depth)
         
         self.strategy = str(self.strategy).lower()
-        if self.strategy == 'bagging':
-            self._fit_bagging(X, y, sample_weight, self.is_classifier)
-        elif self.strategy == 'boosting':
-            self._fit_boosting(X, y, sample_weight, self.is_classifier)
-        elif self.strategy == 'hybrid':
-            self._fit_hybrid(X, y, sample_weight, self.is_classifier)
-        else:
-            raise ValueError(
-                "Invalid strategy, choose from 'hybrid', 'bagging', 'boosting'")
+        with self._parallel_context():
+            if self.strategy == 'bagging':
+                self._fit_bagging(X, y, sample_weight, self.is_classifier)
+            elif self.strategy == 'boosting':
+                self._fit_boosting(X, y, sample_weight, self.is_classifier)
+            elif self.strategy == 'hybrid':
+                self._fit_hybrid(X, y, sample_weight, self.is_classifier)
+            else:
+                raise ValueError(
+                    "Invalid strategy, choose from 'hybrid', 'bagging', 'boosting'")
 
         return self
     
@@ -540,7 +552,8 @@ class BaseEnsemble(BaseEstimator, metaclass=ABCMeta):
             accept_large_sparse=True,
             estimator=get_estimator_name(self)
         )
-        return self.model_.predict(X)
+        with self._parallel_context():
+            return self.model_.predict(X)
 
     def predict_proba(self, X):
         """
@@ -621,6 +634,22 @@ class BaseEnsemble(BaseEstimator, metaclass=ABCMeta):
         """
         raise NotImplementedError(
             "Probability estimates are not available for regressors.")
+    
+    def _parallel_context(self):
+        """
+        Return the joblib context selected by `backend`.
+        
+        The bagging members are dispatched by scikit-learn, so `backend` is 
+        honoured through a `joblib.parallel_backend` context rather than 
+        passed down. Within that context `n_jobs=None` still means 1.
+        """
+        backend = getattr(self, 'backend', None)
+        if backend is None:
+            return nullcontext()
+        return parallel_backend(
+            'threading' if backend == 'threads' else 'loky', 
+            n_jobs=1 if self.n_jobs is None else self.n_jobs
+        )
         
     def _fit_bagging(self, X, y, sample_weight, is_classifier):
         """
@@ -12,11 +12,8 @@ from sklearn.neural_network import MLPRegressor, MLPClassifier
 from sklearn.utils import shuffle as skl_shuffle
 
 from ..tools.validator import check_X_y, check_array, check_is_fitted
-from .util import activator
-try: 
-    from skfuzzy.control import Antecedent
-    import skfuzzy as fuzz
-except: pass 
+from .util import activator, fuzzy_cmeans, triangular_membership 
+from .util import _triangular_fuzzy_sets
 
 
 class BaseGD(BaseEstimator, metaclass=ABCMeta):
@@ -283,13 +280,8 @@ class BaseGD(BaseEstimator, metaclass=ABCMeta):
         self.is_classifier = is_classifier
         if is_classifier:
             self.classes_ = np.unique(y)
-            n_classes = len(self.classes_)
-            self.label_binarizer_ = LabelBinarizer()
-            y = self.label_binarizer_.fit_transform(y)
-            if n_classes == 2:
-                y = np.hstack([1 - y, y])
-        else:
-            y = y.reshape(-1, 1)
+            self.label_binarizer_ = LabelBinarizer().fit(self.classes_)
+        y = self._encode_targets(y)
     
         n_samples, n_features = X.shape
         self._initialize_weights(n_features, y.shape[1])
@@ -302,21 +294,7 @@ class BaseGD(BaseEstimator, metaclass=ABCMeta):
             if self.shuffle:
                 X, y = skl_shuffle(X, y, random_state=self.random_state)
     
-            self._update_weights(X, y)
-            if is_classifier:
-                net_input = self._net_input(X)
-                proba = activator(net_input, self.activation,
-                                  clipping_threshold=self.clipping_threshold)
-                # proba = self._sigmoid(net_input)
-                loss = -np.mean(y * np.log(proba + 1e-9) + (1 - y) * np.log(1 - proba + 1e-9))
-            else:
-                loss = ((y - self._net_input(X)) ** 2).mean()
-    
-            if loss < self.best_loss_ - self.tol:
-                self.best_loss_ = loss
-                self.no_improvement_count_ = 0
-            else:
-                self.no_improvement_count_ += 1
+            self._run_epoch(X, y)
     
             if self.early_stopping and self.no_improvement_count_ >= self.n_iter_no_change:
                 if self.verbose:
@@ -333,6 +311,98 @@ class BaseGD(BaseEstimator, metaclass=ABCMeta):
     
         return self
 
+    def _partial_fit(self, X, y, is_classifier, classes=None):
+        """
+        Run a single gradient descent epoch on a chunk of data.
+    
+        The model is initialized on the first call. On the following calls 
+        the weights and the optimizer state, i.e. the step counter ``n_iter_`` 
+        that drives the ``'invscaling'`` schedule and the ``best_loss_`` / 
+        ``no_improvement_count_`` counters that drive the ``'adaptive'`` 
+        schedule, carry over from the previous chunk. Early stopping is left 
+        to the caller, who can inspect ``no_improvement_count_`` between 
+        chunks.
+    
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Chunk of training data.
+    
+        y : array-like of shape (n_samples,)
+            Target values of the chunk.
+    
+        is_classifier : bool
+            Indicates whether the task is classification (`True`) or 
+            regression (`False`).
+    
+        classes : array-like of shape (n_classes,), default=None
+            All the classes that can appear in `y`. Required on the first call 
+            for classification; ignored afterwards.
+    
+        Returns
+        -------
+        self : object
+            Returns self.
+        """
+        X, y = check_X_y(X, y, estimator=self)
+        first_call = not hasattr(self, 'weights_')
+        if first_call:
+            self.is_classifier = is_classifier
+            if is_classifier:
+                if classes is None:
+                    raise ValueError(
+                        "classes must be passed on the first call to partial_fit.")
+                self.classes_ = np.unique(classes)
+                self.label_binarizer_ = LabelBinarizer().fit(self.classes_)
+        elif X.shape[1] != self.weights_.shape[0] - 1:
+            raise ValueError(
+                f"X has {X.shape[1]} features, but {self.__class__.__name__}"
+                f" is expecting {self.weights_.shape[0] - 1} features.")
+            
+        y = self._encode_targets(y)
+        if first_call:
+            self._initialize_weights(X.shape[1], y.shape[1])
+            
+        if self.shuffle:
+            X, y = skl_shuffle(X, y, random_state=self.random_state)
+        self._run_epoch(X, y)
+        self.n_iter_ += 1
+        
+        return self
+    
+    def _encode_targets(self, y):
+        """Encode the targets as a 2D array, one column per output."""
+        if not self.is_classifier:
+            return y.reshape(-1, 1)
+        
+        y = self.label_binarizer_.transform(y)
+        if len(self.classes_) == 2:
+            y = np.hstack([1 - y, y])
+        return y 
+    
+    def _run_epoch(self, X, y):
+        """
+        Perform one weight update over `X` and refresh the loss counters 
+        used by the learning rate schedule and by early stopping.
+        """
+        self._update_weights(X, y)
+        if self.is_classifier:
+            net_input = self._net_input(X)
+            proba = activator(net_input, self.activation,
+                              clipping_threshold=self.clipping_threshold)
+            # proba = self._sigmoid(net_input)
+            loss = -np.mean(y * np.log(proba + 1e-9) + (1 - y) * np.log(1 - proba + 1e-9))
+        else:
+            loss = ((y - self._net_input(X)) ** 2).mean()
+
+        if loss < self.best_loss_ - self.tol:
+            self.best_loss_ = loss
+            self.no_improvement_count_ = 0
+        else:
+            self.no_improvement_count_ += 1
+            
+        return loss 
+
     def _net_input(self, X):
         """ Compute the Net Input """
         return np.dot(X, self.weights_[1:]) + self.weights_[0]
@@ -601,6 +671,12 @@ class BaseNeuroFuzzy(BaseEstimator, metaclass=ABCMeta):
     is_classifier : bool, default=False
         Whether the model is a classifier (`True`) or a regressor (`False`).
 
+    chunk_size : int, default=None
+        The number of samples fuzzified per block. Fuzzification evaluates 
+        ``n_samples * n_features * n_clusters`` membership degrees; chunking 
+        bounds the memory of the temporaries to ``chunk_size`` samples. If 
+        None, all the samples are fuzzified at once.
+
     Notes
     -----
     The NeuroFuzzyBase class combines the strengths of fuzzy logic and 
@@ -689,7 +765,8 @@ class BaseNeuroFuzzy(BaseEstimator, metaclass=ABCMeta):
         max_fun=15000, 
         random_state=None, 
         verbose=False,
-        is_classifier=False
+        is_classifier=False, 
+        chunk_size=None
     ):
         self.n_clusters = n_clusters
         self.eta0 = eta0
@@ -714,66 +791,61 @@ class BaseNeuroFuzzy(BaseEstimator, metaclass=ABCMeta):
         self.random_state = random_state
         self.verbose = verbose
         self.is_classifier = is_classifier
+        self.chunk_size = chunk_size
         self.scaler = StandardScaler()
         self.encoder = OneHotEncoder()
         
     def _fuzzify(self, X):
         """
-        Transform the input features into fuzzy sets using fuzzy c-means clustering.
+        Build the fuzzy sets of each feature using fuzzy c-means clustering.
     
         Parameters
         ----------
         X : array-like of shape (n_samples, n_features)
-            The input samples to be fuzzified.
+            The (scaled) input samples to be fuzzified.
     
         Returns
         -------
-        antecedents : list of `Antecedent`
-            A list of fuzzy antecedents for each feature in the input data. Each 
-            antecedent represents the fuzzy clusters for a corresponding feature.
+        antecedents : ndarray of shape (n_features, n_clusters, 3)
+            The ``(a, b, c)`` vertices of the triangular fuzzy set of each 
+            cluster of each feature.
     
         Notes
         -----
         The fuzzification process involves the following steps:
     
         1. **Fuzzy c-means Clustering**:
-           For each feature in `X`, fuzzy c-means clustering is applied to 
-           partition the feature values into `n_clusters` fuzzy clusters. The 
-           objective function for fuzzy c-means clustering is:
+           Each feature in `X` is partitioned into `n_clusters` fuzzy 
+           clusters. The objective function for fuzzy c-means clustering is:
            
            .. math::
                \min \sum_{i=1}^{n} \sum_{j=1}^{c} u_{ij}^m \|x_i - v_j\|^2
     
            where :math:`u_{ij}` is the degree of membership of :math:`x_i` in 
            cluster :math:`j`, :math:`v_j` is the cluster center, and :math:`m` 
-           is a weighting exponent.
+           is a weighting exponent. All the features are clustered together 
+           in one batched pass (see :func:`gofast.estimators.util.fuzzy_cmeans`).
     
         2. **Antecedent Creation**:
-           For each feature, an `Antecedent` object is created representing the 
-           universe of discourse for that feature. The fuzzy clusters obtained 
-           from c-means clustering are then used to define the membership 
-           functions for each cluster within the antecedent.
-    
-        This process transforms the input features into fuzzy sets, which can 
-        then be used in the fuzzy inference system.
-    
-        If `verbose=True`, a progress bar will be displayed during the fuzzification 
-        process for each feature.
+           Each cluster center becomes the peak of a triangular membership 
+           function whose feet lie on the neighbouring centers, or on the 
+           feature range for the outermost clusters.
     
         Examples
         --------
-        >>> from gofast.estimators._base import NeuroFuzzyBase
-        >>> X = [[0., 0.], [1., 1.]]
-        >>> model = NeuroFuzzyBase(n_clusters=2, max_iter=1000, verbose=True, 
-                                   is_classifier=True)
-        >>> antecedents = model._fuzzify(X)
-        >>> len(antecedents)
-        2
+        >>> from gofast.estimators.perceptron import NeuroFuzzyClassifier
+        >>> import numpy as np
+        >>> X = np.random.rand(20, 2)
+        >>> model = NeuroFuzzyClassifier(n_clusters=2)
+        >>> model._fuzzify(X).shape
+        (2, 2, 3)
     
         See Also
         --------
-        skfuzzy.cluster.cmeans : Fuzzy c-means clustering algorithm.
-        skfuzzy.control.Antecedent : Class representing a fuzzy antecedent.
+        gofast.estimators.util.fuzzy_cmeans : 
+            Batched fuzzy c-means clustering of the features.
+        gofast.estimators.util.triangular_membership : 
+            Vectorized triangular membership degrees.
     
         References
         ----------
@@ -781,29 +853,22 @@ class BaseNeuroFuzzy(BaseEstimator, metaclass=ABCMeta):
                System," IEEE Transactions on Systems, Man, and Cybernetics, vol.
                23, no. 3, pp. 665-685, 1993.
         """
-        n_features = X.shape[1]
-        antecedents = []
-        if self.verbose:
-            progress_bar = tqdm(
-                total=n_features, ascii=True, ncols=100,
-                desc="{:<30}".format(f'Fuzzify {self.estimator_name_}'), 
-            )
-        for i in range(n_features):
-            antecedent = Antecedent(np.linspace(0, 1, 100), f'feature_{i}')
-            clusters = fuzz.cluster.cmeans(
-                X[:, [i]].T, self.n_clusters, 2, error=0.005, maxiter=1000)[0]
-            for j, cluster in enumerate(clusters):
-                antecedent[f'cluster_{j}'] = fuzz.trimf(antecedent.universe, cluster)
-            antecedents.append(antecedent)
-            
-            if self.verbose: 
-                progress_bar.update(1)
-        if self.verbose: 
-            progress_bar.close()
-            
-        return antecedents
+        centers = fuzzy_cmeans(
+            X, self.n_clusters, m=2, error=0.005, max_iter=1000, 
+            chunk_size=self.chunk_size)
+        return _triangular_fuzzy_sets(centers, X.min(axis=0), X.max(axis=0))
+
+    def _fuzzy_features(self, X_scaled):
+        """
+        Augment the scaled samples with their membership degrees to the 
+        fuzzy sets of `antecedents_`, giving the network inputs of shape 
+        ``(n_samples, n_features * (n_clusters + 1))``.
+        """
+        memberships = triangular_membership(
+            X_scaled, self.antecedents_, chunk_size=self.chunk_size)
+        return np.hstack(
+            [X_scaled, memberships.reshape(X_scaled.shape[0], -1)])
 
-    
     def _fit(self, X, y, sample_weight=None):
         """
         Fit the NeuroFuzzyBase model according to the given training data.
@@ -878,7 +943,7 @@ class BaseNeuroFuzzy(BaseEstimator, metaclass=ABCMeta):
 
         X, y = check_X_y(X, y, estimator=self)
         
-        self.estimator_name_= ( "NeuroFuzzyClassifier" if self.classifier 
+        self.estimator_name_= ( "NeuroFuzzyClassifier" if self.is_classifier 
                                else "NeuroFuzzyRegressor")
         
         if self.verbose: 
@@ -939,13 +1004,14 @@ class BaseNeuroFuzzy(BaseEstimator, metaclass=ABCMeta):
         
         
         self.antecedents_ = self._fuzzify(X_scaled)
+        X_fuzzy = self._fuzzy_features(X_scaled)
         
         if self.verbose:
             for _ in tqdm(range(1), ncols=100, desc="{:<30}".format(
                     f"Fitting {self.estimator_name_}"), ascii=True):
-                self.mlp_.fit(X_scaled, y_encoded)
+                self.mlp_.fit(X_fuzzy, y_encoded)
         else:
-            self.mlp_.fit(X_scaled, y_encoded)
+            self.mlp_.fit(X_fuzzy, y_encoded)
         
         self.fitted_ = True 
         
@@ -960,12 +1026,11 @@ class BaseNeuroFuzzy(BaseEstimator, metaclass=ABCMeta):
         crisp predictions directly, the _defuzzify method is not needed. 
         Instead, the predictions from the MLPRegressor are handled using 
         standard techniques to get the final output classes.
+        
+        `y_fuzzy` holds one row of membership degrees per sample; the index 
+        of the largest degree of every row is returned at once.
         """
-        y = []
-        for yf in y_fuzzy:
-            max_membership = max(yf, key=lambda k: yf[k])
-            y.append(max_membership)
-        return np.array(y)
+        return np.argmax(np.asarray(y_fuzzy), axis=1)
     
     def _predict(self, X):
         """
@@ -1022,12 +1087,11 @@ class BaseNeuroFuzzy(BaseEstimator, metaclass=ABCMeta):
         check_is_fitted(self, "fitted_")
         X = check_array(X, accept_sparse=True, estimator=self)
         X_scaled = self.scaler.transform(X)
-        y_pred = self.mlp_.predict(X_scaled)
+        y_pred = self.mlp_.predict(self._fuzzy_features(X_scaled))
         
         if self.is_classifier:
             y_pred_labels = np.argmax(y_pred, axis=1)
-            y_pred_classes = self.encoder.inverse_transform(
-                y_pred_labels.reshape(-1, 1)).flatten()
+            y_pred_classes = self.encoder.categories_[0][y_pred_labels]
             return y_pred_classes
         else:
             return y_pred
@@ -1098,7 +1162,7 @@ class BaseNeuroFuzzy(BaseEstimator, metaclass=ABCMeta):
         X = check_array(X, accept_sparse=True, estimator=self)
         
         X_scaled = self.scaler.transform(X)
-        y_proba = self.mlp_.predict_proba(X_scaled)
+        y_proba = self.mlp_.predict_proba(self._fuzzy_features(X_scaled))
         return y_proba
 
 class BaseFuzzyNeuralNet(BaseEstimator, metaclass=ABCMeta):
@@ -1230,6 +1294,12 @@ class BaseFuzzyNeuralNet(BaseEstimator, metaclass=ABCMeta):
         Whether to print progress messages to stdout. If `True`, progress 
         messages are printed during training.
 
+    chunk_size : int, default=None
+        The number of samples fuzzified per block. Fuzzification evaluates 
+        ``n_samples * n_features * n_clusters`` membership degrees; chunking 
+        bounds the memory of the temporaries to ``chunk_size`` samples. If 
+        None, all the samples are fuzzified at once.
+
     Notes
     -----
     The FuzzyNeuralNetBase class combines the strengths of fuzzy logic and 
@@ -1287,11 +1357,12 @@ class BaseFuzzyNeuralNet(BaseEstimator, metaclass=ABCMeta):
         n_iter_no_change=10, 
         max_fun=15000, 
         random_state=None, 
-        verbose=False
+        verbose=False, 
+        chunk_size=None
         ):
         self.n_clusters = n_clusters
         self.n_estimators = n_estimators
-        self.learning_rate_init = eta0
+        self.eta0 = eta0
         self.max_iter = max_iter
         self.hidden_layer_sizes = hidden_layer_sizes
         self.activation = activation
@@ -1312,80 +1383,63 @@ class BaseFuzzyNeuralNet(BaseEstimator, metaclass=ABCMeta):
         self.max_fun = max_fun
         self.random_state = random_state
         self.verbose = verbose
+        self.chunk_size = chunk_size
         self.scaler = StandardScaler()
         self.encoder = OneHotEncoder()
 
     def _fuzzify(self, X):
         """
-        Transform the input features into fuzzy sets using fuzzy c-means clustering.
+        Build the fuzzy sets of each feature using fuzzy c-means clustering.
     
         Parameters
         ----------
         X : array-like of shape (n_samples, n_features)
-            The input samples to be fuzzified.
+            The (scaled) input samples to be fuzzified.
     
         Returns
         -------
-        antecedents : list of `Antecedent`
-            A list of fuzzy antecedents for each feature in the input data. Each 
-            antecedent represents the fuzzy clusters for a corresponding feature.
+        antecedents : ndarray of shape (n_features, n_clusters, 3)
+            The ``(a, b, c)`` vertices of the triangular fuzzy set of each 
+            cluster of each feature.
     
         Notes
         -----
-        The fuzzification process involves the following steps:
-    
-        1. **Fuzzy c-means Clustering**:
-           For each feature in `X`, fuzzy c-means clustering is applied to 
-           partition the feature values into `n_clusters` fuzzy clusters. The 
-           objective function for fuzzy c-means clustering is:
+        All the features are clustered together by a batched fuzzy c-means 
+        (see :func:`gofast.estimators.util.fuzzy_cmeans`) minimizing
            
-           .. math::
-               \min \sum_{i=1}^{n} \sum_{j=1}^{c} u_{ij}^m \|x_i - v_j\|^2
-    
-           where :math:`u_{ij}` is the degree of membership of :math:`x_i` in 
-           cluster :math:`j`, :math:`v_j` is the cluster center, and :math:`m` 
-           is a weighting exponent.
-    
-        2. **Antecedent Creation**:
-           For each feature, an `Antecedent` object is created representing the 
-           universe of discourse for that feature. The fuzzy clusters obtained 
-           from c-means clustering are then used to define the membership 
-           functions for each cluster within the antecedent.
+        .. math::
+            \min \sum_{i=1}^{n} \sum_{j=1}^{c} u_{ij}^m \|x_i - v_j\|^2
     
-        This process transforms the input features into fuzzy sets, which can 
-        then be used in the fuzzy inference system.
+        where :math:`u_{ij}` is the degree of membership of :math:`x_i` in 
+        cluster :math:`j`, :math:`v_j` is the cluster center, and :math:`m` 
+        is a weighting exponent. Each center then becomes the peak of a 
+        triangular membership function whose feet lie on the neighbouring 
+        centers, or on the feature range for the outermost clusters.
     
         Examples
         --------
         >>> from gofast.estimators.perceptron import FuzzyNeuralNetClassifier
-        >>> X = [[0., 0.], [1., 1.]]
-        >>> clf = FuzzyNeuralNetClassifier(n_clusters=2, n_estimators=5, 
-                                           max_iter=1000, verbose=True)
-        >>> antecedents = clf._fuzzify(X)
-        >>> len(antecedents)
-        2
+        >>> import numpy as np
+        >>> X = np.random.rand(20, 2)
+        >>> clf = FuzzyNeuralNetClassifier(n_clusters=2, n_estimators=5)
+        >>> clf._fuzzify(X).shape
+        (2, 2, 3)
         """
+        centers = fuzzy_cmeans(
+            X, self.n_clusters, m=2, error=0.005, max_iter=1000, 
+            chunk_size=self.chunk_size)
+        return _triangular_fuzzy_sets(centers, X.min(axis=0), X.max(axis=0))
 
-        n_features = X.shape[1]
-        antecedents = []
-        if self.verbose:
-            progress_bar = tqdm(
-                total=n_features, ascii=True, ncols=100,
-                desc='{:<30}'.format(f'Fuzzyfying {self.estimator_name_}'), 
-            )
-        for i in range(n_features):
-            antecedent = Antecedent(np.linspace(0, 1, 100), f'feature_{i}')
-            clusters = fuzz.cluster.cmeans(
-                X[:, [i]].T, self.n_clusters, 2, error=0.005, maxiter=1000)[0]
-            for j, cluster in enumerate(clusters):
-                antecedent[f'cluster_{j}'] = fuzz.trimf(antecedent.universe, cluster)
-            antecedents.append(antecedent)
-            
-            if self.verbose: 
-                progress_bar.update (1)
-        if self.verbose: 
-            progress_bar.close () 
-        return antecedents
+    def _fuzzy_features(self, X_scaled):
+        """
+        Augment the scaled samples with their membership degrees to the 
+        fuzzy sets of `antecedents_`, giving the network inputs of shape 
+        ``(n_samples, n_features * (n_clusters + 1))``.
+        """
+        memberships = triangular_membership(
+            X_scaled, self.antecedents_, chunk_size=self.chunk_size)
+        return np.hstack(
+            [X_scaled, memberships.reshape(X_scaled.shape[0], -1)])
 
     def _fit(self, X, y, is_classifier, sample_weight=None):
         """
@@ -1521,6 +1575,7 @@ class BaseFuzzyNeuralNet(BaseEstimator, metaclass=ABCMeta):
         self.estimator_name_= ( "FuzzyNeuralNetClassifier" if is_classifier 
                                else "FuzzyNeuralNetRegressor" ) 
         self.antecedents_ = self._fuzzify(X_scaled)
+        X_fuzzy = self._fuzzy_features(X_scaled)
         
         if self.verbose:
             progress_bar = tqdm(
@@ -1528,7 +1583,7 @@ class BaseFuzzyNeuralNet(BaseEstimator, metaclass=ABCMeta):
                 desc='{:<30}'.format(f'Fitting {self.estimator_name_}'), 
             )
         for estimator in self.ensemble_:
-            estimator.fit(X_scaled, y_encoded)
+            estimator.fit(X_fuzzy, y_encoded)
             
             if self.verbose: 
                 progress_bar.update (1)
@@ -5,12 +5,14 @@ from numbers import Integral, Real
 import numpy as np
 from tqdm import tqdm
 from scipy.sparse import issparse
+from joblib import Parallel, delayed, effective_n_jobs
 from sklearn.base import BaseEstimator
 
 from ..tools.validator import check_array, check_is_fitted
 from sklearn.utils._param_validation import Interval, StrOptions
 #from ..tools._param_validation import Interval, StrOptions
 from .util  import validate_fit_weights, validate_positive_integer
+from .util import _bin_tree_inputs, _unbin_tree_thresholds
 
 class BaseWeightedTree(BaseEstimator, metaclass=ABCMeta):
     """
@@ -97,6 +99,19 @@ class BaseWeightedTree(BaseEstimator, metaclass=ABCMeta):
         A node will be split if this split induces a decrease of the impurity 
         greater than or equal to this value.
     
+    tree_method : {"exact", "hist"}, default="exact"
+        The tree construction algorithm. "exact" fits every tree on the raw 
+        feature values. "hist" bins each feature once into at most 
+        `max_bins` quantile bins before the boosting loop and fits every 
+        tree on the same binned matrix, which is much faster on large 
+        datasets. The split thresholds are mapped back to raw values after 
+        each fit, so prediction works on the raw features. Sparse input is 
+        not supported with "hist".
+    
+    max_bins : int, default=255
+        The maximum number of bins per feature when `tree_method="hist"`. 
+        Must be between 2 and 256 so that bin codes fit in ``uint8``.
+    
     verbose : bool, default=False
         Controls the verbosity of the fitting process. If True, the progress
         of the fitting process is displayed.
@@ -106,10 +121,18 @@ class BaseWeightedTree(BaseEstimator, metaclass=ABCMeta):
     base_estimators_ : list of DecisionTreeClassifier or DecisionTreeRegressor
         List of base learners, each a decision tree.
     
+    bin_edges_ : list of ndarray
+        Upper bin thresholds of each feature, only set when 
+        `tree_method="hist"`.
+    
     weights_ : list
         Weights associated with each base learner, influencing their
         contribution to the final prediction.
     
+    compiled_ : object
+        Flattened node arrays of `base_estimators_` used by `predict`, see 
+        :meth:`compile_inference`.
+    
     Notes
     -----
     - The performance of the ensemble model depends on the quality of the base
@@ -191,6 +214,8 @@ class BaseWeightedTree(BaseEstimator, metaclass=ABCMeta):
         "max_leaf_nodes": [Interval(Integral, 2, None, closed="left"), None],
         "min_impurity_decrease": [Interval(Real, 0.0, None, closed="left")],
         "ccp_alpha": [Interval(Real, 0.0, None, closed="left")],
+        "tree_method": [StrOptions({"exact", "hist"})],
+        "max_bins": [Interval(Integral, 2, 256, closed="both")],
     }
     
     @abstractmethod
@@ -208,6 +233,8 @@ class BaseWeightedTree(BaseEstimator, metaclass=ABCMeta):
         random_state=None, 
         max_leaf_nodes=None, 
         min_impurity_decrease=0.,
+        tree_method="exact", 
+        max_bins=255, 
         verbose=False
         ):
         self.n_estimators = n_estimators
@@ -222,6 +249,8 @@ class BaseWeightedTree(BaseEstimator, metaclass=ABCMeta):
         self.random_state = random_state 
         self.max_leaf_nodes = max_leaf_nodes 
         self.min_impurity_decrease = min_impurity_decrease
+        self.tree_method = tree_method 
+        self.max_bins = max_bins 
         self.verbose = verbose
 
     @abstractmethod
@@ -364,6 +393,15 @@ class BaseWeightedTree(BaseEstimator, metaclass=ABCMeta):
             sample_weights = self._compute_sample_weights(y)
         else:
             residuals = y
+        
+        # Trees of every round are fitted and evaluated on the same binned 
+        # matrix; their thresholds are mapped back to raw values afterwards.
+        hist = self.tree_method == "hist"
+        if hist: 
+            if issparse(X):
+                raise ValueError("tree_method='hist' does not support"
+                                 " sparse input.")
+            X, self.bin_edges_ = _bin_tree_inputs(X, self.max_bins)
 
         if self.verbose:
             progress_bar = tqdm(range(self.n_estimators), ascii=True, ncols=100,
@@ -389,7 +427,9 @@ class BaseWeightedTree(BaseEstimator, metaclass=ABCMeta):
                 predictions = base_estimator.predict(X)
                 residuals -= self.eta0 * predictions
                 weight = self.eta0
-
+            
+            if hist: 
+                _unbin_tree_thresholds(base_estimator, self.bin_edges_)
             self.base_estimators_.append(base_estimator)
             self.weights_.append(weight)
 
@@ -398,9 +438,36 @@ class BaseWeightedTree(BaseEstimator, metaclass=ABCMeta):
 
         if self.verbose:
             progress_bar.close()
+        
+        self.compile_inference()
 
         return self
     
+    def compile_inference(self, n_jobs=None):
+        """
+        Flatten the fitted trees for batched prediction.
+    
+        The nodes of all the trees are stored in shared arrays so that 
+        `predict` walks every tree for every sample in one vectorized pass 
+        instead of calling each tree's ``predict``. It is called at the end 
+        of `fit`; call it again to change `n_jobs`.
+    
+        Parameters
+        ----------
+        n_jobs : int, default=None
+            Number of threads across which the trees are split at 
+            prediction time. `None` means 1 unless in a 
+            `joblib.parallel_backend` context.
+    
+        Returns
+        -------
+        self : object
+            Returns self.
+        """
+        check_is_fitted(self, 'base_estimators_')
+        self.compiled_ = _CompiledTrees(self.base_estimators_, n_jobs=n_jobs)
+        return self
+    
     def predict(self, X):
         """
         Predict class labels or target values for samples in `X`.
@@ -486,10 +553,9 @@ class BaseWeightedTree(BaseEstimator, metaclass=ABCMeta):
         """
         check_is_fitted(self, 'base_estimators_')
         X = check_array(X, accept_sparse=True)
-        y_pred = np.zeros(X.shape[0])
-    
-        for base_estimator, weight in zip(self.base_estimators_, self.weights_):
-            y_pred += weight * base_estimator.predict(X)
+        predictions = _tree_predictions(
+            self.base_estimators_, getattr(self, "compiled_", None), X)
+        y_pred = np.asarray(self.weights_, dtype=float) @ predictions
     
         if self._is_classifier():
             y_pred = y_pred / np.sum(self.weights_) if self.weights_ else y_pred
@@ -916,6 +982,8 @@ class BaseDTB(BaseEstimator, metaclass=ABCMeta):
     
         if self.verbose > 0:
             progress_bar.close()
+        
+        self.compile_inference()
     
         if self.bootstrap and self.subsample < 1.0:
             oob_indices = np.setdiff1d(sample_indices, subsample_indices)
@@ -1041,8 +1109,34 @@ class BaseDTB(BaseEstimator, metaclass=ABCMeta):
         """
         check_is_fitted(self, 'estimators_')
         X = check_array(X, accept_sparse=True)
-        predictions = np.array([tree.predict(X) for tree in self.estimators_])
+        predictions = _tree_predictions(
+            self.estimators_, getattr(self, "compiled_", None), X)
         return self._aggregate_predictions(predictions)
+    
+    def compile_inference(self, n_jobs=None):
+        """
+        Flatten the fitted trees for batched prediction.
+    
+        The nodes of all the trees are stored in shared arrays so that 
+        `predict` walks every tree for every sample in one vectorized pass 
+        instead of calling each tree's ``predict``. It is called at the end 
+        of `fit`; call it again to change `n_jobs`.
+    
+        Parameters
+        ----------
+        n_jobs : int, default=None
+            Number of threads across which the trees are split at 
+            prediction time. `None` means 1 unless in a 
+            `joblib.parallel_backend` context.
+    
+        Returns
+        -------
+        self : object
+            Returns self.
+        """
+        check_is_fitted(self, 'estimators_')
+        self.compiled_ = _CompiledTrees(self.estimators_, n_jobs=n_jobs)
+        return self
 
 
     @abstractmethod
@@ -1082,3 +1176,99 @@ class BaseDTB(BaseEstimator, metaclass=ABCMeta):
             The aggregated predictions.
         """
         pass
+
+class _CompiledTrees:
+    """
+    Fitted scikit-learn trees flattened into shared node arrays.
+
+    Nodes of all the trees are concatenated, child indices are offset to 
+    the global numbering and leaves point to themselves, so descending one 
+    level is a single gather for every (sample, tree) pair. The traversal 
+    compares ``float32`` inputs against the thresholds exactly as 
+    scikit-learn does, hence the outputs are those of ``tree.predict``.
+
+    Parameters
+    ----------
+    trees : list of DecisionTreeClassifier or DecisionTreeRegressor
+        The fitted trees.
+
+    n_jobs : int, default=None
+        Number of threads the trees are split across in `apply`.
+    """
+    def __init__(self, trees, n_jobs=None):
+        self.n_jobs = n_jobs
+        n_nodes = [tree.tree_.node_count for tree in trees]
+        self.roots = np.cumsum([0] + n_nodes)[:-1].astype(np.intp)
+        self.max_depth = max([tree.tree_.max_depth for tree in trees], default=0)
+        
+        features, thresholds, lefts, rights, values = [], [], [], [], []
+        for root, tree in zip(self.roots, trees):
+            tree_ = tree.tree_
+            nodes = np.arange(tree_.node_count)
+            is_leaf = tree_.children_left < 0
+            features.append(np.where(is_leaf, 0, tree_.feature))
+            thresholds.append(tree_.threshold)
+            lefts.append(np.where(is_leaf, nodes, tree_.children_left) + root)
+            rights.append(np.where(is_leaf, nodes, tree_.children_right) + root)
+            values.append(tree_.value[:, 0, :])
+            
+        concat = lambda arrays, dtype: np.concatenate(
+            arrays).astype(dtype) if arrays else np.empty(0, dtype=dtype)
+        self.feature = concat(features, np.intp)
+        self.threshold = concat(thresholds, np.float64)
+        # children[2 * node] is the left child, children[2 * node + 1] the 
+        # right one, so that the next node is a single ``take``.
+        self.children = np.column_stack(
+            (concat(lefts, np.intp), concat(rights, np.intp))).ravel()
+        
+        classes = [getattr(tree, "classes_", None) for tree in trees]
+        if classes and classes[0] is not None:
+            # Leaf outputs of ``predict`` and, when every tree saw the same 
+            # classes, of ``predict_proba``.
+            self.leaf_output = np.concatenate([
+                c.take(v.argmax(axis=1)) for c, v in zip(classes, values)])
+            self.leaf_proba = None
+            if all(np.array_equal(c, classes[0]) for c in classes):
+                proba = np.concatenate(values)
+                normalizer = proba.sum(axis=1, keepdims=True)
+                normalizer[normalizer == 0.0] = 1.0
+                self.leaf_proba = proba / normalizer
+        else:
+            self.leaf_output = concat([v[:, 0] for v in values], np.float64)
+            
+    def apply(self, X):
+        """Global leaf index of each sample in each tree, (n_samples, n_trees)."""
+        X = np.ascontiguousarray(X, dtype=np.float32)
+        trees = np.arange(len(self.roots))
+        n_jobs = min(effective_n_jobs(self.n_jobs), max(len(trees), 1))
+        if n_jobs == 1:
+            return self._apply(X, trees)
+        parts = Parallel(n_jobs=n_jobs, prefer="threads")(
+            delayed(self._apply)(X, group) 
+            for group in np.array_split(trees, n_jobs))
+        return np.hstack(parts)
+    
+    def _apply(self, X, trees):
+        n_samples, n_features = X.shape
+        flat_X = X.ravel()
+        row_offsets = (np.arange(n_samples) * n_features)[:, np.newaxis]
+        node = np.repeat(self.roots[trees][np.newaxis], n_samples, axis=0)
+        for _ in range(self.max_depth):
+            values = flat_X.take(row_offsets + self.feature.take(node))
+            go_right = values > self.threshold.take(node)
+            node = self.children.take(2 * node + go_right)
+        return node
+    
+    def predict(self, X):
+        """Outputs of every tree, of shape (n_trees, n_samples)."""
+        return self.leaf_output[self.apply(X)].T
+    
+    def predict_proba(self, X):
+        """Class probabilities averaged over the trees."""
+        return self.leaf_proba[self.apply(X)].mean(axis=1)
+
+def _tree_predictions(trees, compiled, X):
+    """Stack the predictions of `trees`, batched when they are compiled."""
+    if compiled is None or issparse(X):
+        return np.array([tree.predict(X) for tree in trees])
+    return compiled.predict(X)
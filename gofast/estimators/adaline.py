@@ -81,6 +81,12 @@ class AdalineStochasticRegressor(BaseAdalineStochastic, RegressorMixin):
     shuffle : bool, default=True
         Whether to shuffle training data before each epoch to prevent cycles.
 
+    batch_size : int, default=1
+        Number of training instances per weight update. ``1`` performs a 
+        weight update after every instance; larger values update the weights 
+        once per mini-batch from the averaged error, as a single matrix 
+        product.
+
     random_state : int or None, default=None
         Seed used by the random number generator for shuffling and initializing 
         weights.
@@ -173,6 +179,7 @@ class AdalineStochasticRegressor(BaseAdalineStochastic, RegressorMixin):
             learning_rate='constant', 
             eta0_decay=0.99, 
             shuffle=True, 
+            batch_size=1, 
             random_state=None, 
             verbose=False
             ):
@@ -186,6 +193,7 @@ class AdalineStochasticRegressor(BaseAdalineStochastic, RegressorMixin):
             learning_rate=learning_rate, 
             eta0_decay=eta0_decay, 
             shuffle=shuffle, 
+            batch_size=batch_size, 
             random_state=random_state, 
             verbose=verbose
             )
@@ -288,6 +296,7 @@ class AdalineStochasticRegressor(BaseAdalineStochastic, RegressorMixin):
             self._initialize_weights(X.shape[1])
        
         self.cost_ = []
+        self.n_iter_ = 0 
 
         if self.early_stopping:
             X, X_val, y, y_val = train_test_split(
@@ -302,13 +311,7 @@ class AdalineStochasticRegressor(BaseAdalineStochastic, RegressorMixin):
         for i in range(self.max_iter):
             if self.shuffle:
                 X, y = shuffle(X, y, random_state=self.random_state)
-            cost = []
-            for xi, target in zip(X, y):
-                error = target - self.predict(xi.reshape(1, -1))
-                self.weights_[1:] += self.eta0 * xi * error
-                self.weights_[0] += self.eta0 * error
-                cost.append(error ** 2 / 2.0)
-            self.cost_.append(np.mean(cost))
+            self._partial_fit_epoch(X, y)
             
             if self.early_stopping:
                 y_val_pred = self.predict(X_val)
@@ -318,9 +321,6 @@ class AdalineStochasticRegressor(BaseAdalineStochastic, RegressorMixin):
                         print(f'Early stopping at epoch {i+1}')
                         progress_bar.update(self.max_iter - i )
                     break
-
-            if self.learning_rate == 'adaptive':
-                self.eta0 *= self.eta0_decay
             
             if self.verbose:
                 progress_bar.update(1)
@@ -330,6 +330,63 @@ class AdalineStochasticRegressor(BaseAdalineStochastic, RegressorMixin):
         
         return self
 
+    def partial_fit(self, X, y, sample_weight=None):
+        """
+        Update the model with a single epoch over a chunk of data.
+    
+        `partial_fit` allows the regressor to be trained out-of-core, from 
+        successive chunks of a dataset too large to fit in memory (e.g. 
+        ``pd.read_csv(..., chunksize=...)``), or to be updated continuously 
+        as new data arrives.
+    
+        Parameters
+        ----------
+        X : {array-like, sparse matrix}, shape (n_samples, n_features)
+            Chunk of training vectors.
+    
+        y : array-like, shape (n_samples,)
+            Target values of the chunk.
+    
+        sample_weight : array-like of shape (n_samples,), default=None
+            Not used, present for API consistency.
+    
+        Returns
+        -------
+        self : object
+            Returns self.
+    
+        Notes
+        -----
+        The weights are initialized on the first call only. The learning rate 
+        schedule (``eta_``), the epoch counter ``n_iter_`` and the ``cost_`` 
+        history carry over between calls. Early stopping is not applied; the 
+        caller decides when to stop feeding chunks.
+    
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from gofast.estimators.adaline import AdalineStochasticRegressor
+        >>> rng = np.random.RandomState(0)
+        >>> reg = AdalineStochasticRegressor(eta0=0.01, batch_size=32)
+        >>> for _ in range(10):
+        ...     X_chunk = rng.randn(500, 3)
+        ...     reg.partial_fit(X_chunk, X_chunk @ [1., -2., .5])
+        >>> reg.n_iter_
+        10
+        """
+        self._validate_params() 
+        first_call = not hasattr(self, 'weights_')
+        X, y = self._validate_data(
+            X, y, reset=first_call, accept_sparse="csc", ensure_2d=False, 
+            dtype=None
+            )
+        if first_call:
+            self._initialize_weights(X.shape[1])
+            
+        if self.shuffle:
+            X, y = shuffle(X, y, random_state=self.random_state)
+        return self._partial_fit_epoch(X, y)
+
     def predict(self, X):
         """
         Predict continuous output.
@@ -490,6 +547,11 @@ class AdalineStochasticClassifier(BaseAdalineStochastic, ClassifierMixin):
         in preventing cycles and ensures that individual samples are encountered 
         in different orders.
 
+    batch_size : int, default=1
+        Number of training instances per weight update. ``1`` performs a 
+        weight update after every instance; larger values update the weights 
+        of all outputs at once per mini-batch from the averaged error.
+
     random_state : int, default=None
         The seed of the pseudo random number generator to use when shuffling the 
         data and initializing the weights.
@@ -591,6 +653,7 @@ class AdalineStochasticClassifier(BaseAdalineStochastic, ClassifierMixin):
             eta0_decay=0.99, 
             activation='sigmoid', 
             shuffle=True, 
+            batch_size=1, 
             random_state=None, 
             verbose=False
             ):
@@ -604,6 +667,7 @@ class AdalineStochasticClassifier(BaseAdalineStochastic, ClassifierMixin):
             learning_rate=learning_rate, 
             eta0_decay=eta0_decay, 
             shuffle=shuffle, 
+            batch_size=batch_size, 
             random_state=random_state, 
             verbose=verbose
             )
@@ -714,12 +778,11 @@ class AdalineStochasticClassifier(BaseAdalineStochastic, ClassifierMixin):
         if y.ndim == 1:
             y = y[:, np.newaxis]
         
-        rgen = np.random.RandomState(self.random_state)
-        
         if not self.warm_start or not hasattr(self, 'weights_'):
-            self.weights_ = rgen.normal(loc=0.0, scale=0.01, size=(X.shape[1] + 1, y.shape[1]))
+            self._initialize_weights(X.shape[1], y.shape[1])
         
         self.cost_ = []
+        self.n_iter_ = 0 
 
         if self.early_stopping:
             X, X_val, y, y_val = train_test_split(
@@ -734,14 +797,7 @@ class AdalineStochasticClassifier(BaseAdalineStochastic, ClassifierMixin):
         for i in range(self.max_iter):
             if self.shuffle:
                 X, y = shuffle(X, y, random_state=self.random_state)
-            cost = []
-            for xi, target in zip(X, y):
-                for idx in range(self.weights_.shape[1]):
-                    error = target[idx] - self.net_activation(xi, idx)
-                    self.weights_[1:, idx] += self.eta0 * xi * error
-                    self.weights_[0, idx] += self.eta0 * error
-                    cost.append(error ** 2 / 2.0) 
-            self.cost_.append(np.mean(cost))
+            self._partial_fit_epoch(X, y)
             if self.early_stopping:
                 y_val_pred = self.predict(X_val).reshape (-1, 1)
                 val_error = np.mean((y_val - y_val_pred) ** 2)
@@ -752,9 +808,6 @@ class AdalineStochasticClassifier(BaseAdalineStochastic, ClassifierMixin):
                         progress_bar.last_print_n = self.max_iter
                         progress_bar.update(0)  # Refresh the progress bar display
                     break
-
-            if self.learning_rate == 'adaptive':
-                self.eta0 *= self.eta0_decay
             
             if self.verbose:
                 progress_bar.update(1)
@@ -764,6 +817,74 @@ class AdalineStochasticClassifier(BaseAdalineStochastic, ClassifierMixin):
 
         return self
     
+    def partial_fit(self, X, y, classes=None, sample_weight=None):
+        """
+        Update the model with a single epoch over a chunk of data.
+    
+        `partial_fit` allows the classifier to be trained out-of-core, from 
+        successive chunks of a dataset too large to fit in memory, or to be 
+        updated continuously as new data arrives.
+    
+        Parameters
+        ----------
+        X : {array-like, sparse matrix}, shape (n_samples, n_features)
+            Chunk of training vectors.
+    
+        y : array-like, shape (n_samples,)
+            Class labels of the chunk.
+    
+        classes : array-like of shape (n_classes,), default=None
+            All the classes that can appear in `y`. Required on the first 
+            call since a single chunk may not contain every class; ignored 
+            afterwards.
+    
+        sample_weight : array-like of shape (n_samples,), default=None
+            Not used, present for API consistency.
+    
+        Returns
+        -------
+        self : object
+            Returns self.
+    
+        Notes
+        -----
+        The weights are initialized on the first call only. The learning rate 
+        schedule (``eta_``), the epoch counter ``n_iter_`` and the ``cost_`` 
+        history carry over between calls.
+    
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from gofast.estimators.adaline import AdalineStochasticClassifier
+        >>> rng = np.random.RandomState(0)
+        >>> clf = AdalineStochasticClassifier(eta0=0.01, batch_size=32)
+        >>> for _ in range(5):
+        ...     X_chunk = rng.randn(200, 2)
+        ...     y_chunk = (X_chunk[:, 0] > 0).astype(int)
+        ...     clf.partial_fit(X_chunk, y_chunk, classes=[0, 1])
+        """
+        self._validate_params() 
+        first_call = not hasattr(self, 'weights_')
+        if first_call:
+            if classes is None:
+                raise ValueError(
+                    "classes must be passed on the first call to partial_fit.")
+            self.label_binarizer_ = LabelBinarizer().fit(classes)
+            
+        X, y = self._validate_data(
+            X, y, reset=first_call, accept_sparse="csc", ensure_2d=False, 
+            dtype=None, multi_output=True
+            )
+        y = self.label_binarizer_.transform(y)
+        if y.ndim == 1:
+            y = y[:, np.newaxis]
+        if first_call:
+            self._initialize_weights(X.shape[1], y.shape[1])
+            
+        if self.shuffle:
+            X, y = shuffle(X, y, random_state=self.random_state)
+        return self._partial_fit_epoch(X, y)
+    
     def predict(self, X):
         """
         Return class label after unit step.
@@ -1138,12 +1259,12 @@ class AdalineRegressor(BaseEstimator, RegressorMixin):
                Convention Record, New York, 96-104.
         """
         X, y = check_X_y(X, y, estimator=self)
-        rgen = np.random.RandomState(self.random_state)
 
         if not self.warm_start or not hasattr(self, 'weights_'):
-            self.weights_ = rgen.normal(loc=0.0, scale=0.01, size=1 + X.shape[1])
+            self._initialize_weights(X.shape[1])
         
         self.errors_ = []
+        self.n_iter_ = 0 
 
         if self.early_stopping:
             X, X_val, y, y_val = train_test_split(
@@ -1159,12 +1280,7 @@ class AdalineRegressor(BaseEstimator, RegressorMixin):
             if self.shuffle:
                 X, y = shuffle(X, y, random_state=self.random_state)
             
-            net_input = self.net_input(X)
-            errors = y - net_input
-            self.weights_[1:] += self.eta0 * X.T.dot(errors)
-            self.weights_[0] += self.eta0 * errors.sum()
-            cost = (errors**2).sum() / 2.0
-            self.errors_.append(cost)
+            self.errors_.append(self._run_epoch(X, y))
 
             if self.early_stopping:
                 y_val_pred = self.predict(X_val)
@@ -1183,6 +1299,62 @@ class AdalineRegressor(BaseEstimator, RegressorMixin):
 
         return self
 
+    def partial_fit(self, X, y, sample_weight=None):
+        """
+        Update the model with one gradient descent epoch over a chunk of data.
+    
+        `partial_fit` allows the regressor to be trained out-of-core, from 
+        successive chunks of a dataset too large to fit in memory, or to be 
+        updated continuously as new data arrives.
+    
+        Parameters
+        ----------
+        X : {array-like}, shape (n_samples, n_features)
+            Chunk of training vectors.
+    
+        y : array-like, shape (n_samples,)
+            Target values of the chunk.
+    
+        sample_weight : array-like of shape (n_samples,), default=None
+            Not used, present for API consistency.
+    
+        Returns
+        -------
+        self : object
+            Returns self.
+    
+        Notes
+        -----
+        The weights are initialized on the first call only; the epoch counter 
+        ``n_iter_`` and the ``errors_`` history carry over between calls. 
+        Since the update sums the errors of the chunk, `eta0` should be scaled 
+        to the chunk size.
+        """
+        X, y = check_X_y(X, y, estimator=self)
+        if not hasattr(self, 'weights_'):
+            self._initialize_weights(X.shape[1])
+            self.errors_ = []
+            self.n_iter_ = 0 
+        
+        if self.shuffle:
+            X, y = shuffle(X, y, random_state=self.random_state)
+        self.errors_.append(self._run_epoch(X, y))
+        self.n_iter_ += 1
+        
+        return self
+    
+    def _initialize_weights(self, n_features):
+        """Draw small random weights, plus one for the bias term."""
+        rgen = np.random.RandomState(self.random_state)
+        self.weights_ = rgen.normal(loc=0.0, scale=0.01, size=1 + n_features)
+        
+    def _run_epoch(self, X, y):
+        """Perform one batch gradient descent step and return the cost."""
+        errors = y - self.net_input(X)
+        self.weights_[1:] += self.eta0 * X.T.dot(errors)
+        self.weights_[0] += self.eta0 * errors.sum()
+        return (errors**2).sum() / 2.0
+    
     def net_input(self, X):
         """Calculate net input"""
         return np.dot(X, self.weights_[1:]) + self.weights_[0]
@@ -1500,12 +1672,11 @@ class AdalineClassifier(BaseEstimator, ClassifierMixin):
         if y.ndim == 1:
             y = y[:, np.newaxis]
         
-        rgen = np.random.RandomState(self.random_state)
-
         if not self.warm_start or not hasattr(self, 'weights_'):
-            self.weights_ = rgen.normal(loc=0.0, scale=0.01, size=(X.shape[1] + 1, y.shape[1]))
+            self._initialize_weights(X.shape[1], y.shape[1])
         
         self.errors_ = []
+        self.n_iter_ = 0 
 
         if self.early_stopping:
             X, X_val, y, y_val = train_test_split(
@@ -1520,14 +1691,7 @@ class AdalineClassifier(BaseEstimator, ClassifierMixin):
         for i in range(self.max_iter):
             if self.shuffle:
                 X, y = shuffle(X, y, random_state=self.random_state)
-            cost = []
-            for xi, target in zip(X, y):
-                for idx in range(self.weights_.shape[1]):
-                    error = target[idx] - self.activation(xi, idx)
-                    self.weights_[1:, idx] += self.eta0 * xi * error
-                    self.weights_[0, idx] += self.eta0 * error
-                    cost.append(error ** 2 / 2.0)
-            self.errors_.append(np.mean(cost))
+            self.errors_.append(self._run_epoch(X, y))
             
             if self.early_stopping:
                 y_val_pred = self.predict(X_val)
@@ -1546,6 +1710,80 @@ class AdalineClassifier(BaseEstimator, ClassifierMixin):
 
         return self
     
+    def partial_fit(self, X, y, classes=None, sample_weight=None):
+        """
+        Update the model with one epoch over a chunk of data.
+    
+        `partial_fit` allows the classifier to be trained out-of-core, from 
+        successive chunks of a dataset too large to fit in memory, or to be 
+        updated continuously as new data arrives.
+    
+        Parameters
+        ----------
+        X : array-like, shape (n_samples, n_features)
+            Chunk of training vectors.
+    
+        y : array-like, shape (n_samples,)
+            Class labels of the chunk.
+    
+        classes : array-like of shape (n_classes,), default=None
+            All the classes that can appear in `y`. Required on the first 
+            call since a single chunk may not contain every class; ignored 
+            afterwards.
+    
+        sample_weight : array-like of shape (n_samples,), default=None
+            Not used, present for API consistency.
+    
+        Returns
+        -------
+        self : object
+            Returns self.
+    
+        Notes
+        -----
+        The weights are initialized on the first call only; the epoch counter 
+        ``n_iter_`` and the ``errors_`` history carry over between calls.
+        """
+        X, y = check_X_y(X, y, estimator=self, ensure_2d=True, multi_output=True)
+        first_call = not hasattr(self, 'weights_')
+        if first_call:
+            if classes is None:
+                raise ValueError(
+                    "classes must be passed on the first call to partial_fit.")
+            self.label_binarizer_ = LabelBinarizer().fit(classes)
+            
+        y = self.label_binarizer_.transform(y)
+        if y.ndim == 1:
+            y = y[:, np.newaxis]
+        if first_call: 
+            self._initialize_weights(X.shape[1], y.shape[1])
+            self.errors_ = []
+            self.n_iter_ = 0 
+            
+        if self.shuffle:
+            X, y = shuffle(X, y, random_state=self.random_state)
+        self.errors_.append(self._run_epoch(X, y))
+        self.n_iter_ += 1
+        
+        return self
+    
+    def _initialize_weights(self, n_features, n_outputs):
+        """Draw small random weights for each output, plus the bias terms."""
+        rgen = np.random.RandomState(self.random_state)
+        self.weights_ = rgen.normal(
+            loc=0.0, scale=0.01, size=(n_features + 1, n_outputs))
+        
+    def _run_epoch(self, X, y):
+        """Update the weights instance by instance and return the mean cost."""
+        cost = []
+        for xi, target in zip(X, y):
+            for idx in range(self.weights_.shape[1]):
+                error = target[idx] - self.activation(xi, idx)
+                self.weights_[1:, idx] += self.eta0 * xi * error
+                self.weights_[0, idx] += self.eta0 * error
+                cost.append(error ** 2 / 2.0)
+        return np.mean(cost)
+    
     def net_input(self, X, idx):
         """Calculate net input"""
         return np.dot(X, self.weights_[1:, idx]) + self.weights_[0, idx]
@@ -17,6 +17,7 @@ from sklearn.metrics import r2_score , accuracy_score
 from ..api.property import BaseClass 
 from ..tools.validator import check_X_y, get_estimator_name
 from ..tools.validator import check_is_fitted, validate_fit_weights 
+from .util import bin_features
 
 
 __all__=["StandardEstimator", "DecisionStumpRegressor", "DecisionStumpClassifier"]
@@ -130,6 +131,176 @@ class StandardEstimator:
 
         return self
 
+class _StumpSplitter:
+    r"""
+    Split finder shared by the decision stumps and the gradient boosting 
+    ensembles of this module.
+
+    The expensive part of a stump fit is the ordering of the samples along 
+    each feature, which does not depend on the target. The splitter does it 
+    once, either by sorting every column (exact mode) or by quantile-binning 
+    them (histogram mode, when `max_bins` is set), and then scores every 
+    candidate threshold in O(1) from cumulative sums of the weights, the 
+    weighted targets and the weighted squared targets:
+
+    .. math::
+        SSE(t) = \left(S_{wy^2}^{L} - \frac{(S_{wy}^{L})^2}{S_{w}^{L}}\right) +
+                 \left(S_{wy^2}^{R} - \frac{(S_{wy}^{R})^2}{S_{w}^{R}}\right)
+
+    so that a full search costs O(n_samples) per feature in exact mode and 
+    O(max_bins) per feature in histogram mode. Boosting loops reuse the same 
+    splitter for every stage since only the targets change.
+
+    Parameters
+    ----------
+    X : ndarray of shape (n_samples, n_features)
+        The validated input samples.
+
+    max_bins : int, optional
+        If None, the search is exact over all distinct feature values. 
+        Otherwise features are binned with 
+        :func:`gofast.estimators.util.bin_features` and thresholds are 
+        restricted to the bin edges.
+    """
+
+    def __init__(self, X, max_bins=None):
+        self.max_bins = max_bins
+        self.n_samples, self.n_features = X.shape
+        if max_bins is None:
+            self.order_ = np.argsort(X, axis=0, kind="stable")
+            self.X_sorted_ = np.take_along_axis(X, self.order_, axis=0)
+        else:
+            self.X_binned_, self.bin_edges_ = bin_features(X, max_bins)
+
+    def _prefix_sums(self, feature, values):
+        """
+        Cumulative sums of `values` (shape (n_samples,) or (n_samples, k)) 
+        for every candidate left partition of `feature`, with the left 
+        sample counts, the thresholds and the mask of usable candidates.
+        """
+        if self.max_bins is None:
+            idx = self.order_[:, feature]
+            X_sorted = self.X_sorted_[:, feature]
+            # Candidate k puts the first k + 1 sorted samples on the left.
+            left_sums = np.cumsum(values[idx], axis=0)[:-1]
+            n_left = np.arange(1, self.n_samples)
+            candidates = X_sorted[1:] != X_sorted[:-1]
+            thresholds = X_sorted[:-1]
+        else:
+            codes = self.X_binned_[:, feature]
+            thresholds = self.bin_edges_[feature]
+            n_bins = len(thresholds) + 1
+            counts = np.bincount(codes, minlength=n_bins)
+            if values.ndim == 1:
+                hist = np.bincount(codes, weights=values, minlength=n_bins)
+            else:
+                n_outputs = values.shape[1]
+                hist = np.column_stack([
+                    np.bincount(codes, weights=values[:, k], minlength=n_bins)
+                    for k in range(n_outputs)
+                ])
+            left_sums = np.cumsum(hist, axis=0)[:-1]
+            n_left = np.cumsum(counts)[:-1]
+            candidates = counts[:-1] > 0
+            
+        return left_sums, n_left, thresholds, candidates
+
+    def regression_split(self, y, sample_weight, min_samples_split=2, 
+                         min_samples_leaf=1, progress_bar=None):
+        """
+        Find the split minimizing the weighted sum of squared errors.
+
+        Returns
+        -------
+        split : tuple or None
+            ``(feature, threshold, left_value, right_value)`` of the best 
+            split, or None when no valid split exists.
+        importances : ndarray of shape (n_features,)
+            Best reduction of the weighted squared error reached by each 
+            feature.
+        """
+        w = np.asarray(sample_weight, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        # The squared error is shift invariant: centering the target keeps 
+        # the prefix sums of y**2 well conditioned.
+        offset = np.average(y, weights=w) if w.sum() > 0 else 0.
+        y_centered = y - offset
+        wy = w * y_centered
+        values = np.column_stack((w, wy, wy * y_centered))
+        total_w, total_wy, total_wy2 = values.sum(axis=0)
+        parent_error = (total_wy2 - total_wy ** 2 / total_w 
+                        if total_w > 0 else 0.)
+        
+        importances = np.zeros(self.n_features)
+        best_error, split = np.inf, None 
+        for feature in range(self.n_features):
+            left_sums, n_left, thresholds, candidates = self._prefix_sums(
+                feature, values)
+            left_w, left_wy, left_wy2 = left_sums.T
+            right_w = total_w - left_w
+            right_wy = total_wy - left_wy
+            right_wy2 = total_wy2 - left_wy2
+            # Same candidate range as the historical per-threshold loop.
+            valid = (candidates 
+                     & (n_left >= max(min_samples_leaf, min_samples_split))
+                     & (self.n_samples - n_left > min_samples_leaf)
+                     & (left_w > 0) & (right_w > 0)
+                     )
+            if valid.any():
+                with np.errstate(divide="ignore", invalid="ignore"):
+                    error = ((left_wy2 - left_wy ** 2 / left_w) 
+                             + (right_wy2 - right_wy ** 2 / right_w))
+                error = np.where(valid, error, np.inf)
+                k = np.argmin(error)
+                importances[feature] = max(parent_error - error[k], 0.)
+                if error[k] < best_error:
+                    best_error = error[k]
+                    split = (feature, thresholds[k], 
+                             left_wy[k] / left_w[k] + offset, 
+                             right_wy[k] / right_w[k] + offset)
+            if progress_bar is not None:
+                progress_bar.update(1)
+                
+        return split, importances
+
+    def classification_split(self, y_encoded, n_classes, sample_weight, 
+                             min_samples_leaf=1, progress_bar=None):
+        """
+        Find the split maximizing the weight of correctly classified samples 
+        when each side predicts its weighted majority class.
+
+        Returns
+        -------
+        split : tuple or None
+            ``(feature, threshold, left_class, right_class)`` where the 
+            classes are indices into the encoded labels, or None when no 
+            valid split exists.
+        """
+        w = np.asarray(sample_weight, dtype=np.float64)
+        class_weights = np.zeros((self.n_samples, n_classes))
+        class_weights[np.arange(self.n_samples), y_encoded] = w
+        total = class_weights.sum(axis=0)
+
+        best_error, split = np.inf, None 
+        for feature in range(self.n_features):
+            left_sums, n_left, thresholds, candidates = self._prefix_sums(
+                feature, class_weights)
+            right_sums = total - left_sums
+            valid = (candidates & (n_left >= min_samples_leaf) 
+                     & (self.n_samples - n_left >= min_samples_leaf))
+            if valid.any():
+                error = -(left_sums.max(axis=1) + right_sums.max(axis=1))
+                error = np.where(valid, error, np.inf)
+                k = np.argmin(error)
+                if error[k] < best_error:
+                    best_error = error[k]
+                    split = (feature, thresholds[k], 
+                             np.argmax(left_sums[k]), np.argmax(right_sums[k]))
+            if progress_bar is not None:
+                progress_bar.update(1)
+                
+        return split
+
 class DecisionStumpRegressor(BaseClass, StandardEstimator):
     r"""
     A simple decision stump regressor for use in gradient boosting.
@@ -153,6 +324,10 @@ class DecisionStumpRegressor(BaseClass, StandardEstimator):
     two sets.
 
     The algorithm selects the feature and threshold that yield the lowest MSE.
+    Each feature is sorted once and the weighted sums of :math:`y`, 
+    :math:`y^2` and of the weights are accumulated along the sorted order, so 
+    that every threshold is scored in constant time. With `max_bins`, the 
+    features are quantile-binned once and only the bin edges are scanned.
 
     Parameters
     ----------
@@ -164,6 +339,12 @@ class DecisionStumpRegressor(BaseClass, StandardEstimator):
         at any depth will only be considered if it leaves at least this many training 
         samples in each of the left and right branches.
         
+    max_bins : int, optional
+        If set, features are discretized into at most `max_bins` quantile bins 
+        before the split search, which then costs O(max_bins) per feature. 
+        Thresholds are restricted to the bin edges. If None (default), all 
+        distinct feature values are candidate thresholds.
+        
     verbose : int, default=False
         Controls the verbosity when fitting and predicting.
         
@@ -212,9 +393,11 @@ class DecisionStumpRegressor(BaseClass, StandardEstimator):
     >>> predictions = stump.predict(X)
     """
 
-    def __init__(self, min_samples_split=2, min_samples_leaf=1, verbose=False):
+    def __init__(self, min_samples_split=2, min_samples_leaf=1, max_bins=None, 
+                 verbose=False):
         self.min_samples_split = min_samples_split
         self.min_samples_leaf = min_samples_leaf
+        self.max_bins = max_bins 
         self.verbose=verbose
         
         self.split_feature_ = None
@@ -228,9 +411,10 @@ class DecisionStumpRegressor(BaseClass, StandardEstimator):
         """
         Fits the decision stump to the data.
 
-        The method iterates over all features and their unique values to 
-        find the split 
-        that minimizes the mean squared error.
+        The method iterates over all features and their unique values (or 
+        their bin edges when `max_bins` is set) to find the split that 
+        minimizes the mean squared error. Each feature is sorted once and 
+        the candidate thresholds are scored from prefix sums.
 
         Parameters
         ----------
@@ -238,6 +422,8 @@ class DecisionStumpRegressor(BaseClass, StandardEstimator):
             The input samples.
         y : ndarray of shape (n_samples,)
             The target values.
+        sample_weight : ndarray of shape (n_samples,), default=None
+            Sample weights. If None, samples are equally weighted.
 
         Return 
         -------
@@ -250,47 +436,34 @@ class DecisionStumpRegressor(BaseClass, StandardEstimator):
         """
         X, y = check_X_y(X, y )
         sample_weight = validate_fit_weights(np.ones(X.shape[0]), sample_weight)
-        self.feature_importances_ = np.zeros(X.shape[1])
-        min_error = float('inf')
-        n_samples, n_features = X.shape
+        splitter = _StumpSplitter(X, max_bins=self.max_bins)
         
+        return self._fit_splitter(splitter, y, sample_weight)
+    
+    def _fit_splitter(self, splitter, y, sample_weight=None):
+        """
+        Fit the stump from a prepared :class:`_StumpSplitter`. Boosting loops 
+        call it directly to share the sorted or binned features across stages.
+        """
+        if sample_weight is None: 
+            sample_weight = np.ones(splitter.n_samples)
+            
+        progress_bar = None 
         if self.verbose:
             progress_bar = tqdm(
-                range(n_features), ascii=True, ncols= 100,
+                range(splitter.n_features), ascii=True, ncols= 100,
                 desc=f'Fitting {self.__class__.__name__}', 
                 )
-        for feature in range(n_features):
-            sorted_idx = np.argsort(X[:, feature])
-            X_sorted, y_sorted, weights_sorted = ( 
-                X[sorted_idx, feature], y[sorted_idx], sample_weight[sorted_idx]
-                )
-            for i in range(self.min_samples_leaf, n_samples - self.min_samples_leaf):
-                if i < self.min_samples_split or X_sorted[i] == X_sorted[i - 1]:
-                    continue
-                left_mask = sorted_idx[:i]
-                right_mask = sorted_idx[i:]
-                if len(left_mask) < self.min_samples_leaf or len(
-                        right_mask) < self.min_samples_leaf:
-                    continue
-
-                left_value = np.average(y_sorted[:i], weights=weights_sorted[:i])
-                right_value = np.average(y_sorted[i:], weights=weights_sorted[i:])
-                error = (np.sum(weights_sorted[:i] * ((y_sorted[:i] - left_value) ** 2)) +
-                         np.sum(weights_sorted[i:] * ((y_sorted[i:] - right_value) ** 2)))
-
-                if error < min_error:
-                    min_error = error
-                    self.split_feature_ = feature
-                    self.split_value_ = X_sorted[i - 1]
-                    self.left_value_ = left_value
-                    self.right_value_ = right_value
-                    self.feature_importances_[feature] += min_error - error
-            
-            if self.verbose:
-                progress_bar.update(1)
-
-        if self.verbose:
+        split, self.feature_importances_ = splitter.regression_split(
+            y, sample_weight, min_samples_split=self.min_samples_split, 
+            min_samples_leaf=self.min_samples_leaf, progress_bar=progress_bar
+            )
+        if progress_bar is not None:
             progress_bar.close()
+            
+        if split is not None: 
+            (self.split_feature_, self.split_value_, 
+             self.left_value_, self.right_value_) = split 
                 
         self.fitted_ = True
 
@@ -453,6 +626,12 @@ class DecisionStumpClassifier(BaseClass, StandardEstimator):
         ensures that each leaf has at least `min_samples_leaf` samples, which
         helps prevent the tree from overfitting.
         
+    max_bins : int, optional
+        If set, features are discretized into at most `max_bins` quantile bins 
+        and only the bin edges are evaluated as thresholds, which makes the 
+        split search O(max_bins) per feature. If None (default), all distinct 
+        feature values are candidate thresholds.
+        
     verbose : int, default=False
         Controls the verbosity when fitting.
 
@@ -493,9 +672,11 @@ class DecisionStumpClassifier(BaseClass, StandardEstimator):
     It does not handle multi-class classification and does not support more advanced
     tree-building methods that consider information gain or Gini impurity.
     """
-    def __init__(self, min_samples_split=2, min_samples_leaf=1, verbose=False):
+    def __init__(self, min_samples_split=2, min_samples_leaf=1, max_bins=None, 
+                 verbose=False):
         self.min_samples_split = min_samples_split
         self.min_samples_leaf = min_samples_leaf
+        self.max_bins = max_bins 
         self.verbose=verbose
         self.split_feature_ = None
         self.split_value_ = None
@@ -512,7 +693,9 @@ class DecisionStumpClassifier(BaseClass, StandardEstimator):
         calculating the error as the negative of the weighted sum of correct 
         classifications in both left and right groups formed by the threshold. 
         The goal is to maximize the number of correct predictions by selecting 
-        the optimal split.
+        the optimal split. Per-class weights are accumulated along each sorted 
+        feature (or over its bins when `max_bins` is set), so each candidate 
+        threshold is scored without rescanning the data.
     
         .. math::
             error = - \left( \sum_{i \in \text{{left}}}w_i(y_i = \text{{left\_class}}) + 
@@ -563,45 +746,35 @@ class DecisionStumpClassifier(BaseClass, StandardEstimator):
         the estimator in error messages and validations.
         """
         X, y = check_X_y(X, y, estimator=self)
-        min_error = float('inf')
-        n_samples, n_features = X.shape
-    
         sample_weight = validate_fit_weights(y, sample_weight ) 
-        if self.verbose:
-            progress_bar = tqdm(range(n_features), ascii=True, ncols= 100,
-                desc=f'Fitting {self.__class__.__name__}' )
-            
-        for feature in range(n_features):
-            thresholds = np.unique(X[:, feature])
-            for threshold in thresholds:
-                left_mask = X[:, feature] <= threshold
-                right_mask = ~left_mask
-    
-                if np.sum(left_mask) < self.min_samples_leaf or np.sum(
-                        right_mask) < self.min_samples_leaf:
-                    continue
-    
-                left_class = np.bincount(y[left_mask], weights=sample_weight[left_mask]).argmax()
-                right_class = np.bincount(y[right_mask], weights=sample_weight[right_mask]).argmax()
-    
-                error = - (
-                    np.sum(sample_weight[left_mask] * (y[left_mask] == left_class)) + 
-                    np.sum(sample_weight[right_mask] * (y[right_mask] == right_class))
-                )
+        splitter = _StumpSplitter(X, max_bins=self.max_bins)
+        
+        return self._fit_splitter(splitter, y, sample_weight)
     
-                if error < min_error:
-                    min_error = error
-                    self.split_feature_ = feature
-                    self.split_value_ = threshold
-                    self.left_class_ = left_class
-                    self.right_class_ = right_class
-            
-            if self.verbose:
-                progress_bar.update(1)
-
+    def _fit_splitter(self, splitter, y, sample_weight=None):
+        """
+        Fit the stump from a prepared :class:`_StumpSplitter`, sharing the 
+        sorted or binned features with other stumps fitted on the same `X`.
+        """
+        if sample_weight is None: 
+            sample_weight = np.ones(splitter.n_samples)
+        classes, y_encoded = np.unique(y, return_inverse=True)
+        
+        progress_bar = None 
         if self.verbose:
+            progress_bar = tqdm(range(splitter.n_features), ascii=True, ncols= 100,
+                desc=f'Fitting {self.__class__.__name__}' )
+        split = splitter.classification_split(
+            y_encoded, len(classes), sample_weight, 
+            min_samples_leaf=self.min_samples_leaf, progress_bar=progress_bar
+            )
+        if progress_bar is not None:
             progress_bar.close()
             
+        if split is not None: 
+            self.split_feature_, self.split_value_ = split[:2]
+            self.left_class_, self.right_class_ = classes[list(split[2:])]
+            
         self.fitted_ = True
         return self
 
@@ -737,6 +910,10 @@ class _GradientBoostingClassifier:
         The number of boosting stages to be run.
     learning_rate : float
         Learning rate shrinks the contribution of each tree.
+    max_bins : int, optional
+        If set, features are binned once into at most `max_bins` quantile 
+        bins and every stage searches splits over the bin histograms. 
+        Otherwise the features are sorted once and reused by every stage.
     estimators_ : list of DecisionStumpRegressor
         The collection of fitted sub-estimators.
 
@@ -782,9 +959,10 @@ class _GradientBoostingClassifier:
     and ranking problems.
     """
 
-    def __init__(self, n_estimators=100, learning_rate=1.0):
+    def __init__(self, n_estimators=100, learning_rate=1.0, max_bins=None):
         self.n_estimators = n_estimators
         self.learning_rate = learning_rate
+        self.max_bins = max_bins
         self.estimators_ = []
 
     def fit(self, X, y):
@@ -803,18 +981,23 @@ class _GradientBoostingClassifier:
         y = np.where(y == np.unique(y)[0], -1, 1)
 
         F_m = np.zeros(len(y))
-
+        # Sort (or bin) the features once for all boosting stages.
+        splitter = _StumpSplitter(X, max_bins=self.max_bins)
+        self.estimators_ = []
+        
         for m in range(self.n_estimators):
             # Compute pseudo-residuals
             residuals = -1 * y * self._sigmoid(-y * F_m)
 
             # Fit a decision stump to the pseudo-residuals
-            stump = DecisionStumpRegressor()
-            stump.fit(X, residuals)
+            stump = DecisionStumpRegressor(max_bins=self.max_bins)
+            stump._fit_splitter(splitter, residuals)
 
             # Update the model
             F_m += self.learning_rate * stump.predict(X)
             self.estimators_.append(stump)
+            
+        return self 
 
     def predict_proba(self, X):
         """
@@ -887,6 +1070,11 @@ class _GradientBoostingRegressor:
     max_depth : int, default=1
         The maximum depth of the individual regression estimators.
         
+    max_bins : int, optional
+        If set, features are binned once into at most `max_bins` quantile 
+        bins and every stage searches splits over the bin histograms. 
+        Otherwise the features are sorted once and reused by every stage.
+        
     Attributes
     ----------
     estimators_ : list of DecisionStumpRegressor
@@ -937,10 +1125,11 @@ class _GradientBoostingRegressor:
     in predictive modeling and risk assessment applications.
     """
 
-    def __init__(self, n_estimators=100, eta0=1.0, max_depth=1):
+    def __init__(self, n_estimators=100, eta0=1.0, max_depth=1, max_bins=None):
         self.n_estimators = n_estimators
         self.eta0 = eta0
         self.max_depth=max_depth
+        self.max_bins = max_bins
 
     def fit(self, X, y):
         """
@@ -986,14 +1175,17 @@ class _GradientBoostingRegressor:
 
         # Initialize the prediction to zero
         F_m = np.zeros(y.shape)
+        # Sort (or bin) the features once for all boosting stages.
+        splitter = _StumpSplitter(X, max_bins=self.max_bins)
+        self.estimators_ = []
 
         for m in range(self.n_estimators):
             # Compute residuals
             residuals = y - F_m
 
             # # Fit a regression tree to the negative gradient
-            tree = DecisionStumpRegressor(max_depth=self.max_depth)
-            tree.fit(X, residuals)
+            tree = DecisionStumpRegressor(max_bins=self.max_bins)
+            tree._fit_splitter(splitter, residuals)
 
             # Update the model predictions
             F_m += self.eta0 * tree.predict(X)
@@ -9,6 +9,7 @@ for hybrid boosting approaches in classification and regression tasks.
 from __future__ import annotations 
 import numpy as np
 from tqdm import tqdm 
+from scipy.sparse import issparse
 from sklearn.base import BaseEstimator, ClassifierMixin, RegressorMixin
 from sklearn.ensemble import GradientBoostingRegressor, GradientBoostingClassifier
 from sklearn.metrics  import  mean_squared_error
@@ -16,6 +17,7 @@ from sklearn.tree import DecisionTreeRegressor, DecisionTreeClassifier
 
 from ..tools.validator import check_X_y, get_estimator_name, check_array 
 from ..tools.validator import check_is_fitted
+from .util import _bin_tree_inputs, _unbin_tree_thresholds
 
 __all__=[
     "BoostingTreeRegressor","BoostingTreeClassifier",
@@ -154,6 +156,19 @@ class BoostingTreeRegressor(BaseEstimator, RegressorMixin):
         Complexity parameter used for Minimal Cost-Complexity Pruning. The subtree 
         with the largest cost complexity that is smaller than ccp_alpha will be chosen.
         
+    tree_method : {"exact", "hist"}, default="exact"
+        The tree construction algorithm. "exact" fits every tree on the raw 
+        feature values. "hist" bins each feature once into at most 
+        `max_bins` quantile bins before the boosting loop and fits every 
+        tree on the same binned matrix, which is much faster on large 
+        datasets. Thresholds are mapped back to raw values, so prediction 
+        is unchanged. Feature subsampling is still controlled by 
+        `max_features`. Sparse input is not supported with "hist".
+
+    max_bins : int, default=255
+        The maximum number of bins per feature when `tree_method="hist"`.
+        Must be between 2 and 256.
+        
     verbose : int, default=0
         Controls the verbosity when fitting and predicting.
     
@@ -163,6 +178,9 @@ class BoostingTreeRegressor(BaseEstimator, RegressorMixin):
         The collection of fitted sub-estimators.
     initial_prediction_ : float
         The initial prediction (mean of y).
+    bin_edges_ : list of ndarray
+        Upper bin thresholds of each feature, only set when 
+        `tree_method="hist"`.
 
     Examples
     --------
@@ -221,6 +239,8 @@ class BoostingTreeRegressor(BaseEstimator, RegressorMixin):
         max_leaf_nodes=None, 
         min_impurity_decrease=0.,
         ccp_alpha=0., 
+        tree_method="exact", 
+        max_bins=255, 
         verbose=False 
         ):
         self.n_estimators = n_estimators
@@ -238,6 +258,8 @@ class BoostingTreeRegressor(BaseEstimator, RegressorMixin):
         self.max_leaf_nodes = max_leaf_nodes 
         self.min_impurity_decrease = min_impurity_decrease
         self.ccp_alpha = ccp_alpha 
+        self.tree_method = tree_method 
+        self.max_bins = max_bins 
         self.verbose=verbose 
 
     def _loss_derivative(self, y, y_pred):
@@ -313,6 +335,7 @@ class BoostingTreeRegressor(BaseEstimator, RegressorMixin):
         self.estimators_ = []
         self.initial_prediction_ = np.mean(y)
         y_pred = np.full(y.shape, self.initial_prediction_)
+        X = self._check_tree_method(X)
         
         if self.verbose:
             progress_bar = tqdm(range(self.n_estimators), ascii=True, ncols= 100,
@@ -343,6 +366,8 @@ class BoostingTreeRegressor(BaseEstimator, RegressorMixin):
             prediction = tree.predict(X)
             
             y_pred += self.eta0 * prediction
+            if self.tree_method == "hist": 
+                _unbin_tree_thresholds(tree, self.bin_edges_)
             self.estimators_.append(tree)
             
             if self.verbose: 
@@ -353,6 +378,22 @@ class BoostingTreeRegressor(BaseEstimator, RegressorMixin):
             
         return self
 
+    def _check_tree_method(self, X):
+        """
+        Return the matrix the trees are fitted on. With ``tree_method='hist'`` 
+        `X` is binned once and `bin_edges_` is stored to map the split 
+        thresholds back to raw values.
+        """
+        if self.tree_method == "exact":
+            return X
+        if self.tree_method != "hist":
+            raise ValueError("tree_method must be 'exact' or 'hist'."
+                             f" Got {self.tree_method!r}.")
+        if issparse(X):
+            raise ValueError("tree_method='hist' does not support sparse input.")
+        X, self.bin_edges_ = _bin_tree_inputs(X, self.max_bins)
+        return X
+
     def predict(self, X):
         """
         Predict target values for samples in `X`.
@@ -504,6 +545,19 @@ class BoostingTreeClassifier(BaseEstimator, ClassifierMixin):
         subtree with the largest cost complexity that is smaller than 
         `ccp_alpha` will be chosen.
         
+    tree_method : {"exact", "hist"}, default="exact"
+        The tree construction algorithm. "exact" fits every tree on the raw 
+        feature values. "hist" bins each feature once into at most 
+        `max_bins` quantile bins before the boosting loop and fits every 
+        tree on the same binned matrix, which is much faster on large 
+        datasets. Thresholds are mapped back to raw values, so prediction 
+        is unchanged. Feature subsampling is still controlled by 
+        `max_features`. Sparse input is not supported with "hist".
+
+    max_bins : int, default=255
+        The maximum number of bins per feature when `tree_method="hist"`.
+        Must be between 2 and 256.
+        
     verbose : int, default=0
         Controls the verbosity when fitting.
     
@@ -518,6 +572,10 @@ class BoostingTreeClassifier(BaseEstimator, ClassifierMixin):
     initial_prediction_ : float
         The initial prediction (log-odds) used for the logistic regression.
 
+    bin_edges_ : list of ndarray
+        Upper bin thresholds of each feature, only set when 
+        `tree_method="hist"`.
+
     Examples
     --------
     >>> from sklearn.datasets import make_classification
@@ -575,6 +633,8 @@ class BoostingTreeClassifier(BaseEstimator, ClassifierMixin):
         min_impurity_decrease=0.,
         class_weight=None, 
         ccp_alpha=0., 
+        tree_method="exact", 
+        max_bins=255, 
         verbose=0 
         ):
         self.n_estimators = n_estimators
@@ -591,6 +651,8 @@ class BoostingTreeClassifier(BaseEstimator, ClassifierMixin):
         self.min_impurity_decrease = min_impurity_decrease
         self.class_weight = class_weight 
         self.ccp_alpha = ccp_alpha 
+        self.tree_method = tree_method 
+        self.max_bins = max_bins 
         self.verbose=verbose 
         
 
@@ -640,6 +702,7 @@ class BoostingTreeClassifier(BaseEstimator, ClassifierMixin):
         self.estimators_ = []
         self.initial_prediction_ = np.log(np.mean(y) / (1 - np.mean(y)))
         y_pred = np.full(y.shape, self.initial_prediction_, dtype=float)
+        X = self._check_tree_method(X)
         
         if self.verbose:
             progress_bar = tqdm(range(self.n_estimators), ascii=True, ncols= 100,
@@ -670,6 +733,8 @@ class BoostingTreeClassifier(BaseEstimator, ClassifierMixin):
             
             # Update predictions
             y_pred += self.eta0 * (2 * prediction - 1)
+            if self.tree_method == "hist": 
+                _unbin_tree_thresholds(tree, self.bin_edges_)
             self.estimators_.append(tree)
  
             if self.verbose: 
@@ -680,6 +745,22 @@ class BoostingTreeClassifier(BaseEstimator, ClassifierMixin):
             
         return self
 
+    def _check_tree_method(self, X):
+        """
+        Return the matrix the trees are fitted on. With ``tree_method='hist'`` 
+        `X` is binned once and `bin_edges_` is stored to map the split 
+        thresholds back to raw values.
+        """
+        if self.tree_method == "exact":
+            return X
+        if self.tree_method != "hist":
+            raise ValueError("tree_method must be 'exact' or 'hist'."
+                             f" Got {self.tree_method!r}.")
+        if issparse(X):
+            raise ValueError("tree_method='hist' does not support sparse input.")
+        X, self.bin_edges_ = _bin_tree_inputs(X, self.max_bins)
+        return X
+
     def predict(self, X):
         """
         Predict class labels for samples in `X`.
@@ -118,7 +118,14 @@ class KMFClassifier(BaseKMF, ClassifierMixin):
          - 'mean_target': Mean target encoding based on target values provided 
            during fit. This assigns the mean of the target variable for each 
            category.
-           
+
+    batch_size : int, optional
+        Size of the mini-batches of the streaming mode of the featurizer. If 
+        set, the clustering uses `MiniBatchKMeans` and the projection 
+        `IncrementalPCA`, whose memory does not grow with the number of 
+        samples, for data sets of tens of millions of rows. None uses the 
+        full-batch `KMeans` and `PCA`.
+
     Notes
     -----
     - The effectiveness of the KMFClassifier depends on the choice of the base 
@@ -210,7 +217,8 @@ class KMFClassifier(BaseKMF, ClassifierMixin):
         algorithm='lloyd',
         estimator=None,
         to_sparse=False,
-        encoding=None 
+        encoding=None, 
+        batch_size=None
     ):
         super().__init__(
             n_clusters=n_clusters,
@@ -226,7 +234,8 @@ class KMFClassifier(BaseKMF, ClassifierMixin):
             algorithm=algorithm,
             estimator=estimator,
             to_sparse=to_sparse, 
-            encoding =encoding
+            encoding =encoding, 
+            batch_size=batch_size
         )
 
     def predict(self, X):
@@ -478,6 +487,13 @@ class KMFRegressor(BaseKMF, RegressorMixin):
           during fit. This assigns the mean of the target variable for each 
           category.
 
+    batch_size : int, optional
+        Size of the mini-batches of the streaming mode of the featurizer. If 
+        set, the clustering uses `MiniBatchKMeans` and the projection 
+        `IncrementalPCA`, whose memory does not grow with the number of 
+        samples, for data sets of tens of millions of rows. None uses the 
+        full-batch `KMeans` and `PCA`.
+
     Notes
     -----
     - The effectiveness of the KMFRegressor depends on the choice of the base 
@@ -568,7 +584,8 @@ class KMFRegressor(BaseKMF, RegressorMixin):
         algorithm='lloyd',
         estimator=None,
         to_sparse=False, 
-        encoding=None
+        encoding=None, 
+        batch_size=None
     ):
         super().__init__(
             n_clusters=n_clusters,
@@ -584,7 +601,8 @@ class KMFRegressor(BaseKMF, RegressorMixin):
             algorithm=algorithm,
             estimator=estimator,
             to_sparse=to_sparse,
-            encoding=encoding
+            encoding=encoding, 
+            batch_size=batch_size
         )
         
     def score(self, X, y, sample_weight=None):
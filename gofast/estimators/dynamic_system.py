@@ -8,15 +8,22 @@ machine learning techniques.
 """
 from __future__ import annotations 
 import numpy as np
+from joblib import Parallel, delayed
 from tqdm import tqdm 
 
-from sklearn.base import BaseEstimator, ClassifierMixin, RegressorMixin
+from sklearn.base import BaseEstimator, ClassifierMixin, RegressorMixin, clone
+from sklearn.linear_model import GammaRegressor, PoissonRegressor, TweedieRegressor
+from sklearn.linear_model import LogisticRegression, LogisticRegressionCV
+from sklearn.linear_model import PassiveAggressiveClassifier, Perceptron
+from sklearn.linear_model import RidgeClassifier, RidgeClassifierCV, SGDClassifier
+from sklearn.svm import LinearSVC
 from sklearn.utils import resample
 from sklearn.preprocessing import LabelBinarizer # noqa 
 from ..tools.validator import check_X_y, check_array 
 from ..tools.validator import check_is_fitted
 from ..tools.baseutils import normalizer 
-from .util import select_default_estimator, validate_memory_depth 
+from .util import lag_embedding, select_default_estimator
+from .util import validate_memory_depth 
 
 __all__= [
     "HammersteinWienerClassifier","HammersteinWienerRegressor",
@@ -86,6 +93,11 @@ class HammersteinWienerClassifier(BaseEstimator, ClassifierMixin):
         use softmax regression (e.g., 
         LogisticRegression with multi_class='multinomial').
 
+    dtype : data-type, default=None
+        Dtype of the lagged design matrix. ``np.float32`` halves the memory 
+        of the matrix handed to the linear block. If None, ``float64`` is 
+        used.
+
     verbose : int, default=False
         Controls the verbosity when fitting.
         
@@ -134,12 +146,14 @@ class HammersteinWienerClassifier(BaseEstimator, ClassifierMixin):
         nonlinearity_out='sigmoid', 
         memory_depth=5, 
         classifier=None, 
+        dtype=None, 
         verbose=False 
         ):
         self.classifier = classifier
         self.nonlinearity_in = nonlinearity_in
         self.nonlinearity_out = nonlinearity_out
         self.memory_depth = memory_depth
+        self.dtype = dtype 
         self.verbose = verbose 
         
     def _validate_parameters(self):
@@ -299,8 +313,11 @@ class HammersteinWienerClassifier(BaseEstimator, ClassifierMixin):
     
         Returns
         -------
-        X_transformed : array-like
-            The transformed input data.
+        X_lagged : ndarray of shape (n_samples - memory_depth, \
+                memory_depth * n_features)
+            The transformed and lagged input data. It is a read-only view 
+            built by :func:`~gofast.estimators.util.lag_embedding` unless the 
+            classifier modifies its input in place (``copy_X=False``).
     
         Raises
         ------
@@ -336,15 +353,11 @@ class HammersteinWienerClassifier(BaseEstimator, ClassifierMixin):
         self._validate_parameters()
         if self.verbose: 
             print("Start preprocessing X  and control Memory Depth...")
-        X_transformed = self.nonlinearity_in(X)
-        n_samples, n_features = X_transformed.shape
-        if n_samples <= self.memory_depth:
-            raise ValueError("Not enough samples to match the memory depth")
-        X_lagged = np.zeros((n_samples - self.memory_depth, self.memory_depth * n_features))
-        for i in range(self.memory_depth, n_samples):
-            X_lagged[i - self.memory_depth, :] = ( 
-                X_transformed[i - self.memory_depth:i, :].flatten()
-                )
+        X_lagged = lag_embedding(
+            self.nonlinearity_in(X), self.memory_depth, 
+            dtype=self.dtype or np.float64, 
+            copy=getattr(self.classifier, "copy_X", True) is False 
+            )
         if self.verbose: 
             print("Preprocess X and Memory depth control completed.")
             
@@ -405,7 +418,10 @@ class HammersteinWienerClassifier(BaseEstimator, ClassifierMixin):
         """
         check_is_fitted(self, 'fitted_')
         X = check_array(X)
-        X_lagged = self._preprocess_data(X)
+        return self._predict_lagged(self._preprocess_data(X))
+    
+    def _predict_lagged(self, X_lagged):
+        """Predict class labels from an already lagged design matrix."""
         y_linear = self.classifier.predict(X_lagged)
         y_pred = self.nonlinearity_out(y_linear)
         
@@ -536,6 +552,11 @@ class HammersteinWienerRegressor(BaseEstimator, RegressorMixin):
         If a string is provided, it must be "LinearRegression". The choice of 
         linear model influences how the system's linear dynamics are captured.
         
+    dtype : data-type, default=None
+        Dtype of the lagged design matrix. ``np.float32`` halves the memory 
+        of the matrix handed to the linear block. If None, ``float64`` is 
+        used.
+
     random_state : int, RandomState instance or None, default=None
         Controls the randomness of the estimator. Pass an int for reproducible 
         output across multiple function calls.
@@ -601,6 +622,7 @@ class HammersteinWienerRegressor(BaseEstimator, RegressorMixin):
         nonlinearity_out='tanh', 
         memory_depth=5, 
         linear_model=None, 
+        dtype=None, 
         random_state=None, 
         verbose=False 
         ):
@@ -608,6 +630,7 @@ class HammersteinWienerRegressor(BaseEstimator, RegressorMixin):
         self.nonlinearity_out = nonlinearity_out
         self.linear_model = linear_model
         self.memory_depth = memory_depth
+        self.dtype = dtype 
         self.random_state = random_state
         self.verbose = verbose 
         
@@ -697,9 +720,12 @@ class HammersteinWienerRegressor(BaseEstimator, RegressorMixin):
     
         Returns
         -------
-        X_lagged : array-like of shape (n_samples - memory_depth, memory_depth * n_features)
+        X_lagged : ndarray of shape (n_samples - memory_depth, \
+                memory_depth * n_features)
             The transformed and lagged input data, ready to be used for fitting 
-            the linear model.
+            the linear model. It is a read-only view built by 
+            :func:`~gofast.estimators.util.lag_embedding` unless the linear 
+            model modifies its input in place (``copy_X=False``).
     
         Raises
         ------
@@ -739,16 +765,11 @@ class HammersteinWienerRegressor(BaseEstimator, RegressorMixin):
         self.memory_depth = validate_memory_depth(
             X, self.memory_depth,default_depth="auto" )
         
-        X_transformed = self.nonlinearity_in(X)
-        n_samples, n_features = X_transformed.shape
-        if n_samples <= self.memory_depth:
-            raise ValueError("Not enough samples to match the memory depth")
-        X_lagged = np.zeros(
-            (n_samples - self.memory_depth, self.memory_depth * n_features))
-        for i in range(self.memory_depth, n_samples):
-            X_lagged[i - self.memory_depth, :] = ( 
-                X_transformed[i - self.memory_depth:i, :].flatten()
-                )
+        X_lagged = lag_embedding(
+            self.nonlinearity_in(X), self.memory_depth, 
+            dtype=self.dtype or np.float64, 
+            copy=getattr(self.linear_model, "copy_X", True) is False 
+            )
         if self.verbose :
             print(" Preprocess X and Memory depth control completed.")
             
@@ -832,6 +853,7 @@ class HammersteinWienerRegressor(BaseEstimator, RegressorMixin):
             self.linear_model.fit(X_lagged, y_adjusted)
 
         self.fitted_ = True
+        self._reset_stream(X.shape[1])
         if self.verbose :
             print(" Fitting Hammerstein Wiener Regressor completed. ")
             
@@ -898,10 +920,13 @@ class HammersteinWienerRegressor(BaseEstimator, RegressorMixin):
         """
         check_is_fitted(self, 'fitted_')
         X = check_array(X)
-        X_lagged = self._preprocess_data(X)
+        return self._predict_lagged(self._preprocess_data(X))
+    
+    def _predict_lagged(self, X_lagged):
+        """Predict values from an already lagged design matrix."""
         y_linear = self.linear_model.predict(X_lagged)
         y_pred_transformed = self.nonlinearity_out(y_linear)
-        n_samples = X.shape[0]
+        n_samples = X_lagged.shape[0] + self.memory_depth
         y_pred = np.zeros(n_samples)
         y_pred[self.memory_depth:] = y_pred_transformed
         if self.memory_depth > 0:
@@ -909,6 +934,104 @@ class HammersteinWienerRegressor(BaseEstimator, RegressorMixin):
                 y_pred_transformed) > 0 else 0
             y_pred[:self.memory_depth] = default_prediction
         return y_pred
+    
+    def update(self, X):
+        """
+        Push new samples into the streaming memory without predicting.
+    
+        The model keeps a ring buffer of the last `memory_depth` transformed 
+        inputs. `update` is typically used to warm the buffer up with the 
+        recent history of a stream before calling :meth:`predict_step`.
+    
+        Parameters
+        ----------
+        X : array-like of shape (n_features,) or (n_samples, n_features)
+            One sample or a chunk of consecutive samples, oldest first.
+    
+        Returns
+        -------
+        self : object
+            Returns self.
+    
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from gofast.estimators.dynamic_system import HammersteinWienerRegressor
+        >>> X, y = np.random.rand(100, 2), np.random.rand(100)
+        >>> hw = HammersteinWienerRegressor(memory_depth=5).fit(X, y)
+        >>> hw.update(X[-5:]).predict_step(np.random.rand(2))
+        """
+        check_is_fitted(self, 'fitted_')
+        X = np.asarray(X, dtype=float).reshape(-1, self._stream_buffer.shape[1])
+        # Older samples would be overwritten anyway.
+        for x in self.nonlinearity_in(X[-self.memory_depth:]):
+            self._push(x)
+        return self
+    
+    def predict_step(self, x):
+        """
+        Predict the output for one incoming sample of a stream.
+    
+        The prediction for sample ``t`` only depends on the `memory_depth` 
+        previous samples, which are read from the ring buffer, so the cost 
+        is O(memory_depth * n_features) regardless of the length of the 
+        stream. `x` is then pushed into the buffer for the next step. 
+        Feeding the rows of ``X`` one by one gives the same values as 
+        ``predict(X)`` once the buffer is full.
+    
+        Parameters
+        ----------
+        x : array-like of shape (n_features,)
+            The new sample.
+    
+        Returns
+        -------
+        y_pred : float
+            The predicted value, or ``nan`` while fewer than `memory_depth` 
+            samples have been seen since fitting (see :meth:`update`).
+    
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from gofast.estimators.dynamic_system import HammersteinWienerRegressor
+        >>> X, y = np.random.rand(100, 2), np.random.rand(100)
+        >>> hw = HammersteinWienerRegressor(memory_depth=5).fit(X[:80], y[:80])
+        >>> y_stream = [hw.predict_step(x) for x in X[80:]]
+        """
+        check_is_fitted(self, 'fitted_')
+        x = np.asarray(x, dtype=float).ravel()
+        if self._stream_count < self.memory_depth:
+            y_pred = np.nan
+        else:
+            # The window is a contiguous slice of the doubled buffer.
+            window = self._stream_buffer[
+                self._stream_pos: self._stream_pos + self.memory_depth].ravel()
+            if _is_identity_linear(self.linear_model):
+                y_linear = (window @ self.linear_model.coef_ 
+                            + np.ravel(self.linear_model.intercept_)[0])
+            else:
+                y_linear = self.linear_model.predict(window[np.newaxis])[0]
+            y_pred = float(self.nonlinearity_out(y_linear))
+        
+        self._push(self.nonlinearity_in(x))
+        return y_pred
+    
+    def _reset_stream(self, n_features):
+        """Clear the ring buffer used by :meth:`predict_step`."""
+        # Each sample is written twice, at ``pos`` and ``pos + memory_depth``, 
+        # so the last `memory_depth` samples are always a contiguous slice.
+        self._stream_buffer = np.zeros(
+            (2 * self.memory_depth, n_features), dtype=self.dtype or np.float64)
+        self._stream_pos = 0
+        self._stream_count = 0
+    
+    def _push(self, x_transformed):
+        """Write one transformed sample into the ring buffer."""
+        pos = self._stream_pos
+        self._stream_buffer[pos] = x_transformed
+        self._stream_buffer[pos + self.memory_depth] = x_transformed
+        self._stream_pos = (pos + 1) % self.memory_depth
+        self._stream_count += 1
 
 class EnsembleHWClassifier(BaseEstimator, ClassifierMixin):
     """
@@ -946,7 +1069,17 @@ class EnsembleHWClassifier(BaseEstimator, ClassifierMixin):
         The base classifier to be used in the ensemble. If a string is provided, 
         it must be "LogisticRegression". The classifier should have fit and 
         predict methods.
-        
+    dtype : data-type, default=None
+        Dtype of the lagged design matrices of the base models. See 
+        :class:`HammersteinWienerClassifier`.
+    warm_start : bool, default=False
+        When set to True, reuse the base classifiers of the previous call 
+        to fit and only fit the ``n_estimators - len(base_classifiers_)`` 
+        missing ones.
+    n_jobs : int, default=None
+        The number of jobs used to fit the base classifiers and, when their 
+        coefficients cannot be stacked, to compute their predictions. 
+        `None` means 1 unless in a `joblib.parallel_backend` context.
     random_state : int, RandomState instance or None, default=None
         Controls the randomness of the estimator. Pass an int for reproducible 
         output across multiple function calls.
@@ -960,6 +1093,13 @@ class EnsembleHWClassifier(BaseEstimator, ClassifierMixin):
     weights_ : list
         Weights of each base classifier, determining their influence on the 
         final outcome.
+    stacked_coef_ : ndarray of shape (n_lagged_features, n_estimators * k) or None
+        Coefficients of the linear base classifiers stacked column-wise, 
+        with ``k`` the number of rows of their ``coef_``, so that all the 
+        members are evaluated with a single matrix product. None when the 
+        base classifiers are not linear.
+    stacked_intercept_ : ndarray of shape (n_estimators * k,) or None
+        Intercepts matching `stacked_coef_`.
 
     The Hammerstein-Wiener Ensemble Classifier utilizes the following models and 
     computations:
@@ -1035,6 +1175,9 @@ class EnsembleHWClassifier(BaseEstimator, ClassifierMixin):
         nonlinearity_out='sigmoid', 
         memory_depth=5, 
         classifier=None,
+        dtype=None, 
+        warm_start=False, 
+        n_jobs=None, 
         random_state=None, 
         verbose=False 
         ):
@@ -1044,6 +1187,9 @@ class EnsembleHWClassifier(BaseEstimator, ClassifierMixin):
         self.nonlinearity_out = nonlinearity_out
         self.memory_depth = memory_depth
         self.classifier = classifier
+        self.dtype = dtype 
+        self.warm_start = warm_start 
+        self.n_jobs = n_jobs 
         self.random_state = random_state
         self.verbose=verbose 
 
@@ -1109,18 +1255,14 @@ class EnsembleHWClassifier(BaseEstimator, ClassifierMixin):
         True
         """
         X, y = check_X_y(X, y, estimator=self)
-        self.base_classifiers_ = []
-        self.weights_ = []
-        y_pred = np.zeros(len(y))
+        if not self.warm_start or not hasattr(self, 'base_classifiers_'):
+            self.base_classifiers_ = []
+            self.weights_ = []
+        n_new = _check_n_new_estimators(
+            self.n_estimators, len(self.base_classifiers_))
         
-        if self.verbose: 
-            progress_bar = tqdm(
-                total=len(self.n_estimators), 
-                ascii=True, 
-                desc=f'Fitting {self.__class__.__name__}',
-                ncols=100
-            )
-        for _ in range(self.n_estimators):
+        tasks = []
+        for _ in range(n_new):
             X_resampled, y_resampled = resample(
                 X, y, n_samples=len(y), random_state=self.random_state, 
                 stratify=y, replace=True)
@@ -1132,27 +1274,33 @@ class EnsembleHWClassifier(BaseEstimator, ClassifierMixin):
                 sample_weight_resampled = None
     
             base_classifier = HammersteinWienerClassifier(
-                classifier=self.classifier, 
+                classifier=clone(self.classifier) if hasattr(
+                    self.classifier, "get_params") else self.classifier, 
                 nonlinearity_in=self.nonlinearity_in, 
                 nonlinearity_out=self.nonlinearity_out, 
-                memory_depth=self.memory_depth)
-            base_classifier.fit(
-                X_resampled, y_resampled, sample_weight=sample_weight_resampled)
-    
-            y_pred_single = base_classifier.predict(X)
+                memory_depth=self.memory_depth, 
+                dtype=self.dtype)
+            tasks.append(delayed(_fit_member)(
+                base_classifier, X_resampled, y_resampled, 
+                sample_weight_resampled))
+            
+        new_classifiers = Parallel(n_jobs=self.n_jobs, prefer="threads")(tasks)
+        
+        # The members are independent, so they are scored after the 
+        # (parallel) fit against a single lag matrix of X.
+        X_lagged = new_classifiers[0]._preprocess_data(X) if n_new else None 
+        for base_classifier in tqdm(
+                new_classifiers, ascii=True, ncols=100, 
+                desc=f'Fitting {self.__class__.__name__}', 
+                disable=not self.verbose):
+            y_pred_single = base_classifier._predict_lagged(X_lagged)
             weighted_error = np.sum((y - y_pred_single) ** 2) / len(y)
-    
             weight = self.eta0 / (1 + weighted_error)
-            y_pred += weight * y_pred_single
     
             self.base_classifiers_.append(base_classifier)
             self.weights_.append(weight)
-            
-            if self.verbose: 
-                progress_bar.update (1)
         
-        if self.verbose: 
-            progress_bar.close () 
+        self._stack_coefficients()
     
         return self
     
@@ -1202,10 +1350,7 @@ class EnsembleHWClassifier(BaseEstimator, ClassifierMixin):
         """
         check_is_fitted(self, 'base_classifiers_')
         X = check_array(X)
-        y_pred = np.zeros(X.shape[0])
-    
-        for weight, base_classifier in zip(self.weights_, self.base_classifiers_):
-            y_pred += weight * base_classifier.predict(X)
+        y_pred = self._aggregate_predictions(X)
     
         return np.where(y_pred >= 0.5, 1, 0)
     
@@ -1256,15 +1401,55 @@ class EnsembleHWClassifier(BaseEstimator, ClassifierMixin):
         """
         check_is_fitted(self, 'base_classifiers_')
         X = check_array(X)
-        cumulative_prediction = np.zeros(X.shape[0])
-    
-        for weight, classifier in zip(self.weights_, self.base_classifiers_):
-            cumulative_prediction += weight * classifier.predict(X)
+        cumulative_prediction = self._aggregate_predictions(X)
     
         proba_positive_class = 1 / (1 + np.exp(-cumulative_prediction))
         proba_negative_class = 1 - proba_positive_class
     
         return np.vstack((proba_negative_class, proba_positive_class)).T
+    
+    def _stack_coefficients(self):
+        """Stack the coefficients of linear base classifiers, if possible."""
+        self.stacked_coef_ = self.stacked_intercept_ = None 
+        models = [m.classifier for m in self.base_classifiers_]
+        if not models or not all(
+                isinstance(m, _LINEAR_CLASSIFIERS) for m in models) or any(
+                not np.array_equal(m.classes_, models[0].classes_) 
+                for m in models): 
+            return 
+        self.stacked_coef_ = np.vstack([m.coef_ for m in models]).T
+        self.stacked_intercept_ = np.concatenate(
+            [np.ravel(m.intercept_) for m in models])
+        
+    def _aggregate_predictions(self, X):
+        """Weighted sum of the base predictions, sharing one lag matrix."""
+        if not self.base_classifiers_: 
+            return np.zeros(X.shape[0])
+        first = self.base_classifiers_[0]
+        X_lagged = first._preprocess_data(X)
+        weights = np.asarray(self.weights_)
+        if self.stacked_coef_ is None: 
+            predictions = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+                delayed(m._predict_lagged)(X_lagged) 
+                for m in self.base_classifiers_)
+            return weights @ np.asarray(predictions, dtype=float)
+        
+        # Same decision rule as the linear classifiers' predict, for all 
+        # members at once. BLAS cannot use the overlapping strides of the 
+        # lag view, so it is materialized once for the product.
+        classes = first.classifier.classes_
+        decision = (np.ascontiguousarray(X_lagged) @ self.stacked_coef_ + self.stacked_intercept_
+                    ).reshape(X_lagged.shape[0], len(weights), -1)
+        if decision.shape[2] == 1:
+            indices = (decision[:, :, 0] > 0).astype(int)
+        else:
+            indices = decision.argmax(axis=2)
+        y_linear = first.nonlinearity_out(classes[indices])
+        
+        y_pred = np.empty(X.shape[0])
+        y_pred[first.memory_depth:] = np.where(y_linear >= 0.5, 1, 0) @ weights
+        y_pred[:first.memory_depth] = (classes[0] >= 0.5) * weights.sum()
+        return y_pred
 
 class EnsembleHWRegressor(BaseEstimator, RegressorMixin):
     """
@@ -1303,6 +1488,17 @@ class EnsembleHWRegressor(BaseEstimator, RegressorMixin):
         The number of past time steps to consider in the model. This parameter 
         defines the 'memory' of the system, enabling the model to use past 
         information for current predictions.
+    dtype : data-type, default=None
+        Dtype of the lagged design matrices of the base models. See 
+        :class:`HammersteinWienerRegressor`.
+    warm_start : bool, default=False
+        When set to True, reuse the base regressors of the previous call 
+        to fit and only fit the ``n_estimators - len(base_regressors_)`` 
+        missing ones.
+    n_jobs : int, default=None
+        The number of jobs used to fit the base regressors and, when their 
+        coefficients cannot be stacked, to compute their predictions. 
+        `None` means 1 unless in a `joblib.parallel_backend` context.
     random_state : int, RandomState instance or None, default=None
         Controls the randomness of the estimator. Pass an int for reproducible 
         output across multiple function calls.
@@ -1314,6 +1510,15 @@ class EnsembleHWRegressor(BaseEstimator, RegressorMixin):
     weights_ : list
         Weights of each base regressor, determining their influence on the 
         final outcome.
+    stacked_coef_ : ndarray of shape (n_lagged_features, n_estimators) or None
+        Coefficients of the linear base regressors stacked column-wise, so 
+        that all the members are evaluated with a single matrix product. 
+        None when the base regressors are not linear models predicting 
+        ``X @ coef_ + intercept_`` (the generalized linear models, with a 
+        link function, are not), or when the ensemble is empty; the 
+        predictions of the members are then combined one by one.
+    stacked_intercept_ : ndarray of shape (n_estimators,) or None
+        Intercepts matching `stacked_coef_`.
 
     Notes 
     ------
@@ -1400,6 +1605,9 @@ class EnsembleHWRegressor(BaseEstimator, RegressorMixin):
         nonlinearity_out='identity', 
         memory_depth=5, 
         regressor=None,
+        dtype=None, 
+        warm_start=False, 
+        n_jobs=None, 
         random_state=None, 
         verbose=False 
         
@@ -1407,6 +1615,9 @@ class EnsembleHWRegressor(BaseEstimator, RegressorMixin):
         self.n_estimators = n_estimators
         self.eta0 = eta0
         self.regressor = regressor
+        self.dtype = dtype
+        self.warm_start = warm_start 
+        self.n_jobs = n_jobs 
         self.nonlinearity_in = nonlinearity_in
         self.nonlinearity_out = nonlinearity_out
         self.memory_depth = memory_depth
@@ -1445,18 +1656,14 @@ class EnsembleHWRegressor(BaseEstimator, RegressorMixin):
         combines their predictions to form the final model.
         """
         X, y = check_X_y(X, y, estimator=self)
-        self.base_regressors_ = []
-        self.weights_ = []
-        y_pred = np.zeros(len(y))
-    
-        if self.verbose: 
-            progress_bar = tqdm(
-                total=len(self.n_estimators), 
-                ascii=True, 
-                desc=f'Fitting {self.__class__.__name__}',
-                ncols=100
-                )
-        for _ in range(self.n_estimators):
+        if not self.warm_start or not hasattr(self, 'base_regressors_'):
+            self.base_regressors_ = []
+            self.weights_ = []
+        n_new = _check_n_new_estimators(
+            self.n_estimators, len(self.base_regressors_))
+    
+        tasks = []
+        for _ in range(n_new):
             X_resampled, y_resampled = resample(
                 X, y, n_samples=len(y), random_state=self.random_state, 
                 stratify=y if sample_weight is None else None, replace=True)
@@ -1468,28 +1675,34 @@ class EnsembleHWRegressor(BaseEstimator, RegressorMixin):
                 sample_weight_resampled = None
 
             base_regressor = HammersteinWienerRegressor(
-                linear_model=self.regressor,
+                linear_model=clone(self.regressor) if hasattr(
+                    self.regressor, "get_params") else self.regressor,
                 nonlinearity_in=self.nonlinearity_in, 
                 nonlinearity_out=self.nonlinearity_out, 
-                memory_depth=self.memory_depth
+                memory_depth=self.memory_depth, 
+                dtype=self.dtype
             )
-            base_regressor.fit(
-                X_resampled, y_resampled, sample_weight=sample_weight_resampled)
-
-            y_pred_single = base_regressor.predict(X)
+            tasks.append(delayed(_fit_member)(
+                base_regressor, X_resampled, y_resampled, 
+                sample_weight_resampled))
+            
+        new_regressors = Parallel(n_jobs=self.n_jobs, prefer="threads")(tasks)
+
+        # The members are independent, so they are scored after the 
+        # (parallel) fit against a single lag matrix of X.
+        X_lagged = new_regressors[0]._preprocess_data(X) if n_new else None 
+        for base_regressor in tqdm(
+                new_regressors, ascii=True, ncols=100, 
+                desc=f'Fitting {self.__class__.__name__}', 
+                disable=not self.verbose):
+            y_pred_single = base_regressor._predict_lagged(X_lagged)
             weighted_error = np.sum((y - y_pred_single) ** 2) / len(y)
-
             weight = self.eta0 / (1 + weighted_error)
-            y_pred += weight * y_pred_single
 
             self.base_regressors_.append(base_regressor)
             self.weights_.append(weight)
-            
-            if self.verbose: 
-                progress_bar.update (1)
         
-        if self.verbose: 
-            progress_bar.close () 
+        self._stack_coefficients()
 
         return self
 
@@ -1538,12 +1751,8 @@ class EnsembleHWRegressor(BaseEstimator, RegressorMixin):
         """
         check_is_fitted(self, 'base_regressors_')
         X = check_array(X)
-        y_pred = np.zeros(X.shape[0])
-
-        for weight, base_regressor in zip(self.weights_, self.base_regressors_):
-            y_pred += weight * base_regressor.predict(X)
-
-        return y_pred
+        
+        return self._aggregate_predictions(X)
 
     def decision_function(self, X):
         """
@@ -1591,13 +1800,71 @@ class EnsembleHWRegressor(BaseEstimator, RegressorMixin):
         """
         check_is_fitted(self, 'base_regressors_')
         X = check_array(X)
-        decision = np.zeros(X.shape[0])
-
-        for weight, base_regressor in zip(self.weights_, self.base_regressors_):
-            decision += weight * base_regressor.predict(X)
-
-        return decision
-
 
+        return self._aggregate_predictions(X)
+    
+    def _stack_coefficients(self):
+        """Stack the coefficients of linear base regressors, if possible."""
+        self.stacked_coef_ = self.stacked_intercept_ = None 
+        models = [m.linear_model for m in self.base_regressors_]
+        if not models or not all(_is_identity_linear(m) for m in models): 
+            return 
+        self.stacked_coef_ = np.column_stack([m.coef_ for m in models])
+        self.stacked_intercept_ = np.concatenate(
+            [np.ravel(m.intercept_) for m in models])
+        
+    def _aggregate_predictions(self, X):
+        """Weighted sum of the base predictions, sharing one lag matrix."""
+        if not self.base_regressors_: 
+            return np.zeros(X.shape[0])
+        first = self.base_regressors_[0]
+        X_lagged = first._preprocess_data(X)
+        weights = np.asarray(self.weights_)
+        if self.stacked_coef_ is None: 
+            predictions = Parallel(n_jobs=self.n_jobs, prefer="threads")(
+                delayed(m._predict_lagged)(X_lagged) 
+                for m in self.base_regressors_)
+            return weights @ np.asarray(predictions)
+        
+        # One product evaluates every member: column j holds the output of 
+        # the j-th base regressor. BLAS cannot use the overlapping strides 
+        # of the lag view, so it is materialized once for the product.
+        y_linear = first.nonlinearity_out(
+            np.ascontiguousarray(X_lagged) @ self.stacked_coef_ 
+            + self.stacked_intercept_)
+        y_pred = np.empty(X.shape[0])
+        y_pred[first.memory_depth:] = y_linear @ weights
+        # Warm-up samples get each member's mean prediction, as in predict.
+        y_pred[:first.memory_depth] = y_linear.mean(axis=0) @ weights
+        return y_pred
 
+# Linear classifiers whose predict is the class of highest 
+# ``X @ coef_.T + intercept_``.
+_LINEAR_CLASSIFIERS = (
+    LinearSVC, LogisticRegression, LogisticRegressionCV, 
+    PassiveAggressiveClassifier, Perceptron, RidgeClassifier, 
+    RidgeClassifierCV, SGDClassifier)
 
+def _is_identity_linear(model):
+    """
+    Whether the fitted regressor `model` predicts ``X @ coef_ + intercept_``.
+    
+    The generalized linear models apply their inverse link function to it, 
+    so they are excluded. 
+    """
+    return (np.ndim(getattr(model, "coef_", None)) == 1 
+            and np.size(getattr(model, "intercept_", None)) == 1 
+            and not isinstance(
+                model, (GammaRegressor, PoissonRegressor, TweedieRegressor)))
+
+def _check_n_new_estimators(n_estimators, n_fitted):
+    """Number of members still to fit, honouring `warm_start`."""
+    if n_estimators < n_fitted:
+        raise ValueError(
+            f"n_estimators={n_estimators} must be larger or equal to"
+            f" len(estimators_)={n_fitted} when warm_start==True")
+    return n_estimators - n_fitted
+
+def _fit_member(estimator, X, y, sample_weight=None):
+    """Fit one Hammerstein-Wiener member of an ensemble."""
+    return estimator.fit(X, y, sample_weight=sample_weight)
@@ -11,6 +11,7 @@ to improve generalizability and  robustness over a single estimator.
 from __future__ import annotations 
 import re  
 import numpy as np
+from joblib import Parallel, delayed
 from tqdm import tqdm 
 from sklearn.base import BaseEstimator, ClassifierMixin, RegressorMixin, clone
 from sklearn.pipeline import _name_estimators
@@ -80,6 +81,18 @@ class MajorityVoteClassifier(BaseEstimator, ClassifierMixin):
     verbose : bool, default=False
         If True, will print progress messages and use tqdm for progress display.
 
+    n_jobs : int, default=None
+        The number of jobs to run in parallel for fitting the members and 
+        collecting their predictions. ``None`` means 1 unless in a 
+        `joblib.parallel_backend` context; ``-1`` means using all processors.
+
+    backend : {'threads', 'processes'}, default='threads'
+        The joblib backend used to dispatch the members when `n_jobs` is 
+        not 1. 'threads' shares `X` and the fitted members without copies 
+        and suits estimators that release the GIL (most NumPy/SciPy based 
+        ones), while 'processes' runs each member in its own worker and 
+        suits pure-Python estimators.
+
     random_state : int, RandomState instance or None, optional, default=None
         Controls the randomness of the estimator. Pass an int for reproducible
         output across multiple function calls.
@@ -189,6 +202,8 @@ class MajorityVoteClassifier(BaseEstimator, ClassifierMixin):
         tie_breaking_strategy='random', 
         classifier_params=None, 
         verbose=False, 
+        n_jobs=None, 
+        backend='threads', 
         ):
         self.classifiers = classifiers
         self.weights = weights
@@ -200,6 +215,8 @@ class MajorityVoteClassifier(BaseEstimator, ClassifierMixin):
                                   is not None else {}
                                   )
         self.verbose = verbose
+        self.n_jobs = n_jobs
+        self.backend = backend
         self.classifier_names_ = {}
         
     def fit(self, X, y, sample_weight=None):
@@ -260,32 +277,15 @@ class MajorityVoteClassifier(BaseEstimator, ClassifierMixin):
         # Initialize random state for reproducibility
         self.random_state_ = check_random_state(self.random_state)
 
-        self.classifiers_ = []
-        
-        if self.verbose:
-            progress_bar = tqdm(total=len(self.classifiers), ascii=True, ncols=100, 
-                                desc=f'Fitting {self.__class__.__name__}', )
-            for name, clf in zip(
-                    self.classifier_names_.keys(), self.classifiers):
-                params = self.classifier_params.get(name, {})
-                fitted_clf = clone(clf).set_params(**params)
-                fitted_clf = fit_with_estimator(
-                    fitted_clf, X, self._labenc.transform(y),
-                    sample_weight=sample_weight 
-                    )
-                self.classifiers_.append(fitted_clf)
-                progress_bar.update(1)
-                
-            progress_bar.close() 
-        else:
-            for name, clf in zip(self.classifier_names_.keys(), self.classifiers):
-                params = self.classifier_params.get(name, {})
-                fitted_clf = clone(clf).set_params(**params)
-                fitted_clf = fit_with_estimator(
-                    fitted_clf,  X, self._labenc.transform(y), 
-                    sample_weight=sample_weight
-                    )
-                self.classifiers_.append(fitted_clf)
+        classifiers = [
+            clone(clf).set_params(**self.classifier_params.get(name, {}))
+            for name, clf in zip(self.classifier_names_.keys(), self.classifiers)
+        ]
+        self.classifiers_ = _fit_members(
+            classifiers, X, self._labenc.transform(y), sample_weight, 
+            n_jobs=self.n_jobs, backend=self.backend, verbose=self.verbose, 
+            desc=f'Fitting {self.__class__.__name__}'
+            )
         
         return self
     
@@ -339,8 +339,10 @@ class MajorityVoteClassifier(BaseEstimator, ClassifierMixin):
         if self.vote == 'proba':
             maj_vote = np.argmax(self.predict_proba(X), axis=1)
         else:
-            # Collect results from clf.predict
-            preds = np.asarray([clf.predict(X) for clf in self.classifiers_]).T
+            # Stack the labels of all classifiers, one column per classifier
+            preds = _stack_member_outputs(
+                self.classifiers_, X, n_jobs=self.n_jobs, backend=self.backend
+                ).T
             maj_vote = np.apply_along_axis(
                 self._tie_breaking(np.bincount, self.random_state_),
                 axis=1,
@@ -441,7 +443,10 @@ class MajorityVoteClassifier(BaseEstimator, ClassifierMixin):
         >>> y_proba = mv_clf.predict_proba(X_test)
         """
         check_is_fitted(self, 'classifiers_')
-        probas = np.asarray([clf.predict_proba(X) for clf in self.classifiers_])
+        probas = _stack_member_outputs(
+            self.classifiers_, X, method='predict_proba', n_jobs=self.n_jobs, 
+            backend=self.backend
+            )
         avg_proba = np.average(probas, axis=0, weights=self.weights)
     
         return avg_proba
@@ -553,6 +558,18 @@ class SimpleAverageRegressor(BaseEstimator, RegressorMixin):
         If True, will print progress messages and use `tqdm` for progress display
         during fitting.
 
+    n_jobs : int, default=None
+        The number of jobs to run in parallel for fitting the members and 
+        collecting their predictions. ``None`` means 1 unless in a 
+        `joblib.parallel_backend` context; ``-1`` means using all processors.
+
+    backend : {'threads', 'processes'}, default='threads'
+        The joblib backend used to dispatch the members when `n_jobs` is 
+        not 1. 'threads' shares `X` and the fitted members without copies 
+        and suits estimators that release the GIL (most NumPy/SciPy based 
+        ones), while 'processes' runs each member in its own worker and 
+        suits pure-Python estimators.
+
     estimator_params : dict, default=None
         Optional parameter settings for the base estimators. If given, each key
         should be the index of the estimator in the `base_estimators` list, and
@@ -607,12 +624,16 @@ class SimpleAverageRegressor(BaseEstimator, RegressorMixin):
         normalize_predictions=False, 
         estimator_params=None, 
         random_state=None, 
-        verbose=False
+        verbose=False, 
+        n_jobs=None, 
+        backend='threads', 
         ):
         self.base_estimators = base_estimators
         self.normalize_predictions = normalize_predictions
         self.random_state = random_state
         self.verbose = verbose
+        self.n_jobs = n_jobs
+        self.backend = backend
         self.estimator_params = estimator_params if estimator_params is not None else {}
 
     def fit(self, X, y, sample_weight=None):
@@ -657,23 +678,15 @@ class SimpleAverageRegressor(BaseEstimator, RegressorMixin):
      
         np.random.seed(self.random_state)
         
-        if self.verbose:
-            with tqdm(total=len(self.base_estimators), ncols =100,
-                      desc='Fitting {self.__class__.__name__}', ascii=True) as pbar:
-                for i, estimator in enumerate(self.base_estimators):
-                    params = self.estimator_params.get(i, {})
-                    estimator = clone(estimator).set_params(**params)
-                    estimator = fit_with_estimator(
-                        estimator, X, y, sample_weight=sample_weight)
-                    self.base_estimators[i] = estimator
-                    pbar.update(1)
-        else:
-            for i, estimator in enumerate(self.base_estimators):
-                params = self.estimator_params.get(i, {})
-                estimator = clone(estimator).set_params(**params)
-                estimator = fit_with_estimator(
-                    estimator, X, y, sample_weight=sample_weight)
-                self.base_estimators[i] = estimator
+        estimators = [
+            clone(estimator).set_params(**self.estimator_params.get(i, {}))
+            for i, estimator in enumerate(self.base_estimators)
+        ]
+        self.base_estimators[:] = _fit_members(
+            estimators, X, y, sample_weight, n_jobs=self.n_jobs, 
+            backend=self.backend, verbose=self.verbose, 
+            desc=f'Fitting {self.__class__.__name__}'
+            )
         
         self.fitted_ = True
         
@@ -715,14 +728,12 @@ class SimpleAverageRegressor(BaseEstimator, RegressorMixin):
         X = check_array(X, accept_large_sparse=True, accept_sparse=True,
                         to_frame=False)
         
-        predictions = np.array(
-            [estimator.predict(X) for estimator in self.base_estimators])
+        predictions = _stack_member_outputs(
+            self.base_estimators, X, n_jobs=self.n_jobs, backend=self.backend)
         
         if self.normalize_predictions:
-            scaler = MinMaxScaler()
-            predictions = np.array(
-                [scaler.fit_transform(pred[:, np.newaxis]).flatten() 
-                 for pred in predictions])
+            # Min-max scale each member's predictions, i.e. each row.
+            predictions = MinMaxScaler().fit_transform(predictions.T).T
         
         y_pred = np.mean(predictions, axis=0)
         
@@ -768,6 +779,18 @@ class SimpleAverageClassifier(BaseEstimator, ClassifierMixin):
         If True, will print progress messages and use `tqdm` for progress display
         during fitting.
 
+    n_jobs : int, default=None
+        The number of jobs to run in parallel for fitting the members and 
+        collecting their predictions. ``None`` means 1 unless in a 
+        `joblib.parallel_backend` context; ``-1`` means using all processors.
+
+    backend : {'threads', 'processes'}, default='threads'
+        The joblib backend used to dispatch the members when `n_jobs` is 
+        not 1. 'threads' shares `X` and the fitted members without copies 
+        and suits estimators that release the GIL (most NumPy/SciPy based 
+        ones), while 'processes' runs each member in its own worker and 
+        suits pure-Python estimators.
+
     classifier_params : dict, default=None
         Optional parameter settings for the base classifiers. If given, each key
         should be the index of the classifier in the `base_classifiers` list, and
@@ -812,12 +835,16 @@ class SimpleAverageClassifier(BaseEstimator, ClassifierMixin):
         base_classifiers, 
         classifier_params=None, 
         random_state=None, 
-        verbose=False
+        verbose=False, 
+        n_jobs=None, 
+        backend='threads', 
         ):
         self.base_classifiers = base_classifiers
         self.random_state = random_state
         self.classifier_params = classifier_params if classifier_params is not None else {}
         self.verbose = verbose
+        self.n_jobs = n_jobs
+        self.backend = backend
         
     def fit(self, X, y, sample_weight=None):
         """
@@ -843,22 +870,15 @@ class SimpleAverageClassifier(BaseEstimator, ClassifierMixin):
             sample_weight = validate_fit_weights(y, sample_weight)
         
         np.random.seed(self.random_state)
-        self.classifiers_ = []
-        if self.verbose:
-            with tqdm(total=len(self.base_classifiers), ncols =100,
-                      desc='Fitting {self.__class__.__name__}', ascii=True) as pbar:
-                for i, clf in enumerate(self.base_classifiers):
-                    params = self.classifier_params.get(i, {})
-                    clf = clone(clf).set_params(**params)
-                    clf= fit_with_estimator(clf, X, y, sample_weight)
-                    self.classifiers_.append(clf)
-                    pbar.update(1)
-        else:
-            for i, clf in enumerate(self.base_classifiers):
-                params = self.classifier_params.get(i, {})
-                clf = clone(clf).set_params(**params)
-                clf= fit_with_estimator(clf, X, y, sample_weight)
-                self.classifiers_.append(clf)
+        classifiers = [
+            clone(clf).set_params(**self.classifier_params.get(i, {}))
+            for i, clf in enumerate(self.base_classifiers)
+        ]
+        self.classifiers_ = _fit_members(
+            classifiers, X, y, sample_weight, n_jobs=self.n_jobs, 
+            backend=self.backend, verbose=self.verbose, 
+            desc=f'Fitting {self.__class__.__name__}'
+            )
 
         return self
 
@@ -929,7 +949,10 @@ class SimpleAverageClassifier(BaseEstimator, ClassifierMixin):
             The average predicted class probabilities.
         """
         # Get predicted probabilities from each base classifier
-        probas = np.array([clf.predict_proba(X) for clf in self.classifiers_])
+        probas = _stack_member_outputs(
+            self.classifiers_, X, method='predict_proba', n_jobs=self.n_jobs, 
+            backend=self.backend
+            )
         
         # Calculate the average predicted class probabilities
         avg_proba = np.mean(probas, axis=0)
@@ -1000,6 +1023,18 @@ class WeightedAverageRegressor(BaseEstimator, RegressorMixin):
         If True, will print progress messages and use `tqdm` for progress display
         during fitting.
 
+    n_jobs : int, default=None
+        The number of jobs to run in parallel for fitting the members and 
+        collecting their predictions. ``None`` means 1 unless in a 
+        `joblib.parallel_backend` context; ``-1`` means using all processors.
+
+    backend : {'threads', 'processes'}, default='threads'
+        The joblib backend used to dispatch the members when `n_jobs` is 
+        not 1. 'threads' shares `X` and the fitted members without copies 
+        and suits estimators that release the GIL (most NumPy/SciPy based 
+        ones), while 'processes' runs each member in its own worker and 
+        suits pure-Python estimators.
+
     Attributes
     ----------
     fitted_ : bool
@@ -1049,7 +1084,9 @@ class WeightedAverageRegressor(BaseEstimator, RegressorMixin):
         verbose=False, 
         optimizer=None, 
         scaler=None, 
-        cv=None
+        cv=None, 
+        n_jobs=None, 
+        backend='threads', 
         ):
         self.base_estimators = base_estimators
         self.weights = weights
@@ -1058,6 +1095,8 @@ class WeightedAverageRegressor(BaseEstimator, RegressorMixin):
         self.optimizer = optimizer
         self.scaler= scaler 
         self.cv = cv
+        self.n_jobs = n_jobs
+        self.backend = backend
 
     def fit(self, X, y, sample_weight=None):
         """
@@ -1137,28 +1176,11 @@ class WeightedAverageRegressor(BaseEstimator, RegressorMixin):
             self.weights = determine_weights(
                 self.base_estimators, X, y, cv=self.cv)
         
-        if self.verbose:
-            with tqdm(total=len(self.base_estimators),
-                      desc='Fitting estimators', ascii=True,
-                      ncols =100 ) as pbar:
-                for i, estimator in enumerate(self.base_estimators):
-                    if self.optimizer and self.cv is not None:
-                        estimator = optimize_hyperparams(
-                            estimator, X, y, optimizer=self.optimizer, 
-                            cv= self.cv 
-                            )
-                    estimator= fit_with_estimator(estimator, X, y, sample_weight)
-                    self.base_estimators[i] = estimator
-                    pbar.update(1)
-        else:
-            for i, estimator in enumerate(self.base_estimators):
-                if self.optimizer and self.cv:
-                    estimator = estimator = optimize_hyperparams(
-                        estimator, X, y, optimizer=self.optimizer, 
-                        cv= self.cv 
-                        )
-                estimator= fit_with_estimator(estimator, X, y, sample_weight)
-                self.base_estimators[i] = estimator
+        self.base_estimators[:] = _fit_members(
+            self.base_estimators, X, y, sample_weight, n_jobs=self.n_jobs, 
+            backend=self.backend, verbose=self.verbose, 
+            desc='Fitting estimators', optimizer=self.optimizer, cv=self.cv
+            )
         
         self.fitted_ = True
         
@@ -1238,7 +1260,8 @@ class WeightedAverageRegressor(BaseEstimator, RegressorMixin):
         elif self.scaler:
             X = self.scaler.transform(X)
     
-        predictions = np.array([estimator.predict(X) for estimator in self.base_estimators])
+        predictions = _stack_member_outputs(
+            self.base_estimators, X, n_jobs=self.n_jobs, backend=self.backend)
         weighted_predictions = np.average(predictions, axis=0, weights=self.weights)
         return weighted_predictions
     
@@ -1290,6 +1313,18 @@ class WeightedAverageClassifier(BaseEstimator, ClassifierMixin):
     verbose : bool, default=False
         Controls the verbosity when fitting and predicting.
 
+    n_jobs : int, default=None
+        The number of jobs to run in parallel for fitting the members and 
+        collecting their predictions. ``None`` means 1 unless in a 
+        `joblib.parallel_backend` context; ``-1`` means using all processors.
+
+    backend : {'threads', 'processes'}, default='threads'
+        The joblib backend used to dispatch the members when `n_jobs` is 
+        not 1. 'threads' shares `X` and the fitted members without copies 
+        and suits estimators that release the GIL (most NumPy/SciPy based 
+        ones), while 'processes' runs each member in its own worker and 
+        suits pure-Python estimators.
+
     Attributes
     ----------
     classifiers_ : list of fitted classifiers
@@ -1360,6 +1395,8 @@ class WeightedAverageClassifier(BaseEstimator, ClassifierMixin):
         cv=None,
         random_state=None, 
         verbose=False, 
+        n_jobs=None, 
+        backend='threads', 
         ):
         self.base_classifiers = base_classifiers
         self.weights = weights
@@ -1368,6 +1405,8 @@ class WeightedAverageClassifier(BaseEstimator, ClassifierMixin):
         self.cv = cv
         self.random_state = random_state
         self.verbose = verbose
+        self.n_jobs = n_jobs
+        self.backend = backend
             
     def fit(self, X, y, sample_weight=None):
         """
@@ -1452,25 +1491,11 @@ class WeightedAverageClassifier(BaseEstimator, ClassifierMixin):
                 self.base_classifiers, X, y, cv=self.cv, problem='classification'
             )
         
-        if self.verbose:
-            with tqdm(total=len(self.base_classifiers), desc='Fitting estimators',
-                      ascii=True, ncols=100) as pbar:
-                for i, classifier in enumerate(self.base_classifiers):
-                    if self.optimizer and self.cv:
-                        classifier = optimize_hyperparams(
-                            classifier, X, y, optimizer=self.optimizer, cv=self.cv
-                        )
-                    classifier = fit_with_estimator(classifier, X, y, sample_weight)
-                    self.base_classifiers[i] = classifier
-                    pbar.update(1)
-        else:
-            for i, classifier in enumerate(self.base_classifiers):
-                if self.optimizer and self.cv:
-                    classifier = optimize_hyperparams(
-                        classifier, X, y, optimizer=self.optimizer, cv=self.cv
-                    )
-                classifier = fit_with_estimator(classifier, X, y, sample_weight)
-                self.base_classifiers[i] = classifier
+        self.base_classifiers[:] = _fit_members(
+            self.base_classifiers, X, y, sample_weight, n_jobs=self.n_jobs, 
+            backend=self.backend, verbose=self.verbose, 
+            desc='Fitting estimators', optimizer=self.optimizer, cv=self.cv
+            )
         
         self.fitted_ = True
         
@@ -1548,12 +1573,12 @@ class WeightedAverageClassifier(BaseEstimator, ClassifierMixin):
         if self.scaler:
             X = self.scaler.transform(X)
         
-        weighted_sum = np.zeros((X.shape[0], len(
-            np.unique(self.base_classifiers[0].classes_))))
-
-        for clf, weight in zip(self.base_classifiers, self.weights):
-            probabilities = clf.predict_proba(X)
-            weighted_sum += weight * probabilities
+        probas = _stack_member_outputs(
+            self.base_classifiers, X, method='predict_proba', 
+            n_jobs=self.n_jobs, backend=self.backend
+            )
+        weighted_sum = np.tensordot(
+            np.asarray(self.weights, dtype=float), probas, axes=1)
 
         return np.argmax(weighted_sum, axis=1)
     
@@ -1638,7 +1663,10 @@ class WeightedAverageClassifier(BaseEstimator, ClassifierMixin):
             X = self.scaler.transform(X)
         
         # Collect predicted probabilities from each base classifier
-        probas = [clf.predict_proba(X) for clf in self.base_classifiers]
+        probas = _stack_member_outputs(
+            self.base_classifiers, X, method='predict_proba', 
+            n_jobs=self.n_jobs, backend=self.backend
+            )
         
         # Calculate the weighted average of predicted probabilities
         weighted_avg_proba = np.average(probas, axis=0, weights=self.weights)
@@ -1720,6 +1748,10 @@ class EnsembleClassifier(ClassifierMixin, BaseEnsemble):
         The number of jobs to run in parallel for both `fit` and `predict`. 
         None means 1 unless in a `joblib.parallel_backend` context.
         
+    backend : {'threads', 'processes'}, default=None
+        The joblib backend the bagging members are dispatched to when 
+        `n_jobs` is not 1. `None` keeps the scikit-learn default.
+        
     min_impurity_decrease : float, default=0.0
         A node will be split if this split induces a decrease of the impurity 
         greater than or equal to this value. Used to control tree growth.
@@ -1861,7 +1893,8 @@ class EnsembleClassifier(ClassifierMixin, BaseEnsemble):
         ccp_alpha=0.0,
         estimator=None,
         random_state=None,
-        verbose=False
+        verbose=False, 
+        backend=None
         ):
         super().__init__(
             n_estimators=n_estimators, 
@@ -1887,7 +1920,8 @@ class EnsembleClassifier(ClassifierMixin, BaseEnsemble):
             tol=tol,
             ccp_alpha=ccp_alpha,
             estimator =estimator, 
-            verbose=verbose
+            verbose=verbose, 
+            backend=backend
             )
         
     def predict_proba(self, X):
@@ -1988,7 +2022,8 @@ class EnsembleClassifier(ClassifierMixin, BaseEnsemble):
             accept_sparse= True, 
             input_name="X", 
         )
-        return self.model_.predict_proba(X)
+        with self._parallel_context():
+            return self.model_.predict_proba(X)
 
 
 class EnsembleRegressor(RegressorMixin, BaseEnsemble):
@@ -2065,6 +2100,10 @@ class EnsembleRegressor(RegressorMixin, BaseEnsemble):
         The number of jobs to run in parallel for both `fit` and `predict`. 
         None means 1 unless in a `joblib.parallel_backend` context.
 
+    backend : {'threads', 'processes'}, default=None
+        The joblib backend the bagging members are dispatched to when 
+        `n_jobs` is not 1. `None` keeps the scikit-learn default.
+
     min_impurity_decrease : float, default=0.0
         A node will be split if this split induces a decrease of the impurity 
         greater than or equal to this value. Used to control tree growth.
@@ -2206,7 +2245,8 @@ class EnsembleRegressor(RegressorMixin, BaseEnsemble):
         ccp_alpha=0.0,
         estimator=None,
         random_state=None,
-        verbose=0
+        verbose=0, 
+        backend=None
        ):
         super().__init__(
             n_estimators=n_estimators, 
@@ -2232,10 +2272,67 @@ class EnsembleRegressor(RegressorMixin, BaseEnsemble):
             tol=tol,
             estimator =estimator, 
             ccp_alpha=ccp_alpha,
-            verbose=verbose
+            verbose=verbose, 
+            backend=backend
        )
 
- 
-
+def _check_backend(backend):
+    """Validate `backend` and return it as a joblib ``prefer`` hint."""
+    return parameter_validator(
+        "backend", target_strs={"threads", "processes"})(backend)
+
+def _fit_member(estimator, X, y, sample_weight=None, optimizer=None, cv=None):
+    """Optionally tune, then fit one member of an ensemble."""
+    if optimizer and cv:
+        estimator = optimize_hyperparams(
+            estimator, X, y, optimizer=optimizer, cv=cv)
+    return fit_with_estimator(estimator, X, y, sample_weight=sample_weight)
+
+def _fit_members(
+    estimators, X, y, sample_weight=None, *, n_jobs=None, backend='threads', 
+    verbose=False, desc=None, optimizer=None, cv=None
+    ):
+    """
+    Fit the independent members of an ensemble, in parallel when `n_jobs` 
+    allows it.
 
+    The fitted members are taken from the returned values rather than 
+    fitted in place, so that the 'processes' backend, whose workers operate 
+    on copies, behaves exactly like the 'threads' one.
+    """
+    if verbose:
+        estimators = tqdm(estimators, ascii=True, ncols=100, desc=desc)
+    return Parallel(n_jobs=n_jobs, prefer=_check_backend(backend))(
+        delayed(_fit_member)(estimator, X, y, sample_weight, optimizer, cv)
+        for estimator in estimators
+    )
+
+def _stack_member_outputs(
+        estimators, X, method='predict', n_jobs=None, backend='threads'):
+    """
+    Collect the `method` outputs of fitted members into one preallocated 
+    array of shape ``(n_members, *output_shape)``.
 
+    The first member fixes the shape and dtype. With the 'threads' backend 
+    every worker writes its own row in place; with 'processes' the rows are 
+    copied in as the results come back.
+    """
+    first = np.asarray(getattr(estimators[0], method)(X))
+    outputs = np.empty((len(estimators),) + first.shape, dtype=first.dtype)
+    outputs[0] = first
+    others = list(enumerate(estimators[1:], start=1))
+    if _check_backend(backend) == 'threads':
+        Parallel(n_jobs=n_jobs, prefer='threads')(
+            delayed(_write_member_output)(outputs, i, estimator, method, X)
+            for i, estimator in others
+        )
+    else:
+        results = Parallel(n_jobs=n_jobs, prefer='processes')(
+            delayed(getattr(estimator, method))(X) for _, estimator in others)
+        for (i, _), result in zip(others, results):
+            outputs[i] = result
+    return outputs
+
+def _write_member_output(outputs, i, estimator, method, X):
+    """Write the `method` output of the `i`-th member into `outputs`."""
+    outputs[i] = getattr(estimator, method)(X)
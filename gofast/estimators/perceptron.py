@@ -17,7 +17,6 @@ from sklearn.base import BaseEstimator, ClassifierMixin, RegressorMixin
 from sklearn.preprocessing import LabelBinarizer 
 from sklearn.metrics import accuracy_score, r2_score
 
-from ..tools.funcutils import ensure_pkg 
 from ..tools.validator import check_X_y, check_array 
 from ..tools.validator import check_is_fitted
 from ._neural import BaseFuzzyNeuralNet, BaseNeuroFuzzy, BaseGD 
@@ -96,6 +95,9 @@ class Perceptron(BaseEstimator, RegressorMixin, ClassifierMixin):
         The number of misclassifications (updates) in each epoch. It can be
         used to evaluate the performance of the classifier over iterations.
 
+    n_iter_ : int
+        Number of epochs run, accumulated over `partial_fit` calls.
+
     Notes
     -----
     The perceptron algorithm does not converge if the data is not linearly
@@ -283,10 +285,8 @@ class Perceptron(BaseEstimator, RegressorMixin, ClassifierMixin):
                 # Convert to two columns for binary classification
                 y = np.hstack([y, 1 - y])  
         
-        rgen = np.random.RandomState(self.random_state)
-        self.weights_ = rgen.normal(loc=0., scale=0.01, size=(
-            1 + X.shape[1], y.shape[1] if self.problem == 'classification' else 1))
-        self.errors_ = []
+        self._initialize_weights(
+            X.shape[1], y.shape[1] if self.problem == 'classification' else 1)
         
         if self.verbose:
             progress_bar = tqdm(
@@ -294,14 +294,7 @@ class Perceptron(BaseEstimator, RegressorMixin, ClassifierMixin):
                 desc=f'Fitting {self.__class__.__name__}', 
             )
         for _ in range(self.max_iter):
-            errors = 0
-            for xi, target in zip(X, y):
-                update = self.eta0 * (target - self.net_input(
-                    xi.reshape(1, -1)).ravel())
-                self.weights_[1:] += np.outer(xi, update)
-                self.weights_[0] += update
-                errors += int(np.any(update != 0.0))
-            self.errors_.append(errors)
+            errors = self._run_epoch(X, y)
             if self.early_stopping and errors <= self.tol:
                 break
             
@@ -313,6 +306,102 @@ class Perceptron(BaseEstimator, RegressorMixin, ClassifierMixin):
             
         return self
 
+    def partial_fit(self, X, y, classes=None, sample_weight=None):
+        """
+        Update the Perceptron with one epoch over a chunk of data.
+    
+        `partial_fit` allows the model to be trained out-of-core, from 
+        successive chunks of a dataset too large to fit in memory, or to be 
+        updated continuously as new data arrives.
+    
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Chunk of training data.
+    
+        y : array-like of shape (n_samples,)
+            Target values of the chunk.
+    
+        classes : array-like of shape (n_classes,), default=None
+            All the classes that can appear in `y`. Required on the first call 
+            for classification since a single chunk may not contain every 
+            class. Passing `classes` also forces the classification problem 
+            when `problem='auto'`. Ignored after the first call.
+    
+        sample_weight : array-like of shape (n_samples,), default=None
+            Not used, present for API consistency.
+    
+        Returns
+        -------
+        self : object
+            Returns self.
+    
+        Notes
+        -----
+        The problem type, the label encoding and the weights are set on the 
+        first call only. The epoch counter ``n_iter_`` and the ``errors_`` 
+        history carry over between calls.
+    
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from gofast.estimators.perceptron import Perceptron
+        >>> rng = np.random.RandomState(0)
+        >>> model = Perceptron(eta0=0.01)
+        >>> for _ in range(5):
+        ...     X_chunk = rng.randn(100, 2)
+        ...     y_chunk = (X_chunk.sum(axis=1) > 0).astype(int)
+        ...     model.partial_fit(X_chunk, y_chunk, classes=[0, 1])
+        >>> model.n_iter_
+        5
+        """
+        X, y = check_X_y(X, y, estimator=self,)
+        first_call = not hasattr(self, 'weights_')
+        if first_call: 
+            if classes is not None and self.problem == 'auto': 
+                self.problem = 'classification'
+            self.problem = detect_problem_type(self.problem, y, estimator=self )
+            if self.problem == 'classification':
+                if classes is None:
+                    raise ValueError("classes must be passed on the first"
+                                     " call to partial_fit for classification.")
+                self.label_binarizer_ = LabelBinarizer().fit(classes)
+                
+        if self.problem == 'classification':
+            y = self.label_binarizer_.transform(y)
+            if y.shape[1] == 1:
+                y = np.hstack([y, 1 - y])  
+        if first_call:
+            self._initialize_weights(
+                X.shape[1], y.shape[1] if self.problem == 'classification' else 1)
+            
+        self._run_epoch(X, y)
+        
+        return self
+    
+    def _initialize_weights(self, n_features, n_outputs):
+        """Draw small random weights and reset the training history."""
+        rgen = np.random.RandomState(self.random_state)
+        self.weights_ = rgen.normal(loc=0., scale=0.01, size=(
+            1 + n_features, n_outputs))
+        self.errors_ = []
+        self.n_iter_ = 0 
+        
+    def _run_epoch(self, X, y):
+        """Apply the perceptron rule to each instance; return the number 
+        of updates of the epoch."""
+        errors = 0
+        for xi, target in zip(X, y):
+            update = self.eta0 * (target - self.net_input(
+                xi.reshape(1, -1)).ravel())
+            self.weights_[1:] += np.outer(xi, update)
+            self.weights_[0] += update
+            errors += int(np.any(update != 0.0))
+        self.errors_.append(errors)
+        self.n_iter_ += 1
+        
+        return errors 
+    
     def net_input(self, X):
         """ Compute the net input """
         return np.dot(X, self.weights_[1:]) + self.weights_[0]
@@ -584,10 +673,6 @@ class Perceptron(BaseEstimator, RegressorMixin, ClassifierMixin):
         params = ",\n    ".join(f"{key}={val}" for key, val in self.get_params().items())
         return f"{self.__class__.__name__}(\n    {params}\n)"
     
-@ensure_pkg("skfuzzy", extra="The `skfuzzy` package is required for the"
-            " `NeuroFuzzyRegressor` to function correctly. Please install"
-            " it to proceed."
-    )
 class NeuroFuzzyRegressor(RegressorMixin, BaseNeuroFuzzy):
     """
     NeuroFuzzyRegressor is a neuro-fuzzy network-based regressor that
@@ -707,6 +792,11 @@ class NeuroFuzzyRegressor(RegressorMixin, BaseNeuroFuzzy):
     verbose : bool, default=False
         Whether to print progress messages to stdout. If `True`, progress 
         messages are printed during training.
+
+    chunk_size : int, default=None
+        The number of samples fuzzified per block, bounding the memory of 
+        the membership degrees computed for all features and clusters. If 
+        None, all the samples are fuzzified at once.
     
     Notes
     -----
@@ -783,7 +873,8 @@ class NeuroFuzzyRegressor(RegressorMixin, BaseNeuroFuzzy):
         n_iter_no_change=10, 
         max_fun=15000, 
         random_state=None, 
-        verbose=False
+        verbose=False, 
+        chunk_size=None
     ):
         super().__init__(
             n_clusters=n_clusters, 
@@ -808,7 +899,8 @@ class NeuroFuzzyRegressor(RegressorMixin, BaseNeuroFuzzy):
             max_fun=max_fun, 
             random_state=random_state, 
             verbose=verbose, 
-            is_classifier=False
+            is_classifier=False, 
+            chunk_size=chunk_size
         )
 
     def fit(self, X, y, sample_weight=None):
@@ -929,10 +1021,6 @@ class NeuroFuzzyRegressor(RegressorMixin, BaseNeuroFuzzy):
  
         return self._predict(X)
     
-@ensure_pkg(
-    "skfuzzy", ("The `skfuzzy` package is required for the "
-     " `NeuroFuzzyClassifier`to function correctly.")
-    )
 class NeuroFuzzyClassifier(ClassifierMixin, BaseNeuroFuzzy):
     """
     NeuroFuzzyClassifier is a neuro-fuzzy network-based classifier that 
@@ -1051,6 +1139,11 @@ class NeuroFuzzyClassifier(ClassifierMixin, BaseNeuroFuzzy):
         Whether to print progress messages to stdout. If `True`, progress 
         messages are printed during training.
 
+    chunk_size : int, default=None
+        The number of samples fuzzified per block, bounding the memory of 
+        the membership degrees computed for all features and clusters. If 
+        None, all the samples are fuzzified at once.
+
     Notes
     -----
     The NeuroFuzzyClassifier combines the strengths of fuzzy logic and neural 
@@ -1127,7 +1220,8 @@ class NeuroFuzzyClassifier(ClassifierMixin, BaseNeuroFuzzy):
         n_iter_no_change=10, 
         max_fun=15000, 
         random_state=None, 
-        verbose=False
+        verbose=False, 
+        chunk_size=None
     ):
         super().__init__(
             n_clusters=n_clusters, 
@@ -1152,7 +1246,8 @@ class NeuroFuzzyClassifier(ClassifierMixin, BaseNeuroFuzzy):
             max_fun=max_fun, 
             random_state=random_state, 
             verbose=verbose, 
-            is_classifier=True
+            is_classifier=True, 
+            chunk_size=chunk_size
         )
 
     def fit(self, X, y, sample_weight=None):
@@ -1594,6 +1689,52 @@ class LightGDClassifier(ClassifierMixin, BaseGD):
         """
         return self._fit(X, y, is_classifier=True)
 
+    def partial_fit(self, X, y, classes=None, sample_weight=None):
+        """
+        Update the classifier with one gradient descent epoch on a chunk.
+    
+        `partial_fit` allows the classifier to be trained out-of-core, e.g. 
+        from a chunked CSV/Parquet reader, or to be updated continuously as 
+        new data arrives. The weights, the learning rate schedule step 
+        (``n_iter_``) and the early-stopping counters (``best_loss_``, 
+        ``no_improvement_count_``) persist between calls.
+    
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Chunk of training data.
+    
+        y : array-like of shape (n_samples,)
+            Class labels of the chunk.
+    
+        classes : array-like of shape (n_classes,), default=None
+            All the classes that can appear in `y`. Required on the first 
+            call since a single chunk may not contain every class; ignored 
+            afterwards.
+    
+        sample_weight : array-like of shape (n_samples,), default=None
+            Not used, present for API consistency.
+    
+        Returns
+        -------
+        self : object
+            Returns an instance of self.
+    
+        Examples
+        --------
+        >>> import numpy as np
+        >>> from gofast.estimators.perceptron import LightGDClassifier
+        >>> rng = np.random.RandomState(0)
+        >>> clf = LightGDClassifier(eta0=0.001)
+        >>> for _ in range(5):
+        ...     X_chunk = rng.randn(200, 3)
+        ...     y_chunk = (X_chunk[:, 0] > 0).astype(int)
+        ...     clf.partial_fit(X_chunk, y_chunk, classes=[0, 1])
+        >>> clf.n_iter_
+        5
+        """
+        return self._partial_fit(X, y, is_classifier=True, classes=classes)
+
     def predict(self, X):
         """
         Predict class labels for samples in `X`.
@@ -1952,6 +2093,42 @@ class LightGDRegressor(RegressorMixin, BaseGD):
         """
         return self._fit(X, y, is_classifier=False)
     
+    def partial_fit(self, X, y, sample_weight=None):
+        """
+        Update the regressor with one gradient descent epoch on a chunk.
+    
+        `partial_fit` allows the regressor to be trained out-of-core, e.g. 
+        from a chunked CSV/Parquet reader, or to be updated continuously as 
+        new data arrives. The weights, the learning rate schedule step 
+        (``n_iter_``) and the early-stopping counters (``best_loss_``, 
+        ``no_improvement_count_``) persist between calls.
+    
+        Parameters
+        ----------
+        X : array-like of shape (n_samples, n_features)
+            Chunk of training data.
+    
+        y : array-like of shape (n_samples,)
+            Target values of the chunk.
+    
+        sample_weight : array-like of shape (n_samples,), default=None
+            Not used, present for API consistency.
+    
+        Returns
+        -------
+        self : object
+            Returns an instance of self.
+    
+        Examples
+        --------
+        >>> import pandas as pd
+        >>> from gofast.estimators.perceptron import LightGDRegressor
+        >>> reg = LightGDRegressor(eta0=0.0001)
+        >>> for chunk in pd.read_csv('train.csv', chunksize=10_000):
+        ...     reg.partial_fit(chunk.drop(columns='target'), chunk['target'])
+        """
+        return self._partial_fit(X, y, is_classifier=False)
+    
     def predict(self, X):
         """
         Predict continuous target values using the trained LightGDRegressor model.
@@ -2023,11 +2200,6 @@ class LightGDRegressor(RegressorMixin, BaseGD):
         X = check_array(X, accept_sparse=True, estimator=self, input_name="X") 
         return self._predict(X)
 
-@ensure_pkg(
-    "skfuzzy", 
-    extra= ( "The `skfuzzy` is required for the `FuzzyNeuralNetClassifier`"
-            "to function correctly.")
-    )
 class FuzzyNeuralNetClassifier(ClassifierMixin, BaseFuzzyNeuralNet):
     """
     FuzzyNeuralNetClassifier is an ensemble neuro-fuzzy network-based 
@@ -2154,6 +2326,11 @@ class FuzzyNeuralNetClassifier(ClassifierMixin, BaseFuzzyNeuralNet):
         Whether to print progress messages to stdout. If `True`, progress 
         messages are printed during training.
 
+    chunk_size : int, default=None
+        The number of samples fuzzified per block, bounding the memory of 
+        the membership degrees computed for all features and clusters. If 
+        None, all the samples are fuzzified at once.
+
     Notes
     -----
     The FuzzyNeuralNetClassifier combines the strengths of fuzzy logic and 
@@ -2226,7 +2403,8 @@ class FuzzyNeuralNetClassifier(ClassifierMixin, BaseFuzzyNeuralNet):
         n_iter_no_change=10, 
         max_fun=15000, 
         random_state=None, 
-        verbose=False): 
+        verbose=False, 
+        chunk_size=None): 
         super().__init__( 
             n_clusters=n_clusters, 
             n_estimators=n_estimators,
@@ -2250,7 +2428,8 @@ class FuzzyNeuralNetClassifier(ClassifierMixin, BaseFuzzyNeuralNet):
             n_iter_no_change=n_iter_no_change, 
             max_fun=max_fun, 
             random_state=random_state, 
-            verbose=verbose
+            verbose=verbose, 
+            chunk_size=chunk_size
         )
     def fit(self, X, y, sample_weight=None):
         """
@@ -2382,13 +2561,16 @@ class FuzzyNeuralNetClassifier(ClassifierMixin, BaseFuzzyNeuralNet):
         """
         check_is_fitted (self, 'ensemble_') 
         X = check_array(X,accept_sparse= True, to_frame=False, input_name="X" )
-        X_scaled = self.scaler.transform(X)
+        X_fuzzy = self._fuzzy_features(self.scaler.transform(X))
+        # Each member predicts one-hot rows; the votes of all members are 
+        # counted at once rather than sample by sample.
         y_pred_ensemble = np.array(
-            [estimator.predict(X_scaled) for estimator in self.ensemble_])
-        y_pred_majority = np.apply_along_axis(
-            lambda x: np.argmax(np.bincount(x)), axis=0, arr=y_pred_ensemble)
-        y_pred_classes = self.encoder.inverse_transform(
-            y_pred_majority.reshape(-1, 1)).flatten()
+            [estimator.predict(X_fuzzy).argmax(axis=1) 
+             for estimator in self.ensemble_])
+        classes = self.encoder.categories_[0]
+        y_pred_majority = np.eye(len(classes), dtype=int)[
+            y_pred_ensemble].sum(axis=0).argmax(axis=1)
+        y_pred_classes = classes[y_pred_majority]
         
         return y_pred_classes
 
@@ -2455,17 +2637,13 @@ class FuzzyNeuralNetClassifier(ClassifierMixin, BaseFuzzyNeuralNet):
         check_is_fitted (self, 'ensemble_') 
         X = check_array(X,accept_sparse= True, to_frame=False, input_name="X" )
         
-        X_scaled = self.scaler.transform(X)
+        X_fuzzy = self._fuzzy_features(self.scaler.transform(X))
         y_proba_ensemble = np.array(
-            [estimator.predict_proba(X_scaled) for estimator in self.ensemble_])
+            [estimator.predict_proba(X_fuzzy) for estimator in self.ensemble_])
         y_proba_avg = np.mean(y_proba_ensemble, axis=0)
         
         return y_proba_avg
     
-@ensure_pkg(
-    "skfuzzy", ("The `skfuzzy` package is required for the "
-     " `FuzzyNeuralNetRegressor`to function correctly.")
-    )
 class FuzzyNeuralNetRegressor(RegressorMixin, BaseFuzzyNeuralNet):
     """
     FuzzyNeuralNetRegressor is an ensemble neuro-fuzzy network-based 
@@ -2592,6 +2770,11 @@ class FuzzyNeuralNetRegressor(RegressorMixin, BaseFuzzyNeuralNet):
         Whether to print progress messages to stdout. If `True`, progress 
         messages are printed during training.
 
+    chunk_size : int, default=None
+        The number of samples fuzzified per block, bounding the memory of 
+        the membership degrees computed for all features and clusters. If 
+        None, all the samples are fuzzified at once.
+
     Notes
     -----
     The FuzzyNeuralNetRegressor combines the strengths of fuzzy logic and 
@@ -2663,7 +2846,8 @@ class FuzzyNeuralNetRegressor(RegressorMixin, BaseFuzzyNeuralNet):
         n_iter_no_change=10, 
         max_fun=15000, 
         random_state=None, 
-        verbose=False): 
+        verbose=False, 
+        chunk_size=None): 
         super().__init__( 
             n_clusters=n_clusters, 
             n_estimators=n_estimators,
@@ -2687,7 +2871,8 @@ class FuzzyNeuralNetRegressor(RegressorMixin, BaseFuzzyNeuralNet):
             n_iter_no_change=n_iter_no_change, 
             max_fun=max_fun, 
             random_state=random_state, 
-            verbose=verbose
+            verbose=verbose, 
+            chunk_size=chunk_size
         )
         
     def fit(self, X, y, sample_weight=None):
@@ -2813,11 +2998,11 @@ class FuzzyNeuralNetRegressor(RegressorMixin, BaseFuzzyNeuralNet):
                System," IEEE Transactions on Systems, Man, and Cybernetics, vol.
                23, no. 3, pp. 665-685, 1993.
         """
-        check_is_fitted(self, 'ensemble')
+        check_is_fitted(self, 'ensemble_')
         X = check_array(X, accept_sparse=True, to_frame=False, input_name="X")
-        X_scaled = self.scaler.transform(X)
+        X_fuzzy = self._fuzzy_features(self.scaler.transform(X))
         y_pred_ensemble = np.array(
-            [estimator.predict(X_scaled) for estimator in self.ensemble])
+            [estimator.predict(X_fuzzy) for estimator in self.ensemble_])
         y_pred_avg = np.mean(y_pred_ensemble, axis=0)
         
         return y_pred_avg
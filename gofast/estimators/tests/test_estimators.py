@@ -10,6 +10,7 @@ from sklearn.metrics import accuracy_score, mean_squared_error
 from sklearn.tree import DecisionTreeClassifier, DecisionTreeRegressor
 from sklearn.linear_model import LinearRegression
 from sklearn.linear_model import LogisticRegression
+from sklearn.linear_model import PoissonRegressor, SGDRegressor
 from sklearn.neighbors import KNeighborsClassifier
 from sklearn.datasets import make_classification, make_regression
 
@@ -39,8 +40,11 @@ from gofast.estimators.ensemble import EnsembleRegressor
 from gofast.estimators.perceptron import Perceptron 
 from gofast.estimators.perceptron import LightGDClassifier
 from gofast.estimators.perceptron import LightGDRegressor
+from gofast.estimators.perceptron import NeuroFuzzyClassifier
+from gofast.estimators.perceptron import FuzzyNeuralNetRegressor
 from gofast.estimators.tree import DTBClassifier 
 from gofast.estimators.tree import DTBRegressor
+from gofast.estimators.util import fuzzy_cmeans, triangular_membership
 
 
 
@@ -65,6 +69,39 @@ def test_hammerstein_wiener_regressor(sample_data):
     predictions = regressor.predict(X_test)
     assert mean_squared_error(y_test, predictions) < 50000  # Example threshold
 
+def test_hammerstein_wiener_lag_matrix(sample_data):
+    X_train, X_test, y_train, y_test = sample_data
+    regressor = HammersteinWienerRegressor(memory_depth=3).fit(X_train, y_train)
+    X_lagged = regressor._preprocess_data(X_train)
+    X_transformed = np.tanh(X_train)
+    expected = np.array([X_transformed[i - 3:i].ravel()
+                         for i in range(3, len(X_train))])
+    assert np.allclose(X_lagged, expected)
+    # Sliding-window view on the transformed input, not a fresh copy
+    assert not X_lagged.flags.owndata
+
+    regressor32 = HammersteinWienerRegressor(memory_depth=3, dtype=np.float32)
+    regressor32.fit(X_train, y_train)
+    assert regressor32._preprocess_data(X_train).dtype == np.float32
+    assert regressor32.predict(X_test).shape == y_test.shape
+
+def test_hammerstein_wiener_predict_step(sample_data):
+    X_train, X_test, y_train, y_test = sample_data
+    regressor = HammersteinWienerRegressor(memory_depth=3).fit(X_train, y_train)
+    assert np.isnan(regressor.predict_step(X_test[0]))
+    regressor.update(X_test[1:3])
+    streamed = [regressor.predict_step(x) for x in X_test[3:]]
+    assert np.allclose(streamed, regressor.predict(X_test)[3:])
+
+def test_hammerstein_wiener_predict_step_link():
+    rng = np.random.RandomState(0)
+    X, y = rng.rand(120, 2), rng.rand(120) + 0.1
+    # The inverse link of the Poisson model is applied to each step.
+    regressor = HammersteinWienerRegressor(
+        linear_model=PoissonRegressor(), memory_depth=3).fit(X[:100], y[:100])
+    streamed = [regressor.predict_step(x) for x in X[100:]]
+    assert np.allclose(streamed[3:], regressor.predict(X[100:])[3:])
+
 def test_ensemble_hw_classifier(classification_data):
     X_train, X_test, y_train, y_test = classification_data
     classifier = EnsembleHWClassifier(n_estimators=10, eta0=0.1)
@@ -80,6 +117,40 @@ def test_ensemble_hw_regressor(sample_data):
     predictions = regressor.predict(X_test)
     assert mean_squared_error(y_test, predictions) < 50000  # Example threshold
 
+def test_ensemble_hw_stacked_prediction(sample_data):
+    X_train, X_test, y_train, y_test = sample_data
+    regressor = EnsembleHWRegressor(n_estimators=6, n_jobs=2, warm_start=True)
+    regressor.fit(X_train, y_train)
+    assert regressor.stacked_coef_.shape[1] == 6
+    stacked = regressor.predict(X_test)
+    # Per-member evaluation is the fallback for non-linear base models
+    expected = sum(w * m.predict(X_test) for w, m in zip(
+        regressor.weights_, regressor.base_regressors_))
+    assert np.allclose(stacked, expected)
+
+    first = regressor.base_regressors_[0]
+    regressor.set_params(n_estimators=8).fit(X_train, y_train)
+    assert len(regressor.base_regressors_) == 8
+    assert regressor.base_regressors_[0] is first
+
+@pytest.mark.parametrize("base_regressor, stacked", [
+    (LinearRegression(), True), (SGDRegressor(random_state=0), True), 
+    (PoissonRegressor(), False)])
+def test_ensemble_hw_stacked_members(base_regressor, stacked):
+    rng = np.random.RandomState(0)
+    X, y = rng.rand(120, 2), rng.rand(120) + 0.1
+    regressor = EnsembleHWRegressor(
+        n_estimators=4, regressor=base_regressor, memory_depth=5, 
+        random_state=0).fit(X, y)
+    # Only the identity-link linear members are stacked; the log link of 
+    # the Poisson members is applied by their predict.
+    assert (regressor.stacked_coef_ is not None) == stacked
+    expected = sum(w * m.predict(X) for w, m in zip(
+        regressor.weights_, regressor.base_regressors_))
+    assert np.allclose(regressor.predict(X), expected)
+    empty = EnsembleHWRegressor(n_estimators=0, memory_depth=5).fit(X, y)
+    assert np.all(empty.predict(X) == 0)
+
 @pytest.fixture
 def sample_data():
     X, y = make_regression(n_samples=100, n_features=4, noise=0.1)
@@ -110,6 +181,21 @@ def test_decision_tree_based_regressor(sample_data):
     predictions = model.predict(X_test)
     assert mean_squared_error(y_test, predictions) < 50000  # Example threshold
 
+def test_decision_tree_based_compiled_inference(sample_data):
+    X_train, X_test, y_train, y_test = sample_data
+    model = DTBRegressor(n_estimators=10, max_depth=4, random_state=0)
+    model.fit(X_train, y_train)
+    per_tree = np.array([tree.predict(X_test) for tree in model.estimators_])
+    assert np.allclose(model.compiled_.predict(X_test), per_tree)
+    predictions = model.predict(X_test)
+    model.compile_inference(n_jobs=2)
+    assert np.allclose(model.predict(X_test), predictions)
+
+    X, y = load_iris(return_X_y=True)
+    clf = DTBClassifier(n_estimators=10, max_depth=3, random_state=0).fit(X, y)
+    probas = np.mean([tree.predict_proba(X) for tree in clf.estimators_], axis=0)
+    assert np.allclose(clf.predict_proba(X), probas)
+
 # # Helper function to create datasets
 def create_dataset(task='classification', n_classes=2, n_informative=2 ):
     if task == 'classification':
@@ -205,6 +291,30 @@ def test_majority_vote_invalid_input(majority_vote_classifier):
     with pytest.raises(ValueError):
         majority_vote_classifier.fit(np.array([[1, 2], [3, 4]]), np.array([1, 2, 3]))
 
+@pytest.mark.parametrize("backend", ["threads", "processes"])
+def test_ensemble_parallel_members(backend):
+    X_train, X_test, y_train, y_test = create_dataset('classification')
+    clfs = [LogisticRegression(), DecisionTreeClassifier(random_state=0),
+            KNeighborsClassifier()]
+    serial = MajorityVoteClassifier(classifiers=clfs).fit(X_train, y_train)
+    parallel = MajorityVoteClassifier(
+        classifiers=clfs, n_jobs=2, backend=backend, verbose=True
+        ).fit(X_train, y_train)
+    np.testing.assert_array_equal(
+        serial.predict(X_test), parallel.predict(X_test))
+    np.testing.assert_allclose(
+        serial.predict_proba(X_test), parallel.predict_proba(X_test))
+
+    X_train, X_test, y_train, y_test = create_dataset('regression')
+    serial = SimpleAverageRegressor(
+        [LinearRegression(), DecisionTreeRegressor(random_state=0)]
+        ).fit(X_train, y_train)
+    parallel = SimpleAverageRegressor(
+        [LinearRegression(), DecisionTreeRegressor(random_state=0)],
+        n_jobs=2, backend=backend).fit(X_train, y_train)
+    np.testing.assert_allclose(
+        serial.predict(X_test), parallel.predict(X_test))
+
 # AdalineStochasticRegressor tests
 @pytest.fixture
 def adaline_stochastic_regressor():
@@ -235,6 +345,58 @@ def test_adaline_stochastic_classifier_predict_proba(adaline_stochastic_classifi
     probas = adaline_stochastic_classifier.predict_proba(X_test)
     assert probas.shape == (len(y_test), 2)
 
+def test_adaline_stochastic_mini_batch():
+    X, y = make_classification(n_samples=100, n_features=5, n_informative=3,
+                               n_classes=3, random_state=42)
+    clf = AdalineStochasticClassifier(eta0=0.01, max_iter=20, batch_size=16,
+                                      random_state=42)
+    clf.fit(X, y)
+    assert clf.weights_.shape == (X.shape[1] + 1, 3)
+    assert len(clf.cost_) == 20
+
+    X_train, X_test, y_train, y_test = create_dataset('regression')
+    reg = AdalineStochasticRegressor(eta0=0.001, max_iter=10, batch_size=1,
+                                     random_state=42).fit(X_train, y_train)
+    # A single batch holding all samples is plain batch gradient descent
+    full = AdalineStochasticRegressor(eta0=0.001, max_iter=1, shuffle=False,
+                                      batch_size=len(X_train), random_state=42)
+    full.fit(X_train, y_train)
+    rgen = np.random.RandomState(42)
+    weights = rgen.normal(loc=0.0, scale=0.01, size=1 + X_train.shape[1])
+    errors = y_train - (X_train @ weights[1:] + weights[0])
+    weights[1:] += 0.001 * X_train.T @ errors / len(X_train)
+    assert np.allclose(full.weights_[1:], weights[1:])
+    assert reg.predict(X_test).shape == y_test.shape
+
+def test_partial_fit_streaming():
+    X, y = make_classification(n_samples=120, n_features=5, random_state=42)
+    chunks = np.array_split(np.arange(len(X)), 4)
+
+    clf = AdalineStochasticClassifier(eta0=0.01, random_state=42)
+    with pytest.raises(ValueError):
+        clf.partial_fit(X[chunks[0]], y[chunks[0]])
+    for idx in chunks:
+        clf.partial_fit(X[idx], y[idx], classes=np.unique(y))
+    assert clf.n_iter_ == 4
+    assert len(clf.cost_) == 4
+    assert set(clf.predict(X)) <= set(np.unique(y))
+
+    perceptron = Perceptron(eta0=0.01, random_state=42)
+    lgd = LightGDClassifier(random_state=42)
+    for idx in chunks:
+        perceptron.partial_fit(X[idx], y[idx], classes=np.unique(y))
+        lgd.partial_fit(X[idx], y[idx], classes=np.unique(y))
+    assert perceptron.n_iter_ == 4
+    assert lgd.n_iter_ == 4
+    assert lgd.predict(X).shape == y.shape
+
+    X_train, X_test, y_train, y_test = create_dataset('regression')
+    reg = AdalineRegressor(eta0=0.0001)
+    for idx in np.array_split(np.arange(len(X_train)), 3):
+        reg.partial_fit(X_train[idx], y_train[idx])
+    assert reg.n_iter_ == 3
+    assert reg.predict(X_test).shape == y_test.shape
+
 # AdalineRegressor tests
 @pytest.fixture
 def adaline_regressor():
@@ -280,6 +442,14 @@ def test_kmf_regressor_invalid_input(kmf_regressor):
     with pytest.raises(ValueError):
         kmf_regressor.fit(np.array([[1, 2], [3, 4]]), np.array([1, 2, 3]))
 
+def test_kmf_regressor_streaming():
+    X_train, X_test, y_train, y_test = create_dataset('regression')
+    kmf = KMFRegressor(estimator=LinearRegression(), n_clusters=5, 
+                       n_components=3, batch_size=32, encoding='mean_target')
+    kmf.fit(X_train, y_train)
+    assert kmf.featurizer_.km_model_.__class__.__name__ == 'MiniBatchKMeans'
+    assert len(kmf.predict(X_test)) == len(y_test)
+
 # Test cases for DecisionStumpRegressor
 @pytest.fixture
 def decision_stump():
@@ -520,6 +690,34 @@ def test_hybrid_boosted_tree_ensemble_regressor():
 
     assert mse >= 0.0  
 
+def test_vectorized_fuzzification():
+    rng = np.random.RandomState(0)
+    X = np.c_[rng.normal(-2, 0.1, 60), rng.normal(3, 0.1, 60)]
+    X = np.r_[X, -X]
+    centers = fuzzy_cmeans(X, 2)
+    np.testing.assert_allclose(centers, [[-2, 2], [-3, 3]], atol=0.05)
+    np.testing.assert_allclose(centers, fuzzy_cmeans(X, 2, chunk_size=7))
+
+    sets = np.array([[[0., 0., 1.], [0., 1., 2.], [1., 2., 2.]]])
+    memberships = triangular_membership(
+        np.array([[0.], [0.5], [1.], [1.75], [3.]]), sets, chunk_size=2)
+    np.testing.assert_allclose(memberships[:, 0], [
+        [1, 0, 0], [0.5, 0.5, 0], [0, 1, 0], [0, 0.25, 0.75], [0, 0, 0]])
+
+    X, y = make_classification(n_samples=120, n_features=5, n_informative=3,
+                               n_classes=3, random_state=42)
+    X_train, X_test, y_train, y_test = train_test_split(X, y, random_state=42)
+    clf = NeuroFuzzyClassifier(n_clusters=3, max_iter=50, random_state=0,
+                               chunk_size=16).fit(X_train, y_train)
+    assert clf.antecedents_.shape == (X_train.shape[1], 3, 3)
+    assert set(clf.predict(X_test)) <= set(y_train)
+    assert clf.predict_proba(X_test).shape == (len(X_test), 3)
+
+    X_train, X_test, y_train, y_test = create_dataset('regression')
+    reg = FuzzyNeuralNetRegressor(n_clusters=2, n_estimators=2, max_iter=50,
+                                  random_state=0).fit(X_train, y_train)
+    assert reg.predict(X_test).shape == y_test.shape
+
 if __name__ == "__main__":
     pytest.main([__file__])
 
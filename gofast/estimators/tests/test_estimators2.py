@@ -12,6 +12,7 @@ from gofast.estimators.boosting import BoostingTreeClassifier
 from gofast.estimators.boosting import BoostingTreeRegressor
 from gofast.estimators.boosting import HybridBoostingClassifier
 from gofast.estimators.boosting import HybridBoostingRegressor
+from gofast.estimators.tree import WeightedTreeRegressor
 
 
 def test_regressor_fit_predict():
@@ -65,6 +66,41 @@ def test_classifier_no_fit():
     with pytest.raises(Exception):
         stump.predict(X)
 
+def test_regressor_split_matches_brute_force():
+    rng = np.random.RandomState(0)
+    X = np.round(rng.randn(60, 3), 1)
+    y = 2 * X[:, 1] + rng.randn(60)
+    sample_weight = rng.rand(60)
+    stump = DecisionStumpRegressor().fit(X, y, sample_weight=sample_weight)
+
+    # Brute force over every feature and distinct threshold
+    best = (np.inf, None, None)
+    for feature in range(X.shape[1]):
+        for threshold in np.unique(X[:, feature])[:-1]:
+            left = X[:, feature] <= threshold
+            error = 0.
+            for mask in (left, ~left):
+                mean = np.average(y[mask], weights=sample_weight[mask])
+                error += np.sum(sample_weight[mask] * (y[mask] - mean) ** 2)
+            if error < best[0]:
+                best = (error, feature, threshold)
+    assert (stump.split_feature_, stump.split_value_) == best[1:]
+
+def test_stump_max_bins():
+    X, y = make_regression(n_samples=500, n_features=3, noise=0.1, random_state=42)
+    exact = DecisionStumpRegressor().fit(X, y)
+    binned = DecisionStumpRegressor(max_bins=32).fit(X, y)
+    assert binned.split_feature_ == exact.split_feature_
+    assert binned.score(X, y) <= exact.score(X, y) + 1e-12
+    # Lossless binning when every distinct value has its own bin
+    lossless = DecisionStumpRegressor(max_bins=256).fit(np.round(X, 1), y)
+    reference = DecisionStumpRegressor().fit(np.round(X, 1), y)
+    assert lossless.split_value_ == reference.split_value_
+
+    X, y = make_classification(n_samples=500, n_features=5, random_state=42)
+    clf = DecisionStumpClassifier(max_bins=16).fit(X, y)
+    assert clf.score(X, y) >= 0.5
+
 @pytest.fixture
 def data():
     X, y = make_classification(n_samples=100, n_features=4, n_classes=2, random_state=42)
@@ -345,6 +381,22 @@ def test_boosted_tree_classifier_fit_predict():
     accuracy = accuracy_score(y, y_pred)
     assert accuracy > 0.9
 
+def test_boosted_tree_hist_matches_exact():
+    # Fewer distinct values than bins: binning is lossless and the 
+    # histogram trees must reproduce the exact ones on raw inputs.
+    X, y = make_classification(n_samples=100, n_features=4, n_classes=2, 
+                               random_state=42)
+    exact = BoostingTreeClassifier(n_estimators=10, random_state=0).fit(X, y)
+    hist = BoostingTreeClassifier(n_estimators=10, random_state=0, 
+                                  tree_method="hist").fit(X, y)
+    assert len(hist.bin_edges_) == X.shape[1]
+    assert np.allclose(exact.predict_proba(X), hist.predict_proba(X))
+
+    X, y = make_regression(n_samples=300, n_features=4, random_state=42)
+    reg = WeightedTreeRegressor(n_estimators=10, tree_method="hist", 
+                                max_bins=32, random_state=0)
+    assert reg.fit(X, y.copy()).score(X, y) > 0.5
+
 def test_boosted_tree_classifier_incorrect_shape():
     X, y = make_classification(n_samples=100, n_features=4, n_classes=2, random_state=42)
     clf = BoostingTreeClassifier(n_estimators=100, max_depth=3, eta0=0.1)
@@ -8,6 +8,7 @@
 from __future__ import annotations
 from numbers import Integral, Real
 import numpy as np
+from scipy.sparse import issparse
 
 from sklearn.base import ClassifierMixin, RegressorMixin
 from sklearn.tree import DecisionTreeRegressor, DecisionTreeClassifier
@@ -755,6 +756,11 @@ class DTBClassifier(BaseDTB, ClassifierMixin):
             accept_sparse=True,
             to_frame=False, 
         )
+        compiled = getattr(self, "compiled_", None)
+        if compiled is not None and compiled.leaf_proba is not None and (
+                not issparse(X)):
+            return compiled.predict_proba(X)
+        
         probas = np.array([tree.predict_proba(X) for tree in self.estimators_])
         avg_proba = np.mean(probas, axis=0)
         return avg_proba
@@ -853,6 +859,17 @@ class WeightedTreeClassifier(BaseWeightedTree, ClassifierMixin):
         subtree with the largest cost complexity that is smaller than 
         `ccp_alpha` will be chosen.
 
+    tree_method : {"exact", "hist"}, default="exact"
+        The tree construction algorithm. "exact" fits every tree on the raw 
+        feature values. "hist" bins each feature once into at most 
+        `max_bins` quantile bins and fits every tree on the same binned 
+        matrix, which is much faster on large datasets. Thresholds are 
+        mapped back to raw values, so prediction is unchanged. Sparse input 
+        is not supported with "hist".
+
+    max_bins : int, default=255
+        The maximum number of bins per feature when `tree_method="hist"`.
+
     verbose : bool, default=False
         Controls the verbosity of the fitting process. If True, the progress
         of the fitting process is displayed.
@@ -953,6 +970,8 @@ class WeightedTreeClassifier(BaseWeightedTree, ClassifierMixin):
         min_impurity_decrease=0.,
         class_weight=None, 
         ccp_alpha=0., 
+        tree_method="exact", 
+        max_bins=255, 
         verbose=False
         ):
         super().__init__(
@@ -968,6 +987,8 @@ class WeightedTreeClassifier(BaseWeightedTree, ClassifierMixin):
             random_state=random_state, 
             max_leaf_nodes=max_leaf_nodes, 
             min_impurity_decrease=min_impurity_decrease, 
+            tree_method=tree_method, 
+            max_bins=max_bins, 
             verbose=verbose
         )
         self.class_weight = class_weight
@@ -1174,6 +1195,17 @@ class WeightedTreeRegressor(BaseWeightedTree, RegressorMixin):
         A node will be split if this split induces a decrease of the impurity 
         greater than or equal to this value.
 
+    tree_method : {"exact", "hist"}, default="exact"
+        The tree construction algorithm. "exact" fits every tree on the raw 
+        feature values. "hist" bins each feature once into at most 
+        `max_bins` quantile bins and fits every tree on the same binned 
+        matrix, which is much faster on large datasets. Thresholds are 
+        mapped back to raw values, so prediction is unchanged. Sparse input 
+        is not supported with "hist".
+
+    max_bins : int, default=255
+        The maximum number of bins per feature when `tree_method="hist"`.
+
     verbose : bool, default=False
         Controls the verbosity of the fitting process. If True, the progress
         of the fitting process is displayed.
@@ -1265,6 +1297,8 @@ class WeightedTreeRegressor(BaseWeightedTree, RegressorMixin):
         random_state=None, 
         max_leaf_nodes=None, 
         min_impurity_decrease=0.,
+        tree_method="exact", 
+        max_bins=255, 
         verbose=False
         ):
         super().__init__(
@@ -1280,6 +1314,8 @@ class WeightedTreeRegressor(BaseWeightedTree, RegressorMixin):
             random_state=random_state, 
             max_leaf_nodes=max_leaf_nodes, 
             min_impurity_decrease=min_impurity_decrease, 
+            tree_method=tree_method, 
+            max_bins=max_bins, 
             verbose=verbose
         )
 
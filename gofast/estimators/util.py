@@ -29,12 +29,15 @@ from ..tools.validator import validate_fit_weights, get_estimator_name
 from ..tools.validator import validate_positive_integer 
 
 __all__=[
-     'activator','apply_scaling','build_named_estimators', 'detect_problem_type',
+     'activator','apply_scaling','bin_features', 'build_named_estimators', 
+     'detect_problem_type',
      'determine_weights','estimate_memory_depth','fit_with_estimator',
-     'get_default_meta_estimator','normalize_sum','optimize_hyperparams',
+     'fuzzy_cmeans','get_default_meta_estimator','lag_embedding',
+     'normalize_sum',
+     'optimize_hyperparams',
      'select_best_classification_model','select_best_model',
      'select_best_regression_model','select_default_estimator',
-     'validate_memory_depth'
+     'triangular_membership','validate_memory_depth'
  ]
     
 def activator(z, activation='sigmoid', alpha=1.0, clipping_threshold=250):
@@ -788,6 +791,335 @@ def optimize_hyperparams(
     # Return the best estimator if available, otherwise return the search object
     return search.best_estimator_ if hasattr(search, 'best_estimator_') else search
 
+def bin_features(X, max_bins=255):
+    """
+    Discretize each feature of `X` into at most `max_bins` quantile bins.
+
+    Binning is done once, so that split searches can scan per-bin histograms 
+    (O(n_bins)) instead of every distinct value of a feature. When a feature 
+    has no more than `max_bins` distinct values, each value gets its own bin 
+    and the binning is lossless.
+
+    Parameters
+    ----------
+    X : array-like of shape (n_samples, n_features)
+        The input samples.
+
+    max_bins : int, default=255
+        Maximum number of bins per feature. Must be at least 2.
+
+    Returns
+    -------
+    X_binned : ndarray of shape (n_samples, n_features)
+        The bin codes of `X`. The dtype is ``uint8`` when ``max_bins <= 256``
+        and ``uint16`` otherwise.
+
+    bin_edges : list of ndarray
+        Inclusive upper thresholds of each bin, per feature. For a feature 
+        ``j`` and a code ``c``, ``X_binned[:, j] <= c`` is equivalent to 
+        ``X[:, j] <= bin_edges[j][c]``. The last bin is open to the right so 
+        ``len(bin_edges[j])`` is the number of bins of feature ``j`` minus one.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from gofast.estimators.util import bin_features
+    >>> X = np.array([[0.1, 5.], [0.4, 5.], [0.2, 7.], [0.9, 6.]])
+    >>> X_binned, bin_edges = bin_features(X, max_bins=4)
+    >>> X_binned
+    array([[0, 0],
+           [2, 0],
+           [1, 2],
+           [3, 1]], dtype=uint8)
+    >>> bin_edges[1]
+    array([5., 6.])
+    """
+    X = check_array(X, dtype=np.float64, input_name="X", to_frame=False)
+    max_bins = validate_positive_integer(max_bins, "max_bins")
+    if max_bins < 2:
+        raise ValueError(f"max_bins must be at least 2. Got {max_bins}.")
+    
+    dtype = np.uint8 if max_bins <= 256 else np.uint16
+    quantiles = np.linspace(0, 1, max_bins + 1)[1:-1]
+    X_binned = np.empty(X.shape, dtype=dtype, order="F")
+    bin_edges = []
+    for feature in range(X.shape[1]):
+        column = X[:, feature]
+        unique_values = np.unique(column)
+        if unique_values.size <= max_bins:
+            edges = unique_values[:-1]
+        else:
+            edges = np.unique(np.quantile(column, quantiles))
+        X_binned[:, feature] = np.searchsorted(edges, column, side="left")
+        bin_edges.append(edges)
+        
+    return X_binned, bin_edges
+
+def _bin_tree_inputs(X, max_bins=255):
+    """
+    Bin `X` once for histogram tree fitting.
+
+    The codes are returned as a Fortran-ordered ``float32`` matrix, the 
+    dtype and layout scikit-learn trees work on, so that no conversion 
+    happens when fitting the trees of every boosting round.
+    """
+    X_binned, bin_edges = bin_features(X, max_bins=max_bins)
+    return np.asfortranarray(X_binned, dtype=np.float32), bin_edges
+
+def _unbin_tree_thresholds(tree, bin_edges):
+    """
+    Map the split thresholds of a tree fitted on bin codes back to raw 
+    feature values, in place.
+
+    A split ``code <= c + 0.5`` is the split ``x <= bin_edges[f][c]`` on 
+    the raw feature, so the fitted tree can predict raw inputs directly. 
+    Thresholds are rounded to ``float32`` as scikit-learn compares 
+    ``float32`` inputs against them.
+    """
+    tree_ = tree.tree_
+    features, thresholds = tree_.feature, tree_.threshold
+    for node in np.flatnonzero(features >= 0):
+        code = int(thresholds[node])
+        thresholds[node] = np.float32(bin_edges[features[node]][code])
+    return tree
+
+def lag_embedding(X, memory_depth, dtype=None, copy=False):
+    """
+    Build the lagged design matrix of a multivariate time series.
+
+    Row ``t`` of the result holds the ``memory_depth`` samples preceding 
+    sample ``t + memory_depth``, flattened in time order, i.e. 
+    ``X[t:t + memory_depth].ravel()``. Because consecutive windows overlap 
+    in a C-contiguous array, the matrix is returned as a read-only strided 
+    view on `X` and no data is copied unless `dtype` differs from the dtype 
+    of `X` or `copy` is ``True``.
+
+    Parameters
+    ----------
+    X : ndarray of shape (n_samples, n_features)
+        The (already transformed) input series.
+
+    memory_depth : int
+        The number of past time steps stacked in each row.
+
+    dtype : data-type, default=None
+        The dtype of the lagged matrix. ``np.float32`` halves the memory of 
+        the design matrix. If None, the dtype of `X` is kept.
+
+    copy : bool, default=False
+        Whether to materialize the view into a new writable array. Set it 
+        when the consumer modifies its input in place.
+
+    Returns
+    -------
+    X_lagged : ndarray of shape (n_samples - memory_depth, \
+            memory_depth * n_features)
+        The lagged design matrix.
+
+    Raises
+    ------
+    ValueError
+        If `X` does not hold more samples than `memory_depth`.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from gofast.estimators.util import lag_embedding
+    >>> X = np.arange(8.).reshape(4, 2)
+    >>> lag_embedding(X, 2)
+    array([[0., 1., 2., 3.],
+           [2., 3., 4., 5.]])
+    """
+    X = np.ascontiguousarray(X, dtype=dtype)
+    if X.ndim == 1:
+        X = X.reshape(-1, 1)
+    n_samples, n_features = X.shape
+    if n_samples <= memory_depth:
+        raise ValueError("Not enough samples to match the memory depth")
+    
+    itemsize = X.dtype.itemsize
+    X_lagged = np.lib.stride_tricks.as_strided(
+        X, shape=(n_samples - memory_depth, memory_depth * n_features),
+        strides=(n_features * itemsize, itemsize), writeable=False)
+    
+    return X_lagged.copy() if copy else X_lagged
+
+def fuzzy_cmeans(
+    X, n_clusters, m=2.0, error=0.005, max_iter=1000, chunk_size=None):
+    """
+    Fuzzy c-means clustering of every feature of `X` at once.
+
+    Each column of `X` is partitioned on its own into `n_clusters` fuzzy
+    clusters, as ``skfuzzy.cluster.cmeans`` would do when called once per
+    feature. Here the features are processed together: the memberships
+    of all samples, features and clusters are evaluated as one broadcasted
+    ``(n_samples, n_features, n_clusters)`` operation, and the centers are
+    updated from the membership-weighted sums
+
+    .. math::
+        v_{fj} = \\frac{\\sum_i u_{ifj}^m x_{if}}{\\sum_i u_{ifj}^m}, \\quad
+        u_{ifj} = \\left(\\sum_k \\left(\\frac{|x_{if} - v_{fj}|}
+        {|x_{if} - v_{fk}|}\\right)^{2/(m-1)}\\right)^{-1}
+
+    Parameters
+    ----------
+    X : ndarray of shape (n_samples, n_features)
+        The samples to cluster.
+
+    n_clusters : int
+        The number of clusters per feature.
+
+    m : float, default=2.0
+        The fuzzifier exponent; it must be larger than 1.
+
+    error : float, default=0.005
+        Stopping criterion: iterations stop once no center moves by more
+        than `error`.
+
+    max_iter : int, default=1000
+        The maximum number of iterations.
+
+    chunk_size : int, default=None
+        The number of samples processed per block. The weighted sums are
+        accumulated block by block so that the temporaries never exceed
+        ``chunk_size * n_features * n_clusters`` values. If None, all the
+        samples are processed at once.
+
+    Returns
+    -------
+    centers : ndarray of shape (n_features, n_clusters)
+        The cluster centers of each feature, sorted in ascending order.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from gofast.estimators.util import fuzzy_cmeans
+    >>> X = np.r_[np.zeros(10), np.ones(10)].reshape(-1, 1)
+    >>> fuzzy_cmeans(X, 2).round(3)
+    array([[0., 1.]])
+    """
+    X = check_array(X, dtype=np.float64, to_frame=False, input_name="X")
+    n_samples, n_features = X.shape
+    n_clusters = validate_positive_integer(n_clusters, "n_clusters")
+    if m <= 1:
+        raise ValueError(f"The fuzzifier `m` must be larger than 1. Got {m}.")
+    chunk_size = n_samples if chunk_size is None else validate_positive_integer(
+        chunk_size, "chunk_size")
+
+    # Spread the initial centers over the quantiles of each feature so the
+    # result is deterministic and the clusters start already ordered.
+    centers = np.quantile(
+        X, (np.arange(n_clusters) + 0.5) / n_clusters, axis=0).T
+    numerator = np.empty_like(centers)
+    denominator = np.empty_like(centers)
+    for _ in range(max_iter):
+        numerator[:] = 0.
+        denominator[:] = 0.
+        for start in range(0, n_samples, chunk_size):
+            x = X[start:start + chunk_size, :, None]
+            weights = _cmeans_memberships(x, centers, m) ** m
+            numerator += (weights * x).sum(axis=0)
+            denominator += weights.sum(axis=0)
+        new_centers = numerator / denominator
+        shift = np.max(np.abs(new_centers - centers))
+        centers = new_centers
+        if shift < error:
+            break
+
+    return np.sort(centers, axis=1)
+
+def _cmeans_memberships(x, centers, m):
+    """Fuzzy c-means memberships of `x` (n, n_features, 1) to `centers`."""
+    distances = np.fmax(np.abs(x - centers), np.finfo(np.float64).eps)
+    inverse = distances ** (-2. / (m - 1.))
+    return inverse / inverse.sum(axis=-1, keepdims=True)
+
+def _triangular_fuzzy_sets(centers, lower, upper):
+    """
+    Triangular fuzzy sets ``(a, b, c)`` of shape (n_features, n_clusters, 3)
+    peaking at the sorted `centers` and reaching zero at the neighbouring
+    centers, or at the `lower` and `upper` bounds of each feature for the
+    outermost sets.
+    """
+    knots = np.column_stack([
+        np.minimum(lower, centers[:, 0]), centers,
+        np.maximum(upper, centers[:, -1])
+    ])
+    return np.stack(
+        [knots[:, :-2], knots[:, 1:-1], knots[:, 2:]], axis=-1)
+
+def triangular_membership(X, fuzzy_sets, chunk_size=None, dtype=np.float64):
+    """
+    Triangular membership degrees of every sample to every fuzzy set.
+
+    Vectorized equivalent of calling ``skfuzzy.trimf`` for each feature
+    and each of its fuzzy sets: the degrees are computed in one
+    broadcasted ``(n_samples, n_features, n_clusters)`` operation,
+
+    .. math::
+        \\mu(x) = \\max\\left(\\min\\left(\\frac{x - a}{b - a},
+        \\frac{c - x}{c - b}\\right), 0\\right)
+
+    Parameters
+    ----------
+    X : ndarray of shape (n_samples, n_features)
+        The samples to fuzzify.
+
+    fuzzy_sets : ndarray of shape (n_features, n_clusters, 3)
+        The ``(a, b, c)`` vertices of the triangle of each set, with
+        ``a <= b <= c``. A degenerate side (``a == b`` or ``b == c``) is
+        a vertical edge.
+
+    chunk_size : int, default=None
+        The number of samples fuzzified per block, which bounds the
+        temporaries to ``chunk_size * n_features * n_clusters`` values.
+        If None, all the samples are processed at once.
+
+    dtype : data-type, default=np.float64
+        The dtype of the returned degrees.
+
+    Returns
+    -------
+    memberships : ndarray of shape (n_samples, n_features, n_clusters)
+        The membership degree, in ``[0, 1]``, of each sample feature to
+        each fuzzy set of that feature.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from gofast.estimators.util import triangular_membership
+    >>> sets = np.array([[[0., 0., 1.], [0., 1., 1.]]])
+    >>> triangular_membership(np.array([[0.25]]), sets)
+    array([[[0.75, 0.25]]])
+    """
+    X = check_array(X, dtype=np.float64, to_frame=False, input_name="X")
+    fuzzy_sets = np.asarray(fuzzy_sets, dtype=np.float64)
+    if fuzzy_sets.ndim != 3 or fuzzy_sets.shape[::2] != (X.shape[1], 3):
+        raise ValueError(
+            "Expect `fuzzy_sets` of shape (n_features, n_clusters, 3) with"
+            f" n_features={X.shape[1]}. Got {fuzzy_sets.shape}.")
+    n_samples = X.shape[0]
+    chunk_size = n_samples if chunk_size is None else validate_positive_integer(
+        chunk_size, "chunk_size")
+
+    a, b, c = np.moveaxis(fuzzy_sets, -1, 0)
+    # Slopes of the rising and falling edges; a vertical edge has an
+    # infinite slope and turns into a step.
+    with np.errstate(divide='ignore'):
+        rise = 1. / (b - a)
+        fall = 1. / (c - b)
+    memberships = np.empty(
+        (n_samples,) + fuzzy_sets.shape[:2], dtype=dtype)
+    for start in range(0, n_samples, chunk_size):
+        x = X[start:start + chunk_size, :, None]
+        with np.errstate(invalid='ignore'):
+            left = np.where(np.isinf(rise), x >= b, (x - a) * rise)
+            right = np.where(np.isinf(fall), x <= b, (c - x) * fall)
+        memberships[start:start + chunk_size] = np.clip(
+            np.minimum(left, right), 0., 1.)
+
+    return memberships
+
 def estimate_memory_depth(X, default_depth=5):
     """
     Estimates the memory depth for a HammersteinWienerRegressor when none 
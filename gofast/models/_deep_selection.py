@@ -2,20 +2,84 @@
 #   License: BSD-3-Clause
 #   Author: LKouadio <etanoyau@gmail.com>
 
+import time
+import warnings
 import numpy as np
 from math import log
 from sklearn.base import clone, is_classifier
 from sklearn.metrics import check_scoring
-from sklearn.model_selection._validation import _fit_and_score
 from sklearn.model_selection._search import BaseSearchCV, ParameterSampler
 from sklearn.model_selection._split import check_cv
-from sklearn.utils.validation import indexable
+from sklearn.ensemble import (
+    HistGradientBoostingClassifier, HistGradientBoostingRegressor)
+from sklearn.exceptions import FitFailedWarning
+from sklearn.utils import check_random_state, _safe_indexing
+from sklearn.utils.metaestimators import _safe_split
+from sklearn.utils.validation import indexable, _num_samples
 from sklearn.utils.parallel import Parallel, delayed
 
 from .utils import aggregate_cv_results 
 
 __all__=["HyperbandSearchCV"]
 
+def _fit_and_score_budget(
+    estimator, X, y, scorer, train, test, parameters, resource, 
+    resource_name='n_samples', fit_params=None, return_train_score=True, 
+    error_score=np.nan
+    ):
+    """
+    Fits `estimator` on one CV fold with a Hyperband budget and scores it.
+
+    With ``resource_name='n_samples'`` the estimator is fit on the first 
+    `resource` samples of `train`; otherwise `resource` is assigned to the 
+    estimator parameter `resource_name`. The fitted estimator is returned so 
+    that it can be warm started on the next rung.
+
+    Returns
+    -------
+    estimator : estimator object
+        The fitted estimator.
+    result : dict
+        The fold result, with the keys expected by 
+        :func:`~gofast.models.utils.aggregate_cv_results`.
+    """
+    if resource_name == 'n_samples':
+        train = train[:resource]
+    else:
+        estimator.set_params(**{resource_name: resource})
+    fit_params = {
+        key: _safe_indexing(value, train) 
+        if hasattr(value, '__len__') and _num_samples(value) == _num_samples(X)
+        else value for key, value in (fit_params or {}).items()
+    }
+    X_train, y_train = _safe_split(estimator, X, y, train)
+    X_test, y_test = _safe_split(estimator, X, y, test, train)
+
+    result = {'parameters': parameters, 'n_test_samples': _num_samples(X_test),
+              'fit_error': None}
+    start_time = time.time()
+    try:
+        estimator.fit(X_train, y_train, **fit_params)
+    except Exception as e:
+        if error_score == 'raise':
+            raise
+        warnings.warn(
+            f"Estimator fit failed with {parameters} at {resource_name}="
+            f"{resource}. The score on this train-test partition will be set"
+            f" to {error_score}. Details:\n{e!r}", FitFailedWarning)
+        result.update(test_scores=error_score, train_scores=error_score,
+                      fit_time=time.time() - start_time, score_time=0.)
+        return estimator, result
+
+    result['fit_time'] = time.time() - start_time
+    start_time = time.time()
+    result['test_scores'] = scorer(estimator, X_test, y_test)
+    result['score_time'] = time.time() - start_time
+    result['train_scores'] = (scorer(estimator, X_train, y_train) 
+                              if return_train_score else np.nan)
+    return estimator, result
+
+
 class HyperbandSearchCV(BaseSearchCV):
     r"""
     Performs hyperparameter optimization using the Hyperband algorithm, 
@@ -63,6 +127,17 @@ class HyperbandSearchCV(BaseSearchCV):
     eta : int, default=3
         The reduction factor for pruning configurations in each round of 
         successive halving.
+    resource : str, default='n_samples'
+        What a budget `r` of the Hyperband schedule controls. With 
+        ``'n_samples'``, each configuration is fit on the fraction 
+        ``r / max_iter`` of every training fold, the subsets of successive 
+        rounds being nested. Any other value names an integer parameter of 
+        the estimator, e.g. ``'n_estimators'``, ``'max_iter'`` or 
+        ``'epochs'``, which is set to ``r``. If the estimator exposes 
+        `warm_start`, the configurations promoted to the next round keep 
+        training from their fitted state instead of restarting, so an 
+        ensemble only grows the missing members and an iterative estimator
+        only runs the missing iterations.
     cv : int, cross-validation generator or an iterable, default=5
         Determines the cross-validation splitting strategy.
     scoring : string, callable, list/tuple, dict or None, default=None
@@ -94,10 +169,10 @@ class HyperbandSearchCV(BaseSearchCV):
     best_estimator_ : estimator object
         The estimator that was chosen by the search, fitted with the best-found 
         parameters.
-    cv_results_ : dict
-        A dict that describes the fit results for each configuration evaluated.
-        The keys are column headers and the values are columns, where each entry
-        corresponds to one configuration.
+    cv_results_ : list of dicts
+        The fit results of each configuration at each budget it was evaluated
+        with, as returned by `_format_results`. The best configuration is 
+        chosen among the entries that reached the full budget `max_iter`.
     s_max_ : int
         The maximum number of configurations that can be evaluated, derived from
         `max_iter` and `eta`.
@@ -138,8 +213,11 @@ class HyperbandSearchCV(BaseSearchCV):
     optimization. It dynamically allocates and prunes resources, allowing for 
     a more effective search over the hyperparameter space.
     The actual computation within the method involves training models on subsets 
-    of the dataset for varying amounts of resources and iteratively pruning 
-    less promising models. The `fit` method supports classification, regression, 
+    of the dataset, or with a growing `resource` parameter, for varying amounts 
+    of resources and iteratively pruning less promising models. Only the 
+    survivors of a round are carried over and re-evaluated with a larger 
+    budget, so most configurations are only ever trained with a fraction of 
+    `max_iter`. The `fit` method supports classification, regression, 
     and clustering estimators following the scikit-learn API.
     
     """
@@ -149,6 +227,7 @@ class HyperbandSearchCV(BaseSearchCV):
         param_distributions, 
         max_iter=81, 
         eta=3, 
+        resource='n_samples', 
         cv=5, 
         scoring=None, 
         n_jobs=None, 
@@ -162,6 +241,7 @@ class HyperbandSearchCV(BaseSearchCV):
         self.param_distributions = param_distributions
         self.max_iter = max_iter 
         self.eta = eta 
+        self.resource = resource 
         self.cv = cv
         self.scoring = scoring
         self.n_jobs = n_jobs
@@ -309,91 +389,198 @@ class HyperbandSearchCV(BaseSearchCV):
         Notes
         -----
         - The actual computation of the method involves training models on subsets of
-          the dataset for varying amounts of resources and iteratively pruning less
-          promising models.
+          the dataset, or with a growing `resource`, for varying amounts of 
+          resources and iteratively pruning less promising models. The 
+          survivors of each round, not freshly sampled configurations, are 
+          promoted to the next one.
         - The `fit` method supports classification, regression, and clustering estimators
           following the scikit-learn API.
         """
         X, y, groups = indexable(X, y, groups)
         cv = check_cv(self.cv, y, classifier=is_classifier(self.estimator))
+        self._check_resource()
         self.s_max_, self.B_ = self._hyperband_resource_allocation()
 
+        rng = check_random_state(self.random_state)
+        scorer = check_scoring(self.estimator, scoring=self.scoring)
+        splits = list(cv.split(X, y, groups))
+        # A fixed permutation of each training fold keeps the sample
+        # subsets nested: a survivor sees a superset of its previous data.
+        if self.resource == 'n_samples':
+            splits = [(rng.permutation(train), test) for train, test in splits]
+        warm_start = self._supports_warm_start()
+
         all_candidate_params = []
         all_outs = []
+        parallel = Parallel(n_jobs=self.n_jobs, verbose=self.verbose,
+                            pre_dispatch=self.pre_dispatch)
 
         for s in reversed(range(self.s_max_ + 1)):
             # Compute initial number of configurations and resources
             n_configs = int(np.ceil(self.B_ / self.max_iter / (s + 1) * self.eta ** s))
-            resource = self.max_iter * self.eta ** (-s)
+            # Fresh configurations are drawn once per bracket only; every
+            # later rung re-evaluates the survivors of the previous one.
+            candidate_params = list(ParameterSampler(
+                self.param_distributions, n_configs, random_state=rng))
+            estimators = [[None] * len(splits) for _ in candidate_params]
 
             # Begin Successive Halving for each bracket
             for i in range(s + 1):
-                # Update the number of configs and resources for this round
-                n_candidates = n_configs * self.eta ** (-i)
-                resource = resource * self.eta ** (i)
-                
-                # Sample candidate parameters for this round
-                candidate_params = list(ParameterSampler(
-                    self.param_distributions, n_candidates, 
-                    random_state=self.random_state))
-                
-                # Ensure the scoring parameter is correctly set up
-                scoring = check_scoring(self.estimator, scoring=self.scoring)
-                # Evaluate candidate parameters
-                out = Parallel(n_jobs=self.n_jobs, verbose=self.verbose)(
-                    delayed(_fit_and_score)(
-                        clone(self.estimator), X, y, scoring, train_idx, test_idx,
-                        self.verbose, params, fit_params=fit_params,
+                resource = self.max_iter * self.eta ** (i - s)
+                # The warm-started survivors already trained on the budget of
+                # the previous rung.
+                done = (resource / self.eta if i > 0 and warm_start
+                        and not self._is_cumulative_resource() else 0)
+                out = parallel(
+                    delayed(_fit_and_score_budget)(
+                        self._budget_estimator(estimators[k][j], params, warm_start),
+                        X, y, scorer, train_idx, test_idx, params,
+                        resource=self._resource_value(
+                            resource, len(train_idx), done),
+                        resource_name=self.resource,
+                        fit_params=fit_params,
                         return_train_score=self.return_train_score,
                         error_score=self.error_score,
-                        return_parameters=True, 
-                        return_times =True, 
-                        return_n_test_samples =True, 
                         )
-                    for params in candidate_params
-                    for train_idx, test_idx in cv.split(X, y, groups)
+                    for k, params in enumerate(candidate_params)
+                    for j, (train_idx, test_idx) in enumerate(splits)
                 )
-                # Select top candidates based on current results if not the last round
+                n_splits = len(splits)
+                for k in range(len(candidate_params)):
+                    estimators[k] = [est for est, _ in out[k * n_splits:(k + 1) * n_splits]]
+                results = aggregate_cv_results([res for _, res in out])
+                for res in results:
+                    res.update(resource=resource, bracket=s, rung=i)
+
+                all_candidate_params.extend(res['params'] for res in results)
+                all_outs.extend(results)
+
+                # Promote the top configurations, with their fitted
+                # estimators, to the next rung of the bracket.
                 if i < s:
-                    out= aggregate_cv_results(out)
-                    candidate_params = self._select_top_candidates(
-                        out, n_configs // self.eta)
-      
-                # Extend the cumulative lists
-                all_candidate_params.extend(candidate_params)
-                all_outs.extend(out)
- 
+                    n_keep = max(int(len(candidate_params) / self.eta), 1)
+                    order = self._select_top_candidates(
+                        [dict(res, params=k) for k, res in enumerate(results)],
+                        n_keep)
+                    candidate_params = [candidate_params[k] for k in order]
+                    estimators = [estimators[k] for k in order]
+
         self.cv_results_ = self._format_results(all_outs, all_candidate_params)
-        self.best_index_ = np.nanargmax([res['mean_test_score'] for res in self.cv_results_])
+        # Only configurations that reached the full budget compete for best.
+        final_scores = [
+            res['mean_test_score'] if res['rung'] == res['bracket'] else -np.inf
+            for res in self.cv_results_
+        ]
+        self.best_index_ = int(np.nanargmax(final_scores))
         self.best_params_ = self.cv_results_[self.best_index_]['params']
         self.best_score_ = self.cv_results_[self.best_index_]['mean_test_score']
         
-        # Refit the best model on the full dataset
+        # Refit the best model on the full dataset with the full budget
         if self.refit:
-            self.best_estimator_ = clone(self.estimator).set_params(**self.best_params_)
+            best_params = dict(self.best_params_)
+            if self.resource != 'n_samples':
+                best_params[self.resource] = self._resource_value(
+                    self.max_iter, _num_samples(X))
+            self.best_estimator_ = clone(self.estimator).set_params(**best_params)
             self.best_estimator_.fit(X, y, **fit_params)
         
         return self
 
+    def _check_resource(self):
+        """
+        Validates the `resource` parameter against the estimator.
+
+        `resource` must either be ``'n_samples'`` or the name of an integer
+        parameter of the estimator, such as ``'n_estimators'``, ``'max_iter'``
+        or ``'epochs'``, which must not also be searched over in
+        `param_distributions`.
+        """
+        if self.resource == 'n_samples':
+            return
+        if self.resource not in self.estimator.get_params():
+            raise ValueError(
+                f"Invalid resource {self.resource!r}. Expect 'n_samples' or"
+                f" a parameter of {type(self.estimator).__name__}.")
+        distributions = self.param_distributions
+        if isinstance(distributions, dict):
+            distributions = [distributions]
+        if any(self.resource in dist for dist in distributions):
+            raise ValueError(
+                f"Resource {self.resource!r} is allocated by the search and"
+                " cannot be part of `param_distributions`.")
+
+    def _supports_warm_start(self):
+        """
+        Whether survivors can keep training from their previous rung.
+
+        Warm starting only applies when the budget is an estimator
+        parameter; with ``resource='n_samples'`` every rung refits on a
+        larger subset.
+        """
+        return (self.resource != 'n_samples'
+                and 'warm_start' in self.estimator.get_params())
+
+    def _budget_estimator(self, estimator, params, warm_start):
+        """
+        Returns the estimator to fit for one candidate on one fold.
+
+        A survivor's fitted estimator from the previous rung is reused when
+        the estimator supports `warm_start`; otherwise a fresh clone is set
+        with `params`.
+        """
+        if warm_start and estimator is not None:
+            return estimator
+        estimator = clone(self.estimator).set_params(**params)
+        if warm_start:
+            estimator.set_params(warm_start=True)
+        return estimator
+
+    def _resource_value(self, resource, n_train, done=0):
+        """
+        Converts a Hyperband budget into the value applied to a fit.
+
+        With ``resource='n_samples'`` the budget is the fraction
+        ``resource / max_iter`` of the `n_train` training samples; otherwise
+        it is the integer value of the estimator parameter `resource`, less
+        the budget `done` a warm-started estimator has already trained on.
+        """
+        if self.resource == 'n_samples':
+            return max(int(round(n_train * resource / self.max_iter)), 1)
+        return max(int(round(resource)) - int(round(done)), 1)
+
+    def _is_cumulative_resource(self):
+        """
+        Whether a warm-started fit grows the estimator up to `resource`.
+
+        The members of an ensemble, and the boosting iterations of the 
+        histogram gradient boosting estimators, are counted over all the 
+        fits; any other resource, e.g. ``'max_iter'`` or ``'epochs'``, counts
+        the iterations of a single call to fit, which a warm-started survivor
+        adds to those of the previous rungs.
+        """
+        return (self.resource == 'n_estimators' or isinstance(
+            self.estimator, (HistGradientBoostingClassifier, 
+                             HistGradientBoostingRegressor)))
+
     def _format_results(self, outs, candidate_params):
         """
         Formats the raw results from the hyperparameter optimization process 
         into a structured list.
     
-        This method takes the output from `_fit_and_score` alongside the 
-        corresponding candidate parameters and organizes this information into 
-        a list of dictionaries. Each dictionary contains detailed results for 
-        a single hyperparameter configuration, including the mean test score, 
-        standard deviation of the test score, number of test samples, execution 
-        time, and the status of the execution.
+        This method takes the per-rung results aggregated over the CV folds
+        alongside the corresponding candidate parameters and organizes this 
+        information into a list of dictionaries. Each dictionary contains 
+        detailed results for a single hyperparameter configuration at a single
+        budget, including the mean test score, standard deviation of the test 
+        score, number of test samples, fit time, the resource it was trained
+        with and the status of the execution.
     
         Parameters
         ----------
-        outs : list of tuples
-            The raw output from `_fit_and_score`. Each tuple in the list should 
-            contain the mean test score, standard deviation of the test score, 
-            number of test samples, execution time in seconds, and execution 
-            status for a given hyperparameter configuration.
+        outs : list of dicts
+            The results of :func:`~gofast.models.utils.aggregate_cv_results`, 
+            each updated with the 'resource', 'bracket' and 'rung' at which 
+            the configuration was evaluated.
         candidate_params : list of dicts
             The list of hyperparameter configurations that were evaluated. 
             Each configuration is represented as a dictionary.
@@ -405,31 +592,28 @@ class HyperbandSearchCV(BaseSearchCV):
             hyperparameter configuration. Keys in the dictionary include 
             'params' (the hyperparameter configuration), 
             'mean_test_score' (the mean score on the test set), 
-            'std_test_score' (the standard deviation 
-            of the test score), 'n_test_samples' (the number of test samples used),
-            'time_sec' (the execution time in seconds), and 'status' 
-            (the execution status).
+            'std_test_score' (the standard deviation of the test score), 
+            'mean_train_score', 'n_test_samples' (the number of test samples 
+            used), 'fit_times' (the mean fit time in seconds), 'resource' 
+            (the budget allocated), 'bracket' and 'rung' (the Hyperband 
+            bracket and successive-halving round), and 'status' (the 
+            execution status).
     
         Examples
         --------
-        >>> out = [
-        ...     (0.95, 0.02, 100, 60, "OK"),
-        ...     (0.90, 0.03, 100, 45, "OK")
+        >>> outs = [
+        ...     {'mean_test_score': 0.95, 'std_test_score': 0.02,
+        ...      'resource': 81, 'bracket': 0, 'rung': 0},
+        ...     {'mean_test_score': np.nan, 'std_test_score': np.nan,
+        ...      'resource': 81, 'bracket': 0, 'rung': 0}
         ... ]
         >>> candidate_params = [
         ...     {'C': 10, 'kernel': 'linear'},
         ...     {'C': 1, 'kernel': 'linear'}
         ... ]
-        >>> formatted_results = self._format_results(out, candidate_params)
-        >>> print(formatted_results)
-        [
-            {'params': {'C': 10, 'kernel': 'linear'}, 'mean_test_score': 0.95, 
-             'std_test_score': 0.02, 
-             'n_test_samples': 100, 'time_sec': 60, 'status': 'OK'},
-            {'params': {'C': 1, 'kernel': 'linear'}, 'mean_test_score': 0.90,
-             'std_test_score': 0.03, 
-             'n_test_samples': 100, 'time_sec': 45, 'status': 'OK'}
-        ]
+        >>> formatted_results = self._format_results(outs, candidate_params)
+        >>> [res['status'] for res in formatted_results]
+        ['OK', 'failed']
     
         Note
         ----
@@ -439,21 +623,19 @@ class HyperbandSearchCV(BaseSearchCV):
         """
         formatted_results = []
         for score, candidate_param in zip(outs, candidate_params):
-            # Unpack with flexibility, accommodating different lengths of score tuples
-            # The first element should always be mean_test_score
-            mean_test_score = score.get('mean_test_score', np.nan)  
-            std_test_score = score.get('std_test_score', np.nan) if len(score) > 1 else np.nan
-            n_test_samples = score.get('n_test_samples', None) if len(score) > 2 else np.nan
-            time_sec = score.get('fit_times', np.nan) if len(score) > 3 else np.nan
-            status = score if len(score) > 4 else 'OK'  # Assume 'OK' if not provided
-            
+            # Unpack with flexibility, accommodating partial score dicts
             result = {
                 'params': candidate_param,
-                'mean_test_score': mean_test_score,
-                'std_test_score': std_test_score,
-                'n_test_samples': n_test_samples,
-                'fit_times': time_sec,
-                'status': status
+                'mean_test_score': score.get('mean_test_score', np.nan),
+                'std_test_score': score.get('std_test_score', np.nan),
+                'mean_train_score': score.get('mean_train_score', np.nan),
+                'n_test_samples': score.get('mean_n_test_samples', np.nan),
+                'fit_times': score.get('mean_fit_times', np.nan),
+                'resource': score.get('resource', self.max_iter),
+                'bracket': score.get('bracket', 0),
+                'rung': score.get('rung', 0),
+                'status': 'failed' if np.isnan(
+                    score.get('mean_test_score', np.nan)) else 'OK',
             }
             formatted_results.append(result)
 
@@ -507,7 +689,10 @@ class HyperbandSearchCV(BaseSearchCV):
         differences in other metrics such as standard deviation of scores or 
         computational resources used.
         """
-        sorted_results = sorted(results, key=lambda x: x['mean_test_score'], reverse=True)
+        # Failed fits score NaN and must rank last, not break the sort.
+        sorted_results = sorted(
+            results, key=lambda x: np.nan_to_num(
+                x['mean_test_score'], nan=-np.inf), reverse=True)
         top_candidates = sorted_results[:n_candidates]
         top_candidate_params = [candidate['params'] for candidate in top_candidates]
         
@@ -7,18 +7,24 @@ Optimize Base Classes
 
 import joblib
 from abc import ABCMeta, abstractmethod
-from joblib import Parallel, delayed
+from itertools import repeat
+from concurrent.futures import ThreadPoolExecutor, ProcessPoolExecutor
+from joblib import Parallel, delayed, effective_n_jobs
 from tqdm import tqdm 
 import numpy as np 
 
 from sklearn.model_selection import ParameterGrid
 from sklearn.model_selection import GridSearchCV, RandomizedSearchCV
-from sklearn.base import BaseEstimator
+from sklearn.base import BaseEstimator, clone
+from sklearn.pipeline import Pipeline
 
 from ..api.summary import ModelSummary, ResultSummary
 from ..api.types import Any, Dict, List,Union, Tuple, Optional, ArrayLike
 from ..tools.coreutils import get_params, smart_format
+from ..tools.thread import threadpool_limits
 from ..tools.validator import filter_valid_kwargs, get_estimator_name
+from .folds import check_fold_cache
+from .journal import check_journal
 from .utils import get_strategy_method, align_estimators_with_params
 
 
@@ -80,6 +86,24 @@ class BaseOptimizer(metaclass=ABCMeta):
         The number of jobs to run in parallel for the optimization process. 
         `-1` means using all processors.
 
+    journal : str, path-like or SearchJournal, default=None
+        Append-only on-disk journal of the searches, see 
+        :class:`~gofast.models.journal.SearchJournal`. The result of each 
+        completed estimator search is stored in it, so that a restarted 
+        optimization only runs the searches left, and several processes 
+        sharing the journal split the estimators between them. The journal 
+        is also passed to the strategies accepting a `journal`, which then 
+        resume at the fold level.
+
+    fold_cache : bool, str, path-like or FoldCache, default=None
+        Cache of the cross-validation folds, see 
+        :class:`~gofast.models.folds.FoldCache`, passed to the strategies 
+        accepting a `fold_cache`. The other strategies run on the splits 
+        of the cache, and pipeline estimators cache their transformers in 
+        it, so the preprocessing shared by the candidates is fit once per 
+        fold. True uses a temporary cache, a path a cache stored in that 
+        directory. None keeps no cache.
+
     **search_kwargs : dict, optional
         Additional keyword arguments to pass to the search constructor.
 
@@ -145,6 +169,8 @@ class BaseOptimizer(metaclass=ABCMeta):
         cv=None, 
         save_results=False, 
         n_jobs=-1, 
+        journal=None, 
+        fold_cache=None, 
         **search_kwargs
         ):
         self.estimators = estimators
@@ -154,6 +180,8 @@ class BaseOptimizer(metaclass=ABCMeta):
         self.cv = cv
         self.save_results = save_results
         self.n_jobs = n_jobs
+        self.journal = journal
+        self.fold_cache = fold_cache
         self.search_kwargs = search_kwargs
         self.summary_ = None
         
@@ -221,6 +249,15 @@ class BaseOptimizer(metaclass=ABCMeta):
         self._control_strategy()
         self.estimators_nickname 
         
+    def _journal_kwargs(self):
+        """
+        Return the `journal` keyword of the strategy, empty when there is no 
+        journal or the strategy does not accept one.
+        """
+        if self.journal is None:
+            return {}
+        return filter_valid_kwargs(self.strategy_, {'journal': self.journal})
+
     def save_results_to_file(self, results_dict, filename=None):
         """
         Save the optimization results to a joblib file.
@@ -483,6 +520,99 @@ def _optimize_search2(
     return results_dict
 
 
+def _split_core_budget(n_tasks, n_jobs=-1, executor='threads'):
+    """
+    Split a global core budget between outer tasks and inner CV jobs.
+
+    The outer executor runs up to `n_tasks` searches at once, each search 
+    gets an equal share of the remaining cores for its own `n_jobs`, and 
+    each of these jobs is capped to the BLAS threads left, so that the 
+    nested parallelism never oversubscribes the cores.
+
+    The workers of the 'processes' executor run their search sequentially: 
+    a worker spawning loky workers of its own cannot exit until they time 
+    out. Their share of the cores goes to the BLAS threads instead.
+
+    Parameters
+    ----------
+    n_tasks : int
+        Number of independent searches to run.
+    n_jobs : int, default=-1
+        The core budget, as the joblib `n_jobs`. `-1` means using all 
+        processors.
+    executor : {'threads', 'processes', 'loky'}, default='threads'
+        The executor of the searches, see :func:`_run_tasks`.
+
+    Returns
+    -------
+    n_workers : int
+        Number of searches to run concurrently.
+    n_inner_jobs : int
+        The `n_jobs` of each search.
+    n_threads : int
+        The BLAS threads of each inner job.
+    """
+    budget = effective_n_jobs(n_jobs)
+    n_workers = max(1, min(n_tasks, budget))
+    n_inner_jobs = 1 if executor == 'processes' else max(1, budget // n_workers)
+    n_threads = max(1, budget // (n_workers * n_inner_jobs))
+    return n_workers, n_inner_jobs, n_threads
+
+def _run_tasks(func, tasks, executor='threads', n_workers=1, n_threads=None):
+    """
+    Run `func(*args)` for each `args` of `tasks` with the given executor.
+
+    Parameters
+    ----------
+    func : callable
+        The task function. It must be picklable, e.g. a module function, a 
+        `functools.partial` of one or a bound method, for the process-based 
+        executors.
+    tasks : iterable of tuples
+        The positional arguments of each call.
+    executor : {'threads', 'processes', 'loky'}, default='threads'
+        - 'threads' runs the tasks in a `ThreadPoolExecutor`. It only pays 
+          off when the fits release the GIL.
+        - 'processes' runs them in a `ProcessPoolExecutor`.
+        - 'loky' runs them with joblib's reusable loky workers, which also 
+          memory-map the large arrays shared by the tasks.
+    n_workers : int, default=1
+        Number of tasks run concurrently.
+    n_threads : int, optional
+        Maximum number of BLAS threads of each worker, enforced with 
+        :func:`~gofast.tools.thread.threadpool_limits`. None leaves the 
+        limits unchanged.
+
+    Yields
+    ------
+    The result of each task, in the order of `tasks`.
+    """
+    tasks = list(tasks)
+    if executor == 'threads':
+        # The limits are process-wide: set them once for all the threads.
+        with threadpool_limits(limits=n_threads), ThreadPoolExecutor(
+                max_workers=n_workers) as pool:
+            yield from pool.map(_call_with_limits, repeat(func), 
+                                repeat(None), tasks)
+    elif executor == 'processes':
+        with ProcessPoolExecutor(max_workers=n_workers) as pool:
+            yield from pool.map(_call_with_limits, repeat(func), 
+                                repeat(n_threads), tasks)
+    elif executor == 'loky':
+        yield from Parallel(n_jobs=n_workers, backend='loky')(
+            delayed(_call_with_limits)(func, n_threads, args) for args in tasks)
+    else:
+        raise ValueError(
+            f"Invalid executor {executor!r}. Expect 'threads', 'processes'"
+            " or 'loky'.")
+
+def _call_with_limits(func, n_threads, args):
+    """Call `func(*args)` with at most `n_threads` BLAS threads."""
+    if n_threads is None:
+        return func(*args)
+    with threadpool_limits(limits=n_threads):
+        return func(*args)
+
 def _validate_parameters(param_grids, estimators):
     """
     Align estimators with their corresponding parameter grids.
@@ -539,13 +669,14 @@ def _initialize_search(strategy, estimator, param_grid, scoring, cv, **search_kw
         An instance of thestrategy class initialized with the provided parameters.
     """
     strategy_class = get_strategy_method(strategy)
+    # The searches not accepting a journal are resumed as a whole only.
     search_kwargs = filter_valid_kwargs(strategy_class, search_kwargs)
     return strategy_class(
         estimator, param_grid, scoring=scoring, cv=cv, **search_kwargs)
 
 def _perform_search(
         name, estimator, param_grid,strategy, X, y, scoring, cv, 
-        search_kwargs, progress_bar_desc):
+        search_kwargs, progress_bar_desc, journal=None, fold_cache=None):
     """
     Perform the hyperparameter search.
 
@@ -584,6 +715,12 @@ def _perform_search(
     progress_bar_desc : str
         Description for the progress bar.
 
+    journal : SearchJournal, optional
+        The journal to resume the search from, see :func:`_fit_search`.
+
+    fold_cache : bool, str, path-like or FoldCache, optional
+        The cache of the cross-validation folds, see :func:`_fit_search`.
+
     Returns
     -------
     tuple
@@ -591,8 +728,9 @@ def _perform_search(
         best score, and cross-validation results.
     """
     search = _initialize_search(strategy, estimator, param_grid, scoring, cv, 
-                                **search_kwargs)
-    search.fit(X, y)
+                                journal=journal, **search_kwargs)
+    result = _fit_search(search, name, X, y, journal=journal, 
+                         fold_cache=fold_cache)
     n_combinations = len(list(ParameterGrid(param_grid)))
     pbar = tqdm(total=n_combinations, desc=progress_bar_desc, ncols=103,
                 ascii=True, position=0, leave=True)
@@ -602,12 +740,98 @@ def _perform_search(
 
     return (
         name,
-        search.best_estimator_,
-        search.best_params_,
-        search.best_score_,
-        search.cv_results_
+        result['best_estimator_'],
+        result['best_params_'],
+        result['best_score_'],
+        result['cv_results_']
     )
 
+def _fit_search(search, name, X, y, journal=None, fold_cache=None):
+    """
+    Fit the `search` of the estimator `name` and return its results.
+
+    With a `journal`, a search already completed on the same data is not 
+    run again: its stored results are returned instead. A search claimed 
+    by another live process is waited for; otherwise it is claimed, fit and 
+    its results are stored.
+
+    With a `fold_cache`, the search runs on cached folds, see 
+    :func:`_apply_fold_cache`.
+
+    Parameters
+    ----------
+    search : search instance
+        The unfitted search, e.g. a `GridSearchCV`.
+    name : str
+        Name of the estimator.
+    X : array-like of shape (n_samples, n_features)
+        Training data.
+    y : array-like of shape (n_samples,)
+        Target values.
+    journal : str, path-like or SearchJournal, optional
+        The search journal.
+    fold_cache : bool, str, path-like or FoldCache, optional
+        The cache of the cross-validation folds.
+
+    Returns
+    -------
+    dict
+        The 'best_estimator_', 'best_params_', 'best_score_' and 
+        'cv_results_' of the search.
+    """
+    journal = check_journal(journal)
+    if journal is not None:
+        journal = journal.scope(X, y)
+        key = journal.search_key(name, search)
+        result = journal.get_result(key)
+        if result is None and not journal.claim(key):
+            result = journal.wait_result(key)
+        if result is not None:
+            return result
+
+    fold_cache = check_fold_cache(fold_cache)
+    memorized = fold_cache is not None and _apply_fold_cache(
+        search, X, y, fold_cache)
+    search.fit(X, y)
+    if memorized and hasattr(search, 'best_estimator_'):
+        # The cache only serves the search, not the returned pipeline.
+        search.best_estimator_.set_params(memory=None)
+    result = {
+        'best_estimator_': search.best_estimator_,
+        'best_params_': search.best_params_,
+        'best_score_': search.best_score_,
+        'cv_results_': search.cv_results_,
+    }
+    if journal is not None:
+        journal.save_result(key, result, name=name)
+    return result
+
+def _apply_fold_cache(search, X, y, fold_cache):
+    """
+    Set up `search` to run on the folds of `fold_cache`.
+
+    The searches accepting a `fold_cache` take it as is. For the others, 
+    e.g. `GridSearchCV`, the splits of the cache replace `cv`, and a 
+    pipeline estimator caches its transformers in the cache directory 
+    through its `memory`, so that the transformers left unchanged between
+    candidates are fit once per fold.
+
+    Returns True when the `memory` of the estimator was set.
+    """
+    params = search.get_params(deep=False)
+    if 'fold_cache' in params:
+        search.set_params(fold_cache=fold_cache)
+        return False
+    estimator = params.get('estimator')
+    updates = {'cv': fold_cache.split(
+        X, y, params.get('cv'), estimator=estimator)}
+    if (fold_cache.preprocessing and isinstance(estimator, Pipeline) 
+            and estimator.memory is None):
+        updates['estimator'] = clone(estimator).set_params(
+            memory=fold_cache.memory)
+    search.set_params(**updates)
+    return 'estimator' in updates
+
 def _process_estimators_and_params(
     param_grids: List[Union[Dict[str, List[Any]], Tuple[BaseEstimator, Dict[str, List[Any]]]]],
     estimators: Optional[List[BaseEstimator]] = None
@@ -4,15 +4,32 @@
 
 """ Optimization search"""
 
+import time
 import random
+import numbers
+import warnings
+from collections import defaultdict
 import numpy as np 
+from scipy.linalg import cho_solve, cholesky, solve_triangular
+from scipy.spatial.distance import cdist
+from scipy.stats import norm
 
 from abc import abstractmethod
+from sklearn.exceptions import FitFailedWarning
+from sklearn.metrics import check_scoring
 from sklearn.model_selection import cross_val_score
 from sklearn.model_selection._search import BaseSearchCV
-from sklearn.base import  clone
+from sklearn.model_selection._validation import _check_method_params
+from sklearn.model_selection._split import check_cv
+from sklearn.base import  clone, is_classifier
+from sklearn.utils import indexable
+from sklearn.utils.metaestimators import _safe_split
+from sklearn.utils.parallel import Parallel, delayed
+from joblib import effective_n_jobs
 
 from ..tools.validator import _is_numeric_dtype 
+from .folds import check_fold_cache
+from .journal import check_journal
 from .utils import apply_param_types 
 
 class BaseSwarmSearch(BaseSearchCV):
@@ -215,7 +232,10 @@ class BaseSwarmSearch(BaseSearchCV):
         pre_dispatch="2*n_jobs",
         refit=True,
         error_score=np.nan,
-        return_train_score=True
+        return_train_score=True, 
+        pruning=None, 
+        journal=None, 
+        fold_cache=None
         ):
         super().__init__(
             estimator=estimator,
@@ -233,11 +253,23 @@ class BaseSwarmSearch(BaseSearchCV):
         self.inertia_weight = inertia_weight
         self.cognitive_coeff = cognitive_coeff
         self.social_coeff = social_coeff
+        self.pruning = pruning
+        self.journal = journal
+        self.fold_cache = fold_cache
 
     def fit(self, X, y=None, groups=None, **fit_params):
         self.X = X.copy()
         self.y = y.copy()
-        super().fit(X, y, groups=groups, **fit_params)
+        self._fitness_cache = {}
+        self._groups, self._fit_params = groups, fit_params
+        self._pruner = _make_pruner(self.pruning)
+        self._journal = _scope_journal(self, X, y, groups, fit_params)
+        self._folds = _materialize_folds(self, X, y, groups)
+        if self._journal is not None:
+            _fit_from_journal(self, X, y, groups=groups, **fit_params)
+        else:
+            super().fit(X, y, groups=groups, **fit_params)
+        _record_search_history(self)
         return self
 
     def _run_search(self, evaluate_candidates):
@@ -271,14 +303,24 @@ class BaseSwarmSearch(BaseSearchCV):
         return velocity
 
     def _evaluate_particle(self, particle, X, y):
-        estimator = clone(self.estimator)
-        particle['position'] = apply_param_types(estimator, particle['position'])
-        estimator.set_params(**particle['position'])
-        score = np.mean(cross_val_score(
-            estimator, X, y, cv=self.cv,
-            scoring=self.scoring, n_jobs=self.n_jobs)
-        )
-        return score
+        return self._evaluate_particles([particle], X, y)[0]
+
+    def _evaluate_particles(self, particles, X, y):
+        # Score the whole swarm in one batch of particles x folds jobs.
+        for particle in particles:
+            particle['position'] = apply_param_types(
+                self.estimator, particle['position'])
+        return _evaluate_population(
+            self.estimator, [particle['position'] for particle in particles], 
+            X, y, cv=self.cv, scoring=self.scoring, n_jobs=self.n_jobs, 
+            pre_dispatch=self.pre_dispatch, error_score=self.error_score, 
+            cache=getattr(self, '_fitness_cache', None), 
+            pruner=getattr(self, '_pruner', None), 
+            journal=getattr(self, '_journal', None), 
+            folds=getattr(self, '_folds', None), 
+            return_train_score=self.return_train_score, 
+            groups=getattr(self, '_groups', None), 
+            fit_params=getattr(self, '_fit_params', None))
 
     def _move_particles(self, particles, global_best):
         for particle in particles:
@@ -370,8 +412,8 @@ class PSOBaseSearch(BaseSearchCV):
         position.
 
     n_jobs : int, default=1
-        The number of jobs to run in parallel for `cross_val_score`. -1 means 
-        using all processors.
+        The number of jobs to run in parallel over the particles x CV folds 
+        of each iteration. -1 means using all processors.
 
     verbose : int, default=0
         Controls the verbosity of output during the optimization process.
@@ -390,6 +432,22 @@ class PSOBaseSearch(BaseSearchCV):
     return_train_score : bool, default=True
         If False, the `cv_results_` attribute will not include training scores.
 
+    pruning : {'median', 'bound'} or None, default=None
+        Fold-level pruning of the particles. After each CV fold but the last, 
+        a candidate whose running mean score falls below the median of the 
+        running means recorded at that fold (``'median'``), or below the 
+        best score completed so far (``'bound'``), skips its remaining 
+        folds. Every candidate evaluated by the search is recorded 
+        in `cv_results_`, whose 'status' column is ``'completed'`` or 
+        ``'pruned'``. None runs all the folds.
+
+    journal : str, path-like or SearchJournal, default=None
+        Append-only on-disk journal of the fold scores, see 
+        :class:`~gofast.models.journal.SearchJournal`. A restarted search 
+        reuses the folds already recorded instead of refitting them, and 
+        several processes sharing the journal split the candidates between 
+        them. None keeps no journal.
+
     Notes
     -----
     This is an abstract class and cannot be instantiated directly. Instead, it 
@@ -417,6 +475,9 @@ class PSOBaseSearch(BaseSearchCV):
         refit=True, 
         error_score=np.nan, 
         return_train_score=True, 
+        pruning=None, 
+        journal=None, 
+        fold_cache=None 
     ):
         super().__init__(
             estimator=estimator, 
@@ -434,6 +495,9 @@ class PSOBaseSearch(BaseSearchCV):
         self.inertia_weight = inertia_weight
         self.cognitive_coeff = cognitive_coeff
         self.social_coeff = social_coeff
+        self.pruning = pruning
+        self.journal = journal
+        self.fold_cache = fold_cache
     
     def fit(self, X, y=None, groups=None, **fit_params):
         """
@@ -466,7 +530,16 @@ class PSOBaseSearch(BaseSearchCV):
         """
         self.X = X.copy()
         self.y = y.copy()
-        super().fit(X, y, groups=groups, **fit_params)
+        self._fitness_cache = {}
+        self._groups, self._fit_params = groups, fit_params
+        self._pruner = _make_pruner(self.pruning)
+        self._journal = _scope_journal(self, X, y, groups, fit_params)
+        self._folds = _materialize_folds(self, X, y, groups)
+        if self._journal is not None:
+            _fit_from_journal(self, X, y, groups=groups, **fit_params)
+        else:
+            super().fit(X, y, groups=groups, **fit_params)
+        _record_search_history(self)
         return self
 
     def _run_search(self, evaluate_candidates):
@@ -595,18 +668,47 @@ class PSOBaseSearch(BaseSearchCV):
         score : float
             The fitness score of the particle's position.
         """
-        #estimator_name = self.estimator.__class__.__name__
-        estimator = clone(self.estimator)
-        
-        # Apply parameter types to particle['position']
-        particle['position'] = apply_param_types(estimator, particle['position'])
-        
-        estimator.set_params(**particle['position'])
-        score = np.mean(cross_val_score(
-            estimator, X, y, cv=self.cv,
-            scoring=self.scoring, n_jobs=self.n_jobs)
-        )
-        return score
+        return self._evaluate_particles([particle], X, y)[0]
+
+    def _evaluate_particles(self, particles, X, y):
+        """
+        Evaluate the fitness of every particle of the swarm at once.
+    
+        All particles x CV folds are dispatched as one parallel batch, 
+        and positions already visited during the search are scored from 
+        the cache instead of being refit.
+    
+        Parameters
+        ----------
+        particles : list of dicts
+            The particles to evaluate. Their positions are cast to the 
+            estimator parameter types in place.
+    
+        X : array-like of shape (n_samples, n_features)
+            Training vectors.
+    
+        y : array-like of shape (n_samples,)
+            Target values.
+    
+        Returns
+        -------
+        scores : list of float
+            The fitness score of each particle's position.
+        """
+        for particle in particles:
+            particle['position'] = apply_param_types(
+                self.estimator, particle['position'])
+        return _evaluate_population(
+            self.estimator, [particle['position'] for particle in particles], 
+            X, y, cv=self.cv, scoring=self.scoring, n_jobs=self.n_jobs, 
+            pre_dispatch=self.pre_dispatch, error_score=self.error_score, 
+            cache=getattr(self, '_fitness_cache', None), 
+            pruner=getattr(self, '_pruner', None), 
+            journal=getattr(self, '_journal', None), 
+            folds=getattr(self, '_folds', None), 
+            return_train_score=self.return_train_score, 
+            groups=getattr(self, '_groups', None), 
+            fit_params=getattr(self, '_fit_params', None))
     
     def _move_particles(self, particles, global_best):
         """
@@ -960,8 +1062,8 @@ class AnnealingBaseSearch(BaseSearchCV):
         Controls the randomness of the estimator for reproducible results.
 
     n_jobs : int, default=1
-        Number of jobs to run in parallel for `cross_val_score`. -1 means using 
-        all processors.
+        Number of jobs to run in parallel over the candidates x CV folds 
+        evaluated together. -1 means using all processors.
 
     verbose : int, default=0
         Controls the verbosity of output during the optimization process.
@@ -979,6 +1081,22 @@ class AnnealingBaseSearch(BaseSearchCV):
     return_train_score : bool, default=True
         If True, include training scores in the `cv_results_` attribute.
 
+    pruning : {'median', 'bound'} or None, default=None
+        Fold-level pruning of the proposals. After each CV fold but the last, 
+        a candidate whose running mean score falls below the median of the 
+        running means recorded at that fold (``'median'``), or below the 
+        best score completed so far (``'bound'``), skips its remaining 
+        folds. Every candidate evaluated by the search is recorded 
+        in `cv_results_`, whose 'status' column is ``'completed'`` or 
+        ``'pruned'``. None runs all the folds.
+
+    journal : str, path-like or SearchJournal, default=None
+        Append-only on-disk journal of the fold scores, see 
+        :class:`~gofast.models.journal.SearchJournal`. A restarted search 
+        reuses the folds already recorded instead of refitting them, and 
+        several processes sharing the journal split the candidates between 
+        them. None keeps no journal.
+
     Note
     ----
     This is an abstract class and cannot be instantiated directly. Subclasses 
@@ -1002,7 +1120,10 @@ class AnnealingBaseSearch(BaseSearchCV):
         pre_dispatch="2*n_jobs", 
         refit=True,
         error_score=np.nan,
-        return_train_score=True
+        return_train_score=True, 
+        pruning=None, 
+        journal=None, 
+        fold_cache=None
     ):
         super().__init__(
             estimator=estimator, 
@@ -1019,6 +1140,9 @@ class AnnealingBaseSearch(BaseSearchCV):
         self.alpha = alpha
         self.max_iter = max_iter
         self.random_state = random_state
+        self.pruning = pruning
+        self.journal = journal
+        self.fold_cache = fold_cache
 
     def _run_search(self, evaluate_candidates):
         """
@@ -1141,7 +1265,16 @@ class AnnealingBaseSearch(BaseSearchCV):
         parameters found during the annealing process.
         """
         self.X=X.copy() ; self.y=y.copy() 
-        super().fit(X, y, groups=groups, **fit_params)
+        self._fitness_cache = {}
+        self._groups, self._fit_params = groups, fit_params
+        self._pruner = _make_pruner(self.pruning)
+        self._journal = _scope_journal(self, X, y, groups, fit_params)
+        self._folds = _materialize_folds(self, X, y, groups)
+        if self._journal is not None:
+            _fit_from_journal(self, X, y, groups=groups, **fit_params)
+        else:
+            super().fit(X, y, groups=groups, **fit_params)
+        _record_search_history(self)
         return self
 
     def _random_hyperparameters(self):
@@ -1187,13 +1320,38 @@ class AnnealingBaseSearch(BaseSearchCV):
             The mean cross-validation score of the estimator with the given 
             hyperparameters.
         """
-        hyperparameters = apply_param_types(self.estimator, hyperparameters)
-        estimator = clone(self.estimator).set_params(**hyperparameters)
-        score = np.mean(cross_val_score(
-            estimator, self.X, self.y, cv=self.cv, scoring=self.scoring, 
-            n_jobs= self.n_jobs)
-            )
-        return score
+        return self._evaluate_population_fitness([hyperparameters])[0]
+
+    def _evaluate_population_fitness(self, population):
+        """
+        Evaluate the fitness of several sets of hyperparameters at once.
+    
+        The candidates x CV folds are dispatched as one parallel batch, and 
+        sets already evaluated during the search are scored from the cache.
+    
+        Parameters
+        ----------
+        population : list of dicts
+            Hyperparameters of the estimator.
+    
+        Returns
+        -------
+        scores : list of float
+            The mean cross-validation score of each set of hyperparameters.
+        """
+        population = [apply_param_types(self.estimator, hyperparameters)
+                      for hyperparameters in population]
+        return _evaluate_population(
+            self.estimator, population, self.X, self.y, cv=self.cv, 
+            scoring=self.scoring, n_jobs=self.n_jobs, 
+            pre_dispatch=self.pre_dispatch, error_score=self.error_score, 
+            cache=getattr(self, '_fitness_cache', None), 
+            pruner=getattr(self, '_pruner', None), 
+            journal=getattr(self, '_journal', None), 
+            folds=getattr(self, '_folds', None), 
+            return_train_score=self.return_train_score, 
+            groups=getattr(self, '_groups', None), 
+            fit_params=getattr(self, '_fit_params', None))
 
     def _acceptance_criterion(self, current_score, next_score, temperature):
         """
@@ -1245,9 +1403,10 @@ class GeneticBaseSearch(BaseSearchCV):
         the test set. Can be a string, a callable, or None.
 
     n_jobs : int or None, default=None
-        The number of jobs to run in parallel for `cross_val_score`. -1 means
-        using all available processors. This can speed up the fitness
-        evaluation, especially for computationally intensive models.
+        The number of jobs to run in parallel over the individuals x CV 
+        folds of a generation. -1 means using all available processors. 
+        This can speed up the fitness evaluation, especially for 
+        computationally intensive models.
 
     cv : int, cross-validation generator, or an iterable, default=None
         Determines the cross-validation splitting strategy. Could be an integer,
@@ -1301,6 +1460,22 @@ class GeneticBaseSearch(BaseSearchCV):
         If True, the training scores for each set of hyperparameters will be
         returned in the `cv_results_` attribute.
 
+    pruning : {'median', 'bound'} or None, default=None
+        Fold-level pruning of the individuals. After each CV fold but the last, 
+        a candidate whose running mean score falls below the median of the 
+        running means recorded at that fold (``'median'``), or below the 
+        best score completed so far (``'bound'``), skips its remaining 
+        folds. Every candidate evaluated by the search is recorded 
+        in `cv_results_`, whose 'status' column is ``'completed'`` or 
+        ``'pruned'``. None runs all the folds.
+
+    journal : str, path-like or SearchJournal, default=None
+        Append-only on-disk journal of the fold scores, see 
+        :class:`~gofast.models.journal.SearchJournal`. A restarted search 
+        reuses the folds already recorded instead of refitting them, and 
+        several processes sharing the journal split the candidates between 
+        them. None keeps no journal.
+
     """
     @abstractmethod
     def __init__(
@@ -1322,6 +1497,9 @@ class GeneticBaseSearch(BaseSearchCV):
         pre_dispatch="2*n_jobs",
         error_score=np.nan,
         return_train_score=True,
+        pruning=None, 
+        journal=None, 
+        fold_cache=None 
     ):
         super().__init__(
             estimator=estimator, 
@@ -1341,6 +1519,9 @@ class GeneticBaseSearch(BaseSearchCV):
         self.selection_method = selection_method
         self.tournament_size = tournament_size
         self.random_state=random_state 
+        self.pruning = pruning
+        self.journal = journal
+        self.fold_cache = fold_cache
  
     def fit(self, X, y=None, groups=None, **fit_params):
         """
@@ -1388,9 +1569,83 @@ class GeneticBaseSearch(BaseSearchCV):
             Instance of fitted estimator.
             
         """
-        super().fit(X, y, groups=groups, **fit_params)
+        self.X = X ; self.y = y 
+        self._fitness_cache = {}
+        self._groups, self._fit_params = groups, fit_params
+        self._pruner = _make_pruner(self.pruning)
+        self._journal = _scope_journal(self, X, y, groups, fit_params)
+        self._folds = _materialize_folds(self, X, y, groups)
+        if self._journal is not None:
+            _fit_from_journal(self, X, y, groups=groups, **fit_params)
+        else:
+            super().fit(X, y, groups=groups, **fit_params)
+        _record_search_history(self)
         return self
 
+    def _evaluate_generation(self, population, evaluate_candidates):
+        """
+        Score a generation, evaluating only the individuals not seen yet.
+
+        The unseen individuals are passed to `evaluate_candidates` in a 
+        single call, which fits all of them across all the CV folds in one 
+        parallel batch. Individuals surviving from previous generations, or 
+        duplicated within this one, are scored from the cache.
+
+        Parameters
+        ----------
+        population : list of dicts
+            The individuals of the current generation.
+        evaluate_candidates : callable
+            The callback provided by `BaseSearchCV` to `_run_search`.
+
+        Returns
+        -------
+        scores : list of float
+            The mean test score of each individual, in order.
+        """
+        cache = self.__dict__.setdefault('_fitness_cache', {})
+        pruner = getattr(self, '_pruner', None)
+        journal = getattr(self, '_journal', None)
+        folds = getattr(self, '_folds', None)
+        if pruner is not None or journal is not None or folds is not None:
+            # Pruned, journaled or fold-cached individuals skip 
+            # `evaluate_candidates`, whose folds cannot be interrupted, 
+            # resumed nor served from a cache; they reach `cv_results_` at 
+            # the end.
+            return _evaluate_population(
+                self.estimator, population, self.X, self.y, cv=self.cv, 
+                scoring=self.scoring, n_jobs=self.n_jobs, 
+                pre_dispatch=self.pre_dispatch, error_score=self.error_score, 
+                cache=cache, pruner=pruner, journal=journal, folds=folds, 
+                return_train_score=self.return_train_score, 
+                groups=getattr(self, '_groups', None), 
+                fit_params=getattr(self, '_fit_params', None))
+        unseen = {}
+        for individual in population:
+            key = _candidate_key(individual)
+            if key not in cache:
+                unseen.setdefault(key, individual)
+        if unseen:
+            # `evaluate_candidates` returns all the results so far; the 
+            # new candidates are the trailing entries.
+            out = evaluate_candidates(list(unseen.values()))
+            scores = out["mean_test_score"][-len(unseen):]
+            for (key, individual), score in zip(unseen.items(), scores):
+                cache[key] = {'params': individual, 'split_scores': None, 
+                              'mean_test_score': score, 'status': 'completed'}
+        return [cache[_candidate_key(individual)]['mean_test_score'] 
+                for individual in population]
+
+    def _is_completed(self, individual):
+        """
+        Whether `individual` was scored on all the CV folds, i.e. was not 
+        pruned. Only those are compared for the best score, the mean of a 
+        pruned candidate being taken over its first folds only.
+        """
+        record = getattr(self, '_fitness_cache', {}).get(
+            _candidate_key(individual))
+        return record is None or record['status'] == 'completed'
+
     def _generate_population(self):
         """
         Generate the initial population of hyperparameter sets.
@@ -1611,6 +1866,636 @@ def _is_single_numeric(values):
 
 def _choose_single_numeric(values):
     """Return the single numeric value or randomly choose from a list of one element."""
-    return values[0] if len(values) == 1 else random.choice(values)       
-        
+    return values[0] if len(values) == 1 else random.choice(values)
+
+
+def _candidate_key(params):
+    """Return a hashable key identifying a candidate parameter set."""
+    return tuple(sorted((name, repr(value)) for name, value in params.items()))
+
+def _fit_and_score_fold(
+    estimator, X, y, scorer, train, test, error_score=np.nan, 
+    journal=None, key=None, fold=None, data=None, return_train_score=False, 
+    fit_params=None
+    ):
+    """
+    Fit `estimator` on the `train` fold and score it on the `test` fold.
+    
+    Returns the test score, the fit and score times and, with 
+    `return_train_score`, the train score (None otherwise). With a 
+    `journal`, they are appended to it under `key` and `fold` as soon as 
+    the fold completes. The `data` of a cached fold, 
+    ``(X_train, y_train, X_test, y_test)``, replaces the split of `X` and 
+    `y`. The `fit_params` are those of the `train` samples.
+    """
+    if data is None:
+        X_train, y_train = _safe_split(estimator, X, y, train)
+        X_test, y_test = _safe_split(estimator, X, y, test, train)
+    else:
+        X_train, y_train, X_test, y_test = data
+    train_score = None
+    start_time = time.time()
+    try:
+        estimator.fit(X_train, y_train, **(fit_params or {}))
+    except Exception as e:
+        if error_score == 'raise':
+            raise
+        warnings.warn(
+            "Estimator fit failed. The score on this train-test partition"
+            f" will be set to {error_score}. Details:\n{e!r}", FitFailedWarning)
+        fit_time, score_time = time.time() - start_time, 0.
+        score = error_score
+        if return_train_score:
+            train_score = error_score
+    else:
+        fit_time = time.time() - start_time
+        score = scorer(estimator, X_test, y_test)
+        score_time = time.time() - start_time - fit_time
+        if return_train_score:
+            train_score = scorer(estimator, X_train, y_train)
+    if journal is not None:
+        journal.record(key, fold, score, fit_time, 
+                       params=estimator.get_params(deep=False), 
+                       estimator=type(estimator).__name__, 
+                       score_time=score_time, train_score=train_score)
+    return score, fit_time, score_time, train_score
+
+class _FoldPruner:
+    """
+    Fold-level pruning rule shared by the population evaluators.
+
+    After every CV fold but the last, a candidate whose running mean score 
+    falls below the threshold of the rule is not fit on its remaining folds:
+
+    - ``'median'`` compares it with the median running mean of all the 
+      candidates scored at the same fold so far, once at least 
+      `n_min_history` of them are known.
+    - ``'bound'`` compares it with the best mean score of the candidates 
+      completed so far.
 
+    Parameters
+    ----------
+    policy : {'median', 'bound'}
+        The pruning rule.
+    n_min_history : int, default=5
+        Number of running means required at a fold before the median rule
+        prunes at that fold.
+    """
+    def __init__(self, policy, n_min_history=5):
+        if policy not in ('median', 'bound'):
+            raise ValueError(
+                f"Invalid pruning policy {policy!r}. Expect 'median',"
+                " 'bound' or None.")
+        self.policy = policy
+        self.n_min_history = n_min_history
+        self.history_ = {}
+        self.best_score_ = -np.inf
+
+    def prune(self, fold, running_scores):
+        """
+        Record the running means of a population at `fold` and return the 
+        mask of the candidates to prune.
+        """
+        running_scores = np.asarray(running_scores, dtype=float)
+        history = self.history_.setdefault(fold, [])
+        history.extend(running_scores[~np.isnan(running_scores)])
+        if self.policy == 'median':
+            if len(history) < self.n_min_history:
+                return np.zeros(len(running_scores), dtype=bool)
+            threshold = np.median(history)
+        else:
+            threshold = self.best_score_
+        # NaN comparisons are False: failed folds are never pruned.
+        return running_scores < threshold
+
+    def update(self, scores):
+        """Update the incumbent with the mean scores of completed candidates."""
+        scores = np.asarray(scores, dtype=float)
+        if np.any(~np.isnan(scores)):
+            self.best_score_ = max(self.best_score_, np.nanmax(scores))
+
+def _make_pruner(pruning):
+    """Return the `_FoldPruner` of a `pruning` policy, or None."""
+    return None if pruning is None else _FoldPruner(pruning)
+
+def _scope_journal(search, X, y, groups=None, fit_params=None):
+    """Return the journal of `search` scoped to its data and CV settings."""
+    journal = check_journal(search.journal)
+    if journal is None:
+        return None
+    return journal.scope(X, y, groups=groups, fit_params=fit_params or {}, 
+                         cv=search.cv, scoring=search.scoring, 
+                         error_score=search.error_score)
+
+def _materialize_folds(search, X, y, groups=None):
+    """Return the cached folds of `search`, or None without fold cache."""
+    fold_cache = check_fold_cache(search.fold_cache)
+    if fold_cache is None:
+        return None
+    return fold_cache.materialize(
+        search.estimator, X, y, cv=search.cv, 
+        param_names=list(search.param_space), groups=groups, 
+        n_jobs=search.n_jobs)
+
+def _evaluate_population(
+    estimator, candidates, X, y, *, cv=None, scoring=None, n_jobs=None, 
+    pre_dispatch="2*n_jobs", error_score=np.nan, cache=None, pruner=None, 
+    journal=None, folds=None, return_train_score=False, groups=None, 
+    fit_params=None
+    ):
+    """
+    Cross-validate a whole population of candidates in one parallel batch.
+
+    Every (candidate, fold) pair of the population is dispatched as a single
+    joblib job, so the available workers are not bounded by the number of
+    folds. Large `X` and `y` are memory-mapped once and shared by the 
+    workers. Candidates already present in `cache`, or repeated within the
+    population, are not refit.
+
+    With a `pruner`, the population is instead evaluated one fold at a time,
+    each fold being a parallel batch over the remaining candidates, and the
+    candidates pruned after a fold skip their remaining folds.
+
+    With a `journal`, the folds already recorded in it are not refit and 
+    every fold fit is recorded as soon as it completes. Unless pruning, the
+    candidates are also claimed in the journal, and those claimed by 
+    another process are waited for rather than fit twice.
+
+    Parameters
+    ----------
+    estimator : estimator object
+        The unfitted estimator to clone for each candidate.
+    candidates : list of dicts
+        The parameter sets to evaluate.
+    X : array-like of shape (n_samples, n_features)
+        Training vectors.
+    y : array-like of shape (n_samples,)
+        Target values.
+    cv, scoring, n_jobs, pre_dispatch, error_score : 
+        As in :class:`~sklearn.model_selection.GridSearchCV`.
+    cache : dict, optional
+        Mapping of candidate keys to evaluation records, updated in place 
+        with the newly evaluated candidates. A record holds the 'params', 
+        the 'split_scores' (NaN for the pruned folds), the 
+        'mean_test_score' over the folds run and the 'status', either 
+        ``'completed'`` or ``'pruned'``, along with the 'fit_times', the 
+        'score_times' and the 'train_scores' of the folds.
+    pruner : _FoldPruner, optional
+        The fold-level pruning rule. None runs all the folds.
+    journal : SearchJournal, optional
+        The journal scoped to the search, see 
+        :meth:`~gofast.models.journal.SearchJournal.scope`.
+    folds : CachedFolds, optional
+        The folds of `X` and `y` materialized by a 
+        :class:`~gofast.models.folds.FoldCache`. Their splits replace `cv`, 
+        and only the pipeline steps after the cached prefix are fit.
+    return_train_score : bool, default=False
+        Whether to also score the candidates on the training folds. 
+        Otherwise, their 'train_scores' are left to NaN.
+    groups : array-like of shape (n_samples,), optional
+        Group labels of the samples, passed to the `cv` splitter.
+    fit_params : dict, optional
+        Parameters passed to the `fit` method of the candidates, those of 
+        the samples being restricted to the training fold.
+
+    Returns
+    -------
+    scores : list of float
+        The mean cross-validation score of each candidate, in order.
+    """
+    cache = {} if cache is None else cache
+    pending = {}
+    for params in candidates:
+        key = _candidate_key(params)
+        if key not in cache:
+            pending.setdefault(key, params)
+
+    if pending:
+        cv = check_cv(cv, y, classifier=is_classifier(estimator))
+        scorer = check_scoring(estimator, scoring=scoring)
+        splits = (list(cv.split(X, y, groups)) if folds is None 
+                  else folds.splits)
+        parallel = Parallel(
+            n_jobs=n_jobs, pre_dispatch=pre_dispatch, max_nbytes='1M')
+        split_scores = {key: np.full(len(splits), np.nan) for key in pending}
+        fit_times = {key: np.full(len(splits), np.nan) for key in pending}
+        score_times = {key: np.full(len(splits), np.nan) for key in pending}
+        train_scores = {key: np.full(len(splits), np.nan) for key in pending}
+        missing = {key: set(range(len(splits))) for key in pending}
+        journal_keys = {}
+
+        def load_journal(key, folds=None): 
+            folds = journal.folds(journal_keys[key]) if folds is None else folds
+            for fold, (score, *times, train_score) in folds.items():
+                # A fold journaled without its train score is run again
+                if fold in missing[key] and not (
+                        return_train_score and train_score is None):
+                    set_fold(key, fold, (score, *times, train_score))
+
+        def set_fold(key, fold, result):
+            score, fit_time, score_time, train_score = result
+            split_scores[key][fold] = score
+            fit_times[key][fold] = fit_time
+            score_times[key][fold] = score_time
+            if return_train_score:
+                train_scores[key][fold] = train_score
+            missing[key].discard(fold)
+
+        def candidate(key):
+            candidate = clone(estimator).set_params(**pending[key])
+            return candidate if folds is None else folds.tail(candidate)
+
+        def run_folds(jobs):
+            if folds is None or folds.data is None:
+                fold_data = [(X, y, None)] * len(splits)
+            else:
+                # The memmapped cached folds are sent instead of `X` and `y`
+                fold_data = [(None, None, data) for data in folds.data]
+            results = parallel(
+                delayed(_fit_and_score_fold)(
+                    candidate(key), *fold_data[fold][:2], scorer, 
+                    *splits[fold], error_score, journal=journal, 
+                    key=journal_keys.get(key), fold=fold, 
+                    data=fold_data[fold][2], 
+                    return_train_score=return_train_score, 
+                    fit_params=_check_method_params(
+                        X, fit_params or {}, indices=splits[fold][0]))
+                for key, fold in jobs
+            )
+            for (key, fold), result in zip(jobs, results):
+                set_fold(key, fold, result)
+
+        if journal is not None:
+            for key, params in pending.items():
+                journal_keys[key] = journal.candidate_key(estimator, params)
+                load_journal(key)
+
+        alive = list(pending)
+        if pruner is None and journal is None:
+            run_folds([(key, fold) for key in pending 
+                       for fold in range(len(splits))])
+        elif pruner is None:
+            # Claim the candidates in waves of one per worker, so that the 
+            # processes sharing the journal interleave over the population.
+            queue = [key for key in pending if missing[key]]
+            claimed_elsewhere = []
+            while queue:
+                claimed = []
+                while queue and len(claimed) < effective_n_jobs(n_jobs):
+                    key = queue.pop(0)
+                    if journal.claim(journal_keys[key]):
+                        claimed.append(key)
+                    else:
+                        claimed_elsewhere.append(key)
+                run_folds([(key, fold) for key in claimed 
+                           for fold in sorted(missing[key])])
+            # Wait for the candidates of other processes, and finish those 
+            # whose process has died.
+            for key in claimed_elsewhere:
+                load_journal(key, journal.wait(journal_keys[key], len(splits)))
+            run_folds([(key, fold) for key in claimed_elsewhere 
+                       for fold in sorted(missing[key])])
+        else:
+            for fold in range(len(splits)):
+                run_folds([(key, fold) for key in alive if fold in missing[key]])
+                if fold < len(splits) - 1:
+                    pruned = pruner.prune(fold, [
+                        np.nanmean(split_scores[key][:fold + 1]) 
+                        if not np.all(np.isnan(split_scores[key][:fold + 1]))
+                        else np.nan for key in alive])
+                    alive = [key for key, p in zip(alive, pruned) if not p]
+
+        completed = set(alive)
+        for key, params in pending.items():
+            scores = split_scores[key]
+            cache[key] = {
+                'params': params, 
+                'split_scores': scores,
+                'mean_test_score': (np.nan if np.all(np.isnan(scores)) 
+                                    else np.nanmean(scores)),
+                'status': 'completed' if key in completed else 'pruned',
+                'fit_times': fit_times[key], 
+                'score_times': score_times[key], 
+                'train_scores': train_scores[key],
+            }
+        if pruner is not None:
+            pruner.update([cache[key]['mean_test_score'] for key in alive])
+
+    return [cache[_candidate_key(params)]['mean_test_score'] 
+            for params in candidates]
+
+def _fit_from_journal(search, X, y=None, groups=None, **fit_params):
+    """
+    Fit a metaheuristic `search` whose candidates are recorded in its
+    journal, without cross-validating them again through `BaseSearchCV`.
+
+    This follows :meth:`BaseSearchCV.fit`, except that the 
+    `evaluate_candidates` given to `search._run_search` scores the
+    candidates through :func:`_evaluate_population`, so the candidates of
+    `search._fitness_cache` and the folds recorded in `search._journal` are
+    not refit. Their records are laid out as the output of 
+    :func:`~sklearn.model_selection._validation._fit_and_score` and 
+    formatted by `search._format_results`, so that `cv_results_`, the 
+    selection of the best candidate and its refit are those of 
+    :meth:`BaseSearchCV.fit`.
+    """
+    scorers, refit_metric = search._get_scorers()
+    X, y = indexable(X, y)
+    fit_params = _check_method_params(X, params=fit_params)
+    routed_params = search._get_routed_params_for_fit(
+        dict(fit_params, groups=groups))
+    if search._folds is not None:
+        splits = search._folds.splits
+    else:
+        splits = list(check_cv(search.cv, y, classifier=is_classifier(
+            search.estimator)).split(X, y, **routed_params.splitter.split))
+    n_splits = len(splits)
+
+    results = {}
+    all_candidate_params = []
+    all_out = []
+    all_more_results = defaultdict(list)
+
+    def evaluate_candidates(candidate_params, cv=None, more_results=None):
+        candidate_params = list(candidate_params)
+        typed_params = [apply_param_types(search.estimator, params)
+                        for params in candidate_params]
+        _evaluate_population(
+            search.estimator, typed_params, X, y, cv=search.cv,
+            scoring=search.scoring, n_jobs=search.n_jobs,
+            pre_dispatch=search.pre_dispatch, error_score=search.error_score,
+            cache=search._fitness_cache, journal=search._journal,
+            folds=search._folds, 
+            return_train_score=search.return_train_score, 
+            groups=routed_params.splitter.split['groups'], 
+            fit_params=routed_params.estimator.fit)
+        out = []
+        for params in typed_params:
+            record = search._fitness_cache[_candidate_key(params)]
+            out.extend({
+                'fit_error': None, 
+                'test_scores': record['split_scores'][fold], 
+                'train_scores': record['train_scores'][fold], 
+                'n_test_samples': len(test), 
+                'fit_time': record['fit_times'][fold], 
+                'score_time': record['score_times'][fold], 
+                } for fold, (_, test) in enumerate(splits))
+        if not out:
+            raise ValueError("No candidates were evaluated by the search.")
+
+        all_candidate_params.extend(candidate_params)
+        all_out.extend(out)
+        if more_results is not None:
+            for key, value in more_results.items():
+                all_more_results[key].extend(value)
+
+        nonlocal results
+        results = search._format_results(
+            all_candidate_params, n_splits, all_out, all_more_results)
+        return results
+
+    search._run_search(evaluate_candidates)
+    if not all_out:
+        raise ValueError("No candidates were evaluated by the search.")
+    # The candidates are scored by a single scorer, see _evaluate_population
+    search.multimetric_ = False
+
+    search.best_index_ = search._select_best_index(
+        search.refit, refit_metric, results)
+    if not callable(search.refit):
+        search.best_score_ = results[f"mean_test_{refit_metric}"][
+            search.best_index_]
+    search.best_params_ = results["params"][search.best_index_]
+
+    if search.refit:
+        search.best_estimator_ = clone(search.estimator).set_params(
+            **clone(search.best_params_, safe=False))
+        refit_start_time = time.time()
+        if y is not None:
+            search.best_estimator_.fit(X, y, **routed_params.estimator.fit)
+        else:
+            search.best_estimator_.fit(X, **routed_params.estimator.fit)
+        search.refit_time_ = time.time() - refit_start_time
+        if hasattr(search.best_estimator_, "feature_names_in_"):
+            search.feature_names_in_ = search.best_estimator_.feature_names_in_
+
+    search.scorer_ = scorers
+    search.cv_results_ = results
+    search.n_splits_ = n_splits
+    return search
+
+def _record_search_history(search):
+    """
+    Add the candidates evaluated internally by a metaheuristic search to its
+    `cv_results_`, with a 'status' column.
+
+    The rows produced by `evaluate_candidates` are left as they are and 
+    marked ``'completed'``. The records of `search._fitness_cache` missing 
+    from them, including the pruned candidates, are appended after them and 
+    ranked below them: the completed ones by score, then the pruned ones.
+    The columns the records do not hold are set to NaN.
+    """
+    results = search.cv_results_
+    n_rows = len(results['params'])
+    seen = {_candidate_key(params) for params in results['params']}
+    records = [record for key, record in getattr(
+        search, '_fitness_cache', {}).items() 
+        if key not in seen and record.get('split_scores') is not None]
+    results['status'] = np.array(
+        ['completed'] * n_rows + [record['status'] for record in records], 
+        dtype=object)
+    if not records or 'mean_test_score' not in results:
+        return
+
+    n_extra = len(records)
+    split_scores = np.array([record['split_scores'] for record in records])
+    means = np.array([record['mean_test_score'] for record in records])
+    extra_columns = {
+        column: np.array([record.get(field, np.full(len(
+            record['split_scores']), np.nan)) for record in records], dtype=float)
+        for column, field in [('train_score', 'train_scores'), 
+                              ('fit_time', 'fit_times'), 
+                              ('score_time', 'score_times')]
+    }
+    train_scores = extra_columns['train_score']
+    status = [record['status'] for record in records]
+    # Completed before pruned, each by decreasing score, NaN last.
+    order = np.lexsort((np.nan_to_num(-means, nan=np.inf), 
+                        [s == 'pruned' for s in status]))
+    ranks = np.empty(n_extra, dtype=np.int32)
+    ranks[order] = np.max(results['rank_test_score'], initial=0) + 1 + np.arange(
+        n_extra)
+
+    for name, column in list(results.items()):
+        if name == 'status':
+            continue
+        if name == 'params':
+            results[name] = list(column) + [record['params'] for record in records]
+            continue
+        if name.startswith('param_'):
+            param = name[len('param_'):]
+            values = np.ma.masked_all(n_extra, dtype=object)
+            for k, record in enumerate(records):
+                if param in record['params']:
+                    values[k] = record['params'][param]
+            results[name] = np.ma.concatenate(
+                [np.ma.asarray(column).astype(object), values])
+            continue
+        if name == 'rank_test_score':
+            values = ranks
+        elif name == 'mean_test_score':
+            values = means
+        elif name == 'std_test_score':
+            values = np.array([np.nan if np.all(np.isnan(scores)) 
+                               else np.nanstd(scores) for scores in split_scores])
+        elif (name.startswith('split') and name.endswith('_test_score') 
+              and name[len('split'):-len('_test_score')].isdigit()):
+            fold = int(name[len('split'):-len('_test_score')])
+            values = (split_scores[:, fold] if fold < split_scores.shape[1] 
+                      else np.full(n_extra, np.nan))
+        elif (name.startswith('split') and name.endswith('_train_score') 
+              and name[len('split'):-len('_train_score')].isdigit()):
+            fold = int(name[len('split'):-len('_train_score')])
+            values = (train_scores[:, fold] if fold < train_scores.shape[1] 
+                      else np.full(n_extra, np.nan))
+        elif name in ('mean_train_score', 'std_train_score', 'mean_fit_time', 
+                      'std_fit_time', 'mean_score_time', 'std_score_time'):
+            stat, column_name = name.split('_', 1)
+            values = np.array([
+                np.nan if np.all(np.isnan(v)) 
+                else (np.nanmean if stat == 'mean' else np.nanstd)(v) 
+                for v in extra_columns[column_name]])
+        else:
+            values = np.full(n_extra, np.nan)
+        column = np.asarray(column)
+        if column.dtype.kind not in 'fc':
+            column = column.astype(object)
+        results[name] = np.concatenate([column, values])
+
+class _ParamEncoder:
+    """
+    Encode the parameter sets of a search space as rows of a numeric matrix.
+
+    Numeric parameters take one column each, scaled to [0, 1] over the 
+    reference sample given to `fit`, on a log scale when they are positive 
+    and span more than two orders of magnitude. The other parameters are 
+    one-hot encoded over the values of the reference sample.
+    """
+    def fit(self, candidates):
+        """Learn the columns from a reference sample of parameter sets."""
+        names = sorted({name for params in candidates for name in params})
+        self.columns_ = []
+        for name in names:
+            values = [params.get(name) for params in candidates]
+            if all(isinstance(v, numbers.Real) and not isinstance(v, bool)
+                   for v in values):
+                values = np.asarray(values, dtype=float)
+                log = values.min() > 0 and values.max() > 100 * values.min()
+                if log:
+                    values = np.log10(values)
+                low, span = values.min(), np.ptp(values)
+                self.columns_.append(
+                    (name, 'numeric', (log, low, span if span > 0 else 1.)))
+            else:
+                categories = np.array(list(dict.fromkeys(map(repr, values))))
+                self.columns_.append((name, 'categorical', categories))
+        return self
+
+    def transform(self, candidates):
+        """Return the encoded matrix of the `candidates`."""
+        blocks = [np.zeros((len(candidates), 0))]
+        for name, kind, info in self.columns_:
+            values = [params.get(name) for params in candidates]
+            if kind == 'numeric':
+                log, low, span = info
+                values = np.asarray(values, dtype=float)
+                if log:
+                    values = np.log10(np.maximum(values, np.finfo(float).tiny))
+                blocks.append(((values - low) / span)[:, None])
+            else:
+                codes = np.array([repr(v) for v in values])
+                blocks.append((codes[:, None] == info[None, :]).astype(float))
+        return np.hstack(blocks)
+
+
+class _IncrementalGP:
+    """
+    Gaussian-process surrogate with a fixed RBF kernel, updated in place.
+
+    The kernel hyperparameters are fixed so that new observations extend the
+    Cholesky factor of the kernel matrix by a block update, in O(n^2 q) for 
+    q new points instead of the O(n^3) of a refit. Predictions over m 
+    candidates cost O(n^2 m) in a few vectorized calls. The targets are 
+    standardized at prediction time.
+
+    Parameters
+    ----------
+    length_scale : float, default=1.0
+        Length scale of the RBF kernel, in the encoded space.
+    noise : float, default=1e-3
+        Variance added to the diagonal, relative to the unit kernel 
+        amplitude, accounting for the noise of the CV scores.
+    """
+    def __init__(self, length_scale=1.0, noise=1e-3):
+        self.length_scale = length_scale
+        self.noise = noise
+        self.X_ = None
+        self.y_ = None
+        self.L_ = None
+
+    def _kernel(self, A, B):
+        return np.exp(-0.5 * cdist(A, B, 'sqeuclidean') / self.length_scale ** 2)
+
+    def update(self, X, y):
+        """Add the observations `X`, `y` to the surrogate."""
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        y = np.asarray(y, dtype=float).ravel()
+        K22 = self._kernel(X, X) + self.noise * np.eye(len(X))
+        if self.X_ is None:
+            self.X_, self.y_ = X, y
+            self.L_ = cholesky(K22, lower=True)
+            return self
+        # [[L, 0], [L21, L22]] factors [[K, K12], [K12.T, K22]]
+        L21 = solve_triangular(
+            self.L_, self._kernel(self.X_, X), lower=True).T
+        L22 = cholesky(K22 - L21 @ L21.T, lower=True)
+        n, q = len(self.X_), len(X)
+        L = np.zeros((n + q, n + q))
+        L[:n, :n] = self.L_
+        L[n:, :n] = L21
+        L[n:, n:] = L22
+        self.X_ = np.vstack([self.X_, X])
+        self.y_ = np.concatenate([self.y_, y])
+        self.L_ = L
+        return self
+
+    def copy(self):
+        """Return an independent copy, e.g. to add fantasy observations."""
+        gp = _IncrementalGP(self.length_scale, self.noise)
+        gp.X_, gp.y_, gp.L_ = self.X_, self.y_, self.L_
+        return gp
+
+    def predict(self, X):
+        """Return the predicted mean and standard deviation at `X`."""
+        X = np.atleast_2d(np.asarray(X, dtype=float))
+        mean = self.y_.mean()
+        scale = self.y_.std() or 1.
+        alpha = cho_solve((self.L_, True), (self.y_ - mean) / scale)
+        K = self._kernel(self.X_, X)
+        v = solve_triangular(self.L_, K, lower=True)
+        variance = np.clip(1. - np.einsum('ij,ij->j', v, v), 1e-12, None)
+        return K.T @ alpha * scale + mean, np.sqrt(variance) * scale
+
+def _acquisition(mean, std, best, kind='ei', xi=0., kappa=1.96):
+    """
+    Vectorized acquisition function of candidates with predicted `mean` and
+    `std`, for maximizing the score: expected improvement ('ei'), 
+    probability of improvement ('pi') or upper confidence bound ('ucb').
+    """
+    if kind == 'ucb':
+        return mean + kappa * std
+    improvement = mean - best - xi
+    z = improvement / std
+    if kind == 'pi':
+        return norm.cdf(z)
+    return improvement * norm.cdf(z) + std * norm.pdf(z)
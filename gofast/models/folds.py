@@ -0,0 +1,271 @@
+# -*- coding: utf-8 -*-
+#   License: BSD-3-Clause
+#   Author: LKouadio <etanoyau@gmail.com>
+
+"""Provides a cache of materialized cross-validation folds, shared by the
+candidates of hyperparameter searches: the train/test splits are computed
+once, and the output of the fixed preprocessing steps of a pipeline is
+computed once per fold and served read-only to the workers via memmap."""
+
+import os
+import shutil
+import hashlib
+import tempfile
+import weakref
+
+import joblib
+import numpy as np
+from sklearn.base import clone, is_classifier
+from sklearn.model_selection._split import check_cv
+from sklearn.pipeline import Pipeline
+from sklearn.utils.metaestimators import _safe_split
+from sklearn.utils.parallel import Parallel, delayed
+
+from .journal import SearchJournal
+
+__all__ = ["FoldCache"]
+
+
+class FoldCache:
+    """
+    Cache of cross-validation folds shared by the candidates of a search.
+
+    Hyperparameter searches evaluate many candidates on the same folds. The
+    cache computes the train/test splits of a data set once and, when the
+    estimator is a :class:`~sklearn.pipeline.Pipeline`, fits the leading
+    steps that no searched parameter touches (the *fixed prefix*, e.g.
+    imputation and scaling) once per fold. The transformed train and test
+    folds are stored in `cache_dir` and loaded as read-only memmaps, which
+    joblib passes to the workers by reference. Each candidate then only fits
+    the remaining steps of the pipeline.
+
+    The stored folds are keyed by the fingerprint of the data, the fold
+    indices and the parameters of the prefix steps, so a cache directory
+    can be reused by later searches and processes.
+
+    Parameters
+    ----------
+    cache_dir : str or path-like, default=None
+        Directory of the stored folds. None uses a temporary directory
+        removed with the cache.
+    preprocessing : bool, default=True
+        Whether to precompute the fixed prefix of pipelines. If False, only
+        the splits are cached.
+
+    Examples
+    --------
+    >>> from sklearn.datasets import load_iris
+    >>> from sklearn.pipeline import make_pipeline
+    >>> from sklearn.preprocessing import StandardScaler
+    >>> from sklearn.svm import SVC
+    >>> from gofast.models.folds import FoldCache
+    >>> from gofast.models.selection import SwarmSearchCV
+    >>> X, y = load_iris(return_X_y=True)
+    >>> pipe = make_pipeline(StandardScaler(), SVC())
+    >>> # The scaler is fit once per fold, not once per particle and fold.
+    >>> search = SwarmSearchCV(pipe, {'svc__C': (0.1, 10)}, max_iter=5,
+    ...                        fold_cache=FoldCache()).fit(X, y)
+    """
+
+    def __init__(self, cache_dir=None, preprocessing=True):
+        self.cache_dir = cache_dir
+        self.preprocessing = preprocessing
+        self._location = None
+        self._splits = {}
+
+    def __deepcopy__(self, memo):
+        # Cloned searches share the cache instead of copying it.
+        return self
+
+    def __getstate__(self):
+        state = self.__dict__.copy()
+        if self.cache_dir is None:
+            # The temporary directory belongs to the process that made it.
+            state['_location'] = None
+        return state
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(cache_dir={self.cache_dir!r},"
+                f" preprocessing={self.preprocessing!r})")
+
+    @property
+    def location(self):
+        """The directory of the stored folds, created on first use."""
+        if self._location is None:
+            if self.cache_dir is None:
+                location = tempfile.mkdtemp(prefix='gofast_folds_')
+                weakref.finalize(self, shutil.rmtree, location, True)
+            else:
+                location = os.fspath(self.cache_dir)
+                os.makedirs(location, exist_ok=True)
+            self._location = location
+        return self._location
+
+    @property
+    def memory(self):
+        """:class:`joblib.Memory` caching the transformers of pipelines."""
+        return joblib.Memory(os.path.join(self.location, 'pipelines'),
+                             verbose=0)
+
+    def split(self, X, y=None, cv=None, estimator=None, groups=None):
+        """
+        Return the train/test index splits of `cv` over `X` and `y`.
+
+        The splits of a data set are computed once per `cv` setting and
+        then served from memory.
+
+        Parameters
+        ----------
+        X, y, groups : array-like
+            The data to split.
+        cv : int, cross-validation generator or iterable, default=None
+            As in :func:`~sklearn.model_selection.check_cv`.
+        estimator : estimator object, default=None
+            Integer `cv` are stratified when it is a classifier.
+
+        Returns
+        -------
+        list of tuple
+            The ``(train, test)`` index arrays of each fold.
+        """
+        classifier = estimator is not None and is_classifier(estimator)
+        key = (SearchJournal.fingerprint(X, y, groups=groups), repr(cv),
+               classifier)
+        if key not in self._splits:
+            cv = check_cv(cv, y, classifier=classifier)
+            self._splits[key] = [
+                (np.asarray(train), np.asarray(test))
+                for train, test in cv.split(X, y, groups)]
+        return self._splits[key]
+
+    def prefix_length(self, estimator, param_names=()):
+        """
+        Return the number of leading steps of `estimator` that none of
+        `param_names` refers to, excluding its final step.
+
+        Non-pipeline estimators, and pipelines searched over parameters of
+        the pipeline itself such as ``steps``, have no fixed prefix.
+        """
+        if not self.preprocessing or not isinstance(estimator, Pipeline):
+            return 0
+        touched = {name.split('__', 1)[0] for name in param_names}
+        if any('__' not in name for name in param_names):
+            return 0
+        n_prefix = 0
+        for name, _ in estimator.steps[:-1]:
+            if name in touched:
+                break
+            n_prefix += 1
+        return n_prefix
+
+    def materialize(self, estimator, X, y=None, cv=None, param_names=(),
+                    groups=None, n_jobs=None):
+        """
+        Return the folds of a search of `estimator` over `param_names`.
+
+        The fixed prefix of the pipeline is fit on each train fold, in
+        parallel, unless its transformed folds are already stored.
+
+        Parameters
+        ----------
+        estimator : estimator object
+            The estimator of the search.
+        X, y, groups : array-like
+            The training data of the search.
+        cv : int, cross-validation generator or iterable, default=None
+            The cross-validation strategy of the search.
+        param_names : iterable of str, default=()
+            The searched parameters.
+        n_jobs : int, default=None
+            Number of folds whose prefix is fit in parallel.
+
+        Returns
+        -------
+        folds : CachedFolds
+            The splits and, when the estimator has a fixed prefix, the
+            memory-mapped transformed folds.
+        """
+        splits = self.split(X, y, cv, estimator=estimator, groups=groups)
+        n_prefix = self.prefix_length(estimator, list(param_names))
+        if not n_prefix:
+            return CachedFolds(splits)
+
+        prefix = estimator[:n_prefix]
+        context = SearchJournal.fingerprint(X, y)
+        steps = [(name, type(step).__qualname__, sorted(
+            (param, repr(value)) for param, value
+            in step.get_params(deep=True).items()))
+            if hasattr(step, 'get_params') else (name, repr(step))
+            for name, step in prefix.steps]
+        paths = []
+        for train, test in splits:
+            key = hashlib.sha1(repr(
+                (context, joblib.hash([train, test]), steps)).encode()
+                ).hexdigest()
+            paths.append(os.path.join(self.location, f"{key}.joblib"))
+        todo = [i for i, path in enumerate(paths) if not os.path.exists(path)]
+        Parallel(n_jobs=n_jobs)(
+            delayed(_store_fold)(prefix, X, y, *splits[i], paths[i])
+            for i in todo)
+        data = [joblib.load(path, mmap_mode='r') for path in paths]
+        return CachedFolds(splits, n_prefix, data)
+
+
+class CachedFolds:
+    """
+    The folds of a search served by a :class:`FoldCache`.
+
+    Attributes
+    ----------
+    splits : list of tuple
+        The ``(train, test)`` index arrays of each fold.
+    n_prefix : int
+        Number of leading pipeline steps already applied to `data`.
+    data : list of tuple or None
+        The ``(X_train, y_train, X_test, y_test)`` of each fold, transformed
+        by the prefix; None without prefix.
+    """
+    def __init__(self, splits, n_prefix=0, data=None):
+        self.splits = splits
+        self.n_prefix = n_prefix
+        self.data = data
+
+    def __len__(self):
+        return len(self.splits)
+
+    def tail(self, estimator):
+        """Return the steps of `estimator` left to fit on the cached folds."""
+        return estimator[self.n_prefix:] if self.n_prefix else estimator
+
+
+def _store_fold(prefix, X, y, train, test, path):
+    """Fit `prefix` on a train fold and store the transformed fold."""
+    prefix = clone(prefix)
+    X_train, y_train = _safe_split(prefix, X, y, train)
+    X_test, y_test = _safe_split(prefix, X, y, test, train)
+    X_train = prefix.fit_transform(X_train, y_train)
+    X_test = prefix.transform(X_test)
+    # Written aside then renamed, so that readers never see a partial file.
+    temp = f"{path}.{os.getpid()}.tmp"
+    joblib.dump((X_train, y_train, X_test, y_test), temp)
+    os.replace(temp, path)
+
+
+def check_fold_cache(fold_cache):
+    """
+    Validate the `fold_cache` parameter of a search.
+
+    Returns None, the given :class:`FoldCache`, a new temporary cache when
+    `fold_cache` is True, or a cache stored at `fold_cache` when it is a path.
+    """
+    if fold_cache is None or fold_cache is False:
+        return None
+    if isinstance(fold_cache, FoldCache):
+        return fold_cache
+    if fold_cache is True:
+        return FoldCache()
+    if isinstance(fold_cache, (str, os.PathLike)):
+        return FoldCache(fold_cache)
+    raise TypeError(
+        "fold_cache must be None, a bool, a path or a FoldCache, got"
+        f" {type(fold_cache).__name__!r}.")
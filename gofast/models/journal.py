@@ -0,0 +1,381 @@
+# -*- coding: utf-8 -*-
+#   License: BSD-3-Clause
+#   Author: LKouadio <etanoyau@gmail.com>
+
+"""Provides an append-only, on-disk journal of hyperparameter search
+evaluations, so that interrupted searches resume without refitting and
+several processes on one machine can share the work of a search."""
+
+import os
+import copy
+import time
+import pickle
+import socket
+import sqlite3
+import hashlib
+import threading
+
+import joblib
+import numpy as np
+from sklearn.base import clone
+
+__all__ = ["SearchJournal"]
+
+# Search parameters that do not change the result of a search.
+_EXECUTION_PARAMS = {'n_jobs', 'pre_dispatch', 'verbose', 'journal'}
+
+
+class SearchJournal:
+    """
+    Append-only SQLite journal of cross-validation fold evaluations.
+
+    Every completed fold of a candidate is recorded as a row
+    ``(key, fold, score, fit_time)``, where `key` hashes the estimator, its
+    full parameter set and the search context (data, CV and scoring). A
+    restarted search looks its candidates up in the journal and only fits
+    the folds that are missing. The journal also records the final results
+    of whole searches, used by the multi-estimator optimizers of
+    :mod:`gofast.models.optimize` to skip the estimators already tuned.
+
+    Several processes on the same machine can open the same journal: SQLite
+    serializes the writes, and a process *claims* a candidate before
+    evaluating it so that the others wait for its folds instead of fitting
+    them again. A claim whose process is no longer alive is stale and can be
+    taken over.
+
+    Parameters
+    ----------
+    path : str or path-like
+        The SQLite database file. It is created if it does not exist.
+    timeout : float, default=60.0
+        Seconds a write waits for a lock held by another process.
+    poll_interval : float, default=1.0
+        Seconds between two checks while waiting for a candidate claimed by
+        another process.
+    lease_timeout : float, default=86400.0
+        Seconds without progress after which the claim of a process whose
+        liveness cannot be verified, such as a process of another host, is
+        taken over. The claims of the live processes of this host are 
+        never taken over, however long they take.
+
+    Examples
+    --------
+    >>> from sklearn.datasets import load_iris
+    >>> from sklearn.svm import SVC
+    >>> from gofast.models.journal import SearchJournal
+    >>> from gofast.models.selection import SwarmSearchCV
+    >>> X, y = load_iris(return_X_y=True)
+    >>> journal = SearchJournal('swarm_svc.sqlite')
+    >>> search = SwarmSearchCV(SVC(), {'C': [1, 10, 100], 'gamma': [0.01, 0.1]},
+    ...                        max_iter=5, journal=journal).fit(X, y)
+    >>> # Fitting again, or from a restarted process, refits nothing.
+    >>> search = search.fit(X, y)
+    """
+
+    def __init__(self, path, timeout=60.0, poll_interval=1.0, 
+                 lease_timeout=86400.0):
+        self.path = os.fspath(path)
+        self.timeout = timeout
+        self.poll_interval = poll_interval
+        self.lease_timeout = lease_timeout
+        self.context = ''
+        self._local = threading.local()
+
+    def __getstate__(self):
+        # SQLite connections cannot cross processes; workers reconnect.
+        state = self.__dict__.copy()
+        del state['_local']
+        return state
+
+    def __setstate__(self, state):
+        self.__dict__.update(state)
+        self._local = threading.local()
+
+    def __repr__(self):
+        return f"{self.__class__.__name__}(path={self.path!r})"
+
+    @property
+    def connection(self):
+        """
+        The SQLite connection of the calling thread, opened on first use.
+
+        SQLite connections cannot be shared between threads, nor inherited
+        by forked processes, so each thread of each process opens its own.
+        The scoped views of :meth:`scope` share the connections of the
+        journal.
+        """
+        local = self._local
+        if getattr(local, 'pid', None) != os.getpid():
+            connection = sqlite3.connect(
+                self.path, timeout=self.timeout, isolation_level=None)
+            connection.execute("PRAGMA journal_mode=WAL")
+            connection.executescript(
+                """
+                CREATE TABLE IF NOT EXISTS folds (
+                    key TEXT, fold INTEGER, score REAL, fit_time REAL,
+                    estimator TEXT, params TEXT, created REAL,
+                    score_time REAL, train_score REAL,
+                    PRIMARY KEY (key, fold));
+                CREATE TABLE IF NOT EXISTS claims (
+                    key TEXT PRIMARY KEY, host TEXT, pid INTEGER,
+                    created REAL);
+                CREATE TABLE IF NOT EXISTS searches (
+                    key TEXT PRIMARY KEY, name TEXT, result BLOB,
+                    created REAL);
+                """
+            )
+            # Journals written before the score times and train scores.
+            columns = {row[1] for row in connection.execute(
+                "PRAGMA table_info(folds)")}
+            for column in ('score_time', 'train_score'):
+                if column not in columns:
+                    connection.execute(
+                        f"ALTER TABLE folds ADD COLUMN {column} REAL")
+            local.connection, local.pid = connection, os.getpid()
+        return local.connection
+
+    @staticmethod
+    def fingerprint(X, y=None, **context):
+        """
+        Hash the data and settings that make fold scores comparable.
+
+        Parameters
+        ----------
+        X, y : array-like
+            The training data of the search.
+        **context : dict
+            Other settings of the search, e.g. ``cv`` and ``scoring``; their
+            `repr` is hashed.
+
+        Returns
+        -------
+        str
+            The hexadecimal fingerprint.
+        """
+        return joblib.hash(
+            [X, y, sorted((name, repr(value)) for name, value in context.items())])
+
+    def scope(self, X, y=None, **context):
+        """
+        Return a view of the journal whose keys are bound to a search.
+
+        The view shares the database and connection of the journal, but its
+        :meth:`candidate_key` and :meth:`search_key` also hash the
+        :meth:`fingerprint` of `X`, `y` and `context`, so scores computed on
+        other data or with other CV settings are never reused.
+        """
+        scoped = copy.copy(self)
+        scoped.context = self.fingerprint(X, y, **context)
+        return scoped
+
+    def candidate_key(self, estimator, params):
+        """
+        Return the journal key of `estimator` set with `params`.
+
+        The key covers the estimator class and all its parameters, not only
+        the searched ones, as well as the context of the journal.
+        """
+        estimator = clone(estimator).set_params(**params)
+        return self._hash(
+            type(estimator).__module__, type(estimator).__qualname__,
+            sorted((name, repr(value)) for name, value
+                   in estimator.get_params(deep=False).items())
+        )
+
+    def search_key(self, name, search):
+        """
+        Return the journal key of the whole `search` of the estimator `name`.
+
+        The key covers the search class and its parameters, except those 
+        that do not change its result such as `n_jobs`.
+        """
+        return self._hash(
+            name, type(search).__qualname__,
+            sorted((param, repr(value)) for param, value 
+                   in search.get_params(deep=False).items()
+                   if param not in _EXECUTION_PARAMS)
+        )
+
+    def _hash(self, *items):
+        return hashlib.sha1(repr((self.context,) + items).encode()).hexdigest()
+
+    def folds(self, key):
+        """
+        Return the recorded folds of `key` as a dict mapping each fold index
+        to its ``(score, fit_time, score_time, train_score)``. The train 
+        score is None when it was not recorded, NaN when it failed.
+        """
+        rows = self.connection.execute(
+            "SELECT fold, score, fit_time, score_time, train_score FROM folds"
+            " WHERE key = ?", (key,))
+        return {fold: (np.nan if score is None else score, fit_time, 
+                       np.nan if score_time is None else score_time,
+                       train_score if train_score is not None or score is not None 
+                       else np.nan)
+                for fold, score, fit_time, score_time, train_score in rows}
+
+    def record(self, key, fold, score, fit_time=np.nan, params=None,
+               estimator=None, score_time=np.nan, train_score=None):
+        """
+        Append the result of one fold. A fold already recorded is kept, 
+        only its train score being added when it was not recorded.
+        """
+        score = None if score is None or np.isnan(score) else float(score)
+        if train_score is not None:
+            train_score = None if np.isnan(train_score) else float(train_score)
+        self.connection.execute(
+            "INSERT INTO folds (key, fold, score, fit_time, estimator, params,"
+            " created, score_time, train_score) VALUES (?, ?, ?, ?, ?, ?, ?,"
+            " ?, ?) ON CONFLICT (key, fold) DO UPDATE SET"
+            " train_score = excluded.train_score,"
+            " score_time = excluded.score_time WHERE folds.train_score IS NULL"
+            " AND excluded.train_score IS NOT NULL",
+            (key, int(fold), score, float(fit_time),
+             None if estimator is None else str(estimator),
+             None if params is None else repr(params), time.time(),
+             float(score_time), train_score)
+        )
+
+    def claim(self, key, force=False):
+        """
+        Claim `key` for this process.
+
+        Returns True if the candidate is now owned by this process, either
+        because it was free, already claimed by this process, or claimed by
+        a process of this host that is no longer alive. With `force`, the
+        claim of any other process is taken over.
+        """
+        host, pid = socket.gethostname(), os.getpid()
+        connection = self.connection
+        connection.execute("BEGIN IMMEDIATE")
+        try:
+            owner = connection.execute(
+                "SELECT host, pid FROM claims WHERE key = ?", (key,)).fetchone()
+            if (not force and owner is not None 
+                    and tuple(owner) != (host, pid) 
+                    and _owner_alive(*owner) is not False):
+                return False
+            connection.execute(
+                "INSERT OR REPLACE INTO claims VALUES (?, ?, ?, ?)",
+                (key, host, pid, time.time()))
+            return True
+        finally:
+            connection.execute("COMMIT")
+
+    def wait(self, key, n_folds, timeout=None):
+        """
+        Wait until `n_folds` folds of `key` are recorded by another process.
+
+        Returns the folds as :meth:`folds` does, or None when this process 
+        has claimed `key` instead: either the other process died, or its 
+        liveness cannot be verified and no new fold of `key` was recorded 
+        for `timeout` seconds (by default the `lease_timeout` of the 
+        journal), in which case its claim is taken over.
+        """
+        timeout = self.lease_timeout if timeout is None else timeout
+        return self._wait(
+            lambda: self.folds(key), lambda folds: len(folds) >= n_folds, 
+            len, key, timeout)
+
+    def wait_result(self, key, timeout=None):
+        """
+        Wait until the result of the search `key` is saved by another process.
+
+        Returns the result, or None when this process has claimed `key` 
+        instead: either the other process died, or its liveness cannot be 
+        verified and no fold was recorded in the journal for `timeout` 
+        seconds (by default the `lease_timeout` of the journal), in which 
+        case its claim is taken over.
+        """
+        timeout = self.lease_timeout if timeout is None else timeout
+        return self._wait(
+            lambda: self.get_result(key), lambda result: result is not None, 
+            lambda result: self.connection.execute(
+                "SELECT COUNT(*) FROM folds").fetchone()[0], key, timeout)
+
+    def _wait(self, poll, done, progress, key, timeout):
+        # Poll until `done`, the timeout restarting whenever `progress` moves.
+        last_progress, last_time = None, time.time()
+        while True:
+            value = poll()
+            if done(value):
+                return value
+            current = progress(value)
+            if current != last_progress:
+                last_progress, last_time = current, time.time()
+            alive = self._owner_alive(key)
+            if alive is False and self.claim(key):
+                return None
+            if alive is None and time.time() - last_time > timeout:
+                self.claim(key, force=True)
+                return None
+            time.sleep(self.poll_interval)
+
+    def _owner_alive(self, key):
+        # True, False, or None when the owner cannot be verified.
+        owner = self.connection.execute(
+            "SELECT host, pid FROM claims WHERE key = ?", (key,)).fetchone()
+        return False if owner is None else _owner_alive(*owner)
+
+    def _is_stale(self, key):
+        return self._owner_alive(key) is False
+
+    def get_result(self, key):
+        """Return the stored result of the search `key`, or None."""
+        row = self.connection.execute(
+            "SELECT result FROM searches WHERE key = ?", (key,)).fetchone()
+        return None if row is None else pickle.loads(row[0])
+
+    def save_result(self, key, result, name=None):
+        """Store the `result` of the completed search `key`."""
+        self.connection.execute(
+            "INSERT OR IGNORE INTO searches VALUES (?, ?, ?, ?)",
+            (key, None if name is None else str(name), pickle.dumps(result),
+             time.time()))
+
+
+def _pid_alive(pid):
+    """
+    Whether a process with `pid` is running on this host, or None when it 
+    cannot be checked.
+    """
+    if pid <= 0:
+        return False
+    if os.name == 'nt':
+        # Signal 0 is CTRL_C_EVENT on Windows.
+        return None
+    try:
+        os.kill(pid, 0)
+    except ProcessLookupError:
+        return False
+    except PermissionError:
+        return True
+    except OSError:
+        return None
+    return True
+
+
+def _owner_alive(host, pid):
+    """
+    Whether the claim owner `pid` of `host` is alive, or None when it cannot
+    be verified, as for the processes of other hosts.
+    """
+    if host != socket.gethostname():
+        return None
+    return _pid_alive(pid)
+
+
+def check_journal(journal):
+    """
+    Validate the `journal` parameter of a search.
+
+    Returns None, the given :class:`SearchJournal`, or a new journal opened
+    at `journal` when it is a path.
+    """
+    if journal is None or isinstance(journal, SearchJournal):
+        return journal
+    if isinstance(journal, (str, os.PathLike)):
+        return SearchJournal(journal)
+    raise TypeError(
+        "journal must be None, a path or a SearchJournal, got"
+        f" {type(journal).__name__!r}.")
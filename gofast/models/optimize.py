@@ -10,6 +10,7 @@ searches in parallel."""
 import joblib
 import concurrent 
 from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 from tqdm import tqdm
 from joblib import Parallel, delayed
 
@@ -22,6 +23,9 @@ from ..api.summary import ModelSummary
 from ..tools.coreutils import ellipsis2false 
 from ..tools.validator import get_estimator_name , check_X_y 
 from ._optimize import BaseOptimizer, _perform_search, _validate_parameters
+from ._optimize import _fit_search, _run_tasks, _split_core_budget
+from .folds import FoldCache
+from .journal import SearchJournal
 from .utils import get_strategy_method, params_combinations # noqa
 from .utils import prepare_estimators_and_param_grids
 
@@ -370,6 +374,24 @@ class Optimizer(BaseOptimizer):
         The number of jobs to run in parallel for the optimization process. 
         `-1` means using all processors.
 
+    journal : str, path-like or SearchJournal, default=None
+        Append-only on-disk journal of the searches, see 
+        :class:`~gofast.models.journal.SearchJournal`. The result of each 
+        completed estimator search is stored in it, so that a restarted 
+        optimization only runs the searches left, and several processes 
+        sharing the journal split the estimators between them. The journal 
+        is also passed to the strategies accepting a `journal`, which then 
+        resume at the fold level.
+
+    fold_cache : bool, str, path-like or FoldCache, default=None
+        Cache of the cross-validation folds, see 
+        :class:`~gofast.models.folds.FoldCache`, passed to the strategies 
+        accepting a `fold_cache`. The other strategies run on the splits 
+        of the cache, and pipeline estimators cache their transformers in 
+        it, so the preprocessing shared by the candidates is fit once per 
+        fold. True uses a temporary cache, a path a cache stored in that 
+        directory. None keeps no cache.
+
     scoring : str, callable, list/tuple, or dict, default=None
         A string (see model evaluation documentation), a callable (see 
         defining your scoring strategy from metric functions), a list/tuple 
@@ -466,6 +488,8 @@ class Optimizer(BaseOptimizer):
         n_jobs=-1, 
         scoring=None, 
         cv=None, 
+        journal=None, 
+        fold_cache=None, 
         **search_kwargs
     ):
         super().__init__(
@@ -476,6 +500,8 @@ class Optimizer(BaseOptimizer):
             cv=cv, 
             save_results=save_results, 
             n_jobs=n_jobs, 
+            journal=journal, 
+            fold_cache=fold_cache, 
             **search_kwargs
             )
 
@@ -564,7 +590,8 @@ class Optimizer(BaseOptimizer):
         results = Parallel(n_jobs=self.n_jobs)(delayed(_perform_search)(
             name, self.estimators[i], self.param_grids[i], 
             self.strategy, X, y, self.scoring, self.cv, self.search_kwargs,
-            f"Optimizing {get_estimator_name(name):<{max_length}}") for i, 
+            f"Optimizing {get_estimator_name(name):<{max_length}}", 
+            journal=self.journal, fold_cache=self.fold_cache) for i, 
             name in enumerate(self.estimators))
     
         result_dict = {get_estimator_name(name): {
@@ -625,6 +652,24 @@ class OptimizeSearch(BaseOptimizer):
         The number of jobs to run in parallel for the optimization process. 
         `-1` means using all processors.
 
+    journal : str, path-like or SearchJournal, default=None
+        Append-only on-disk journal of the searches, see 
+        :class:`~gofast.models.journal.SearchJournal`. The result of each 
+        completed estimator search is stored in it, so that a restarted 
+        optimization only runs the searches left, and several processes 
+        sharing the journal split the estimators between them. The journal 
+        is also passed to the strategies accepting a `journal`, which then 
+        resume at the fold level.
+
+    fold_cache : bool, str, path-like or FoldCache, default=None
+        Cache of the cross-validation folds, see 
+        :class:`~gofast.models.folds.FoldCache`, passed to the strategies 
+        accepting a `fold_cache`. The other strategies run on the splits 
+        of the cache, and pipeline estimators cache their transformers in 
+        it, so the preprocessing shared by the candidates is fit once per 
+        fold. True uses a temporary cache, a path a cache stored in that 
+        directory. None keeps no cache.
+
     **search_kwargs : dict, optional
         Additional keyword arguments to pass to the search constructor.
 
@@ -708,6 +753,8 @@ class OptimizeSearch(BaseOptimizer):
         cv: Optional[Union[int, Callable]] = None, 
         save_results: bool = False, 
         n_jobs: int = -1, 
+        journal: Optional[Union[str, SearchJournal]] = None, 
+        fold_cache: Optional[Union[bool, str, FoldCache]] = None, 
         **search_kwargs: Any
         ):
         super().__init__(
@@ -718,6 +765,8 @@ class OptimizeSearch(BaseOptimizer):
             cv=cv, 
             save_results=save_results, 
             n_jobs=n_jobs, 
+            journal=journal, 
+            fold_cache=fold_cache, 
             **search_kwargs
             )
 
@@ -812,10 +861,14 @@ class OptimizeSearch(BaseOptimizer):
         def perform_search(estimator_name, estimator, param_grid):
             search = self.strategy_(estimator, param_grid, n_jobs=self.n_jobs,
                                     scoring=self.scoring, cv=self.cv, 
+                                    **self._journal_kwargs(), 
                                     **self.search_kwargs)
-            search.fit(X, y)
-            return (estimator_name, search.best_estimator_, search.best_params_,
-                    search.best_score_, search.cv_results_)
+            result = _fit_search(search, estimator_name, X, y, 
+                                 journal=self.journal, 
+                                 fold_cache=self.fold_cache)
+            return (estimator_name, result['best_estimator_'], 
+                    result['best_params_'], result['best_score_'], 
+                    result['cv_results_'])
         
         estimators = {get_estimator_name(est): est for est in self.estimators}
         results = Parallel(n_jobs=self.n_jobs)(delayed(perform_search)(
@@ -882,8 +935,10 @@ class ParallelizeSearch(BaseOptimizer):
         - 'GENSCV', 'GeneticSearchCV' for Genetic Algorithms-based Search.
 
     n_jobs : int, default=-1
-        The number of jobs to run in parallel for the optimization process. 
-        `-1` means using all processors.
+        The global core budget of the optimization. It is split between the 
+        estimators optimized concurrently and the CV jobs of each search, 
+        and the BLAS threads of each job are capped to the cores left. `-1` 
+        means using all processors.
         
     save_results : bool, default=False
         If True, the optimization results (best parameters and scores) for 
@@ -893,6 +948,13 @@ class ParallelizeSearch(BaseOptimizer):
         If True, aggregate multiple models' results and save them into a single 
         binary file.
 
+    executor : {'threads', 'processes', 'loky'}, default='threads'
+        How the estimators are optimized concurrently. 'threads' only speeds 
+        up fits releasing the GIL; 'processes' and 'loky' (joblib's reusable 
+        workers, memory-mapping large arrays) require picklable estimators 
+        and scorers. The 'processes' workers run their search without inner 
+        CV jobs, their share of the cores going to BLAS threads.
+
     **kws : dict, optional
         Additional keyword arguments to pass to the search constructor.
 
@@ -924,13 +986,13 @@ class ParallelizeSearch(BaseOptimizer):
 
     Notes
     -----
-    When parallelizing tasks that are already CPU-intensive (like 
-    GridSearchCV with `n_jobs=-1`), it's important to manage the overall CPU 
-    load to avoid overloading your system. Adjust the `n_jobs` parameter 
-    based on your system's capabilities.
+    The `n_jobs` budget bounds the whole nested parallelism: with 
+    ``n_jobs=8`` and two estimators, both searches run concurrently with 
+    ``n_jobs=4`` each and one BLAS thread per CV job, rather than every 
+    search claiming all the cores.
 
-    The `ParallelizeSearch` class uses `ThreadPoolExecutor` for parallel 
-    processing and `tqdm` for progress display.
+    The `ParallelizeSearch` class runs the searches with the chosen 
+    `executor` and uses `tqdm` for progress display.
 
     The optimization process involves searching for the best set of 
     hyperparameters that minimizes or maximizes a given scoring function. 
@@ -973,6 +1035,7 @@ class ParallelizeSearch(BaseOptimizer):
         n_jobs: int = -1, 
         save_results: bool=False, 
         pack_models: bool = False, 
+        executor: str = 'threads', 
         **search_kwargs
         ):
         super().__init__(
@@ -987,6 +1050,7 @@ class ParallelizeSearch(BaseOptimizer):
             )
         self.file_prefix = file_prefix
         self.pack_models = pack_models
+        self.executor = executor
 
 
     def fit(self, X: ArrayLike, y: ArrayLike):
@@ -1020,8 +1084,8 @@ class ParallelizeSearch(BaseOptimizer):
     
         Notes
         -----
-        The `fit` method leverages parallel processing using 
-        `concurrent.futures.ThreadPoolExecutor` to expedite the hyperparameter 
+        The `fit` method runs the searches concurrently with the `executor`, 
+        within the `n_jobs` core budget, to expedite the hyperparameter 
         search process. The progress of the optimization is displayed using 
         `tqdm` progress bars.
     
@@ -1086,42 +1150,41 @@ class ParallelizeSearch(BaseOptimizer):
         if self.pack_models: 
             self.save_results =True 
 
-        with ThreadPoolExecutor() as executor:
-            futures = []
-            for estimator, param_grid in zip(self.estimators, self.param_grids):
-                futures.append(executor.submit(
-                    optimize_hyperparams, estimator, 
-                    param_grid, X, y, self.cv, self.scoring, self.strategy, 
-                    self.n_jobs, **self.search_kwargs))
-
-            for future, estimator in zip(
-                    tqdm(concurrent.futures.as_completed(futures),
-                         total=len(futures),
-                         desc=f"Optimizing {self.estimators_nickname_} Estimators", 
-                         ncols=100, ascii=True),
-                    self.estimators):
-                est_name = get_estimator_name(estimator)
-                summary = future.result()
-                best_estimator = summary.best_estimator_
-                best_params = summary.best_params_
-                cv_results = summary.cv_results_
-
-                pack[f"{est_name}"] = {
-                    "best_params_": best_params,
-                    "best_estimator_": best_estimator,
-                    
-                    "cv_results_": cv_results
-                }
-                o[f"{est_name}"] = KeyBox(**pack[f"{est_name}"])
+        n_workers, n_inner_jobs, n_threads = _split_core_budget(
+            len(self.estimators), self.n_jobs, self.executor)
+        tasks = [(estimator, param_grid, X, y, self.cv, self.scoring, 
+                  self.strategy, n_inner_jobs) 
+                 for estimator, param_grid in zip(
+                         self.estimators, self.param_grids)]
+        summaries = _run_tasks(
+            partial(optimize_hyperparams, **self.search_kwargs), tasks, 
+            executor=self.executor, n_workers=n_workers, n_threads=n_threads)
+        for summary, estimator in zip(
+                tqdm(summaries, total=len(tasks),
+                     desc=f"Optimizing {self.estimators_nickname_} Estimators", 
+                     ncols=100, ascii=True),
+                self.estimators):
+            est_name = get_estimator_name(estimator)
+            best_estimator = summary.best_estimator_
+            best_params = summary.best_params_
+            cv_results = summary.cv_results_
 
-                if self.save_results and not self.pack_models:
-                    file_name = f"{est_name}_{self.estimators.index(estimator)}.joblib"
-                    joblib.dump((best_estimator, best_params), file_name)
-                    print(f"Results saved to {file_name}")
+            pack[f"{est_name}"] = {
+                "best_params_": best_params,
+                "best_estimator_": best_estimator,
+                
+                "cv_results_": cv_results
+            }
+            o[f"{est_name}"] = KeyBox(**pack[f"{est_name}"])
+
+            if self.save_results and not self.pack_models:
+                file_name = f"{est_name}_{self.estimators.index(estimator)}.joblib"
+                joblib.dump((best_estimator, best_params), file_name)
+                print(f"Results saved to {file_name}")
 
-            if self.pack_models:
-                joblib.dump(pack, filename=f"{self.file_prefix}.joblib")
-                print(f"Aggregated results saved to {self.file_prefix}.joblib")
+        if self.pack_models:
+            joblib.dump(pack, filename=f"{self.file_prefix}.joblib")
+            print(f"Aggregated results saved to {self.file_prefix}.joblib")
 
         self.summary_ = ModelSummary(descriptor="ParallelizeSearch", **o)
         self.summary_.summary(o)
@@ -1470,6 +1533,24 @@ class ParallelOptimizer(BaseOptimizer):
         The number of jobs to run in parallel for the optimization process. 
         `-1` means using all processors.
 
+    journal : str, path-like or SearchJournal, default=None
+        Append-only on-disk journal of the searches, see 
+        :class:`~gofast.models.journal.SearchJournal`. The result of each 
+        completed estimator search is stored in it, so that a restarted 
+        optimization only runs the searches left, and several processes 
+        sharing the journal split the estimators between them. The journal 
+        is also passed to the strategies accepting a `journal`, which then 
+        resume at the fold level.
+
+    fold_cache : bool, str, path-like or FoldCache, default=None
+        Cache of the cross-validation folds, see 
+        :class:`~gofast.models.folds.FoldCache`, passed to the strategies 
+        accepting a `fold_cache`. The other strategies run on the splits 
+        of the cache, and pipeline estimators cache their transformers in 
+        it, so the preprocessing shared by the candidates is fit once per 
+        fold. True uses a temporary cache, a path a cache stored in that 
+        directory. None keeps no cache.
+
     **search_kwargs : dict, optional
         Additional keyword arguments to pass to the search constructor.
 
@@ -1595,6 +1676,8 @@ class ParallelOptimizer(BaseOptimizer):
         cv=None, 
         n_jobs=-1, 
         save_results=False, 
+        journal=None, 
+        fold_cache=None, 
         **search_kwargs
         ):
         super().__init__( 
@@ -1605,6 +1688,8 @@ class ParallelOptimizer(BaseOptimizer):
             cv=cv, 
             save_results=save_results, 
             n_jobs=n_jobs, 
+            journal=journal, 
+            fold_cache=fold_cache, 
             **search_kwargs)
 
     def _optimize(self, estimator_name, estimator, param_grid, X, y):
@@ -1614,24 +1699,15 @@ class ParallelOptimizer(BaseOptimizer):
             scoring=self.scoring, 
             cv=self.cv, 
             n_jobs=self.n_jobs, 
+            **self._journal_kwargs(), 
             **self.search_kwargs
             )
         desc = f"Optimizing {estimator_name:<{self._max_name_length_}}"
         n_combinations = len(list(params_combinations(param_grid)))
         with tqdm(total=n_combinations, desc=desc, ascii=True, ncols=100 ) as pbar:
-            search.fit(X, y)
-           
-            best_estimator = search.best_estimator_
-            best_params = search.best_params_
-            best_score = search.best_score_
-            cv_results = search.cv_results_
-    
-            result = {
-                "best_estimator_": best_estimator,
-                "best_params_": best_params,
-                "best_score_": best_score,
-                "cv_results_": cv_results
-            }
+            result = _fit_search(search, estimator_name, X, y, 
+                                 journal=self.journal, 
+                                 fold_cache=self.fold_cache)
     
             if self.save_results:
                 self.save_results_to_file(result, f"{estimator_name}_results")
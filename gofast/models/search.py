@@ -15,7 +15,6 @@ from pprint import pprint
 import numpy as np 
 import pandas as pd 
 from tqdm import tqdm
-from concurrent.futures import ThreadPoolExecutor
 
 from sklearn.base import BaseEstimator, clone
 from sklearn.metrics import mean_squared_error, accuracy_score 
@@ -34,6 +33,9 @@ from ..tools.coreutils import listing_items_format, validate_ratio
 from ..tools.validator import check_X_y, check_array, check_consistent_length 
 from ..tools.validator import get_estimator_name, filter_valid_kwargs 
 
+from ._optimize import _run_tasks, _split_core_budget
+from ._selection import _candidate_key, _evaluate_population
+from .folds import FoldCache, check_fold_cache
 from .utils import get_scorers, dummy_evaluation, get_strategy_name
 from .utils import _standardize_input , get_strategy_method 
 from .utils import align_estimators_with_params, process_performance_data 
@@ -94,6 +96,19 @@ class MultipleSearch(BaseClass):
         Whether to save the tuning results to a joblib file. Default is False.
     filename : str, optional
         The filename for saving the joblib file. Required if savejob is True.
+    n_jobs : int, optional
+        The global core budget. It is split between the searches run 
+        concurrently and the CV jobs of each search, and the BLAS threads of 
+        each job are capped to the cores left, so that the nested 
+        parallelism does not oversubscribe the cores. Default is -1, all 
+        the processors.
+    executor : {'threads', 'processes', 'loky'}, optional
+        How the (strategy, estimator) searches are run concurrently. 
+        'threads' only speeds up fits releasing the GIL; 'processes' and 
+        'loky' (joblib's reusable workers, memory-mapping large arrays) 
+        require picklable estimators and scorers. The 'processes' workers 
+        run their search without inner CV jobs, their share of the cores 
+        going to BLAS threads. Default is 'threads'.
 
     Attributes
     ----------
@@ -225,7 +240,9 @@ class MultipleSearch(BaseClass):
         n_iter=10,
         scoring=None,
         savejob=False, 
-        filename=None
+        filename=None, 
+        n_jobs=-1, 
+        executor='threads'
         ):
         self.estimators = estimators
         self.param_grids = param_grids
@@ -235,6 +252,8 @@ class MultipleSearch(BaseClass):
         self.scoring = scoring
         self.savejob = savejob
         self.filename = filename
+        self.n_jobs = n_jobs
+        self.executor = executor
         
     def fit(self, X, y):
         r"""
@@ -299,19 +318,18 @@ class MultipleSearch(BaseClass):
         
         estimators, param_grids = align_estimators_with_params(
             self.param_grids, self.estimators)
+        tasks = [(estimator, param_grid, strategy, X, y, self.scoring)
+                 for strategy in self.strategies
+                 for estimator, param_grid in zip(estimators, param_grids)]
+        n_workers, self._n_inner_jobs, n_threads = _split_core_budget(
+            len(tasks), self.n_jobs, self.executor)
         with warnings.catch_warnings():
             warnings.simplefilter("ignore")
-            with ThreadPoolExecutor(max_workers=len(self.strategies)) as executor:
-                futures = []
-                for strategy in self.strategies:
-                    for estimator, param_grid in zip(estimators, param_grids):
-                        future = executor.submit(
-                            self._search, estimator,
-                            param_grid, strategy, X, y, self.scoring)
-                        futures.append(future)
-                
-                results, self.best_params_ =self._update_results_based_on_score(
-                    futures, results, self.best_params_ )
+            outputs = _run_tasks(
+                self._search, tasks, executor=self.executor, 
+                n_workers=n_workers, n_threads=n_threads)
+            results, self.best_params_ =self._update_results_based_on_score(
+                outputs, results, self.best_params_ )
 
         if self.savejob: 
             self.filename = self.filename or "ms_results.joblib"
@@ -351,6 +369,8 @@ class MultipleSearch(BaseClass):
         strategy_ = get_strategy_method(strategy)
         search_kwargs = {"n_iter": self.n_iter} 
         search_kwargs = filter_valid_kwargs(estimator, search_kwargs)
+        search_kwargs.update(filter_valid_kwargs(
+            strategy_, {"n_jobs": getattr(self, '_n_inner_jobs', None)}))
         search = strategy_(estimator, param_grid, cv=self.cv, scoring=scoring, 
                            **search_kwargs)
         search.fit(X, y)
@@ -374,8 +394,8 @@ class MultipleSearch(BaseClass):
     
         Parameters
         ----------
-        futures : list
-            List of futures containing the results of the parameter search.
+        futures : iterable
+            The futures, or directly the outputs, of the parameter searches.
         results : dict, optional
             A dictionary to store the updated results. If not provided, a new 
             dictionary is created.
@@ -403,19 +423,15 @@ class MultipleSearch(BaseClass):
         >>> from concurrent.futures import ThreadPoolExecutor
         >>> from sklearn.ensemble import RandomForestClassifier
         >>> from sklearn.datasets import make_classification
-        >>> import numpy as np
-        >>> class DummyClass:
-        ...     def __init__(self):
-        ...         self.best_params_ = {}
-        ...         self.results_ = {}
-        >>> dummy_instance = DummyClass()
+        >>> from gofast.models.search import MultipleSearch
         >>> def dummy_search_function(estimator, param_grid, strategy, X, y):
-        ...     best_params = {estimator.__class__.__name__: {'n_estimators': 100}}
+        ...     name = estimator.__class__.__name__
+        ...     best_params = {name: {'n_estimators': 100}}
         ...     result = {
-        ...         estimator.__class__.__name__: {
+        ...         name: {
         ...             "best_estimator_": estimator,
         ...             "best_params_": {'n_estimators': 100},
-        ...             "best_score_": np.random.rand(),
+        ...             "best_score_": {'GSCV': 0.8, 'RSCV': 0.9}[strategy],
         ...             "strategy": strategy,
         ...             "cv_results_": None,
         ...         }
@@ -425,24 +441,28 @@ class MultipleSearch(BaseClass):
         >>> estimators = [RandomForestClassifier()]
         >>> param_grids = [{'n_estimators': [100, 200], 'max_depth': [10, 20]}]
         >>> strategies = ['GSCV', 'RSCV']
+        >>> search = MultipleSearch(estimators, param_grids, strategies)
         >>> futures = []
         >>> with ThreadPoolExecutor(max_workers=len(strategies)) as executor:
         ...     for strategy in strategies:
         ...         for estimator, param_grid in zip(estimators, param_grids):
         ...             future = executor.submit(
-        ...                 dummy_search_function, estimator, param_grid, strategy, X, y
-        ...             )
+        ...                 dummy_search_function, estimator, param_grid, 
+        ...                 strategy, X, y)
         ...             futures.append(future)
-        >>> updated_results, updated_best_params = dummy_instance._update_results_based_on_score(
-        ...      futures)
-        >>> print(updated_results)
-        >>> print(updated_best_params)
+        >>> updated_results, updated_best_params = (
+        ...     search._update_results_based_on_score(futures))
+        >>> updated_results['RandomForestClassifier']['strategy']
+        'RSCV'
+        >>> updated_best_params
+        {'RandomForestClassifier': {'n_estimators': 100}}
         """
         results = results or {}
         best_params = best_params or {}
         for future in tqdm(futures, desc='Optimizing parameters', ncols=100, 
                            ascii=True, unit='search'):
-            best_param, result = future.result()
+            best_param, result = (
+                future.result() if hasattr(future, 'result') else future)
             estimator_name = list(best_param.keys())[0]
             results, best_params = update_if_higher(
                 results, 
@@ -930,6 +950,14 @@ class CrossValidator(BaseClass):
     
     scoring : str, optional
         The scoring strategy to evaluate the model (default is 'accuracy').
+
+    fold_cache : bool, str, path-like or FoldCache, optional
+        Cache of the cross-validation folds, see 
+        :class:`~gofast.models.folds.FoldCache`. When the estimator is a 
+        pipeline, its preprocessing steps are fit once per fold and reused 
+        by the later validations of pipelines sharing them, e.g. when 
+        comparing final estimators on the same data. Default is None, 
+        which keeps no cache.
     
     Attributes
     ----------
@@ -995,12 +1023,14 @@ class CrossValidator(BaseClass):
     def __init__(
         self, estimator: BaseEstimator,
         cv: int = 5, 
-        scoring: str = 'accuracy'
+        scoring: str = 'accuracy', 
+        fold_cache: Optional[Union[bool, str, FoldCache]] = None, 
         ):
   
         self.estimator = estimator
         self.cv = cv
         self.scoring = scoring
+        self.fold_cache = fold_cache
 
     def fit(self, X: Union[ArrayLike, list],
             y: Optional[Union[ArrayLike, list]] = None):
@@ -1024,7 +1054,16 @@ class CrossValidator(BaseClass):
             raise ValueError("Target labels `y` must be provided for"
                              " supervised learning models.")
         
-        scores = cross_val_score(self.estimator, X, y, cv=self.cv, scoring=self.scoring)
+        fold_cache = check_fold_cache(self.fold_cache)
+        if fold_cache is None: 
+            scores = cross_val_score(
+                self.estimator, X, y, cv=self.cv, scoring=self.scoring)
+        else: 
+            folds = fold_cache.materialize(self.estimator, X, y, cv=self.cv)
+            cache = {}
+            _evaluate_population(self.estimator, [{}], X, y, 
+                                 scoring=self.scoring, cache=cache, folds=folds)
+            scores = cache[_candidate_key({})]['split_scores']
         mean_score = scores.mean()
         self.score_results_ = (scores, mean_score)
 
@@ -10,13 +10,16 @@ import warnings
 import random
 import itertools 
 import numpy as np 
+from scipy.spatial.distance import pdist
 
 from sklearn.base import  clone
-from sklearn.model_selection import cross_val_score 
+from sklearn.utils import check_random_state
 from sklearn.model_selection._search import BaseSearchCV, ParameterSampler
 
 from ._selection import GeneticBaseSearch, BaseSwarmSearch  
 from ._selection import GradientBaseSearch, AnnealingBaseSearch
+from ._selection import _evaluate_population, _candidate_key
+from ._selection import _IncrementalGP, _ParamEncoder, _acquisition
 from .utils import apply_param_types 
 
 __all__=["SwarmSearchCV", "GradientSearchCV", "AnnealingSearchCV", 
@@ -105,9 +108,10 @@ class SwarmSearchCV(BaseSwarmSearch):
         Controls the randomness of the algorithm.
     
     n_jobs : int, default=1
-        The number of jobs to run in parallel for `cross_val_score`. -1 means
-        using all available processors. This can speed up the fitness evaluation,
-        especially for computationally intensive models.
+        The number of jobs to run in parallel over the particles x CV folds 
+        of each iteration. -1 means using all available processors. This can
+        speed up the fitness evaluation, especially for computationally 
+        intensive models.
         
     verbose : int, default=0
         Controls the verbosity of output during the optimization process.
@@ -178,6 +182,29 @@ class SwarmSearchCV(BaseSwarmSearch):
         expensive and is not strictly required to select the parameters that
         yield the best generalization performance.
 
+    pruning : {'median', 'bound'} or None, default=None
+        Fold-level pruning of the particles. After each CV fold but the last, 
+        a candidate whose running mean score falls below the median of the 
+        running means recorded at that fold (``'median'``), or below the 
+        best score completed so far (``'bound'``), skips its remaining 
+        folds. Every candidate evaluated by the search is recorded 
+        in `cv_results_`, whose 'status' column is ``'completed'`` or 
+        ``'pruned'``. None runs all the folds.
+
+    journal : str, path-like or SearchJournal, default=None
+        Append-only on-disk journal of the fold scores, see 
+        :class:`~gofast.models.journal.SearchJournal`. A restarted search 
+        reuses the folds already recorded instead of refitting them, and 
+        several processes sharing the journal split the candidates between 
+        them. None keeps no journal.
+
+    fold_cache : bool, str, path-like or FoldCache, default=None
+        Cache of the cross-validation folds, see 
+        :class:`~gofast.models.folds.FoldCache`. The splits are computed 
+        once, and the leading steps of a pipeline estimator that no 
+        searched parameter refers to are fit once per fold instead of once 
+        per candidate and fold. True uses a temporary cache, a path a cache 
+        stored in that directory. None keeps no cache.
 
     Attributes
     ----------
@@ -395,6 +422,9 @@ class SwarmSearchCV(BaseSwarmSearch):
         refit=True, 
         error_score=np.nan, 
         return_train_score=True, 
+        pruning=None, 
+        journal=None, 
+        fold_cache=None 
         ):
         super().__init__(
             estimator=estimator, 
@@ -411,6 +441,9 @@ class SwarmSearchCV(BaseSwarmSearch):
             return_train_score=return_train_score, 
             n_jobs=n_jobs, 
             verbose=verbose, 
+            pruning=pruning, 
+            journal=journal, 
+            fold_cache=fold_cache 
         )
         self.max_iter = max_iter
         self.random_state = random_state
@@ -446,10 +479,9 @@ class SwarmSearchCV(BaseSwarmSearch):
         global_best_candidates = []
 
         for iteration in range(self.max_iter):
-            for particle in particles:
-                # Evaluate the current position using a separate method
-                current_score = self._evaluate_particle(particle, self.X, self.y)
-
+            # Evaluate the whole swarm in one parallel batch
+            scores = self._evaluate_particles(particles, self.X, self.y)
+            for particle, current_score in zip(particles, scores):
                 # Update particle's personal best
                 if particle['best_score'] < current_score:
                     particle['best_position'] = particle['position'].copy()
@@ -1280,6 +1312,32 @@ class AnnealingSearchCV(AnnealingBaseSearch):
         expensive and is not strictly required to select the parameters that
         yield the best generalization performance.
 
+    pruning : {'median', 'bound'} or None, default=None
+        Fold-level pruning of the proposals. After each CV fold but the last, 
+        a candidate whose running mean score falls below the median of the 
+        running means recorded at that fold (``'median'``), or below the 
+        best score completed so far (``'bound'``), skips its remaining 
+        folds. The proposals are scored in a single batch, which leaves 
+        ``'bound'`` no completed incumbent to prune against; prefer 
+        ``'median'``. Every candidate evaluated by the search is recorded 
+        in `cv_results_`, whose 'status' column is ``'completed'`` or 
+        ``'pruned'``. None runs all the folds.
+
+    journal : str, path-like or SearchJournal, default=None
+        Append-only on-disk journal of the fold scores, see 
+        :class:`~gofast.models.journal.SearchJournal`. A restarted search 
+        reuses the folds already recorded instead of refitting them, and 
+        several processes sharing the journal split the candidates between 
+        them. None keeps no journal.
+
+    fold_cache : bool, str, path-like or FoldCache, default=None
+        Cache of the cross-validation folds, see 
+        :class:`~gofast.models.folds.FoldCache`. The splits are computed 
+        once, and the leading steps of a pipeline estimator that no 
+        searched parameter refers to are fit once per fold instead of once 
+        per candidate and fold. True uses a temporary cache, a path a cache 
+        stored in that directory. None keeps no cache.
+
     Attributes
     ----------
     cv_results_ : dict of numpy (masked) ndarrays
@@ -1447,7 +1505,10 @@ class AnnealingSearchCV(AnnealingBaseSearch):
         pre_dispatch="2*n_jobs", 
         refit=True,
         error_score=np.nan,
-        return_train_score=True
+        return_train_score=True, 
+        pruning=None, 
+        journal=None, 
+        fold_cache=None
     ):
         super().__init__(
             estimator=estimator, 
@@ -1462,7 +1523,10 @@ class AnnealingSearchCV(AnnealingBaseSearch):
             pre_dispatch=pre_dispatch, 
             refit=refit,
             error_score=error_score,
-            return_train_score=return_train_score
+            return_train_score=return_train_score, 
+            pruning=pruning, 
+            journal=journal, 
+            fold_cache=fold_cache
         )
         self.param_space=param_space 
         
@@ -1511,8 +1575,9 @@ class AnnealingSearchCV(AnnealingBaseSearch):
         -----
         - The `_random_hyperparameters` method is used to generate new sets of 
           parameters for evaluation.
-        - The `_evaluate_fitness` method computes the fitness score for a given set 
-          of parameters.
+        - The `_evaluate_population_fitness` method computes the fitness scores 
+          of all the proposals in one parallel batch, since they do not depend 
+          on the current state of the chain.
         - The `_acceptance_criterion` method determines whether to accept the new 
           set of parameters based on the current temperature and score differences.
     
@@ -1523,13 +1588,18 @@ class AnnealingSearchCV(AnnealingBaseSearch):
         random.seed(self.random_state)
         temperature = self.init_temp
 
-        current_params = self._random_hyperparameters()
-        current_score = self._evaluate_fitness(current_params)
+        # Proposals do not depend on the current state, so the whole chain
+        # is drawn and scored in one parallel batch before the walk.
+        proposals = [self._random_hyperparameters() 
+                     for _ in range(self.max_iter + 1)]
+        proposal_scores = self._evaluate_population_fitness(proposals)
+
+        current_params, current_score = proposals[0], proposal_scores[0]
 
         candidate_params =[current_params ]
         for iteration in range(self.max_iter):
-            next_params = self._random_hyperparameters()
-            next_score = self._evaluate_fitness(next_params)
+            next_params = proposals[iteration + 1]
+            next_score = proposal_scores[iteration + 1]
             # check current param whether to fit the criterion
             if self._acceptance_criterion(current_score, next_score, temperature):
                 current_params, current_score = next_params, next_score
@@ -1696,6 +1766,30 @@ class GeneticSearchCV(GeneticBaseSearch):
         higher values will provide more detailed information about the progress of 
         the algorithm, including the current generation number and the best score 
         at each generation.
+
+    pruning : {'median', 'bound'} or None, default=None
+        Fold-level pruning of the individuals. After each CV fold but the last, 
+        a candidate whose running mean score falls below the median of the 
+        running means recorded at that fold (``'median'``), or below the 
+        best score completed so far (``'bound'``), skips its remaining 
+        folds. Every candidate evaluated by the search is recorded 
+        in `cv_results_`, whose 'status' column is ``'completed'`` or 
+        ``'pruned'``. None runs all the folds.
+
+    journal : str, path-like or SearchJournal, default=None
+        Append-only on-disk journal of the fold scores, see 
+        :class:`~gofast.models.journal.SearchJournal`. A restarted search 
+        reuses the folds already recorded instead of refitting them, and 
+        several processes sharing the journal split the candidates between 
+        them. None keeps no journal.
+
+    fold_cache : bool, str, path-like or FoldCache, default=None
+        Cache of the cross-validation folds, see 
+        :class:`~gofast.models.folds.FoldCache`. The splits are computed 
+        once, and the leading steps of a pipeline estimator that no 
+        searched parameter refers to are fit once per fold instead of once 
+        per candidate and fold. True uses a temporary cache, a path a cache 
+        stored in that directory. None keeps no cache.
         
     Attributes
     ----------
@@ -1755,6 +1849,9 @@ class GeneticSearchCV(GeneticBaseSearch):
         pre_dispatch="2*n_jobs",
         error_score=np.nan,
         return_train_score=True,
+        pruning=None, 
+        journal=None, 
+        fold_cache=None 
         ):
         super().__init__(
             estimator, 
@@ -1773,6 +1870,9 @@ class GeneticSearchCV(GeneticBaseSearch):
             pre_dispatch=pre_dispatch, 
             error_score=error_score, 
             return_train_score= return_train_score, 
+            pruning=pruning, 
+            journal=journal, 
+            fold_cache=fold_cache 
         ) 
         self.param_space = param_space 
      
@@ -1802,13 +1902,12 @@ class GeneticSearchCV(GeneticBaseSearch):
                 print(f"Generation {generation + 1}/{self.n_generations}:")
             # Evaluate current generation
             candidate_params = [individual for individual in population]
-            out = evaluate_candidates(candidate_params)
-            # Extract scores and update best parameters and estimator
-            scores = out["mean_test_score"]
-            params= out["params"]
-            #print(len(params), len(scores))
-            for score, candidate_param in zip(scores, params):
-                if score >= self.best_score_:
+            scores = self._evaluate_generation(
+                candidate_params, evaluate_candidates)
+            # Update best parameters and estimator
+            for score, candidate_param in zip(scores, candidate_params):
+                if (score >= self.best_score_ 
+                        and self._is_completed(candidate_param)):
                     self.best_score_ = score
                     self.best_params_ = candidate_param #s[idx]
                     self.best_estimator_ = clone(self.estimator).set_params(
@@ -1827,6 +1926,11 @@ class GeneticSearchCV(GeneticBaseSearch):
             # Create next generation
             population = self._create_next_generation(population, scores)
 
+        if (self._pruner is not None or self._journal is not None 
+                or self._folds is not None) and self.best_params_ is not None:
+            # The generations were scored outside `evaluate_candidates`
+            evaluate_candidates([self.best_params_])
+
         if self.verbose:
             print("Optimization completed.")
             print(f"Best score: {self.best_score_:.4f}")
@@ -1852,8 +1956,16 @@ class GeneticSearchCV(GeneticBaseSearch):
         float
             Mean cross-validation score for the individual.
         """
-        estimator = clone(self.estimator).set_params(**individual)
-        return np.mean(cross_val_score(estimator, X, y, cv=self.cv, scoring=scoring))
+        return _evaluate_population(
+            self.estimator, [individual], X, y, cv=self.cv, scoring=scoring, 
+            n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch, 
+            error_score=self.error_score, 
+            cache=getattr(self, '_fitness_cache', None), 
+            pruner=getattr(self, '_pruner', None), 
+            journal=getattr(self, '_journal', None), 
+            return_train_score=self.return_train_score, 
+            groups=getattr(self, '_groups', None), 
+            fit_params=getattr(self, '_fit_params', None))[0]
 
     def _crossover(self, parent1, parent2):
         """
@@ -2146,6 +2258,30 @@ class EvolutionarySearchCV(GeneticBaseSearch):
         expensive and is not strictly required to select the parameters that
         yield the best generalization performance.
 
+    pruning : {'median', 'bound'} or None, default=None
+        Fold-level pruning of the individuals. After each CV fold but the last, 
+        a candidate whose running mean score falls below the median of the 
+        running means recorded at that fold (``'median'``), or below the 
+        best score completed so far (``'bound'``), skips its remaining 
+        folds. Every candidate evaluated by the search is recorded 
+        in `cv_results_`, whose 'status' column is ``'completed'`` or 
+        ``'pruned'``. None runs all the folds.
+
+    journal : str, path-like or SearchJournal, default=None
+        Append-only on-disk journal of the fold scores, see 
+        :class:`~gofast.models.journal.SearchJournal`. A restarted search 
+        reuses the folds already recorded instead of refitting them, and 
+        several processes sharing the journal split the candidates between 
+        them. None keeps no journal.
+
+    fold_cache : bool, str, path-like or FoldCache, default=None
+        Cache of the cross-validation folds, see 
+        :class:`~gofast.models.folds.FoldCache`. The splits are computed 
+        once, and the leading steps of a pipeline estimator that no 
+        searched parameter refers to are fit once per fold instead of once 
+        per candidate and fold. True uses a temporary cache, a path a cache 
+        stored in that directory. None keeps no cache.
+
     random_state : int, RandomState instance or None, default=None
         Controls the randomness of the algorithm. Used for reproducible results.
         
@@ -2330,6 +2466,9 @@ class EvolutionarySearchCV(GeneticBaseSearch):
         pre_dispatch="2*n_jobs",
         error_score=np.nan,
         return_train_score=True,
+        pruning=None, 
+        journal=None, 
+        fold_cache=None 
         ):
         super().__init__(
             estimator=estimator, 
@@ -2348,6 +2487,9 @@ class EvolutionarySearchCV(GeneticBaseSearch):
             pre_dispatch=pre_dispatch, 
             error_score=error_score, 
             return_train_score=return_train_score, 
+            pruning=pruning, 
+            journal=journal, 
+            fold_cache=fold_cache 
         ) 
         self.param_space = param_space 
     
@@ -2381,10 +2523,8 @@ class EvolutionarySearchCV(GeneticBaseSearch):
     
             # Evaluate fitness
             candidate_params = [individual for individual in population]
-            out = evaluate_candidates(candidate_params)
-            # Extract scores
-            scores = out["mean_test_score"]
-            params= out["params"]
+            scores = self._evaluate_generation(
+                candidate_params, evaluate_candidates)
             # Check if scores array is empty
             if len(scores) == 0:
                 if self.verbose: 
@@ -2399,8 +2539,9 @@ class EvolutionarySearchCV(GeneticBaseSearch):
             #     self.best_params_ = candidate_params[best_idx]
             #     self.best_estimator_ = clone(self.estimator).set_params(
             #         **self.best_params_)
-            for score, candidate_param in zip(scores, params):
-                if score >= self.best_score_:
+            for score, candidate_param in zip(scores, candidate_params):
+                if (score >= self.best_score_ 
+                        and self._is_completed(candidate_param)):
                     self.best_score_ = score
                     self.best_params_ = candidate_param #s[idx]
                     self.best_estimator_ = clone(self.estimator).set_params(
@@ -2417,6 +2558,11 @@ class EvolutionarySearchCV(GeneticBaseSearch):
     
             if self.verbose:
                 print(f"Best score in this generation: {self.best_score_:.4f}")
+
+        if (self._pruner is not None or self._journal is not None 
+                or self._folds is not None) and self.best_params_ is not None:
+            # The generations were scored outside `evaluate_candidates`
+            evaluate_candidates([self.best_params_])
     
         if self.verbose:
             print("Optimization completed.")
@@ -2444,12 +2590,7 @@ class EvolutionarySearchCV(GeneticBaseSearch):
         fitness_score : float
             The fitness score of the individual.
         """
-        estimator = clone(self.estimator).set_params(**individual)
-        score = np.mean(cross_val_score(
-            estimator, X, y, cv=self.cv, scoring=self.scoring, 
-            n_jobs= self.n_jobs)
-            )
-        return score
+        return self._evaluate_fitness([individual], X, y)[0]
 
     def _initialize_population(self):
         """
@@ -2502,13 +2643,16 @@ class EvolutionarySearchCV(GeneticBaseSearch):
         fitness_scores : list
             A list containing the fitness score of each individual in the population.
         """
-        fitness_scores = []
-        for individual in population:
-            estimator = clone(self.estimator).set_params(**individual)
-            score = np.mean(cross_val_score(estimator, X, y, cv=self.cv,
-                                            scoring=self.scoring, n_jobs= self.n_jobs))
-            fitness_scores.append(score)
-        return fitness_scores
+        return _evaluate_population(
+            self.estimator, population, X, y, cv=self.cv, scoring=self.scoring, 
+            n_jobs=self.n_jobs, pre_dispatch=self.pre_dispatch, 
+            error_score=self.error_score, 
+            cache=getattr(self, '_fitness_cache', None), 
+            pruner=getattr(self, '_pruner', None), 
+            journal=getattr(self, '_journal', None), 
+            return_train_score=self.return_train_score, 
+            groups=getattr(self, '_groups', None), 
+            fit_params=getattr(self, '_fit_params', None))
 
     def _evolve(self, population, fitness_scores):
         """
@@ -2564,6 +2708,9 @@ class EvolutionarySearchCV(GeneticBaseSearch):
         """
         parent1 = random.choice(selected_individuals)
         parent2 = random.choice(selected_individuals)
+        # A converged selection has no distinct pair to draw.
+        if all(individual == parent1 for individual in selected_individuals):
+            return parent1, parent2
         while parent1 == parent2:
             parent2 = random.choice(selected_individuals)
         return parent1, parent2
@@ -2694,9 +2841,29 @@ class SequentialSearchCV (BaseSearchCV):
         as values, defining the search space for each hyperparameter.
     
     n_iter : int, default=10
-        Number of parameter settings that are sampled. n_iter trades
+        Number of parameter settings that are evaluated. n_iter trades
         off runtime vs quality of the solution.
 
+    acquisition : {'ei', 'pi', 'ucb'}, default='ei'
+        The acquisition function maximized to propose the next parameter 
+        settings: expected improvement, probability of improvement or upper 
+        confidence bound.
+
+    n_initial_points : int, default=5
+        Number of random parameter settings evaluated before the surrogate 
+        model guides the search.
+
+    n_candidates : int, default=1000
+        Number of random parameter settings drawn at each iteration and 
+        scored by the acquisition function in one vectorized call. The best 
+        ones are evaluated.
+
+    n_parallel_suggestions : int, default=1
+        Number of parameter settings proposed per iteration (q-batch). They 
+        are chosen one after the other, each assuming the surrogate 
+        prediction of the previous ones as observed ("kriging believer"), 
+        then cross-validated together in one parallel batch.
+
     scoring : str, callable, list, tuple or dict, default=None
         Strategy to evaluate the performance of the cross-validated model on
         the test set.
@@ -2950,6 +3117,14 @@ class SequentialSearchCV (BaseSearchCV):
     -----
     SMBO is particularly useful for optimization problems with expensive evaluations,
     as it efficiently narrows down the search space using the surrogate model.
+
+    The surrogate is a Gaussian process with an RBF kernel over the encoded 
+    parameters, whose length scale is set once from the spread of the 
+    search space. Keeping it fixed lets each iteration extend the Cholesky 
+    factor of the kernel matrix instead of refitting the process, so the 
+    overhead per iteration stays small as the history grows to hundreds of 
+    points. Settings already evaluated are never proposed again; the search 
+    stops early once a discrete space is exhausted.
     
     References
     ----------
@@ -2965,6 +3140,10 @@ class SequentialSearchCV (BaseSearchCV):
         param_space,
         *,
         n_iter=10,
+        acquisition='ei', 
+        n_initial_points=5, 
+        n_candidates=1000, 
+        n_parallel_suggestions=1, 
         scoring=None,
         n_jobs=None,
         refit=True,
@@ -2977,6 +3156,10 @@ class SequentialSearchCV (BaseSearchCV):
     ):
         self.param_space = param_space
         self.n_iter = n_iter
+        self.acquisition = acquisition
+        self.n_initial_points = n_initial_points
+        self.n_candidates = n_candidates
+        self.n_parallel_suggestions = n_parallel_suggestions
         self.random_state = random_state
         
         super().__init__(
@@ -2993,12 +3176,14 @@ class SequentialSearchCV (BaseSearchCV):
 
     def _run_search(self, evaluate_candidates):
         """
-        Perform the search over the parameter space.
+        Perform the sequential model-based search over the parameter space.
 
-        This method samples a fixed number of candidate parameter sets from the
-        defined parameter space. It uses `ParameterSampler` to generate parameter
-        combinations, which are then evaluated to find the best set of parameters
-        for the given estimator.
+        After `n_initial_points` random settings, each iteration draws 
+        `n_candidates` random settings, predicts their score with the 
+        Gaussian-process surrogate, and cross-validates the 
+        `n_parallel_suggestions` ones maximizing the acquisition function. 
+        The surrogate is then updated with their scores, until `n_iter` 
+        settings are evaluated.
 
         The method is specifically designed to be called internally by the `fit`
         method of the base class during the hyperparameter optimization process.
@@ -3010,41 +3195,82 @@ class SequentialSearchCV (BaseSearchCV):
             parameter settings. It evaluates each parameter setting using 
             cross-validation and records the results.
 
-        Attributes
-        ----------
-        param_space : dict
-            Dictionary with parameters names as keys and distributions or lists of
-            parameters to try. Distributions must provide a `rvs` method for sampling
-            (such as those from `scipy.stats.distributions`).
-        
-        n_iter : int
-            Number of parameter settings that are sampled. `n_iter` trades off runtime
-            vs quality of the solution.
-        
-        random_state : int, RandomState instance or None, default=None
-            Pseudo-random number generator state used for random uniform sampling from
-            lists of possible values instead of scipy.stats distributions.
-
         Notes
         -----
         `_run_search` does not return any value; instead, it works by side effect,
         calling the `evaluate_candidates` function and thus modifying the state of
         the search object with the results of the evaluation.
-
-        Examples
-        --------
-        >>> from sklearn.datasets import load_iris
-        >>> from sklearn.svm import SVC
-        >>> from gofast.models.selection import SequentialSearchCV
-        >>> X, y = load_iris(return_X_y=True)
-        >>> param_space = {'C': scipy.stats.expon(scale=100),
-                           'gamma': scipy.stats.expon(scale=.1)}
-        >>> search = SequentialSearchCV(estimator=SVC(), param_space=param_space, 
-                                        n_iter=50)
-        >>> search._run_search(search._get_param_iterator)
         """
-        evaluate_candidates(
-            ParameterSampler(
-                self.param_space, self.n_iter, random_state=self.random_state
-            )
-        )
+        if self.acquisition not in ('ei', 'pi', 'ucb'):
+            raise ValueError(
+                f"Invalid acquisition {self.acquisition!r}. Expect 'ei', 'pi'"
+                " or 'ucb'.")
+        rng = check_random_state(self.random_state)
+        candidates = self._sample_candidates(rng, seen=set())
+        encoder = _ParamEncoder().fit(candidates)
+        encoded = encoder.transform(candidates[:200])
+        # Median heuristic, fixed so that the surrogate updates incrementally
+        length_scale = np.median(pdist(encoded)) if len(encoded) > 1 else 1.
+        surrogate = _IncrementalGP(length_scale=length_scale or 1.)
+
+        seen = set()
+        batch = candidates[:max(1, min(self.n_initial_points, self.n_iter))]
+        while batch:
+            out = evaluate_candidates(batch)
+            seen.update(_candidate_key(params) for params in batch)
+            score_key = ('mean_test_score' if 'mean_test_score' in out 
+                         else f"mean_test_{self.refit}")
+            if score_key not in out:
+                # No single metric to model: sample the rest at random.
+                evaluate_candidates(self._sample_candidates(
+                    rng, seen)[:self.n_iter - len(seen)])
+                return
+            scores = np.asarray(out[score_key][-len(batch):], dtype=float)
+            # Failed fits are modelled as the worst score observed.
+            observed = np.concatenate([surrogate.y_ if surrogate.y_ is not None 
+                                       else [], scores])
+            worst = np.nanmin(observed) if np.any(~np.isnan(observed)) else 0.
+            surrogate.update(encoder.transform(batch), 
+                             np.where(np.isnan(scores), worst, scores))
+
+            n_left = self.n_iter - len(seen)
+            candidates = self._sample_candidates(rng, seen) if n_left > 0 else []
+            batch = self._suggest(
+                surrogate, encoder, candidates, 
+                min(self.n_parallel_suggestions, n_left))
+
+    def _sample_candidates(self, rng, seen):
+        """Draw up to `n_candidates` distinct settings not in `seen`."""
+        with warnings.catch_warnings():
+            # Small discrete spaces are sampled exhaustively.
+            warnings.simplefilter("ignore", UserWarning)
+            sampler = ParameterSampler(
+                self.param_space, self.n_candidates, random_state=rng)
+            candidates = {}
+            for params in sampler:
+                key = _candidate_key(params)
+                if key not in seen:
+                    candidates.setdefault(key, params)
+        return list(candidates.values())
+
+    def _suggest(self, surrogate, encoder, candidates, n_suggestions):
+        """
+        Return the `n_suggestions` candidates maximizing the acquisition 
+        function, using the surrogate predictions of the ones already 
+        chosen as fantasy observations.
+        """
+        if not candidates or n_suggestions <= 0:
+            return []
+        X = encoder.transform(candidates)
+        best = surrogate.y_.max()
+        xi = 0.01 * surrogate.y_.std()
+        chosen = []
+        for k in range(min(n_suggestions, len(candidates))):
+            mean, std = surrogate.predict(X)
+            scores = _acquisition(mean, std, best, kind=self.acquisition, xi=xi)
+            scores[chosen] = -np.inf
+            index = int(np.argmax(scores))
+            chosen.append(index)
+            if k < n_suggestions - 1:
+                surrogate = surrogate.copy().update(X[[index]], mean[[index]])
+        return [candidates[index] for index in chosen]
@@ -0,0 +1,76 @@
+# -*- coding: utf-8 -*-
+"""
+test_deep_selection.py
+"""
+
+import pytest
+from sklearn.datasets import make_classification
+from sklearn.ensemble import RandomForestClassifier
+from sklearn.linear_model import LogisticRegression, SGDClassifier
+from gofast.experimental import enable_hyperband_selection # noqa
+from gofast.models._deep_selection import HyperbandSearchCV
+
+@pytest.fixture
+def classification_data():
+    X, y = make_classification(n_samples=300, n_features=8, random_state=42)
+    return X, y
+
+def test_hyperband_promotes_survivors(classification_data):
+    X, y = classification_data
+    search = HyperbandSearchCV(
+        LogisticRegression(), {'C': [0.01, 0.1, 1, 10, 100]}, max_iter=9,
+        eta=3, cv=3, random_state=0).fit(X, y)
+    for bracket in {res['bracket'] for res in search.cv_results_}:
+        rungs = [[res for res in search.cv_results_ 
+                  if res['bracket'] == bracket and res['rung'] == i]
+                 for i in range(bracket + 1)]
+        for lower, upper in zip(rungs, rungs[1:]):
+            # Survivors are a subset of the previous rung, with more budget
+            assert len(upper) <= max(len(lower) // 3, 1)
+            assert all(res['params'] in [r['params'] for r in lower] 
+                       for res in upper)
+            assert upper[0]['resource'] > lower[0]['resource']
+    best = search.cv_results_[search.best_index_]
+    assert best['resource'] == search.max_iter
+    assert search.best_estimator_.C == search.best_params_['C']
+
+def test_hyperband_estimator_resource(classification_data):
+    X, y = classification_data
+    search = HyperbandSearchCV(
+        RandomForestClassifier(random_state=0), {'max_depth': [2, 4, None]},
+        max_iter=9, eta=3, resource='n_estimators', cv=3, random_state=0
+        ).fit(X, y)
+    assert search.best_estimator_.n_estimators == 9
+    assert not search.best_estimator_.warm_start
+
+    with pytest.raises(ValueError):
+        HyperbandSearchCV(
+            RandomForestClassifier(), {'n_estimators': [10, 20]},
+            resource='n_estimators').fit(X, y)
+    with pytest.raises(ValueError):
+        HyperbandSearchCV(
+            LogisticRegression(), {'C': [1, 10]}, resource='epochs').fit(X, y)
+
+class EpochCountingSGD(SGDClassifier):
+    n_epochs = []
+
+    def fit(self, X, y, **fit_params):
+        super().fit(X, y, **fit_params)
+        self.epochs_ = getattr(self, 'epochs_', 0) + self.max_iter
+        EpochCountingSGD.n_epochs.append(self.epochs_)
+        return self
+
+def test_hyperband_warm_start_resumes_budget(classification_data):
+    X, y = classification_data
+    EpochCountingSGD.n_epochs = []
+    search = HyperbandSearchCV(
+        EpochCountingSGD(tol=None, random_state=0), 
+        {'alpha': [1e-4, 1e-3, 1e-2]}, max_iter=9, eta=3, resource='max_iter',
+        cv=3, random_state=0, refit=False).fit(X, y)
+    # A survivor resumed from the previous rung only runs the epochs it 
+    # misses, so it is trained on the budget of its rung in total.
+    assert set(EpochCountingSGD.n_epochs) == {
+        res['resource'] for res in search.cv_results_}
+
+if __name__ == '__main__':
+    pytest.main([__file__])
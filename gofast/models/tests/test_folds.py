@@ -0,0 +1,93 @@
+# -*- coding: utf-8 -*-
+"""
+test_folds.py
+"""
+
+import random
+
+import numpy as np
+import pytest
+from sklearn.datasets import load_iris
+from sklearn.linear_model import LogisticRegression
+from sklearn.pipeline import make_pipeline
+from sklearn.preprocessing import StandardScaler
+from sklearn.svm import SVC
+from gofast.models.folds import FoldCache
+from gofast.models.optimize import OptimizeSearch
+from gofast.models.search import CrossValidator
+from gofast.models.selection import GeneticSearchCV, SwarmSearchCV
+
+class CountingScaler(StandardScaler):
+    n_fits = 0
+
+    def fit(self, X, y=None, sample_weight=None):
+        CountingScaler.n_fits += 1
+        return super().fit(X, y, sample_weight)
+
+@pytest.fixture
+def iris():
+    return load_iris(return_X_y=True)
+
+def test_prefix_length():
+    cache = FoldCache()
+    pipe = make_pipeline(StandardScaler(), StandardScaler(), SVC())
+    assert cache.prefix_length(pipe, ['svc__C']) == 2
+    assert cache.prefix_length(pipe, ['standardscaler-2__with_mean']) == 1
+    assert cache.prefix_length(pipe, ['steps']) == 0
+    assert cache.prefix_length(SVC(), ['C']) == 0
+    assert FoldCache(preprocessing=False).prefix_length(pipe, ['svc__C']) == 0
+
+def test_split_once(iris):
+    X, y = iris
+    cache = FoldCache()
+    assert cache.split(X, y, cv=3) is cache.split(X, y, cv=3)
+    assert cache.split(X, y, cv=3) is not cache.split(X, y, cv=4)
+
+@pytest.mark.parametrize("search_cls, kwargs", [
+    (SwarmSearchCV, dict(max_iter=2, n_particles=4)),
+    (GeneticSearchCV, dict(n_generations=2, n_population=4)),
+])
+def test_search_fold_cache(iris, tmp_path, search_cls, kwargs):
+    X, y = iris
+    pipe = make_pipeline(CountingScaler(), SVC())
+    param_space = {'svc__C': [0.1, 1, 10, 100]}
+    results = {}
+    for fold_cache in (None, FoldCache(tmp_path)):
+        CountingScaler.n_fits = 0
+        random.seed(0); np.random.seed(0)
+        search = search_cls(pipe, param_space, cv=3, fold_cache=fold_cache,
+                            **kwargs).fit(X, y)
+        results[fold_cache is None] = (CountingScaler.n_fits, search.best_score_)
+    assert results[False][0] < results[True][0]
+    assert results[False][1] == pytest.approx(results[True][1])
+    # The stored folds are memory-mapped and reused by later searches.
+    folds = FoldCache(tmp_path).materialize(pipe, X, y, cv=3,
+                                            param_names=param_space)
+    assert folds.n_prefix == 1 and isinstance(folds.data[0][0], np.memmap)
+
+def test_cross_validator_fold_cache(iris):
+    X, y = iris
+    cache = FoldCache()
+    scores = []
+    for estimator in (SVC(), LogisticRegression()):
+        CountingScaler.n_fits = 0
+        validator = CrossValidator(make_pipeline(CountingScaler(), estimator),
+                                   cv=3, fold_cache=cache).fit(X, y)
+        scores.append(validator.score_results_[0])
+    # The second pipeline reuses the scaled folds of the first one.
+    assert CountingScaler.n_fits == 0
+    np.testing.assert_allclose(scores[1], CrossValidator(
+        make_pipeline(StandardScaler(), LogisticRegression()), cv=3
+        ).fit(X, y).score_results_[0])
+
+def test_optimizer_fold_cache(iris):
+    X, y = iris
+    fits = []
+    for fold_cache in (None, True):
+        CountingScaler.n_fits = 0
+        summary = OptimizeSearch(
+            [make_pipeline(CountingScaler(), SVC())], [{'svc__C': [0.1, 1, 10]}],
+            strategy='GSCV', cv=3, n_jobs=1, fold_cache=fold_cache).fit(X, y)
+        fits.append(CountingScaler.n_fits)
+    assert fits[1] < fits[0]
+    assert summary.Pipeline['best_estimator_'].memory is None
@@ -0,0 +1,167 @@
+# -*- coding: utf-8 -*-
+"""
+test_journal.py
+"""
+
+import os
+import random
+import socket
+import threading
+import time
+
+import numpy as np
+import pytest
+from joblib import parallel_backend
+from sklearn.datasets import load_iris
+from sklearn.svm import SVC
+from sklearn.tree import DecisionTreeClassifier
+from gofast.models.journal import SearchJournal
+from gofast.models.optimize import OptimizeSearch
+from gofast.models.selection import (
+    AnnealingSearchCV, GeneticSearchCV, SwarmSearchCV)
+from gofast.models._selection import _evaluate_population
+
+class CountingTree(DecisionTreeClassifier):
+    n_fits = 0
+
+    def fit(self, X, y, **kwargs):
+        CountingTree.n_fits += 1
+        return super().fit(X, y, **kwargs)
+
+@pytest.fixture
+def iris():
+    return load_iris(return_X_y=True)
+
+@pytest.fixture
+def journal(tmp_path):
+    return SearchJournal(tmp_path / 'journal.sqlite', poll_interval=0.01)
+
+def test_journal_resumes_folds(iris, journal):
+    X, y = iris
+    scoped = journal.scope(X, y, cv=3)
+    candidates = [{'max_depth': d} for d in (1, 2, 3)]
+    CountingTree.n_fits = 0
+    scores = _evaluate_population(
+        CountingTree(random_state=0), candidates, X, y, cv=3, journal=scoped)
+    assert CountingTree.n_fits == 9
+    # A restarted evaluation only fits the folds missing from the journal.
+    key = scoped.candidate_key(CountingTree(random_state=0), {'max_depth': 4})
+    scoped.record(key, 0, 0.5)
+    CountingTree.n_fits = 0
+    resumed = _evaluate_population(
+        CountingTree(random_state=0), candidates + [{'max_depth': 4}], X, y,
+        cv=3, journal=scoped)
+    assert CountingTree.n_fits == 2
+    assert resumed[:3] == scores
+    # Other data does not reuse the journaled folds.
+    other = journal.scope(X[:120], y[:120], cv=3)
+    assert not other.folds(other.candidate_key(
+        CountingTree(random_state=0), candidates[0]))
+
+def test_journal_claims(journal):
+    assert journal.claim('a')
+    assert journal.claim('a')
+    # A claim held by a dead process of this host is stale.
+    journal.connection.execute("UPDATE claims SET pid = -1 WHERE key = 'a'")
+    assert journal._is_stale('a')
+    assert journal.wait('a', n_folds=3) is None
+    assert not journal._is_stale('a')
+
+def test_journal_wait_timeout(journal):
+    for key in ('a', 'b', 'c'):
+        journal.claim(key)
+        journal.connection.execute(
+            "UPDATE claims SET pid = ? WHERE key = ?", (os.getppid(), key))
+        assert not journal.claim(key)
+    # A live process of this host keeps its claim however long it takes.
+    def record_folds():
+        time.sleep(0.2)
+        for fold in range(3):
+            journal.record('a', fold, 1.0, 0.0)
+    thread = threading.Thread(target=record_folds)
+    thread.start()
+    assert len(journal.wait('a', n_folds=3, timeout=0.05)) == 3
+    thread.join()
+    # The claims of processes that cannot be verified expire.
+    journal.connection.execute("UPDATE claims SET host = 'elsewhere'")
+    assert journal.wait('b', n_folds=3, timeout=0.05) is None
+    assert journal.wait_result('c', timeout=0.05) is None
+    assert journal.connection.execute(
+        "SELECT host, pid FROM claims WHERE key != 'a'").fetchall() == [
+            (socket.gethostname(), os.getpid())] * 2
+
+@pytest.mark.parametrize("search_cls, kwargs", [
+    (SwarmSearchCV, dict(max_iter=2, n_particles=4)),
+    (GeneticSearchCV, dict(n_generations=2, n_population=4)),
+    (AnnealingSearchCV, dict(max_iter=3, random_state=0)),
+])
+def test_search_journal(iris, journal, search_cls, kwargs):
+    X, y = iris
+    param_space = {'max_depth': [1, 2, 3, 4]}
+    CountingTree.n_fits = 0
+    # The metaheuristics draw from the global generators; replay the draws.
+    random.seed(0); np.random.seed(0)
+    search = search_cls(CountingTree(random_state=0), param_space, cv=3,
+                        journal=journal, refit=False, **kwargs).fit(X, y)
+    assert CountingTree.n_fits > 0
+    CountingTree.n_fits = 0
+    random.seed(0); np.random.seed(0)
+    resumed = search_cls(CountingTree(random_state=0), param_space, cv=3,
+                         journal=journal.path, refit=False, **kwargs).fit(X, y)
+    # Every fold, including those of the final `evaluate_candidates`, is 
+    # read back from the journal.
+    assert CountingTree.n_fits == 0
+    assert resumed.best_params_ == search.best_params_
+    assert resumed.best_score_ == pytest.approx(search.best_score_)
+    assert resumed.best_score_ == pytest.approx(
+        np.nanmax(resumed.cv_results_['mean_test_score']))
+
+@pytest.mark.parametrize("refit", [True, 'score', lambda results: int(
+    np.argmin(results['mean_test_score']))])
+def test_search_journal_results(iris, journal, refit):
+    X, y = iris
+    param_space = {'C': [0.1, 1.0, 10.0, 100.0]}
+    searches = []
+    for search_journal in [None, journal]:
+        random.seed(0); np.random.seed(0)
+        searches.append(SwarmSearchCV(
+            SVC(), param_space, cv=3, max_iter=2, n_particles=4, refit=refit, 
+            journal=search_journal).fit(X, y))
+    search, journaled = searches
+    # The journaled results have the layout of those of BaseSearchCV.
+    assert set(journaled.cv_results_) == set(search.cv_results_)
+    assert {'mean_fit_time', 'std_score_time', 'split0_train_score', 
+            'mean_train_score'} <= set(journaled.cv_results_)
+    assert journaled.best_index_ == search.best_index_
+    assert journaled.best_params_ == search.best_params_
+    assert [type(v) for v in journaled.best_params_.values()] == [
+        type(v) for v in search.best_params_.values()]
+    assert hasattr(journaled, 'best_score_') == hasattr(search, 'best_score_')
+    np.testing.assert_allclose(journaled.cv_results_['mean_train_score'], 
+                               search.cv_results_['mean_train_score'])
+    assert hasattr(journaled, 'best_estimator_')
+
+def test_search_journal_threads(iris, journal):
+    X, y = iris
+    # Each worker thread writes the folds through its own connection.
+    with parallel_backend('threading', n_jobs=2):
+        search = SwarmSearchCV(
+            CountingTree(random_state=0), {'max_depth': [1, 2, 3, 4]}, cv=3,
+            max_iter=2, n_particles=4, n_jobs=2, journal=journal).fit(X, y)
+    assert search.best_score_ > 0.9
+    assert journal.connection.execute(
+        "SELECT COUNT(*) FROM folds").fetchone()[0] > 0
+
+def test_optimizer_journal(iris, journal):
+    X, y = iris
+    estimators = [SVC(), CountingTree(random_state=0)]
+    param_grids = [{'C': [1, 10]}, {'max_depth': [2, 3]}]
+    OptimizeSearch(estimators, param_grids, strategy='GSCV', cv=3, n_jobs=1,
+                   journal=journal).fit(X, y)
+    assert len(journal.connection.execute(
+        "SELECT * FROM searches").fetchall()) == 2
+    # The restarted optimization loads both searches from the journal.
+    CountingTree.n_fits = 0
+    OptimizeSearch(estimators, param_grids, strategy='GSCV', cv=3, n_jobs=1,
+                   journal=journal).fit(X, y)
+    assert CountingTree.n_fits == 0
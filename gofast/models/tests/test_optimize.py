@@ -14,6 +14,8 @@ from sklearn.model_selection import train_test_split
 from gofast.api import testing 
 from gofast.models.optimize import optimize_hyperparams, parallelize_search
 from gofast.models.optimize import optimize_search, optimize_search2
+from gofast.models.optimize import ParallelizeSearch
+from gofast.models._optimize import _split_core_budget
 
 X, y = load_iris(return_X_y=True)
 
@@ -85,7 +87,9 @@ def test_optimize_hyperparams_correct_input(split_iris_data):
     assert 'cv_results_' in results
 
 # Test parallelize_search with correct inputs
-def test_parallelize_search_correct_input(iris_data):
+def test_parallelize_search_correct_input(iris_data, tmp_path, monkeypatch):
+    # The tuned models are saved in the working directory.
+    monkeypatch.chdir(tmp_path)
     X, y = iris_data
     estimators = [SVC(), DecisionTreeClassifier()]
     param_grids = [{'C': [1, 10], 'kernel': ['linear', 'rbf']},
@@ -96,6 +100,23 @@ def test_parallelize_search_correct_input(iris_data):
     assert 'best_params_' in results['SVC']
     assert 'best_params_' in results['DecisionTreeClassifier']
 
+@pytest.mark.parametrize("executor", ['threads', 'processes', 'loky'])
+def test_parallelize_search_executor(iris_data, executor):
+    X, y = iris_data
+    estimators = [SVC(), DecisionTreeClassifier(random_state=0)]
+    param_grids = [{'C': [1, 10]}, {'max_depth': [3, 5]}]
+    summary = ParallelizeSearch(estimators, param_grids, strategy='GSCV', cv=3,
+                                n_jobs=2, executor=executor).fit(X, y)
+    # Results are matched with their estimator whatever the completion order
+    assert summary.SVC.best_params_['C'] in (1, 10)
+    assert summary.DecisionTreeClassifier.best_params_['max_depth'] in (3, 5)
+
+def test_split_core_budget():
+    assert _split_core_budget(2, 8) == (2, 4, 1)
+    assert _split_core_budget(16, 8) == (8, 1, 1)
+    # Process workers run their search sequentially, with more BLAS threads
+    assert _split_core_budget(2, 8, 'processes') == (2, 1, 4)
+
 # Test for handling invalid input types
 @pytest.mark.parametrize("estimator, param_grid", [
     (None, {'n_estimators': [10]}),  # None is not a valid estimator
@@ -3,12 +3,16 @@
 test_selection.py 
 """
 
+import random
+
 import pytest
+import numpy as np
 from scipy.stats import expon
 from sklearn.datasets import load_iris
 from sklearn.svm import SVC
 from gofast.models.selection import SwarmSearchCV, GradientSearchCV, AnnealingSearchCV
 from gofast.models.selection import GeneticSearchCV, EvolutionarySearchCV, SequentialSearchCV
+from gofast.models._selection import _IncrementalGP
 
 @pytest.fixture
 def iris_data():
@@ -231,5 +235,134 @@ def test_sequential_search_cv2(iris_data, svc):
     assert isinstance(search.best_score_, float)
     assert search.best_score_ > 0
 
+def test_evaluate_population_cache(iris_data, svc):
+    import numpy as np
+    from sklearn.model_selection import cross_val_score
+    from gofast.models._selection import _evaluate_population
+    X, y = iris_data
+    population = [{'C': 1}, {'C': 10}, {'C': 1}]
+    cache = {}
+    scores = _evaluate_population(svc, population, X, y, cv=3, n_jobs=2,
+                                  cache=cache)
+    # Duplicates are fit once and scored like cross_val_score
+    assert len(cache) == 2
+    assert scores[0] == scores[2]
+    assert np.isclose(scores[1], np.mean(cross_val_score(
+        SVC(C=10), X, y, cv=3)))
+    cache[next(iter(cache))]['mean_test_score'] = -1.
+    assert _evaluate_population(svc, population[:1], X, y, cv=3, 
+                                cache=cache) == [-1.]
+
+def test_annealing_search_cache(iris_data, param_space, svc):
+    X, y = iris_data
+    search = AnnealingSearchCV(estimator=svc, param_space=param_space, 
+                               max_iter=20, random_state=42)
+    search.fit(X, y)
+    # Only the 6 distinct points of the space are ever cross-validated
+    assert len(search._fitness_cache) <= 6
+
+@pytest.mark.parametrize("pruning", ['median', 'bound'])
+def test_fold_pruning(iris_data, svc, pruning):
+    import numpy as np
+    X, y = iris_data
+    param_space = {'C': [0.001, 0.01, 0.1, 1, 10, 100], 
+                   'gamma': [1, 0.1, 0.01, 0.001, 0.0001]}
+    search = GeneticSearchCV(estimator=svc, param_space=param_space, cv=5,
+                             n_population=10, n_generations=3, 
+                             random_state=42, pruning=pruning)
+    # The genetic operators draw from the global generators; with these 
+    # draws, both rules prune some candidates.
+    random.seed(0); np.random.seed(0)
+    search.fit(X, y)
+    results = search.cv_results_
+    pruned = results['status'] == 'pruned'
+    assert len(results['params']) == len(results['status'])
+    assert pruned.any() and not pruned.all()
+    # Pruned candidates did not run their last fold and rank last
+    assert np.all(np.isnan(results['split4_test_score'][pruned]))
+    assert (results['rank_test_score'][pruned].min() 
+            > results['rank_test_score'][~pruned].max())
+    assert results['status'][search.best_index_] == 'completed'
+
+    with pytest.raises(ValueError):
+        SwarmSearchCV(estimator=svc, param_space=param_space, max_iter=1,
+                      pruning='mean').fit(X, y)
+
+@pytest.mark.parametrize("search_cls", [GeneticSearchCV, EvolutionarySearchCV])
+def test_best_from_completed_candidates(iris_data, svc, search_cls):
+    from gofast.models._selection import _candidate_key
+    X, y = iris_data
+
+    class PrunedBest(search_cls):
+        # Candidates with a large C are pruned after a lucky first fold.
+        def _evaluate_generation(self, population, evaluate_candidates):
+            scores = [0.9 if individual['C'] > 5 else 0.6 
+                      for individual in population]
+            for individual, score in zip(population, scores):
+                self._fitness_cache[_candidate_key(individual)] = {
+                    'params': individual, 'split_scores': None, 
+                    'mean_test_score': score, 
+                    'status': 'pruned' if score > 0.6 else 'completed'}
+            return scores
+
+    random.seed(0); np.random.seed(0)
+    search = PrunedBest(estimator=svc, param_space={'C': [1.0, 10.0]}, cv=3, 
+                        n_population=10, n_generations=2, pruning='median')
+    search.fit(X, y)
+    assert search.best_params_['C'] == 1.0
+
+@pytest.mark.parametrize("search_cls, kwargs", [
+    (SwarmSearchCV, dict(max_iter=2, n_particles=4)),
+    (GeneticSearchCV, dict(n_generations=2, n_population=4)),
+])
+@pytest.mark.parametrize("option", ['pruning', 'journal'])
+def test_population_groups_and_fit_params(iris_data, tmp_path, search_cls, 
+                                          kwargs, option):
+    from sklearn.model_selection import GroupKFold
+    from sklearn.tree import DecisionTreeClassifier
+    X, y = iris_data
+
+    class WeightedTree(DecisionTreeClassifier):
+        def fit(self, X, y, sample_weight=None):
+            # The weights of the training fold reach every fit
+            assert sample_weight is not None and len(sample_weight) == len(X)
+            return super().fit(X, y, sample_weight=sample_weight)
+
+    groups = np.arange(len(X)) % 5
+    random.seed(0); np.random.seed(0)
+    kwargs = dict(kwargs, **{'pruning': 'median'} if option == 'pruning' 
+                  else {'journal': str(tmp_path / 'journal.sqlite')})
+    search = search_cls(WeightedTree(random_state=0), 
+                        {'max_depth': [1, 2, 3, 4]}, cv=GroupKFold(5), 
+                        **kwargs)
+    search.fit(X, y, groups=groups, sample_weight=np.ones(len(X)))
+    assert search.n_splits_ == 5
+
+def test_incremental_gp_matches_refit():
+    rng = np.random.RandomState(0)
+    X, y = rng.rand(60, 3), rng.rand(60)
+    gp = _IncrementalGP(length_scale=0.5)
+    for start in range(0, 60, 4):
+        gp.update(X[start:start + 4], y[start:start + 4])
+    full = _IncrementalGP(length_scale=0.5).update(X, y)
+    candidates = rng.rand(500, 3)
+    for incremental, refit in zip(gp.predict(candidates), full.predict(candidates)):
+        np.testing.assert_allclose(incremental, refit, atol=1e-8)
+
+@pytest.mark.parametrize("acquisition", ['ei', 'pi', 'ucb'])
+def test_sequential_search_batch_suggestions(iris_data, svc, acquisition):
+    X, y = iris_data
+    param_space = {'C': expon(scale=10), 'kernel': ['linear', 'rbf']}
+    search = SequentialSearchCV(estimator=svc, param_space=param_space, n_iter=8,
+                                acquisition=acquisition, n_parallel_suggestions=3,
+                                n_candidates=200, cv=3, random_state=0).fit(X, y)
+    params = search.cv_results_['params']
+    assert len(params) == 8
+    assert len({(p['C'], p['kernel']) for p in params}) == 8
+    # A discrete space is exhausted without evaluating a setting twice.
+    search = SequentialSearchCV(estimator=svc, param_space={'C': [1, 10, 100]},
+                                n_iter=5, cv=3, random_state=0).fit(X, y)
+    assert len(search.cv_results_['params']) == 3
+
 if __name__ == "__main__":
     pytest.main([__file__])
@@ -22,6 +22,8 @@ from ..tools.funcutils import make_data_dynamic
 from ..tools.funcutils import flatten_data_if, update_series_index 
 from ..tools.funcutils import update_index, convert_and_format_data
 from ..tools.funcutils import series_naming 
+from .moments import _STATS_CACHE, column_stats
+from .streaming import _streamable
 from .utils import validate_stats_plot_type, prepare_stats_plot
 
 __all__= [ 
@@ -43,6 +45,7 @@ __all__= [
     "z_scores",
 ]
 
+@_streamable('gini', quantiles=False, pooled=True)
 @make_data_dynamic(capture_columns=True, dynamize=False)
 def gini_coeffs(
     data: Union[DataFrame, np.ndarray],
@@ -74,7 +77,10 @@ def gini_coeffs(
     ----------
     data : Union[pd.DataFrame, np.ndarray]
         Input data for which to calculate the Gini coefficient. Can be a 
-        pandas DataFrame or a numpy ndarray.
+        pandas DataFrame or a numpy ndarray. A file path or an iterator of 
+        DataFrame chunks is read by chunks and the coefficient approximated 
+        from a quantile sketch of the values (see 
+        :func:`~gofast.stats.streaming.stream_stats`).
     columns : Optional[Union[str, List[str]]], optional
         If provided, specifies the column(s) to use when `data` is a DataFrame.
         If a single string is provided, it will select a single column.
@@ -342,9 +348,14 @@ def skew(
     can indicate the need for data transformation or the use of non-parametric
     statistical methods.
     """
-    # Ensuring numeric data type for calculation # for consisteny 
-    data_numeric = data.apply(pd.to_numeric, errors='coerce')
-    skewness_value = data_numeric.skew(axis=0, **kwargs) 
+    shared = _shared_stats(data, kws=kwargs)
+    if shared is not None: 
+        data_numeric = data 
+        skewness_value = shared.skew()
+    else: 
+        # Ensuring numeric data type for calculation # for consisteny 
+        data_numeric = data.apply(pd.to_numeric, errors='coerce')
+        skewness_value = data_numeric.skew(axis=0, **kwargs) 
 
     if view:
         colors, alphas = get_colors_and_alphas( data_numeric.columns, cmap)
@@ -480,7 +491,9 @@ def kurtosis(
     propensity of data to produce outliers. A higher kurtosis can indicate
     a higher risk or potential for outlier values in the dataset.
     """
-    kurtosis_value = data.kurtosis(axis=axis, **kwargs)
+    shared = _shared_stats(data, axis, kwargs)
+    kurtosis_value = ( shared.kurtosis() if shared is not None 
+                      else data.kurtosis(axis=axis, **kwargs))
     if view:
         plot_type= validate_stats_plot_type(
             plot_type, target_strs= ['density', 'hist'],
@@ -657,6 +670,7 @@ def visualize_weighted_median(data, weights, w_median, cmap, fig_size):
     plt.legend()
     plt.show()
 
+@_streamable('mode', quantiles=False, counts=True)
 @make_data_dynamic(capture_columns=True)
 def mode(
     data: Union[ArrayLike, DataFrame], 
@@ -680,6 +694,9 @@ def mode(
     data : ArrayLike or DataFrame
         The input data from which to calculate the mode. Can be a list, 
         numpy array, or pandas DataFrame containing valid numeric values.
+        A file path or an iterator of DataFrame chunks is read by chunks, 
+        the modes of the columns being exact (see 
+        :func:`~gofast.stats.streaming.stream_stats`).
     columns : list of str, optional
         List of column names to consider for the calculation if `data` is a 
         DataFrame. If not provided, all 
@@ -773,6 +790,7 @@ def _visualize_mode(data, mode_result, cmap='viridis', fig_size=None, axis=0):
     plt.legend()
     plt.show()
     
+@_streamable('var', quantiles=False)
 @make_data_dynamic(capture_columns=True, reset_index=True)
 def var(
     data: Union[ArrayLike, DataFrame], 
@@ -800,6 +818,9 @@ def var(
     data : ArrayLike or DataFrame
         The input data from which to calculate the variance. Can be a list, 
         numpy array, or pandas DataFrame containing valid numeric values.
+        A file path or an iterator of DataFrame chunks is read by chunks, 
+        the variances being exact (see 
+        :func:`~gofast.stats.streaming.stream_stats`).
     columns : list of str, optional
         List of column names to consider for the calculation if `data` is a 
         DataFrame. If not provided, all numeric columns are considered.
@@ -868,7 +889,9 @@ def var(
     """
     if isinstance(data, pd.DataFrame):
         axis = axis or 0 # Pandas default ddof=1
-        variance_result = data.var(ddof=ddof, axis=axis, **kws)  
+        shared = _shared_stats(data, axis, kws)
+        variance_result = ( shared.var(ddof) if shared is not None 
+                           else data.var(ddof=ddof, axis=axis, **kws))  
     else:
         data = np.asarray(data)
         # Ensure consistency with pandas
@@ -913,6 +936,7 @@ def _visualize_variance(data, variance_result, columns=None, cmap='viridis',
     plt.legend()
     plt.show()
 
+@_streamable('std', quantiles=False)
 @make_data_dynamic(
     capture_columns=True, 
     reset_index=True
@@ -943,6 +967,9 @@ def std(
     data : ArrayLike or DataFrame
         The input data from which to calculate the standard deviation. Can be 
         a list, numpy array, or pandas DataFrame containing valid numeric values.
+        A file path or an iterator of DataFrame chunks is read by chunks, 
+        the standard deviations being exact (see 
+        :func:`~gofast.stats.streaming.stream_stats`).
     columns : list of str, optional
         List of column names to consider for the calculation if `data` is a 
         DataFrame. If not provided, all numeric columns are considered.
@@ -1018,7 +1045,9 @@ def std(
     if isinstance(data, pd.DataFrame):
         axis = axis or 0
         # Pandas defaults ddof=1
-        std_dev_result = data.std(ddof=ddof, axis=axis,  **kws)  
+        shared = _shared_stats(data, axis, kws)
+        std_dev_result = ( shared.std(ddof) if shared is not None 
+                          else data.std(ddof=ddof, axis=axis,  **kws))  
     else:
         # Convert ArrayLike to np.ndarray for consistent processing
         # In the case frame conversion failed, ensure consistency with pandas 
@@ -1168,7 +1197,10 @@ def quartiles(
     analysis, particularly in exploratory data analysis (EDA) and data visualization.
     """
 
-    if isinstance(data, pd.DataFrame):
+    shared = _shared_stats(data, axis, kws)
+    if shared is not None: 
+        quartiles_result = shared.quantiles([0.25, 0.5, 0.75])
+    elif isinstance(data, pd.DataFrame):
         data_selected = data.copy() 
         quartiles_result = data_selected.quantile(
             [0.25, 0.5, 0.75], axis = axis,  **kws)
@@ -1225,6 +1257,7 @@ def _visualize_quartiles(
         data, pd.DataFrame) else None
     plt.show()
 
+@_streamable('quantile')
 @DynamicMethod (capture_columns=True)
 def quantile(
     data: Union[ArrayLike, DataFrame], 
@@ -1248,7 +1281,10 @@ def quantile(
     ----------
     data : ArrayLike or DataFrame
         The input data from which to compute quantiles. Can be a list, numpy 
-        array, or pandas DataFrame containing valid numeric values.
+        array, or pandas DataFrame containing valid numeric values. A file 
+        path or an iterator of DataFrame chunks is read by chunks, the 
+        quantiles being approximated within the rank error `quantile_error`
+        (see :func:`~gofast.stats.streaming.stream_stats`).
     q : float or list of float
         Quantile or sequence of quantiles to compute, which must be between 0 
         and 1 inclusive.
@@ -1429,6 +1465,7 @@ def _visualize_quantiles(
         plt.legend()
     plt.show()
     
+@_streamable('median')
 @make_data_dynamic(capture_columns=True)
 def median(
     data: Union[ArrayLike, DataFrame], 
@@ -1453,6 +1490,9 @@ def median(
     data : ArrayLike or DataFrame
         The input data from which to calculate the median. Can be a list,
         numpy array, or pandas DataFrame containing valid numeric values.
+        A file path or an iterator of DataFrame chunks is read by chunks, 
+        the medians being approximated from a quantile sketch (see 
+        :func:`~gofast.stats.streaming.stream_stats`).
     columns : list of str, optional
         List of column names to consider for the calculation if `data` is a
         DataFrame. If not provided, all numeric columns are considered.
@@ -1573,6 +1613,7 @@ def _visualize_median(
     plt.legend()
     plt.show()
 
+@_streamable('mean', quantiles=False)
 @make_data_dynamic(capture_columns=True)
 def mean(
     data: Union[ArrayLike, DataFrame], 
@@ -1601,6 +1642,9 @@ def mean(
     data : ArrayLike or DataFrame
         The input data from which to calculate the mean. Can be a list, 
         numpy array, or pandas DataFrame containing valid numeric values.
+        A file path or an iterator of DataFrame chunks is read by chunks, 
+        the means being exact (see 
+        :func:`~gofast.stats.streaming.stream_stats`).
     columns : list of str, optional
         List of column names to consider in the calculation if `data` is a
         DataFrame. If not provided, all numeric columns are considered.
@@ -1674,7 +1718,9 @@ def mean(
     """
     if isinstance(data, (pd.DataFrame, pd.Series)):
         axis = axis or 0
-        mean_values = data.mean(axis =axis, **kws)
+        shared = _shared_stats(data, axis, kws)
+        mean_values = ( shared.mean() if shared is not None 
+                       else data.mean(axis =axis, **kws))
     else:
         data = np.array(data)
         mean_values = np.mean(data, axis =axis,  **kws)
@@ -1885,9 +1931,14 @@ def iqr(
     outliers.
     """
     # Calculate IQR
-    Q1 = data.quantile(0.25, axis = axis or 0 , **kws)
-    Q3 = data.quantile(0.75, axis = axis or 0 , **kws)
-    iqr_values = Q3 - Q1
+    shared = _shared_stats(data, axis, kws)
+    if shared is not None: 
+        Q1, Q3 = shared.quantiles([0.25, 0.75]).to_numpy()
+        iqr_values = pd.Series(Q3 - Q1, index=data.columns)
+    else: 
+        Q1 = data.quantile(0.25, axis = axis or 0 , **kws)
+        Q3 = data.quantile(0.75, axis = axis or 0 , **kws)
+        iqr_values = Q3 - Q1
  
     # Visualization
     if view:
@@ -2149,10 +2200,14 @@ def get_range(
     workflows.
     """
 
-    data_selected = data.copy() if isinstance(data, pd.DataFrame) else data 
+    shared = _shared_stats(data, axis, kws)
+    data_selected = data.copy() if ( 
+        isinstance(data, pd.DataFrame) and shared is None) else data 
     
     # Compute the range for DataFrame or ArrayLike
-    if isinstance(data_selected, pd.DataFrame):
+    if shared is not None: 
+        range_values = shared.max() - shared.min()
+    elif isinstance(data_selected, pd.DataFrame):
         axis = axis or 0 
         range_values = data_selected.max(axis=axis, **kws) - data_selected.min(
             axis=axis, **kws)
@@ -2217,6 +2272,7 @@ def _visualize_range(data, range_values, columns=None,
     plt.legend()
     plt.show()
 
+@_streamable('describe')
 @make_data_dynamic(capture_columns=True)
 def describe(
     data: DataFrame,
@@ -2245,7 +2301,12 @@ def describe(
     data : ArrayLike or pd.DataFrame
         The input data for which descriptive statistics are to be calculated.
         Can be a Pandas DataFrame or any array-like structure containing 
-        numerical data.
+        numerical data. A file path, e.g. of a CSV export too large for the 
+        memory, or an iterator of DataFrame chunks is profiled by chunks: 
+        the count, mean, std, min and max are exact and the percentiles 
+        approximated within the rank error `quantile_error`. The chunks are
+        processed by `n_jobs` processes and the reading is controlled by 
+        `chunksize` (see :func:`~gofast.stats.streaming.stream_stats`).
     columns : List[str], optional
         Specific columns to include in the analysis if `data` is a DataFrame.
         If None, all columns are included. Default is None.
@@ -2303,6 +2364,9 @@ def describe(
     
     >>> df = pd.DataFrame(data, columns=['A', 'B', 'C', 'D'])
     >>> describe(df, columns=['A', 'B'], view=True, plot_type='hist')
+
+    >>> # Profile a CSV export by chunks of 500000 rows on 4 processes
+    >>> describe('export.csv', chunksize=500_000, n_jobs=4)
     Note
     ----
     This function is a convenient wrapper around `pd.DataFrame.describe`,
@@ -2312,7 +2376,14 @@ def describe(
     """
     # Convert array-like input to DataFrame if necessary
     # stats_result = data.describe(dtypes_include, dtypes_exclude, **kwargs)
-    stats_result = _safe_describe(data, dtypes_exclude=dtypes_exclude, **kwargs)
+    if dtypes_exclude is None and _is_float_frame(data) and not kwargs: 
+        # One pass over the data for the moments and one selection per 
+        # column for the quartiles.
+        stats_result = column_stats(
+            data, quantiles=(0.25, 0.5, 0.75)).describe()
+    else: 
+        stats_result = _safe_describe(
+            data, dtypes_exclude=dtypes_exclude, **kwargs)
     # Visualization
     if view:
         plot_type= validate_stats_plot_type(
@@ -2343,6 +2414,22 @@ def describe(
         )
     return stats_result
 
+def _is_float_frame(data):
+    """Whether `data` is a non-empty DataFrame of float64 columns."""
+    return ( isinstance(data, pd.DataFrame) and data.shape[1] > 0 
+            and all(dtype == np.float64 for dtype in data.dtypes))
+
+def _shared_stats(data, axis=0, kws=None):
+    """
+    Return the statistics of the columns of `data` shared within 
+    :func:`~gofast.stats.moments.stats_cache`, or None outside the context 
+    or when the computation is not column-wise on float data.
+    """
+    if ( not _STATS_CACHE.depth or kws or axis != 0 
+            or not _is_float_frame(data)): 
+        return None 
+    return column_stats(data)
+
 def _safe_describe(data, dtypes_include=None, dtypes_exclude=None, **kwargs):
     if dtypes_exclude == 'all':
         dtypes_exclude = data.dtypes.unique().tolist()
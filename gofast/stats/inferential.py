@@ -12,6 +12,7 @@ from scipy import stats
 import pandas as pd
 import seaborn as sns 
 import matplotlib.pyplot as plt 
+from joblib import Parallel, delayed, effective_n_jobs
 
 from ..api.formatter import DataFrameFormatter 
 from ..api.types import Optional, List, Dict, Union, Tuple, Callable
@@ -1722,7 +1723,11 @@ def bootstrap(
     fig_size: Tuple[int, int] = (10, 6),
     random_state: Optional[int] = None,
     return_ci: bool = False,
-    ci: float = 0.95
+    ci: float = 0.95, 
+    method: str = 'percentile', 
+    per_column: bool = False, 
+    n_jobs: Optional[int] = None, 
+    block_size: Optional[int] = None
 ) -> Union[Array1D, DataFrame, Tuple[Union[Array1D, DataFrame],
                                      Tuple[float, float]]]:
     """
@@ -1749,6 +1754,9 @@ def bootstrap(
         Specific columns to use if `data` is a DataFrame.
     func : callable, optional
         The statistic to compute from the resampled data, default is np.mean.
+        NumPy reductions such as ``np.mean``, ``np.median``, ``np.std`` or 
+        ``np.max`` are evaluated on whole blocks of resamples at once; any 
+        other callable is called on each resample.
     as_frame : bool, optional
         If True, returns results in a pandas DataFrame. Default is True.
     view : bool, optional
@@ -1761,28 +1769,56 @@ def bootstrap(
     fig_size : Tuple[int, int], optional
         Size of the figure for the histogram. Default is (10, 6).
     random_state : int, optional
-        Seed for the random number generator for reproducibility. 
-        Default is None.
+        Seed of the local random generators drawing the resamples, for 
+        reproducibility; the global NumPy random state is left untouched. 
+        The resamples depend on `random_state` and `block_size`, not on 
+        `n_jobs`. Default is None.
     return_ci : bool, optional
         If True, returns a tuple with bootstrapped statistics and their 
         confidence interval. Default is False.
     ci : float, optional
         The confidence level for the interval. Default is 0.95.
+    method : {'percentile', 'bca', 'studentized'}, optional
+        The confidence interval computed from the bootstrapped statistics:
+
+        - ``'percentile'``: the percentiles of the bootstrapped statistics.
+        - ``'bca'``: the bias-corrected and accelerated percentiles [1]_. The 
+          acceleration is estimated by jackknife, on at most 1000 groups of 
+          rows.
+        - ``'studentized'``: the bootstrap-t interval, which standardizes 
+          each bootstrapped statistic by its standard error. Supported for 
+          ``np.mean`` and ``np.sum``, whose standard errors are computed 
+          with the statistics.
+
+        Default is 'percentile'.
+    per_column : bool, optional
+        If True, the rows of the data are resampled and the statistic is 
+        computed on each column, instead of on the flattened data. Default 
+        is False.
+    n_jobs : int, optional
+        Number of workers resampling blocks of bootstrap samples: threads 
+        for the NumPy reductions, processes for any other `func`. None 
+        resamples in the current thread. Default is None.
+    block_size : int, optional
+        Number of bootstrap samples drawn at once. By default, the blocks 
+        hold about four million resampled values, which bounds the memory 
+        used whatever the size of the data.
 
     Returns
     -------
     bootstrapped_stats : ndarray or DataFrame
-        Array or DataFrame of bootstrapped statistic values. If `return_ci` 
-        is True, also returns a tuple containing
-        the lower and upper bounds of the confidence interval.
+        Array or DataFrame of bootstrapped statistic values, with one column 
+        per data column if `per_column` is True. If `return_ci` is True, 
+        also returns a tuple containing the lower and upper bounds of the 
+        confidence interval, Series indexed by the columns if `per_column` 
+        is True.
 
     Examples
     --------
     >>> from gofast.stats.inferential import bootstrap
     >>> import numpy as np
-    >>> np.random.seed(0)
     >>> data = np.arange(10)
-    >>> stats = bootstrap(data, n=100, func=np.mean)
+    >>> stats = bootstrap(data, n=100, func=np.mean, random_state=0)
     >>> print(stats[:5])
 
     Using a DataFrame, returning confidence intervals:
@@ -1790,40 +1826,198 @@ def bootstrap(
     >>> stats, ci = bootstrap(df, n=1000, func=np.median, columns=['A'],
                               view=True, return_ci=True, ci=0.95)
     >>> print(f"Median CI: {ci}")
-    """
-    if random_state is not None:
-        np.random.seed(random_state)
-    data = data.to_numpy().flatten()
 
-    bootstrapped_stats = [
-        func(np.random.choice(data, size=len(data), replace=True)
-             ) for _ in range(n)]
+    Bias-corrected and accelerated intervals of the medians of each column:
+    >>> stats, (lower, upper) = bootstrap(
+    ...     df, n=10000, func=np.median, per_column=True, return_ci=True,
+    ...     method='bca', random_state=0)
+
+    References
+    ----------
+    .. [1] Efron B., Better bootstrap confidence intervals, Journal of the 
+           American Statistical Association, 82(397), 171-185, 1987.
+    """
+    method = normalize_string(
+        method, target_strs=['percentile', 'bca', 'studentized'],
+        match_method='exact', return_target_only=True, raise_exception=True, 
+        error_msg=(f"Invalid method {method!r}. Expect 'percentile',"
+                   " 'bca' or 'studentized'."))
+    columns = data.columns if per_column else None 
+    X = data.to_numpy(dtype=np.float64)
+    X = X if per_column else X.reshape(-1, 1)
+    standard_error = _get_standard_error(func)
+    if method == 'studentized' and standard_error is None:
+        raise ValueError("Studentized intervals are supported for np.mean"
+                         " and np.sum only.")
+
+    replicates, errors = _bootstrap_replicates(
+        X, func, n, random_state=random_state, n_jobs=n_jobs, 
+        block_size=block_size, 
+        standard_error=standard_error if method == 'studentized' else None
+        )
+    bootstrapped_stats = replicates if per_column else replicates[:, 0]
 
     if view:
         colors, alphas = get_colors_and_alphas(
-            bootstrapped_stats, cmap, convert_to_named_color=True)
+            np.atleast_1d(columns if per_column else bootstrapped_stats), 
+            cmap, convert_to_named_color=True)
         plt.figure(figsize=fig_size)
-        plt.hist(bootstrapped_stats, bins='auto', color=colors[0],
-                 alpha=alpha, rwidth=0.85)
+        plt.hist(bootstrapped_stats, bins='auto', 
+                 color=colors if per_column else colors[0],
+                 alpha=alpha, rwidth=0.85, 
+                 label=list(columns) if per_column else None)
+        if per_column:
+            plt.legend()
         plt.title('Distribution of Bootstrapped Statistics')
         plt.xlabel('Statistic Value')
         plt.ylabel('Frequency')
         plt.show()
 
-    if return_ci:
-        lower_bound = np.percentile(bootstrapped_stats, (1 - ci) / 2 * 100)
-        upper_bound = np.percentile(bootstrapped_stats, (1 + ci) / 2 * 100)
-        result = (bootstrapped_stats, (lower_bound, upper_bound))
-    else:
-        result = bootstrapped_stats
-
     if as_frame:
-        return convert_and_format_data( 
-            result if not return_ci else result[0], return_df=True,
-            series_name="bootstrap_stats"
-            ) if as_frame else np.array(bootstrapped_stats) 
+        bootstrapped_stats = pd.DataFrame(
+            bootstrapped_stats, columns=columns) if per_column else ( 
+            convert_and_format_data(
+                bootstrapped_stats, return_df=True,
+                series_name="bootstrap_stats")
+            )
+    if not return_ci:
+        return bootstrapped_stats 
+
+    lower_bound, upper_bound = _bootstrap_interval(
+        X, func, replicates, ci, method=method, errors=errors, 
+        standard_error=standard_error)
+    if per_column:
+        lower_bound = pd.Series(lower_bound, index=columns, name='lower')
+        upper_bound = pd.Series(upper_bound, index=columns, name='upper')
+    else: 
+        lower_bound, upper_bound = float(lower_bound[0]), float(upper_bound[0])
     
-    return result
+    return bootstrapped_stats, (lower_bound, upper_bound)
+
+# NumPy reductions evaluated along the axis of the rows of a whole block 
+# of resamples in one call.
+_BOOTSTRAP_REDUCTIONS = {
+    np.mean, np.median, np.std, np.var, np.sum, np.min, np.max, np.amin, 
+    np.amax, np.ptp, np.nanmean, np.nanmedian, np.nanstd, np.nanvar, 
+    np.nansum, np.nanmin, np.nanmax
+    }
+# Standard errors of the statistics, from the resampled columns.
+_BOOTSTRAP_STANDARD_ERRORS = {
+    np.mean: lambda X, axis: X.std(axis=axis, ddof=1) / np.sqrt(
+        X.shape[axis]),
+    np.sum: lambda X, axis: X.std(axis=axis, ddof=1) * np.sqrt(
+        X.shape[axis]),
+    }
+# Number of resampled values drawn at once by default.
+_BOOTSTRAP_BLOCK_VALUES = 2 ** 22
+# Maximum number of groups of rows left out by the jackknife of the BCa 
+# acceleration.
+_JACKKNIFE_GROUPS = 1000
+
+def _is_reduction(func):
+    """Whether `func` is one of the NumPy reductions of the resamples."""
+    try:
+        return func in _BOOTSTRAP_REDUCTIONS
+    except TypeError: # unhashable callable
+        return False
+
+def _get_standard_error(func):
+    """The standard error of the statistic `func`, or None."""
+    if not _is_reduction(func):
+        return None
+    return _BOOTSTRAP_STANDARD_ERRORS.get(func)
+
+def _bootstrap_replicates(
+    X, func, n, random_state=None, n_jobs=None, block_size=None,
+    standard_error=None
+    ):
+    """
+    Draw the `n` bootstrap resamples of the rows of `X` by blocks and return 
+    the statistics `func` of their columns, of shape (n, n_columns), and, 
+    if `standard_error` is given, their standard errors.
+    """
+    if block_size is None:
+        block_size = _BOOTSTRAP_BLOCK_VALUES // max(X.size, 1)
+    block_size = int(min(max(block_size, 1), n))
+    sizes = [min(block_size, n - start) for start in range(0, n, block_size)]
+    # Each block has its own generator, so that the resamples do not depend 
+    # on the number of workers.
+    seeds = np.random.SeedSequence(random_state).spawn(len(sizes))
+    vectorized = _is_reduction(func)
+    if n_jobs is None or effective_n_jobs(n_jobs) == 1:
+        blocks = [_bootstrap_block(X, func, size, seed, vectorized, 
+                                   standard_error)
+                  for size, seed in zip(sizes, seeds)]
+    else:
+        blocks = Parallel(
+            n_jobs=n_jobs, prefer='threads' if vectorized else 'processes')(
+            delayed(_bootstrap_block)(X, func, size, seed, vectorized, 
+                                      standard_error)
+            for size, seed in zip(sizes, seeds))
+    replicates, errors = zip(*blocks)
+    return np.concatenate(replicates), ( 
+        None if standard_error is None else np.concatenate(errors))
+
+def _bootstrap_block(X, func, size, seed, vectorized, standard_error=None):
+    """Statistics, and standard errors, of a block of `size` resamples."""
+    rng = np.random.default_rng(seed)
+    indices = rng.integers(0, len(X), size=(size, len(X)))
+    samples = X[indices]
+    if vectorized:
+        replicates = func(samples, axis=1)
+    else:
+        replicates = np.array([[func(sample[:, j]) for j in range(X.shape[1])]
+                               for sample in samples], dtype=np.float64)
+    errors = None if standard_error is None else standard_error(samples, 1)
+    return replicates, errors
+
+def _bootstrap_interval(
+    X, func, replicates, ci, method='percentile', errors=None, 
+    standard_error=None
+    ):
+    """
+    Return the lower and upper bounds of the confidence interval of level 
+    `ci` of the statistics of each column of `X`, from their bootstrapped 
+    values `replicates`.
+    """
+    tail = (1 - ci) / 2 
+    if method == 'percentile':
+        return tuple(np.percentile(
+            replicates, [100 * tail, 100 * (1 - tail)], axis=0))
+    estimate = _column_statistics(X, func)
+    if method == 'studentized':
+        error = standard_error(X, 0)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t_stats = (replicates - estimate) / errors
+        t_lower, t_upper = np.nanpercentile(
+            t_stats, [100 * tail, 100 * (1 - tail)], axis=0)
+        return estimate - t_upper * error, estimate - t_lower * error
+    # Bias correction, from the rank of the estimate among the replicates.
+    rank = ((replicates < estimate).sum(axis=0) 
+            + (replicates <= estimate).sum(axis=0)) / (2 * len(replicates))
+    bias = stats.norm.ppf(rank)
+    # Acceleration, from the skewness of the jackknife statistics.
+    groups = np.array_split(np.arange(len(X)), min(len(X), _JACKKNIFE_GROUPS))
+    jackknife = np.array([_column_statistics(np.delete(X, group, axis=0), func)
+                          for group in groups])
+    deviations = jackknife.mean(axis=0) - jackknife
+    with np.errstate(divide='ignore', invalid='ignore'):
+        acceleration = np.nan_to_num((deviations ** 3).sum(axis=0) / (
+            6 * ((deviations ** 2).sum(axis=0)) ** 1.5))
+    z = stats.norm.ppf([tail, 1 - tail])[:, None]
+    levels = stats.norm.cdf(bias + (bias + z) / (1 - acceleration * (bias + z)))
+    bounds = np.array([
+        np.percentile(replicates[:, j], 100 * levels[:, j]) 
+        if np.isfinite(levels[:, j]).all() else [np.nan, np.nan]
+        for j in range(replicates.shape[1])])
+    return bounds[:, 0], bounds[:, 1]
+
+def _column_statistics(X, func):
+    """The statistics `func` of the columns of `X`."""
+    if _is_reduction(func):
+        return func(X, axis=0)
+    return np.array([func(X[:, j]) for j in range(X.shape[1])], 
+                    dtype=np.float64)
 
 @ensure_pkg(
     "statsmodels", 
@@ -0,0 +1,489 @@
+# -*- coding: utf-8 -*-
+#   License: BSD-3-Clause
+#   Author: LKouadio <etanoyau@gmail.com>
+
+"""Provides the engine shared by the descriptive statistics: a single-pass,
+mergeable accumulator of the moments of each column, quantiles from one
+partition-based selection per column, and a cache of the statistics
+computed on a data object."""
+
+import contextlib
+import copy
+import threading
+import weakref
+import numpy as np
+import pandas as pd
+
+from ..api.types import Optional, Tuple, Union, ArrayLike, DataFrame
+from ..tools.funcutils import _data_source
+
+__all__ = ["MomentAccumulator", "ColumnStats", "column_stats",
+           "column_quantiles", "stats_cache"]
+
+# Number of values accumulated at once, so that the centered powers of a
+# block of rows are computed while the block is still in cache.
+_BLOCK_SIZE = 2 ** 15
+
+class MomentAccumulator:
+    """
+    Single-pass, mergeable accumulator of the count, mean, central moments
+    of order 2 to 4, minimum and maximum of each column.
+
+    The data are accumulated by blocks of rows: the moments of each block
+    are combined with the running moments using the pairwise update
+    formulas of Pébay [1]_, which are numerically stable and let
+    accumulators built on different chunks of the data, possibly in
+    different processes, be merged into the accumulator of the whole data.
+    Missing values (NaN) are skipped column-wise, as pandas does.
+
+    Attributes
+    ----------
+    count : ndarray of shape (n_columns,)
+        Number of non-missing values of each column.
+    mean : ndarray of shape (n_columns,)
+        The running means.
+    m2, m3, m4 : ndarray of shape (n_columns,)
+        The sums of the centered powers of order 2, 3 and 4.
+    min, max : ndarray of shape (n_columns,)
+        The extrema, NaN for columns without values.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from gofast.stats.moments import MomentAccumulator
+    >>> X = np.random.randn(1000, 3)
+    >>> left = MomentAccumulator().update(X[:400])
+    >>> right = MomentAccumulator().update(X[400:])
+    >>> np.allclose(left.merge(right).var(), X.var(axis=0, ddof=1))
+    True
+
+    References
+    ----------
+    .. [1] Pébay P., Formulas for robust, one-pass parallel computation of
+           covariances and arbitrary-order statistical moments, Sandia
+           Report SAND2008-6212, 2008.
+    """
+
+    def __init__(self):
+        self.count = None
+        self.mean = None
+        self.m2 = None
+        self.m3 = None
+        self.m4 = None
+        self.min = None
+        self.max = None
+
+    def __repr__(self):
+        n_columns = None if self.count is None else len(self.count)
+        return f"{self.__class__.__name__}(n_columns={n_columns})"
+
+    def update(self, X: ArrayLike, block_size: Optional[int] = None):
+        """
+        Accumulate the rows of `X`.
+
+        Parameters
+        ----------
+        X : array-like of shape (n_samples,) or (n_samples, n_columns)
+            The data; one-dimensional data are a single column.
+        block_size : int, optional
+            Number of rows accumulated at once. By default, the blocks
+            hold about 32k values.
+
+        Returns
+        -------
+        self : MomentAccumulator
+        """
+        X = np.asarray(X, dtype=np.float64)
+        if X.ndim == 1:
+            X = X[:, None]
+        if X.ndim != 2:
+            raise ValueError(f"Expect a 1D or 2D array, got {X.ndim}D.")
+        if self.count is None:
+            self._reset(X.shape[1])
+        elif X.shape[1] != len(self.count):
+            raise ValueError(
+                f"Expect {len(self.count)} columns, got {X.shape[1]}.")
+        if block_size is None:
+            block_size = max(256, _BLOCK_SIZE // max(X.shape[1], 1))
+        for start in range(0, X.shape[0], block_size):
+            self._merge(*_block_moments(X[start:start + block_size]))
+        return self
+
+    def merge(self, other: "MomentAccumulator"):
+        """
+        Merge the moments accumulated by `other` into this accumulator.
+
+        Parameters
+        ----------
+        other : MomentAccumulator
+            An accumulator of the same columns, e.g. over another chunk
+            of the data.
+
+        Returns
+        -------
+        self : MomentAccumulator
+        """
+        if other.count is None:
+            return self
+        if self.count is None:
+            self._reset(len(other.count))
+        self._merge(other.count, other.mean, other.m2, other.m3, other.m4,
+                    other.min, other.max)
+        return self
+
+    def var(self, ddof: int = 1) -> np.ndarray:
+        """Variances, NaN for the columns with at most `ddof` values."""
+        with np.errstate(divide='ignore', invalid='ignore'):
+            return np.where(self.count > ddof,
+                            self.m2 / (self.count - ddof), np.nan)
+
+    def std(self, ddof: int = 1) -> np.ndarray:
+        """Standard deviations, NaN for columns with at most `ddof` values."""
+        return np.sqrt(self.var(ddof))
+
+    def skew(self) -> np.ndarray:
+        """
+        Unbiased skewness (adjusted Fisher-Pearson coefficient), as
+        :meth:`pandas.DataFrame.skew`: NaN below 3 values and 0 for
+        constant columns.
+        """
+        n = self.count
+        m2, m3 = _zero_out_fperr(self.m2), _zero_out_fperr(self.m3)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            result = (n * (n - 1) ** 0.5 / (n - 2)) * (m3 / m2 ** 1.5)
+        result = np.where(m2 == 0, 0., result)
+        return np.where(n < 3, np.nan, result)
+
+    def kurtosis(self) -> np.ndarray:
+        """
+        Unbiased excess kurtosis (Fisher's definition), as
+        :meth:`pandas.DataFrame.kurtosis`: NaN below 4 values and 0 for
+        constant columns.
+        """
+        n = self.count
+        with np.errstate(divide='ignore', invalid='ignore'):
+            adjustment = 3 * (n - 1) ** 2 / ((n - 2) * (n - 3))
+            numerator = n * (n + 1) * (n - 1) * self.m4
+            denominator = (n - 2) * (n - 3) * self.m2 ** 2
+            numerator = _zero_out_fperr(numerator)
+            denominator = _zero_out_fperr(denominator)
+            result = numerator / denominator - adjustment
+        result = np.where(denominator == 0, 0., result)
+        return np.where(n < 4, np.nan, result)
+
+    def _reset(self, n_columns):
+        """Initialize the moments of `n_columns` empty columns."""
+        self.count = np.zeros(n_columns)
+        self.mean, self.m2, self.m3, self.m4 = (
+            np.zeros(n_columns) for _ in range(4))
+        self.min = np.full(n_columns, np.nan)
+        self.max = np.full(n_columns, np.nan)
+
+    def _merge(self, n_b, mean_b, m2_b, m3_b, m4_b, min_b, max_b):
+        """Combine the moments of a block with the running moments."""
+        n_a, mean_a, m2_a, m3_a = self.count, self.mean, self.m2, self.m3
+        n = n_a + n_b
+        # Empty columns on both sides keep zero moments.
+        n_safe = np.where(n > 0, n, 1)
+        delta = mean_b - mean_a
+        delta_n = delta / n_safe
+        term = delta * delta_n * n_a * n_b
+        self.m4 = (self.m4 + m4_b
+                   + term * delta_n ** 2 * (n_a ** 2 - n_a * n_b + n_b ** 2)
+                   + 6 * delta_n ** 2 * (n_a ** 2 * m2_b + n_b ** 2 * m2_a)
+                   + 4 * delta_n * (n_a * m3_b - n_b * m3_a))
+        self.m3 = (m3_a + m3_b + term * delta_n * (n_a - n_b)
+                   + 3 * delta_n * (n_a * m2_b - n_b * m2_a))
+        self.m2 = m2_a + m2_b + term
+        self.mean = mean_a + delta_n * n_b
+        self.count = n
+        self.min = np.fmin(self.min, min_b)
+        self.max = np.fmax(self.max, max_b)
+
+def _zero_out_fperr(values):
+    """Zero the round-off residues, as pandas does for the moments."""
+    return np.where(np.abs(values) < 1e-14, 0., values)
+
+def _block_moments(X):
+    """Return the count, mean, centered power sums and extrema of the
+    columns of the block `X`."""
+    missing = np.isnan(X)
+    if missing.any():
+        count = (~missing).sum(axis=0).astype(np.float64)
+        with np.errstate(invalid='ignore', divide='ignore'):
+            mean = np.where(count > 0, np.nansum(X, axis=0) / count, 0.)
+        deviations = np.where(missing, 0., X - mean)
+    else:
+        count = np.full(X.shape[1], X.shape[0], dtype=np.float64)
+        mean = X.mean(axis=0)
+        deviations = X - mean
+    squares = deviations * deviations
+    return (count, mean, squares.sum(axis=0),
+            (squares * deviations).sum(axis=0),
+            (squares * squares).sum(axis=0),
+            np.fmin.reduce(X, axis=0), np.fmax.reduce(X, axis=0))
+
+def column_quantiles(X: ArrayLike, q: Union[float, ArrayLike]) -> np.ndarray:
+    """
+    Compute the quantiles `q` of each column of `X` with one partition-based
+    selection per column.
+
+    All the order statistics needed by the quantiles are selected at once
+    by :func:`numpy.partition`, and interpolated linearly as
+    :func:`numpy.quantile` and :meth:`pandas.DataFrame.quantile` do.
+    Missing values are skipped.
+
+    Parameters
+    ----------
+    X : array-like of shape (n_samples,) or (n_samples, n_columns)
+        The data.
+    q : float or array-like of float
+        The quantiles, in [0, 1].
+
+    Returns
+    -------
+    ndarray of shape (n_quantiles, n_columns)
+        The quantiles of each column, NaN for columns without values.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from gofast.stats.moments import column_quantiles
+    >>> X = np.random.randn(101, 2)
+    >>> np.allclose(column_quantiles(X, [0.25, 0.75]),
+    ...             np.quantile(X, [0.25, 0.75], axis=0))
+    True
+    """
+    X = np.asarray(X, dtype=np.float64)
+    if X.ndim == 1:
+        X = X[:, None]
+    q = np.atleast_1d(np.asarray(q, dtype=np.float64))
+    if np.any((q < 0) | (q > 1)):
+        raise ValueError("Quantiles must be in the range [0, 1].")
+    result = np.full((len(q), X.shape[1]), np.nan)
+    missing = np.isnan(X)
+    if not missing.any():
+        # All the columns are selected at once.
+        if len(X):
+            result[:] = _select_quantiles(X, q)
+        return result
+    for j in range(X.shape[1]):
+        values = X[~missing[:, j], j]
+        if len(values):
+            result[:, j] = _select_quantiles(values[:, None], q)[:, 0]
+    return result
+
+def _select_quantiles(X, q):
+    """Interpolate the quantiles `q` of the columns of `X` without NaN."""
+    position = (len(X) - 1) * q
+    lower = np.floor(position).astype(int)
+    upper = np.ceil(position).astype(int)
+    # The columns are copied contiguously and partitioned in place.
+    selected = np.array(X.T, order='C')
+    selected.partition(np.unique(np.r_[lower, upper]), axis=1)
+    below, above = selected[:, lower].T, selected[:, upper].T
+    return below + (above - below) * (position - lower)[:, None]
+
+class ColumnStats:
+    """
+    Descriptive statistics of the columns of a numeric DataFrame, computed
+    in a single pass.
+
+    The moments are accumulated once, by :class:`MomentAccumulator`, when
+    the statistics are created; the quantiles are selected on demand and
+    memoized, those requested together being selected at once.
+
+    Parameters
+    ----------
+    data : DataFrame
+        The numeric data.
+    quantiles : sequence of float, default=()
+        The quantiles selected upfront.
+
+    Attributes
+    ----------
+    columns : Index
+        The columns of `data`.
+    moments : MomentAccumulator
+        The accumulated moments.
+    """
+
+    def __init__(self, data: DataFrame, quantiles=()):
+        self.columns = data.columns
+        self._data = data
+        self._values = data.to_numpy(dtype=np.float64)
+        self.moments = MomentAccumulator().update(self._values)
+        self._quantiles = {}
+        if len(quantiles):
+            self.quantiles(quantiles)
+
+    def _bind(self, data=None):
+        """
+        Return a copy of the statistics bound to `data`, which holds the same
+        values, or to no data, sharing the moments and the quantiles.
+        """
+        stats = copy.copy(self)
+        stats._data, stats._values = data, None
+        if data is not None:
+            stats.columns = data.columns
+        return stats
+
+    def _series(self, values, name=None):
+        return pd.Series(values, index=self.columns, name=name)
+
+    def count(self) -> pd.Series:
+        return self._series(self.moments.count.astype(np.int64))
+
+    def mean(self) -> pd.Series:
+        with np.errstate(invalid='ignore'):
+            return self._series(np.where(
+                self.moments.count > 0, self.moments.mean, np.nan))
+
+    def var(self, ddof: int = 1) -> pd.Series:
+        return self._series(self.moments.var(ddof))
+
+    def std(self, ddof: int = 1) -> pd.Series:
+        return self._series(self.moments.std(ddof))
+
+    def skew(self) -> pd.Series:
+        return self._series(self.moments.skew())
+
+    def kurtosis(self) -> pd.Series:
+        return self._series(self.moments.kurtosis())
+
+    def min(self) -> pd.Series:
+        return self._series(self.moments.min)
+
+    def max(self) -> pd.Series:
+        return self._series(self.moments.max)
+
+    def quantiles(self, q) -> pd.DataFrame:
+        """
+        Return the quantiles `q` of the columns, indexed by `q` as
+        :meth:`pandas.DataFrame.quantile`. Only the quantiles not yet
+        computed are selected, in one selection per column.
+        """
+        q = [float(value) for value in np.atleast_1d(q)]
+        todo = [value for value in dict.fromkeys(q)
+                if value not in self._quantiles]
+        if todo:
+            if self._values is None:
+                self._values = self._data.to_numpy(dtype=np.float64)
+            self._quantiles.update(zip(
+                todo, column_quantiles(self._values, todo)))
+        return pd.DataFrame([self._quantiles[value] for value in q],
+                            index=q, columns=self.columns)
+
+    def describe(
+        self, percentiles: Tuple[float, ...] = (0.25, 0.5, 0.75)
+        ) -> pd.DataFrame:
+        """
+        Return the summary of :meth:`pandas.DataFrame.describe`: count,
+        mean, std, min, the `percentiles` and max of each column.
+        """
+        quantiles = self.quantiles(percentiles)
+        quantiles.index = [f"{100 * value:g}%" for value in percentiles]
+        summary = pd.concat([
+            pd.DataFrame([self.count(), self.mean(), self.std(), self.min()],
+                         index=['count', 'mean', 'std', 'min']),
+            quantiles,
+            pd.DataFrame([self.max()], index=['max'])
+            ])
+        return summary.astype(np.float64)
+
+class _StatsCache(threading.local):
+    """Statistics computed on data objects while :func:`stats_cache` is
+    active in the current thread, keyed by the data object given by the 
+    caller."""
+
+    def __init__(self):
+        self.depth = 0
+        self.entries = {}
+
+_STATS_CACHE = _StatsCache()
+
+@contextlib.contextmanager
+def stats_cache():
+    """
+    Context manager sharing the statistics computed on a data object
+    between the descriptive functions.
+
+    Within the context, :func:`column_stats` accumulates the moments of a
+    data object once, so that ``describe``, ``mean``, ``var``, ``std``,
+    ``skew``, ``kurtosis``, ``quartiles``, ``get_range`` and ``iqr`` of
+    :mod:`gofast.stats.descriptive` called on the same array or DataFrame
+    share one pass over the data. The data must not be modified in place
+    within the context. The cache is emptied on exit, and is private to the
+    thread that entered the context.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from gofast.stats.descriptive import mean, std, skew
+    >>> from gofast.stats.moments import stats_cache
+    >>> X = np.random.randn(100000, 5)
+    >>> with stats_cache():
+    ...     m, s, g = mean(X), std(X), skew(X)
+    """
+    _STATS_CACHE.depth += 1
+    try:
+        yield _STATS_CACHE
+    finally:
+        _STATS_CACHE.depth -= 1
+        if not _STATS_CACHE.depth:
+            _STATS_CACHE.entries.clear()
+
+def column_stats(
+    data: DataFrame,
+    quantiles=(),
+    use_cache: Optional[bool] = None
+    ) -> ColumnStats:
+    """
+    Return the :class:`ColumnStats` of the numeric DataFrame `data`.
+
+    Parameters
+    ----------
+    data : DataFrame
+        The numeric data.
+    quantiles : sequence of float, default=()
+        Quantiles to select upfront, together.
+    use_cache : bool, optional
+        Whether to look the statistics up in the cache. None uses the cache
+        within :func:`stats_cache` only.
+
+    Returns
+    -------
+    ColumnStats
+        The statistics, shared with the previous calls on the same data
+        when cached.
+    """
+    if use_cache is None:
+        use_cache = _STATS_CACHE.depth > 0
+    if not use_cache:
+        return ColumnStats(data, quantiles)
+    # The data object of the caller, before its conversion to `data`, 
+    # identifies the statistics: the conversion copies the data with 
+    # missing values and the multi-block DataFrames on every call.
+    source = _data_source(data)
+    source = data if source is None else source
+    key = (id(source), data.shape, tuple(data.columns))
+    entries = _STATS_CACHE.entries
+    entry = entries.get(key)
+    if entry is None or entry[0]() is not source:
+        try:
+            # The entry goes away with its data object, whose id may then 
+            # be reused.
+            ref = weakref.ref(
+                source, lambda _, key=key: entries.pop(key, None))
+        except TypeError:
+            # Lists and dicts cannot be referenced weakly.
+            return ColumnStats(data, quantiles)
+        stats = ColumnStats(data)
+        # The cached statistics hold no data, which would keep the data 
+        # object alive.
+        entries[key] = (ref, stats._bind())
+    else:
+        stats = entry[1]._bind(data)
+    if len(quantiles):
+        stats.quantiles(quantiles)
+    return stats
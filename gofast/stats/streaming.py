@@ -0,0 +1,691 @@
+# -*- coding: utf-8 -*-
+#   License: BSD-3-Clause
+#   Author: LKouadio <etanoyau@gmail.com>
+
+"""Provides the out-of-core engine of the descriptive statistics: column
+profiles of data read by chunks, from a file or an iterator of DataFrames,
+with exact moments and value counts, and approximate quantiles from a
+mergeable sketch of bounded error."""
+
+import os
+import inspect
+import functools
+import itertools
+from collections.abc import Iterator
+
+import numpy as np
+import pandas as pd
+from joblib import Parallel, delayed, effective_n_jobs
+
+from ..api.types import Optional, List, Union, Tuple, ArrayLike, DataFrame
+from ..tools.coreutils import to_numeric_dtypes
+from .moments import MomentAccumulator, _select_quantiles
+
+__all__ = ["QuantileSketch", "StreamingStats", "stream_stats", "iter_chunks",
+           "is_stream"]
+
+# Extensions of the files read by chunks; the other files readable by
+# `read_data` are loaded at once and processed as a single chunk.
+_CHUNKED_EXTENSIONS = ('.csv',)
+
+class QuantileSketch:
+    """
+    Mergeable sketch of the quantiles of a stream of values.
+
+    The sketch is the compactor hierarchy of Karnin, Lang and Liberty
+    (KLL) [1]_: the values are appended to the lowest compactor; a compactor
+    exceeding its capacity is sorted and every other value, starting at a
+    random offset, is promoted to the next compactor with a doubled weight.
+    The capacities decrease geometrically from the top compactor, of
+    capacity `k`, so that the sketch holds O(k) values whatever the length
+    of the stream, and the rank of any value is estimated within
+    ``error * count`` with high probability. Sketches built on different
+    chunks of a stream, possibly in different processes, merge into the
+    sketch of the whole stream. Until the first compaction, the sketch holds
+    all the values and its quantiles are exact. Missing values are skipped.
+
+    Parameters
+    ----------
+    error : float, default=0.01
+        The targeted rank error, as a fraction of the number of values.
+    random_state : int, RandomState instance or None, optional
+        Seeds the offsets of the compactions.
+
+    Attributes
+    ----------
+    k : int
+        The capacity of the top compactor.
+    count : int
+        Number of values accumulated.
+    levels : list of ndarray
+        The values held by each compactor, of weight ``2 ** level``.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> from gofast.stats.streaming import QuantileSketch
+    >>> x = np.random.randn(100000)
+    >>> sketch = QuantileSketch(error=0.01, random_state=0)
+    >>> for chunk in np.array_split(x, 10):
+    ...     sketch = sketch.update(chunk)
+    >>> abs(np.mean(x <= sketch.quantile(0.5)[0]) - 0.5) < 0.01
+    True
+
+    References
+    ----------
+    .. [1] Karnin Z., Lang K. and Liberty E., Optimal quantile approximation
+           in streams, IEEE 57th Annual Symposium on Foundations of
+           Computer Science, 2016.
+    """
+
+    def __init__(self, error: float = 0.01, random_state=None):
+        if not 0 < error < 1:
+            raise ValueError(f"error must be in ]0, 1[, got {error!r}.")
+        self.error = error
+        self.random_state = random_state
+        self.k = max(8, int(np.ceil(2.5 / error)))
+        self.count = 0
+        self.levels = [np.empty(0)]
+        self._rng = np.random.RandomState(random_state)
+
+    def __repr__(self):
+        return (f"{self.__class__.__name__}(error={self.error}, "
+                f"count={self.count}, size={self.size})")
+
+    @property
+    def size(self) -> int:
+        """Number of values held by the sketch."""
+        return sum(len(level) for level in self.levels)
+
+    def update(self, values: ArrayLike):
+        """
+        Accumulate `values`.
+
+        Parameters
+        ----------
+        values : array-like
+            The values, flattened.
+
+        Returns
+        -------
+        self : QuantileSketch
+        """
+        values = np.asarray(values, dtype=np.float64).ravel()
+        values = values[~np.isnan(values)]
+        if len(values):
+            self.levels[0] = np.concatenate([self.levels[0], values])
+            self.count += len(values)
+            self._compress()
+        return self
+
+    def merge(self, other: "QuantileSketch"):
+        """
+        Merge the sketch `other` into this one.
+
+        Returns
+        -------
+        self : QuantileSketch
+        """
+        for level, values in enumerate(other.levels):
+            if level == len(self.levels):
+                self.levels.append(np.empty(0))
+            self.levels[level] = np.concatenate([self.levels[level], values])
+        self.count += other.count
+        self._compress()
+        return self
+
+    def _capacity(self, level):
+        depth = len(self.levels) - 1 - level
+        return max(2, int(np.ceil(self.k * (2. / 3.) ** depth)))
+
+    def _compress(self):
+        level = 0
+        while level < len(self.levels):
+            values = self.levels[level]
+            if len(values) > self._capacity(level):
+                if level + 1 == len(self.levels):
+                    self.levels.append(np.empty(0))
+                values = np.sort(values)
+                # With an odd number of values, the smallest one stays.
+                odd = len(values) % 2
+                offset = odd + self._rng.randint(2)
+                self.levels[level] = values[:odd]
+                self.levels[level + 1] = np.concatenate(
+                    [self.levels[level + 1], values[offset::2]])
+            level += 1
+
+    def sorted_items(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Return the values held by the sketch, sorted, and their weights,
+        which sum to :attr:`count`.
+        """
+        values = np.concatenate(self.levels)
+        weights = np.concatenate([np.full(len(values), 2. ** level)
+                                  for level, values in enumerate(self.levels)])
+        order = np.argsort(values, kind='stable')
+        return values[order], weights[order]
+
+    def quantile(self, q: Union[float, ArrayLike]) -> np.ndarray:
+        """
+        Return the quantiles `q` of the values.
+
+        The quantiles are interpolated linearly, as :func:`numpy.quantile`
+        does, as long as the sketch holds all the values; afterwards, the
+        quantile `q` is the value of estimated rank ``q * (count - 1)``.
+
+        Parameters
+        ----------
+        q : float or array-like of float
+            The quantiles, in [0, 1].
+
+        Returns
+        -------
+        ndarray of shape (n_quantiles,)
+            The quantiles, NaN when no values were accumulated.
+        """
+        q = np.atleast_1d(np.asarray(q, dtype=np.float64))
+        if np.any((q < 0) | (q > 1)):
+            raise ValueError("Quantiles must be in the range [0, 1].")
+        if not self.count:
+            return np.full(len(q), np.nan)
+        if len(self.levels) == 1:
+            return _select_quantiles(self.levels[0][:, None], q)[:, 0]
+        values, weights = self.sorted_items()
+        ranks = np.cumsum(weights)
+        index = np.searchsorted(ranks, q * (ranks[-1] - 1), side='right')
+        return values[np.minimum(index, len(values) - 1)]
+
+class StreamingStats:
+    """
+    Descriptive statistics of the numeric columns of a stream of DataFrame
+    chunks.
+
+    Each chunk updates a :class:`~gofast.stats.moments.MomentAccumulator`,
+    so that the count, mean, variance, standard deviation, skewness,
+    kurtosis, minimum and maximum are exact; a :class:`QuantileSketch` per
+    column, so that the quantiles and medians are approximate within the
+    rank error `quantile_error`; and, on request, the exact value counts of
+    each column, for the modes, and a sketch of all the values pooled, for
+    the Gini coefficient. Statistics of different chunks merge into the
+    statistics of the whole stream.
+
+    Parameters
+    ----------
+    columns : list of str, optional
+        The columns profiled. Their values that are not numeric are
+        missing. None profiles the numeric columns of the first chunk, as
+        identified by :func:`~gofast.tools.coreutils.to_numeric_dtypes`.
+    quantiles : bool, default=True
+        Whether to sketch the quantiles of each column.
+    counts : bool, default=False
+        Whether to count the values of each column.
+    pooled : bool, default=False
+        Whether to sketch the quantiles of all the values pooled.
+    quantile_error : float, default=0.01
+        The rank error of the quantile sketches.
+    random_state : int, RandomState instance or None, optional
+        Seeds the quantile sketches.
+
+    Attributes
+    ----------
+    n_rows : int
+        Number of rows accumulated.
+    moments : MomentAccumulator
+        The moments of the columns.
+    sketches : list of QuantileSketch
+        The quantile sketch of each column.
+    value_counts : list of Series
+        The value counts of each column.
+    pooled_sketch : QuantileSketch
+        The quantile sketch of all the values.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pandas as pd
+    >>> from gofast.stats.streaming import StreamingStats
+    >>> df = pd.DataFrame(np.random.randn(10000, 3), columns=list('abc'))
+    >>> stats = StreamingStats()
+    >>> for start in range(0, len(df), 1000):
+    ...     stats = stats.update(df.iloc[start:start + 1000])
+    >>> np.allclose(stats.var(), df.var())
+    True
+    """
+
+    def __init__(
+        self,
+        columns: Optional[List[str]] = None,
+        quantiles: bool = True,
+        counts: bool = False,
+        pooled: bool = False,
+        quantile_error: float = 0.01,
+        random_state=None
+        ):
+        self.columns = None if columns is None else list(columns)
+        self.quantiles = quantiles
+        self.counts = counts
+        self.pooled = pooled
+        self.quantile_error = quantile_error
+        self.random_state = random_state
+        self.n_rows = 0
+        self.moments = MomentAccumulator()
+        self.sketches = None
+        self.value_counts = None
+        self.pooled_sketch = None
+        self._initialized = False
+
+    def __repr__(self):
+        n_columns = None if self.columns is None else len(self.columns)
+        return (f"{self.__class__.__name__}(n_columns={n_columns}, "
+                f"n_rows={self.n_rows})")
+
+    def get_params(self) -> dict:
+        """Return the parameters of the statistics."""
+        return dict(columns=self.columns, quantiles=self.quantiles,
+                    counts=self.counts, pooled=self.pooled,
+                    quantile_error=self.quantile_error,
+                    random_state=self.random_state)
+
+    def _initialize(self, columns):
+        self.columns = list(columns)
+        self._initialized = True
+        rng = np.random.RandomState(self.random_state)
+        seeds = iter(rng.randint(np.iinfo(np.int32).max,
+                                 size=len(self.columns) + 1))
+        if self.quantiles:
+            self.sketches = [QuantileSketch(self.quantile_error, next(seeds))
+                             for _ in self.columns]
+        if self.counts:
+            self.value_counts = [pd.Series(dtype=np.float64)
+                                 for _ in self.columns]
+        if self.pooled:
+            self.pooled_sketch = QuantileSketch(
+                self.quantile_error, rng.randint(np.iinfo(np.int32).max))
+
+    def _select(self, chunk):
+        """Return the profiled columns of `chunk` as numeric columns."""
+        if not isinstance(chunk, pd.DataFrame):
+            chunk = pd.DataFrame(chunk)
+        if not self._initialized:
+            if self.columns is None:
+                chunk = to_numeric_dtypes(chunk, drop_nan_columns=False,
+                                          copy=False)
+                self.columns = [
+                    column for column, dtype in chunk.dtypes.items()
+                    if isinstance(dtype, np.dtype) and dtype.kind in 'biuf']
+            self._initialize(self.columns)
+        missing = [column for column in self.columns
+                   if column not in chunk.columns]
+        if missing:
+            raise KeyError(f"Columns {missing} are missing from the chunk.")
+        chunk = chunk[self.columns]
+        for column, dtype in chunk.dtypes.items():
+            if not (isinstance(dtype, np.dtype) and dtype.kind in 'biuf'):
+                chunk = chunk.apply(pd.to_numeric, errors='coerce')
+                break
+        return chunk
+
+    def update(self, chunk: DataFrame):
+        """
+        Accumulate the rows of `chunk`.
+
+        Parameters
+        ----------
+        chunk : DataFrame or array-like
+            A chunk of the data.
+
+        Returns
+        -------
+        self : StreamingStats
+        """
+        chunk = self._select(chunk)
+        values = chunk.to_numpy(dtype=np.float64)
+        self.n_rows += len(values)
+        self.moments.update(values)
+        for j, sketch in enumerate(self.sketches or ()):
+            sketch.update(values[:, j])
+        for j, (column, counts) in enumerate(
+                zip(self.columns, self.value_counts or ())):
+            self.value_counts[j] = counts.add(
+                chunk[column].value_counts(), fill_value=0)
+        if self.pooled_sketch is not None:
+            self.pooled_sketch.update(values)
+        return self
+
+    def merge(self, other: "StreamingStats"):
+        """
+        Merge the statistics `other`, of the same columns, into these ones.
+
+        Returns
+        -------
+        self : StreamingStats
+        """
+        if not other._initialized:
+            return self
+        if self.columns is not None and self.columns != other.columns:
+            raise ValueError("Statistics of different columns cannot be"
+                             " merged.")
+        if not self._initialized:
+            self._initialize(other.columns)
+        self.n_rows += other.n_rows
+        self.moments.merge(other.moments)
+        for sketch, other_sketch in zip(self.sketches or (),
+                                        other.sketches or ()):
+            sketch.merge(other_sketch)
+        if self.value_counts is not None:
+            self.value_counts = [
+                counts.add(other_counts, fill_value=0) for counts, other_counts
+                in zip(self.value_counts, other.value_counts)]
+        if self.pooled_sketch is not None:
+            self.pooled_sketch.merge(other.pooled_sketch)
+        return self
+
+    def _series(self, values, name=None):
+        return pd.Series(values, index=self.columns, name=name)
+
+    def _check(self, attribute, option):
+        if getattr(self, attribute) is None:
+            raise ValueError(f"The statistics were accumulated without"
+                             f" {option}=True.")
+
+    def count(self) -> pd.Series:
+        return self._series(self.moments.count.astype(np.int64))
+
+    def mean(self) -> pd.Series:
+        with np.errstate(invalid='ignore'):
+            return self._series(np.where(
+                self.moments.count > 0, self.moments.mean, np.nan))
+
+    def var(self, ddof: int = 1) -> pd.Series:
+        return self._series(self.moments.var(ddof))
+
+    def std(self, ddof: int = 1) -> pd.Series:
+        return self._series(self.moments.std(ddof))
+
+    def skew(self) -> pd.Series:
+        return self._series(self.moments.skew())
+
+    def kurtosis(self) -> pd.Series:
+        return self._series(self.moments.kurtosis())
+
+    def min(self) -> pd.Series:
+        return self._series(self.moments.min)
+
+    def max(self) -> pd.Series:
+        return self._series(self.moments.max)
+
+    def quantile(self, q) -> pd.DataFrame:
+        """
+        Return the quantiles `q` of the columns, indexed by `q` as
+        :meth:`pandas.DataFrame.quantile`.
+        """
+        self._check('sketches', 'quantiles')
+        q = [float(value) for value in np.atleast_1d(q)]
+        return pd.DataFrame(
+            np.column_stack([sketch.quantile(q) for sketch in self.sketches]),
+            index=q, columns=self.columns)
+
+    def median(self) -> pd.Series:
+        return self.quantile(0.5).iloc[0].rename(None)
+
+    def mode(self) -> pd.DataFrame:
+        """
+        Return the modes of the columns, as :meth:`pandas.DataFrame.mode`:
+        the values of highest count of each column, sorted, padded with NaN.
+        """
+        self._check('value_counts', 'counts')
+        modes = {}
+        for column, counts in zip(self.columns, self.value_counts):
+            modes[column] = pd.Series(np.sort(
+                counts.index[counts == counts.max()].to_numpy(np.float64)))
+        return pd.DataFrame(modes, columns=self.columns)
+
+    def gini(self) -> float:
+        """
+        Return the Gini coefficient of all the values pooled, from the
+        ranks of the sketched values.
+        """
+        self._check('pooled_sketch', 'pooled')
+        values, weights = self.pooled_sketch.sorted_items()
+        n = weights.sum()
+        # Mean rank of the values merged into each item.
+        ranks = np.cumsum(weights) - (weights - 1) / 2
+        total = np.sum(weights * values)
+        return (2 * np.sum(weights * ranks * values) - (n + 1) * total) / (
+            n * total)
+
+    def describe(
+        self, percentiles: Tuple[float, ...] = (0.25, 0.5, 0.75)
+        ) -> pd.DataFrame:
+        """
+        Return the summary of :meth:`pandas.DataFrame.describe`: count,
+        mean, std, min, the `percentiles` and max of each column.
+        """
+        quantiles = self.quantile(percentiles)
+        quantiles.index = [f"{100 * value:g}%" for value in percentiles]
+        summary = pd.concat([
+            pd.DataFrame([self.count(), self.mean(), self.std(), self.min()],
+                         index=['count', 'mean', 'std', 'min']),
+            quantiles,
+            pd.DataFrame([self.max()], index=['max'])
+            ])
+        return summary.astype(np.float64)
+
+def is_stream(data) -> bool:
+    """
+    Whether `data` is a stream of chunks: a path to a file or an iterator,
+    such as the reader returned by ``pd.read_csv(chunksize=...)`` or a
+    generator of DataFrames.
+    """
+    return isinstance(data, (str, os.PathLike)) or (
+        isinstance(data, Iterator)
+        and not isinstance(data, (np.ndarray, pd.DataFrame, pd.Series)))
+
+def iter_chunks(
+    source,
+    chunksize: int = 100_000,
+    **read_kws
+    ):
+    """
+    Iterate over the DataFrame chunks of `source`.
+
+    Parameters
+    ----------
+    source : str, path-like or iterator
+        A file readable by :func:`~gofast.dataops.management.read_data`,
+        CSV files being read by chunks of `chunksize` rows and the other
+        files at once, or an iterator of chunks.
+    chunksize : int, default=100_000
+        Number of rows of the chunks read from CSV files.
+    **read_kws : dict
+        Keyword arguments passed to
+        :func:`~gofast.dataops.management.read_data`.
+
+    Yields
+    ------
+    DataFrame or array-like
+        The chunks.
+    """
+    if not isinstance(source, (str, os.PathLike)):
+        if read_kws:
+            raise TypeError("Reading options are only supported for files,"
+                            f" got {sorted(read_kws)}.")
+        yield from source
+        return
+    from ..dataops.management import read_data
+    source = os.fspath(source)
+    if os.path.splitext(source)[1].lower() in _CHUNKED_EXTENSIONS:
+        read_kws['chunksize'] = chunksize
+    data = read_data(source, **read_kws)
+    if isinstance(data, pd.DataFrame):
+        yield data
+    else:
+        with data:
+            yield from data
+
+def _chunk_stats(chunk, params, random_state):
+    return StreamingStats(**dict(params, random_state=random_state)
+                          ).update(chunk)
+
+def stream_stats(
+    source,
+    columns: Optional[List[str]] = None,
+    chunksize: int = 100_000,
+    n_jobs: Optional[int] = None,
+    quantiles: bool = True,
+    counts: bool = False,
+    pooled: bool = False,
+    quantile_error: float = 0.01,
+    random_state=None,
+    **read_kws
+    ) -> StreamingStats:
+    """
+    Profile the numeric columns of a file or of an iterator of DataFrame
+    chunks without loading the data.
+
+    The chunks are accumulated into :class:`StreamingStats`, one at a time
+    or in parallel: each worker profiles a chunk and the profiles are
+    merged in the order of the chunks, at most a few chunks per worker 
+    being in memory at once. The statistics are the same whatever 
+    `n_jobs`, but those estimated from the quantile sketches (quantiles, 
+    median and Gini coefficients) depend on `chunksize`, the sketches of
+    the chunks being compacted differently.
+
+    Parameters
+    ----------
+    source : str, path-like or iterator
+        A file, CSV files being read by chunks of `chunksize` rows, or an
+        iterator of chunks, such as ``pd.read_csv(path, chunksize=...)``.
+    columns : list of str, optional
+        The columns profiled; by default, the numeric columns of the first
+        chunk.
+    chunksize : int, default=100_000
+        Number of rows of the chunks read from CSV files.
+    n_jobs : int, optional
+        Number of processes profiling the chunks. None processes them in
+        the current process.
+    quantiles, counts, pooled, quantile_error :
+        See :class:`StreamingStats`.
+    random_state : int, RandomState instance or None, optional
+        Seeds the quantile sketches.
+    **read_kws : dict
+        Keyword arguments passed to
+        :func:`~gofast.dataops.management.read_data` for files.
+
+    Returns
+    -------
+    StreamingStats
+        The statistics of the whole data.
+
+    Examples
+    --------
+    >>> import numpy as np
+    >>> import pandas as pd
+    >>> from gofast.stats.streaming import stream_stats
+    >>> df = pd.DataFrame(np.random.randn(10000, 3), columns=list('abc'))
+    >>> df.to_csv('data.csv', index=False)
+    >>> stats = stream_stats('data.csv', chunksize=1000, n_jobs=2)
+    >>> stats.describe()
+    """
+    chunks = iter_chunks(source, chunksize, **read_kws)
+    if columns is not None:
+        columns = [columns] if isinstance(columns, str) else list(columns)
+    stats = StreamingStats(columns, quantiles=quantiles, counts=counts,
+                           pooled=pooled, quantile_error=quantile_error,
+                           random_state=random_state)
+    first = next(chunks, None)
+    if first is None:
+        return stats
+    # The first chunk fixes the columns profiled by the workers.
+    stats.update(first)
+    # Every other chunk is profiled with its own seed and merged in order,
+    # in this process as in the workers, so that the sketched statistics 
+    # do not depend on `n_jobs`.
+    rng = np.random.RandomState(random_state)
+    seeds = (rng.randint(np.iinfo(np.int32).max) for _ in itertools.count())
+    params = stats.get_params()
+    if n_jobs is None or effective_n_jobs(n_jobs) == 1:
+        profiles = (_chunk_stats(chunk, params, seed)
+                    for chunk, seed in zip(chunks, seeds))
+    else:
+        profiles = Parallel(n_jobs=n_jobs, return_as='generator')(
+            delayed(_chunk_stats)(chunk, params, seed)
+            for chunk, seed in zip(chunks, seeds))
+    for chunk_stats in profiles:
+        stats.merge(chunk_stats)
+    return stats
+
+# Keyword arguments of the descriptive functions that configure the
+# streaming of their data.
+_STREAM_PARAMS = ('chunksize', 'n_jobs', 'quantile_error', 'random_state')
+
+def _streamable(method: str, **options):
+    """
+    Decorator letting a descriptive function profile a stream of chunks.
+
+    When the data passed to the decorated function is a stream (see
+    :func:`is_stream`), the function is not called: the chunks are profiled
+    by :func:`stream_stats`, with the streaming arguments ``chunksize``,
+    ``n_jobs``, ``quantile_error`` and ``random_state``, the columns
+    selected by ``columns`` and the keyword arguments of the function
+    passed to :func:`~gofast.dataops.management.read_data`, and the
+    statistic `method` of :class:`StreamingStats` is returned, shaped as
+    the result of the function on a DataFrame.
+
+    Parameters
+    ----------
+    method : str
+        The method of :class:`StreamingStats` computing the statistic.
+    **options : dict
+        Options of :class:`StreamingStats` needed by the statistic.
+    """
+    def decorator(func):
+        signature = inspect.signature(func)
+        read_kws_name = next((
+            name for name, param in signature.parameters.items()
+            if param.kind is inspect.Parameter.VAR_KEYWORD), None)
+
+        @functools.wraps(func)
+        def wrapper(data, *args, **kwargs):
+            if not is_stream(data):
+                return func(data, *args, **kwargs)
+            stream_kws = {name: kwargs.pop(name) for name in _STREAM_PARAMS
+                          if name in kwargs}
+            arguments = signature.bind_partial(
+                data, *args, **kwargs).arguments
+            if arguments.get('view'):
+                raise ValueError(f"{func.__name__} cannot visualize"
+                                 " streamed data; set view=False.")
+            if arguments.get('axis') not in (None, 0):
+                raise ValueError(f"{func.__name__} computes the statistics"
+                                 " of the columns (axis=0) of streamed data.")
+            read_kws = dict(arguments.get(read_kws_name, {}))
+            if method == 'describe' and 'percentiles' in read_kws:
+                arguments['percentiles'] = read_kws.pop('percentiles')
+            stats = stream_stats(
+                data, columns=arguments.get('columns'), **options,
+                **stream_kws, **read_kws)
+            return _stream_result(stats, method, arguments)
+        return wrapper
+    return decorator
+
+def _stream_result(stats, method, arguments):
+    """Return the statistic `method` of `stats` shaped as the result of
+    the descriptive function called with `arguments`."""
+    if method in ('var', 'std'):
+        return getattr(stats, method)(arguments.get('ddof', 1))
+    if method == 'quantile':
+        q = np.atleast_1d(arguments['q'])
+        result = stats.quantile(q).T
+        result.columns = [f'{int(value * 100)}%' for value in q]
+        return result.iloc[:, 0] if len(q) == 1 else result
+    if method == 'describe' and arguments.get('percentiles') is not None:
+        percentiles = sorted(set(arguments['percentiles']) | {0.5})
+        return stats.describe(tuple(percentiles))
+    if method == 'gini':
+        gini = stats.gini()
+        if arguments.get('as_frame'):
+            return pd.DataFrame({'Gini-coefficients': [gini]},
+                                index=['gini_coeffs'])
+        return gini
+    return getattr(stats, method)()
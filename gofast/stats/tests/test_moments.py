@@ -0,0 +1,97 @@
+# -*- coding: utf-8 -*-
+"""
+test_moments.py
+"""
+
+import threading
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gofast.stats.descriptive import describe, mean, skew, std, quartiles
+from gofast.stats.descriptive import kurtosis
+from gofast.stats.moments import MomentAccumulator, ColumnStats
+from gofast.stats.moments import column_quantiles, stats_cache
+from gofast.stats.moments import _STATS_CACHE
+
+@pytest.fixture
+def frame():
+    rng = np.random.RandomState(0)
+    X = rng.randn(3000, 4) * [1, 10, 100, 0.1] + [0, 5, -3, 1e6]
+    X[rng.rand(*X.shape) < 0.05] = np.nan
+    X[:, 3] = np.where(np.isnan(X[:, 3]), np.nan, 7.)
+    return pd.DataFrame(X, columns=list('abcd'))
+
+@pytest.mark.parametrize("name", ['count', 'mean', 'var', 'std', 'skew',
+                                  'kurtosis', 'min', 'max'])
+def test_column_stats_match_pandas(frame, name):
+    stats = ColumnStats(frame)
+    pd.testing.assert_series_equal(getattr(stats, name)(),
+                                   getattr(frame, name)(), rtol=1e-9)
+
+def test_describe_and_quantiles(frame):
+    stats = ColumnStats(frame)
+    pd.testing.assert_frame_equal(stats.describe(), frame.describe())
+    pd.testing.assert_frame_equal(stats.quantiles([0.1, 0.9]),
+                                  frame.quantile([0.1, 0.9]))
+    X = np.random.randn(101, 3)
+    np.testing.assert_allclose(column_quantiles(X, [0, 0.33, 1]),
+                               np.quantile(X, [0, 0.33, 1], axis=0))
+
+def test_moment_accumulator_merge(frame):
+    X = frame.to_numpy()
+    full = MomentAccumulator().update(X)
+    merged = MomentAccumulator().update(X[:1000], block_size=300).merge(
+        MomentAccumulator().update(X[1000:]))
+    for name in ('count', 'mean', 'm2', 'm3', 'm4', 'min', 'max'):
+        np.testing.assert_allclose(getattr(merged, name), getattr(full, name),
+                                   rtol=1e-9)
+
+def test_stats_cache():
+    X = np.random.randn(500, 3)
+    expected = [mean(X), std(X), skew(X), quartiles(X), describe(X)]
+    with stats_cache() as cache:
+        results = [mean(X), std(X), skew(X), quartiles(X), describe(X)]
+        # The statistics of X are computed once
+        assert len(cache.entries) == 1
+    assert not cache.entries
+    for result, value in zip(results, expected):
+        np.testing.assert_allclose(result, value)
+
+def test_stats_cache_axis_none(frame):
+    # Over the flattened data, the results do not come from the columns.
+    expected = kurtosis(frame, axis=None)
+    with stats_cache() as cache:
+        result = kurtosis(frame, axis=None)
+        assert not cache.entries
+        with pytest.raises(ValueError):
+            quartiles(frame, axis=None)
+    assert np.ndim(result) == 0
+    np.testing.assert_allclose(result, expected)
+
+def test_stats_cache_converted_data(frame):
+    # Data with NaN and multi-block frames are copied by every conversion.
+    multi_block = pd.DataFrame({'a': np.random.randn(200)})
+    multi_block['b'] = np.arange(200.)
+    for data in (frame.to_numpy(), multi_block):
+        expected = mean(data)
+        with stats_cache() as cache:
+            results = [mean(data) for _ in range(5)] + [quartiles(data)]
+            assert len(cache.entries) == 1
+            # The statistics of temporary data are not kept.
+            mean(np.random.randn(50, 2))
+            assert len(cache.entries) == 1
+        np.testing.assert_allclose(results[-2], expected)
+
+def test_stats_cache_thread_local():
+    X = np.random.randn(100, 2)
+    seen = []
+    with stats_cache() as cache:
+        mean(X)
+        # Another thread does not see, nor fill, the cache of this one.
+        thread = threading.Thread(target=lambda: seen.append(
+            (_STATS_CACHE.depth, len(_STATS_CACHE.entries), mean(X))))
+        thread.start(); thread.join()
+        assert seen[0][:2] == (0, 0)
+        assert len(cache.entries) == 1
@@ -886,6 +886,41 @@ def test_input_validation():
         # Assuming the function raises ValueError for invalid data types
         bootstrap(data="invalid", n=10)  
 
+@pytest.mark.parametrize("method", ['percentile', 'bca', 'studentized'])
+def test_bootstrap_intervals(sample_dataframe4, method):
+    from scipy import stats as scipy_stats
+    from scipy.stats import bootstrap as scipy_bootstrap
+    stats, (lower, upper) = bootstrap(
+        sample_dataframe4, n=4000, per_column=True, return_ci=True,
+        method=method, random_state=0)
+    assert list(stats.columns) == ['A', 'B'] and len(stats) == 4000
+    for column in ('A', 'B'):
+        values = sample_dataframe4[column].to_numpy()
+        if method == 'studentized':
+            # Close to the t interval for the mean of near-uniform data.
+            expected = scipy_stats.t.interval(
+                0.95, len(values) - 1, loc=values.mean(),
+                scale=scipy_stats.sem(values))
+        else:
+            expected = scipy_bootstrap(
+                (values,), np.mean, n_resamples=4000, random_state=0,
+                method={'bca': 'BCa'}.get(method, method)
+                ).confidence_interval
+        assert lower[column] == pytest.approx(expected[0], abs=0.01)
+        assert upper[column] == pytest.approx(expected[1], abs=0.01)
+
+def test_bootstrap_engines(sample_data4):
+    stats = bootstrap(sample_data4, n=50, func=np.median, as_frame=False,
+                      random_state=0, block_size=8)
+    # Arbitrary callables, run by a process pool, draw the same resamples.
+    parallel = bootstrap(sample_data4, n=50, func=lambda x: np.median(x),
+                         as_frame=False, random_state=0, block_size=8,
+                         n_jobs=2)
+    np.testing.assert_allclose(stats, parallel)
+    with pytest.raises(ValueError):
+        bootstrap(sample_data4, n=10, func=np.median, return_ci=True,
+                  method='studentized')
+
 def test_kaplan_meier_with_numpy():
     durations = np.array([5, 6, 6, 2.5, 4, 4])
     event_observed = np.array([1, 0, 0, 1, 1, 1])
@@ -0,0 +1,104 @@
+# -*- coding: utf-8 -*-
+"""
+test_streaming.py
+"""
+
+import numpy as np
+import pandas as pd
+import pytest
+
+from gofast.stats.descriptive import describe, mean, median, mode, quantile
+from gofast.stats.descriptive import gini_coeffs, std, var
+from gofast.stats.streaming import QuantileSketch, StreamingStats, stream_stats
+
+@pytest.fixture
+def frame():
+    rng = np.random.RandomState(0)
+    df = pd.DataFrame(rng.randn(6000, 3) * [1, 10, 100], columns=list('abc'))
+    df['d'] = rng.randint(0, 4, len(df))
+    df['label'] = 'x'
+    return df
+
+@pytest.fixture
+def csv_file(frame, tmp_path):
+    path = tmp_path / 'data.csv'
+    frame.to_csv(path, index=False)
+    return str(path)
+
+def _chunks(frame, size=700):
+    return (frame.iloc[start:start + size]
+            for start in range(0, len(frame), size))
+
+@pytest.mark.parametrize("error", [0.05, 0.01])
+def test_quantile_sketch_error(error):
+    x = np.random.RandomState(0).lognormal(size=200000)
+    sketches = [QuantileSketch(error, random_state=i).update(chunk)
+                for i, chunk in enumerate(np.array_split(x, 20))]
+    sketch = sketches[0]
+    for other in sketches[1:]:
+        sketch.merge(other)
+    assert sketch.count == len(x) and sketch.size < 3 * sketch.k
+    q = np.linspace(0, 1, 51)
+    ranks = np.searchsorted(np.sort(x), sketch.quantile(q)) / len(x)
+    assert np.abs(ranks - q).max() <= error
+    # Without compaction the quantiles are exact.
+    np.testing.assert_allclose(QuantileSketch().update(x[:50]).quantile(q),
+                               np.quantile(x[:50], q))
+
+def test_streaming_stats_merge(frame):
+    numeric = frame[list('abcd')]
+    stats = StreamingStats(counts=True)
+    for chunk in _chunks(frame):
+        stats.update(chunk)
+    assert stats.columns == list('abcd') and stats.n_rows == len(frame)
+    merged = StreamingStats(counts=True).update(frame[:1000]).merge(
+        StreamingStats(counts=True).update(frame[1000:]))
+    for result in (stats, merged):
+        for name in ('count', 'mean', 'var', 'std', 'skew', 'min', 'max'):
+            pd.testing.assert_series_equal(
+                getattr(result, name)(), getattr(numeric, name)(),
+                check_dtype=False, rtol=1e-9)
+        pd.testing.assert_frame_equal(result.mode(), numeric.mode(),
+                                      check_dtype=False)
+
+def test_descriptive_streaming(frame, csv_file):
+    numeric = frame[list('abcd')]
+    summary = describe(csv_file, chunksize=500)
+    expected = numeric.describe()
+    assert summary.shape == expected.shape
+    rows = ['count', 'mean', 'std', 'min', 'max']
+    pd.testing.assert_frame_equal(summary.loc[rows], expected.loc[rows])
+    np.testing.assert_allclose(mean(csv_file), numeric.mean())
+    np.testing.assert_allclose(var(_chunks(frame), ddof=0),
+                               numeric.var(ddof=0))
+    np.testing.assert_allclose(std(pd.read_csv(csv_file, chunksize=999),
+                                   columns=['a', 'b']), numeric[['a', 'b']].std())
+    quantiles = quantile(csv_file, [0.1, 0.9], chunksize=500,
+                         quantile_error=0.005)
+    assert list(quantiles.columns) == ['10%', '90%']
+    for column in 'abc':
+        ranks = np.searchsorted(np.sort(numeric[column]),
+                                quantiles.loc[column]) / len(frame)
+        np.testing.assert_allclose(ranks, [0.1, 0.9], atol=0.005)
+    assert median(csv_file).index.tolist() == list('abcd')
+    pd.testing.assert_frame_equal(mode(csv_file, columns='d'),
+                                  numeric[['d']].mode(), check_dtype=False)
+    assert gini_coeffs(csv_file, columns=['d']) == pytest.approx(
+        gini_coeffs(numeric['d'].to_numpy()), abs=0.01)
+    with pytest.raises(ValueError):
+        mean(csv_file, view=True)
+
+def test_stream_stats_parallel(frame):
+    serial = stream_stats(_chunks(frame), counts=True, random_state=0)
+    parallel = stream_stats(_chunks(frame), counts=True, n_jobs=2,
+                            random_state=0)
+    np.testing.assert_allclose(parallel.var(), serial.var())
+    pd.testing.assert_frame_equal(parallel.mode(), serial.mode())
+    assert parallel.n_rows == len(frame)
+    # The sketches are merged in the same order whatever `n_jobs`.
+    serial = stream_stats(_chunks(frame), pooled=True, random_state=0,
+                          quantile_error=0.05)
+    parallel = stream_stats(_chunks(frame), pooled=True, n_jobs=2, 
+                            random_state=0, quantile_error=0.05)
+    assert parallel.gini() == serial.gini()
+    pd.testing.assert_series_equal(parallel.median(), serial.median())
@@ -493,7 +493,8 @@ def to_numeric_dtypes(
     how: str = 'all', 
     reset_index: bool = ..., 
     drop_index: bool = True, 
-    verbose: bool = ...
+    verbose: bool = ..., 
+    copy: bool = True
 ) -> Union[DataFrame, Tuple[DataFrame, List[str], List[str]]]:
     """
     Converts an array to a DataFrame and coerces values to appropriate 
@@ -551,6 +552,11 @@ def to_numeric_dtypes(
     
     verbose : bool, default=False
         If True, prints additional information during processing.
+    
+    copy : bool, default=True
+        If False, the columns left unchanged (e.g. the float64 columns) 
+        share their memory with `arr` instead of being copied. The input 
+        itself is never modified.
 
     Returns
     -------
@@ -559,6 +565,13 @@ def to_numeric_dtypes(
         tuple with the DataFrame, list of numeric feature names (`nf`), 
         and list of categorical feature names (`cf`).
 
+    Notes
+    -----
+    The coercion runs in a single pass over the columns: float64 columns 
+    are kept as they are, only the object and string columns are scanned 
+    for empty strings, the other columns are cast to float64 when possible, 
+    and the result is built from the converted columns at once.
+
     Examples
     --------
     >>> from gofast.datasets.dload import load_bagoue
@@ -597,7 +610,8 @@ def to_numeric_dtypes(
         raise TypeError(f"Expect array. Got {type (arr).__name__!r}")
 
     if hasattr ( arr, '__array__') and hasattr ( arr, 'columns'): 
-        df = arr.copy()
+        # The data are copied, if needed, by the coercion below.
+        df = arr.copy(deep=False)
         if columns is not None: 
             if verbose: 
                 print("Dataframe is passed. Columns should be replaced.")
@@ -614,29 +628,33 @@ def to_numeric_dtypes(
            df = sanitize_frame_cols(
                df, regex=regex, fill_pattern=fill_pattern ) 
 
-    #replace empty string by Nan if NaN exist in dataframe  
-    df= df.replace(r'^\s*$', missing_values, regex=True)
-    
-    # check the possibililty to cast all 
+    # replace empty strings by `missing_values` and cast all 
     # the numerical data 
-    for serie in df.columns: 
-        try: 
-            df= df.astype(
-                {serie:np.float64})
-        except:continue
+    df = _coerce_numeric_columns(df, missing_values, copy=copy)
     
     # drop nan  columns if exists 
     if drop_nan_columns: 
+        isna = df.isna()
+        nan_mask = isna.all().to_numpy()
         if verbose: 
-            nan_columns = df.columns [ df.isna().all()].tolist() 
+            nan_columns = df.columns [ nan_mask].tolist() 
             print("No NaN column found.") if len(
                 nan_columns)==0 else listing_items_format (nan_columns, 
                     "NaN columns found in the data",
                     " ", inline =True, lstyle='.')                               
-        # drop rows and columns with NaN values everywhere.                                                   
-        df.dropna ( axis=1, how='all', inplace =True)
+        # drop rows and columns with NaN values everywhere. The frame 
+        # is only sliced when there is something to drop. 
+        if nan_mask.any(): 
+            # rebuilt from the kept columns, which are not copied again 
+            kept = np.flatnonzero(~nan_mask)
+            columns = df.columns[kept]
+            df = pd.DataFrame({i: df.iloc[:, i] for i in kept}, 
+                              index=df.index, copy=False)
+            df.columns = columns
         if str(how).lower()=='all': 
-            df.dropna ( axis=0, how='all', inplace =True)
+            nan_rows = isna.loc[:, ~nan_mask].all(axis=1).to_numpy()
+            if nan_rows.any(): 
+                df = df.loc[~nan_rows]
     
     # reset_index of the dataframe
     # This is useful after droping rows
@@ -644,8 +662,9 @@ def to_numeric_dtypes(
         df.reset_index (inplace =True, drop = drop_index )
     # collect numeric and non-numeric data 
     nf, cf =[], []    
-    for serie in df.columns: 
-        if _is_numeric_dtype(df[serie], to_array =True ): 
+    for serie, dtype in df.dtypes.items(): 
+        if ( dtype.kind in 'buifc' if isinstance(dtype, np.dtype) 
+            else _is_numeric_dtype(df[serie], to_array =True )): 
             nf.append(serie)
         else: cf.append(serie)
 
@@ -663,6 +682,54 @@ def to_numeric_dtypes(
     
     return (df, nf, cf) if return_feature_types else df 
 
+def _coerce_numeric_columns(
+        df: DataFrame, missing_values: float = np.nan, copy: bool = True
+        ) -> DataFrame: 
+    """ Cast the columns of `df` to float64 where possible, in one pass.
+    
+    Float64 columns are kept as they are. Only the object and string 
+    columns, and the categories of the categorical columns, are scanned 
+    for empty strings, replaced by `missing_values`; the other columns are
+    cast when their values allow it. The result is 
+    built at once from the converted columns. With ``copy=False``, the 
+    unchanged columns share their memory with `df`.
+    """
+    data = {}
+    for i, (_, serie) in enumerate(df.items()): 
+        if serie.dtype == np.float64: 
+            data[i] = serie 
+            continue 
+        if serie.dtype == object or isinstance(serie.dtype, pd.StringDtype): 
+            try: 
+                empty = serie.str.fullmatch(r'\s*') 
+            except AttributeError: 
+                # no string values to scan
+                empty = None 
+            if empty is not None and empty.any(): 
+                serie = serie.mask(empty.fillna(False).astype(bool), 
+                                   missing_values)
+        elif isinstance(serie.dtype, pd.CategoricalDtype): 
+            # Scan the categories rather than the values.
+            categories = serie.cat.categories 
+            try: 
+                blank = np.asarray(categories.str.fullmatch(r'\s*'), 
+                                   dtype=bool)
+            except AttributeError: 
+                blank = None 
+            if blank is not None and blank.any(): 
+                serie = serie.mask(np.isin(serie.cat.codes, 
+                                           np.flatnonzero(blank)), 
+                                   missing_values)
+        try: 
+            serie = serie.astype(np.float64)
+        except (ValueError, TypeError): 
+            pass 
+        data[i] = serie 
+    
+    coerced = pd.DataFrame(data, index=df.index, copy=copy)
+    coerced.columns = df.columns
+    return coerced 
+
 def listing_items_format ( 
         lst,  begintext ='', endtext='' , bullet='-', 
         enum =True , lstyle=None , space =3 , inline =False, verbose=True
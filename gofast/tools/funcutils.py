@@ -1266,6 +1266,19 @@ def apply_transform(
         return data
     return transformed_callable
 
+# The (input, converted data) pair of the innermost call decorated by 
+# `make_data_dynamic`, per thread.
+_DATA_SOURCES = threading.local()
+
+def _data_source(data):
+    """
+    Return the input that `data` was converted from by the innermost call
+    decorated with :func:`make_data_dynamic`, or None when `data` is not 
+    the data of that call.
+    """
+    call = getattr(_DATA_SOURCES, 'call', None)
+    return call[0] if call is not None and call[1] is data else None
+
 def make_data_dynamic(
     expected_type: str = 'numeric', 
     capture_columns: bool = False, 
@@ -1318,7 +1331,15 @@ def make_data_dynamic(
        output format, catering to different preferences or requirements 
        for subsequent data processing steps. Default is False.
 
-       
+    Notes
+    -----
+    Contiguous numeric arrays and all-numeric DataFrames without missing 
+    values skip the preprocessing when no `columns` are captured and no 
+    missing values are dropped: the decorated function receives a DataFrame 
+    view of the data (cast to float64 when needed) instead of a converted 
+    copy. The decorated function must therefore not modify its input in 
+    place. Whether a kind of input (type and dtypes) qualifies is decided 
+    once per decorated function and cached.
 
     Examples
     --------
@@ -1338,19 +1359,32 @@ def make_data_dynamic(
     missing value handling, and index state.
     """
     def decorator(func: Callable) -> Callable:
+        # Decisions of the numeric fast path, per kind of input.
+        dispatch_cache = {}
+        fast_path = expected_type in ('numeric', 'both') and not drop_na
+        
         @functools.wraps(func)
         def wrapper(*args, **kwargs):
             if not args:
                 raise ValueError("Function requires at least one argument.")
             
-            data = _check_and_convert_input(args[0])
-            data = _preprocess_data(
-                data, capture_columns, expected_type, drop_na, na_thresh,
-                na_meth, reset_index, **kwargs)
+            data = None 
+            if fast_path and not (capture_columns and 'columns' in kwargs): 
+                data = _numeric_view(args[0], reset_index, dispatch_cache)
+            if data is None: 
+                data = _check_and_convert_input(args[0])
+                data = _preprocess_data(
+                    data, capture_columns, expected_type, drop_na, na_thresh,
+                    na_meth, reset_index, **kwargs)
             # Infer dataframe to series for single columns.
             data= to_pandas(data, convert_single_column= force_df)
             new_args = (data,) + args[1:]
-            return func(*new_args, **kwargs)
+            previous = getattr(_DATA_SOURCES, 'call', None)
+            _DATA_SOURCES.call = (args[0], data)
+            try: 
+                return func(*new_args, **kwargs)
+            finally: 
+                _DATA_SOURCES.call = previous
         
         if dynamize: 
             _add_dynamic_method (wrapper )
@@ -1358,6 +1392,75 @@ def make_data_dynamic(
         return wrapper
     return decorator
 
+def _numeric_view(input_data, reset_index=False, dispatch_cache=None):
+    """
+    Return the numeric `input_data` as a DataFrame without preprocessing, 
+    or None when it needs the full conversion.
+    
+    Contiguous numeric arrays and DataFrames whose columns are all numeric 
+    qualify. Their integer and boolean values are cast to float64, as 
+    :func:`~gofast.tools.coreutils.to_numeric_dtypes` does; float64 data 
+    are wrapped without copy. Data with missing values are left to the full 
+    conversion, which drops the all-NaN rows and columns. 
+    
+    Parameters
+    ----------
+    input_data : any
+        The first argument passed to the decorated function.
+    reset_index : bool, default=False
+        Whether the index is to be reset; only DataFrames with a default 
+        index qualify then.
+    dispatch_cache : dict, optional
+        Decisions already taken, keyed by the type and dtypes of the input.
+    
+    Returns
+    -------
+    pd.DataFrame or None
+        The DataFrame view of `input_data`, or None.
+    """
+    if isinstance(input_data, np.ndarray): 
+        key = (type(input_data), input_data.dtype, input_data.ndim, 
+               input_data.flags.c_contiguous or input_data.flags.f_contiguous)
+    elif isinstance(input_data, pd.DataFrame): 
+        key = (type(input_data), *dict.fromkeys(input_data.dtypes))
+    else: 
+        return None 
+    
+    if dispatch_cache is None: 
+        dispatch_cache = {}
+    if key not in dispatch_cache: 
+        dtypes = key[1:2] if isinstance(input_data, np.ndarray) else key[1:]
+        qualifies = all(isinstance(dtype, np.dtype) and dtype.kind in 'biuf'
+                        for dtype in dtypes) and bool(dtypes) 
+        if isinstance(input_data, np.ndarray): 
+            qualifies = (qualifies and type(input_data) is np.ndarray 
+                         and input_data.ndim in (1, 2) and key[3])
+        dispatch_cache[key] = qualifies and (
+            'view' if all(dtype == np.float64 for dtype in dtypes) else 'cast')
+    decision = dispatch_cache[key]
+    if not decision or 0 in input_data.shape: 
+        return None 
+    
+    if isinstance(input_data, np.ndarray): 
+        if decision == 'cast': 
+            input_data = input_data.astype(np.float64)
+        total = np.add.reduce(input_data, axis=None)
+    else: 
+        if reset_index and not input_data.index.equals(
+                pd.RangeIndex(len(input_data))): 
+            return None 
+        # The shallow copy keeps the columns added by the decorated 
+        # function from leaking into the input.
+        input_data = ( input_data.astype(np.float64) if decision == 'cast' 
+                      else input_data.copy(deep=False))
+        total = input_data.sum(skipna=False).sum(skipna=False)
+    # A NaN anywhere makes the sum NaN, without a mask of the data.
+    if np.isnan(total): 
+        return None 
+    
+    return ( pd.DataFrame(input_data, copy=False) 
+            if isinstance(input_data, np.ndarray) else input_data )
+
 def _check_and_convert_input(input_data):
     """
     Check the type of the input data and convert it to a suitable 
@@ -33,6 +33,39 @@ def test_to_numeric_dtypes ():
     # print X0.dtypes and check the 
     # datatypes 
     print( to_numeric_dtypes(X0)) 
+
+def test_to_numeric_dtypes_coercion(): 
+    df = pd.DataFrame({'a': [1, 2, 3], 'b': ['1.5', ' ', '2'], 
+                       'c': ['x', '', 'y'], 'd': np.arange(3.), 
+                       'e': [np.nan] * 3})
+    out, nf, cf = to_numeric_dtypes(df, return_feature_types=True)
+    assert nf == ['a', 'b', 'd'] and cf == ['c']
+    assert out['b'].isna().tolist() == [False, True, False]
+    assert out['c'].isna().tolist() == [False, True, False]
+    assert df['b'].tolist() == ['1.5', ' ', '2'] # input left untouched
+    # with copy=False, the unchanged columns share the input memory 
+    assert not np.shares_memory(out['d'].to_numpy(), df['d'].to_numpy())
+    shared = to_numeric_dtypes(df, copy=False)
+    assert np.shares_memory(shared['d'].to_numpy(), df['d'].to_numpy())
+
+def test_to_numeric_dtypes_categorical_blanks(): 
+    df = pd.DataFrame({
+        'obj': ['1', ' ', '2.5', ''], 
+        'cat': pd.Categorical(['x', ' ', 'y', 'x']), 
+        'catnum': pd.Categorical(['1', '', '2.5', ' ']), 
+        'codes': pd.Categorical([1, 2, 1, 2]), 
+        'flt': [1., np.nan, 3., 4.]})
+    # The former single-pass conversion: blank strings replaced everywhere,
+    # then every column cast to float where possible.
+    expected = df.replace(r'^\s*$', np.nan, regex=True)
+    for name, serie in expected.items(): 
+        try: 
+            expected[name] = serie.astype(np.float64)
+        except (ValueError, TypeError): 
+            pass 
+    out = to_numeric_dtypes(df, drop_nan_columns=False)
+    pd.testing.assert_frame_equal(out[expected.columns], expected)
+    assert out['cat'].isna().tolist() == [False, True, False, False]
     
 def test_reshape (): 
     np.random.seed (0) 
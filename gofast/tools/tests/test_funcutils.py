@@ -166,6 +166,28 @@ def test_make_data_dynamic_reset_index():
     result = process_reset_index(df)
     assert result.index.equals(pd.RangeIndex(start=0, stop=3, step=1)), "Index was not reset"
 
+def test_make_data_dynamic_numeric_fast_path():
+    @make_data_dynamic(capture_columns=True, reset_index=True)
+    def process(data, columns=None):
+        return data
+
+    x = np.random.randn(20, 3)
+    result = process(x)
+    # Float arrays are wrapped without copy 
+    assert np.shares_memory(result.to_numpy(), x)
+    assert result.columns.tolist() == [0, 1, 2]
+    assert process(np.arange(5)).dtypes.iloc[0] == np.float64
+    df = pd.DataFrame(x, columns=list('abc'))
+    result = process(df)
+    result['d'] = 1.
+    assert 'd' not in df.columns
+    # Missing values, captured columns and custom indexes take the full path
+    x[0] = np.nan 
+    assert len(process(x)) == 19
+    assert process(df, columns=['a']).columns.tolist() == ['a']
+    df.index = range(1, 21)
+    assert process(df).index[0] == 0
+
 def test_make_data_dynamic_with_custom_logic():
     mock_preprocess = Mock(return_value=pd.DataFrame({'A': [1, 2, 3]}))
     df = pd.DataFrame({'A': [1, 2, 3], 'B': ['x', 'y', 'z']})
@@ -12,13 +12,16 @@ import itertools
 import warnings 
 import numpy as np 
 import pandas as pd 
-from scipy import sparse
+from scipy import sparse, stats
 
-from sklearn.base import BaseEstimator,TransformerMixin 
+from functools import partial
+from joblib import Parallel, delayed, effective_n_jobs
+from sklearn.base import BaseEstimator,TransformerMixin, clone
 from sklearn.compose import ColumnTransformer
 from sklearn.pipeline import Pipeline
-from sklearn.cluster import KMeans 
-from sklearn.decomposition import PCA
+from sklearn.cluster import KMeans, MiniBatchKMeans
+from sklearn.decomposition import PCA, IncrementalPCA
+from sklearn.metrics import pairwise_distances_argmin
 from sklearn.preprocessing import StandardScaler,MinMaxScaler, OrdinalEncoder
 from sklearn.preprocessing import OneHotEncoder, PolynomialFeatures, RobustScaler
 from sklearn.preprocessing import LabelEncoder
@@ -27,7 +30,9 @@ from sklearn.feature_selection import SelectFromModel
 from sklearn.impute import SimpleImputer
 from sklearn.metrics import recall_score, precision_score
 from sklearn.metrics import accuracy_score,  roc_auc_score
+from sklearn.metrics import check_scoring
 from sklearn.model_selection import train_test_split, StratifiedShuffleSplit
+from sklearn.utils import Bunch, check_random_state
 
 from .._gofastlog import gofastlog 
 from ..api.types import _F, Union, Optional
@@ -97,6 +102,29 @@ class FeatureImportanceSelector(BaseEstimator, TransformerMixin):
         The number of trees in the forest, applicable if the default model is used.
     rf_kwargs : dict, optional
         Additional keyword arguments to pass to the RandomForest constructor.
+    importance : {'auto', 'builtin', 'permutation'}, default='auto'
+        How the importances are computed. 'builtin' reads the
+        ``feature_importances_`` of the fitted model, 'permutation' measures
+        the drop of the model score on ``(X, y)`` when each feature is
+        shuffled, and 'auto' uses the built-in importances when the model
+        exposes them and permutation importances otherwise.
+    scoring : str or callable, default=None
+        Scorer of the permutation importances. None uses the ``score``
+        method of the model.
+    n_repeats : int, default=5
+        Maximum number of shuffles of each feature for the permutation
+        importances.
+    max_samples : int or float, default=None
+        Number (int) or fraction (float) of the samples drawn to compute
+        the permutation importances. None uses all samples.
+    confidence : float, default=0.95
+        Confidence level of the intervals of the permutation importances.
+        A feature is no longer shuffled once its interval lies entirely
+        above or below `threshold`. None always runs `n_repeats` shuffles.
+    n_jobs : int, default=None
+        Number of workers shuffling features in parallel.
+    random_state : int, RandomState instance or None, default=None
+        Seed of the shuffles and of the subsample.
 
     Attributes
     ----------
@@ -104,6 +132,12 @@ class FeatureImportanceSelector(BaseEstimator, TransformerMixin):
         Indices of features considered important based on the importance threshold.
     feature_names_ : ndarray
         Feature names extracted from the input DataFrame, if provided.
+    feature_importances_ : ndarray of shape (n_features,)
+        The importances compared to `threshold`.
+    permutation_importances_ : Bunch or None
+        The ``importances_mean``, ``importances_std``, ``importances`` and
+        ``n_repeats`` of the permutation importances, None when the
+        built-in importances are used.
 
     Examples
     --------
@@ -114,11 +148,24 @@ class FeatureImportanceSelector(BaseEstimator, TransformerMixin):
     >>> X_selected = selector.fit_transform(X, y)
     >>> print(selector.get_feature_names_out())
 
+    Models without ``feature_importances_`` are supported through the
+    permutation importances:
+
+    >>> from sklearn.svm import SVC
+    >>> selector = FeatureImportanceSelector(SVC(), threshold=0.05, n_jobs=2)
+    >>> X_selected = selector.fit_transform(X, y)
+
     Notes
     -----
     This selector is particularly useful in scenarios where dimensionality
     reduction based on feature importance is required to improve model
     performance or interpretability.
+
+    The permutation importances are the decrease of the score of the model
+    when a feature is shuffled, hence on the scale of `scoring` rather than
+    summing to one. Each worker shuffles its features in place in a single
+    copy of the data, restoring each column afterwards, and the model is
+    only used to predict.
     """
 
     def __init__(
@@ -128,7 +175,14 @@ class FeatureImportanceSelector(BaseEstimator, TransformerMixin):
         use_classifier=True, 
         max_depth=None, 
         n_estimators=100, 
-        rf_kwargs=None
+        rf_kwargs=None, 
+        importance='auto', 
+        scoring=None, 
+        n_repeats=5, 
+        max_samples=None, 
+        confidence=0.95, 
+        n_jobs=None, 
+        random_state=None
     ):
         self.model = model
         self.threshold = threshold
@@ -136,6 +190,13 @@ class FeatureImportanceSelector(BaseEstimator, TransformerMixin):
         self.n_estimators = n_estimators
         self.max_depth = max_depth
         self.rf_kwargs = rf_kwargs or {}
+        self.importance = importance
+        self.scoring = scoring
+        self.n_repeats = n_repeats
+        self.max_samples = max_samples
+        self.confidence = confidence
+        self.n_jobs = n_jobs
+        self.random_state = random_state
         self.important_indices_ = None
         self.feature_names_ = None 
         
@@ -229,7 +290,7 @@ class FeatureImportanceSelector(BaseEstimator, TransformerMixin):
             If the model does not support the fit method.
         ValueError
             If the model lacks the `feature_importances_` attribute necessary 
-            for feature selection.
+            for feature selection while ``importance='builtin'``.
     
         Notes
         -----
@@ -257,6 +318,10 @@ class FeatureImportanceSelector(BaseEstimator, TransformerMixin):
                     "Classifier is selected while the task seems to be regression.",
                     UserWarning)
     
+        if self.importance not in ('auto', 'builtin', 'permutation'):
+            raise ValueError(
+                "importance must be 'auto', 'builtin' or 'permutation',"
+                f" got {self.importance!r}.")
         # Fit the model and check for feature_importances_ attribute
         if not hasattr(self.model, 'feature_importances_'):
             if not hasattr(self.model, 'fit'):
@@ -267,16 +332,33 @@ class FeatureImportanceSelector(BaseEstimator, TransformerMixin):
                 self.model.fit(X, y)
             except Exception as e:
                 raise ValueError(
-                    "The model used does not have feature_importances_ attribute."
+                    f"Fitting the model {self.model.__class__.__name__} failed."
                 ) from e
         
         # Store feature names if X is a DataFrame
         if hasattr(X, 'columns'):
             self.feature_names_ = X.columns
 
+        self.permutation_importances_ = None
+        if self.importance == 'permutation' or (
+                self.importance == 'auto' 
+                and not hasattr(self.model, 'feature_importances_')):
+            self.permutation_importances_ = _permutation_importances(
+                self.model, X, y, scoring=self.scoring, 
+                n_repeats=self.n_repeats, max_samples=self.max_samples, 
+                confidence=self.confidence, threshold=self.threshold, 
+                n_jobs=self.n_jobs, random_state=self.random_state)
+            self.feature_importances_ = (
+                self.permutation_importances_.importances_mean)
+        elif hasattr(self.model, 'feature_importances_'):
+            self.feature_importances_ = self.model.feature_importances_
+        else:
+            raise ValueError(
+                "The model used does not have feature_importances_ attribute.")
+
         # Fetch important features based on the threshold
         self.important_indices_ = np.where(
-            self.model.feature_importances_ > self.threshold)[0]
+            self.feature_importances_ > self.threshold)[0]
     
         return self
     
@@ -352,6 +434,157 @@ class FeatureImportanceSelector(BaseEstimator, TransformerMixin):
             # Default feature names if X was an array
             return [f"feature_{i}" for i in self.important_indices_]
 
+def _permutation_importances(
+    estimator, X, y, scoring=None, n_repeats=5, max_samples=None, 
+    confidence=0.95, threshold=None, n_jobs=None, random_state=None
+    ):
+    """
+    Compute the permutation importances of the features of a fitted 
+    `estimator` on ``(X, y)``.
+
+    The importance of a feature is the decrease of the score when its 
+    column is shuffled. The features are split among `n_jobs` workers, each 
+    shuffling its columns in place in one copy of `X` and restoring them 
+    afterwards, so `X` is never copied per feature. 
+
+    The shuffles run in rounds. When `confidence` is set, a feature stops 
+    being shuffled once the confidence interval of its mean importance lies 
+    entirely above or below `threshold` or, without `threshold`, no longer 
+    overlaps the interval of any other feature. 
+
+    Parameters
+    ----------
+    estimator : fitted estimator
+        The model to explain.
+    X : ndarray or DataFrame of shape (n_samples, n_features)
+        The data to shuffle.
+    y : array-like of shape (n_samples,)
+        The targets of `X`.
+    scoring : str or callable, default=None
+        The scorer; None uses the ``score`` method of `estimator`.
+    n_repeats : int, default=5
+        Maximum number of shuffles per feature.
+    max_samples : int or float, default=None
+        Number (int) or fraction (float) of samples drawn without 
+        replacement to score on. None uses all samples.
+    confidence : float, default=0.95
+        Confidence level of the intervals; None disables early termination.
+    threshold : float, default=None
+        The importance the intervals are compared to.
+    n_jobs : int, default=None
+        Number of workers.
+    random_state : int, RandomState instance or None, default=None
+        Seed of the subsample and of the shuffles. The shuffles of a feature 
+        do not depend on `n_jobs` nor on the early termination.
+
+    Returns
+    -------
+    result : Bunch
+        ``importances`` of shape (n_features, n_repeats), NaN for the 
+        shuffles skipped by the early termination, and per feature 
+        ``importances_mean``, ``importances_std`` and ``n_repeats``.
+    """
+    rng = check_random_state(random_state)
+    scorer = check_scoring(estimator, scoring=scoring)
+    y = np.asarray(y)
+    n_samples, n_features = X.shape
+    if max_samples is not None:
+        if isinstance(max_samples, float):
+            max_samples = int(max_samples * n_samples)
+        if not 1 <= max_samples <= n_samples:
+            raise ValueError(
+                f"max_samples must be in [1, {n_samples}], got {max_samples}.")
+        if max_samples < n_samples:
+            rows = np.sort(rng.choice(n_samples, max_samples, replace=False))
+            X = X.iloc[rows] if hasattr(X, 'iloc') else X[rows]
+            y = y[rows]
+    # One seed per shuffle, drawn up front for reproducible shuffles.
+    seeds = rng.randint(np.iinfo(np.int32).max, size=(n_features, n_repeats))
+    baseline = scorer(estimator, X, y)
+
+    scores = np.full((n_features, n_repeats), np.nan)
+    n_done = np.zeros(n_features, dtype=int)
+    active = np.arange(n_features)
+    start, n_round = 0, n_repeats if confidence is None else min(3, n_repeats)
+    with Parallel(n_jobs=n_jobs) as parallel:
+        while active.size:
+            chunks = np.array_split(
+                active, min(active.size, effective_n_jobs(n_jobs)))
+            results = parallel(
+                delayed(_permuted_scores)(
+                    estimator, scorer, X, y, chunk, start, n_round, seeds)
+                for chunk in chunks)
+            for chunk, result in zip(chunks, results):
+                scores[chunk, start:start + n_round] = result
+            start += n_round
+            n_done[active] = start
+            if start == n_repeats:
+                break
+            if confidence is not None:
+                lower, upper = _importance_intervals(
+                    baseline - scores, n_done, confidence)
+                if threshold is not None:
+                    resolved = (lower > threshold) | (upper < threshold)
+                else:
+                    overlap = ((lower[:, None] <= upper[None, :]) 
+                               & (lower[None, :] <= upper[:, None]))
+                    np.fill_diagonal(overlap, False)
+                    resolved = ~overlap.any(axis=1)
+                active = active[~resolved[active]]
+            n_round = 1
+
+    importances = baseline - scores
+    return Bunch(
+        importances_mean=np.nanmean(importances, axis=1), 
+        importances_std=np.nanstd(importances, axis=1), 
+        importances=importances, 
+        n_repeats=n_done
+    )
+
+def _permuted_scores(estimator, scorer, X, y, features, start, n_round, 
+                     seeds):
+    """
+    Score `estimator` with each of `features` shuffled in turn, for the 
+    shuffles ``start`` to ``start + n_round``, in one copy of `X`.
+    """
+    X = X.copy()
+    scores = np.empty((len(features), n_round))
+    for i, feature in enumerate(features):
+        if hasattr(X, 'iloc'):
+            column = X.iloc[:, feature].to_numpy(copy=True)
+        else:
+            column = X[:, feature].copy()
+        for k in range(n_round):
+            shuffled = column[np.random.RandomState(
+                seeds[feature, start + k]).permutation(len(column))]
+            _set_column(X, feature, shuffled)
+            scores[i, k] = scorer(estimator, X, y)
+        _set_column(X, feature, column)
+    return scores
+
+def _set_column(X, index, values):
+    """Overwrite the column `index` of the array or DataFrame `X`."""
+    if hasattr(X, 'iloc'):
+        X.isetitem(index, values)
+    else:
+        X[:, index] = values
+
+def _importance_intervals(importances, n_done, confidence):
+    """
+    Return the bounds of the `confidence` intervals of the mean of each row 
+    of `importances`, over its first `n_done` shuffles.
+    """
+    mean = np.nanmean(importances, axis=1)
+    std = np.nanstd(importances, axis=1, ddof=1)
+    half_width = stats.t.ppf((1 + confidence) / 2, n_done - 1) * std / np.sqrt(
+        n_done)
+    return mean - half_width, mean + half_width
+
+def _get_permutation_importances(importances, estimator):
+    """Importance getter of :class:`SelectFromModel` returning the 
+    precomputed permutation `importances`."""
+    return importances
+
 class FloatCategoricalToInt(BaseEstimator, TransformerMixin):
     """
     A transformer that detects floating-point columns in a DataFrame 
@@ -524,6 +757,15 @@ class SequentialBackwardSelector(BaseEstimator, TransformerMixin):
       :math:`X_{k+1} = X_k - x^{-}; k = k - 1`.
     - Terminate if :math:`k` equals the desired number of features;
       otherwise, repeat from step 2. [2]_
+
+    With ``floating=True``, the Sequential Backward Floating Selection 
+    (SBFS) variant [3]_ follows each removal by conditional inclusions: an 
+    excluded feature is added back as long as this yields a better subset 
+    than the best one seen so far with as many features.
+
+    All the candidate subsets of a step are scored in parallel with 
+    `n_jobs`, and every scored subset is memoized, so that no subset is 
+    ever fit twice, e.g. by the floating inclusions.
     
     Parameters
     ----------
@@ -543,6 +785,18 @@ class SequentialBackwardSelector(BaseEstimator, TransformerMixin):
     random_state : int, RandomState instance, or None, default=None
         Controls the shuffling applied to the data before the split.
         An integer value ensures reproducible results across multiple function calls.
+    n_jobs : int, default=None
+        Number of candidate subsets of a step scored in parallel. None means 
+        1 unless in a :obj:`joblib.parallel_backend` context, -1 means using 
+        all processors.
+    floating : bool, default=False
+        Whether to run the floating variant (SBFS), which may add back 
+        features removed earlier.
+    early_stop_k : int, default=None
+        Stop the elimination once the best score has not improved for 
+        `early_stop_k` consecutive steps, before reaching `k_features`. The 
+        selected subset is then the best one seen, the smallest among ties. 
+        None always eliminates down to `k_features`.
     
     Attributes
     ----------
@@ -595,6 +849,9 @@ class SequentialBackwardSelector(BaseEstimator, TransformerMixin):
     .. [1] Raschka, S., Mirjalili, V., Python Machine Learning, 3rd ed., Packt, 2019.
     .. [2] Ferri F., Pudil P., Hatef M., Kittler J., Comparative study of
            techniques for large-scale feature selection, pages 403-413, 1994.
+    .. [3] Pudil P., Novovicova J., Kittler J., Floating search methods in 
+           feature selection, Pattern Recognition Letters 15(11), 
+           1119-1125, 1994.
            
     """
 
@@ -611,13 +868,19 @@ class SequentialBackwardSelector(BaseEstimator, TransformerMixin):
         k_features=1, 
         scoring='accuracy', 
         test_size=0.25, 
-        random_state=42
+        random_state=42, 
+        n_jobs=None, 
+        floating=False, 
+        early_stop_k=None
         ):
         self.estimator = estimator
         self.k_features = k_features
         self.scoring = scoring
         self.test_size = test_size
         self.random_state = random_state
+        self.n_jobs = n_jobs
+        self.floating = floating
+        self.early_stop_k = early_stop_k
 
     def fit(self, X, y):
         """
@@ -658,26 +921,84 @@ class SequentialBackwardSelector(BaseEstimator, TransformerMixin):
         X_train, X_test, y_train, y_test = train_test_split(
             X, y, test_size=self.test_size, random_state=self.random_state)
 
+        self._data = (X_train, X_test, y_train, y_test)
+        self.subset_scores_ = {}
         self.indices_ = tuple(range(X_train.shape[1]))
         self.subsets_ = [self.indices_]
-        self.scores_ = [self._compute_score(X_train, X_test, y_train, y_test, self.indices_)]
+        self.scores_ = self._score_subsets([self.indices_])
+        # Best subset per size, to accept the floating inclusions and 
+        # detect plateaus.
+        best = {len(self.indices_): (self.scores_[0], self.indices_)}
+        n_stale, best_score = 0, self.scores_[0]
 
         while len(self.indices_) > self.k_features:
-            scores, subsets = [], []
-            for subset in itertools.combinations(self.indices_, r=len(self.indices_)-1):
-                score = self._compute_score(X_train, X_test, y_train, y_test, subset)
-                scores.append(score)
-                subsets.append(subset)
-
+            subsets = list(itertools.combinations(
+                self.indices_, r=len(self.indices_) - 1))
+            scores = self._score_subsets(subsets)
             best_score_index = np.argmax(scores)
-            self.indices_ = subsets[best_score_index]
-            self.subsets_.append(self.indices_)
-            self.scores_.append(scores[best_score_index])
+            self._add_step(subsets[best_score_index], scores[best_score_index], 
+                           best)
+
+            while self.floating:
+                # Conditional inclusion of an excluded feature
+                excluded = sorted(set(range(X_train.shape[1])) - set(self.indices_))
+                size = len(self.indices_) + 1
+                if not excluded or size not in best: 
+                    break
+                subsets = [tuple(sorted(self.indices_ + (feature,)))
+                           for feature in excluded]
+                scores = self._score_subsets(subsets)
+                best_score_index = np.argmax(scores)
+                if scores[best_score_index] <= best[size][0]:
+                    break
+                self._add_step(subsets[best_score_index], 
+                               scores[best_score_index], best)
+
+            if self.scores_[-1] > best_score: 
+                n_stale, best_score = 0, self.scores_[-1]
+            else: 
+                n_stale += 1 
+            if self.early_stop_k is not None and n_stale >= self.early_stop_k:
+                # The score plateaus: keep the best, smallest subset seen.
+                self.indices_ = max(
+                    best.values(), key=lambda item: (item[0], -len(item[1])))[1]
+                self.scores_.append(self.subset_scores_[self.indices_])
+                self.subsets_.append(self.indices_)
+                break
+        else: 
+            if best[len(self.indices_)][1] != self.indices_: 
+                # The floating search met a better subset of this size 
+                # on another path.
+                self._add_step(*best[len(self.indices_)][::-1], best)
 
         self.k_score_ = self.scores_[-1]
+        del self._data
         
         return self
 
+    def _add_step(self, subset, score, best): 
+        """Move to `subset` and record it as a step of the selection."""
+        self.indices_ = subset
+        self.subsets_.append(subset)
+        self.scores_.append(score)
+        if score > best.get(len(subset), (-np.inf,))[0]: 
+            best[len(subset)] = (score, subset)
+
+    def _score_subsets(self, subsets): 
+        """
+        Return the scores of the feature `subsets`, fitting in parallel 
+        those not memoized in `subset_scores_` yet.
+        """
+        pending = [subset for subset in dict.fromkeys(subsets) 
+                   if subset not in self.subset_scores_]
+        if pending: 
+            scores = Parallel(n_jobs=self.n_jobs)(
+                delayed(_fit_score_subset)(
+                    clone(self.estimator), *self._data, subset, self.scoring)
+                for subset in pending)
+            self.subset_scores_.update(zip(pending, scores))
+        return [self.subset_scores_[subset] for subset in subsets]
+
     def transform(self, X):
         """
         Transform the dataset to contain only the selected features.
@@ -739,9 +1060,8 @@ class SequentialBackwardSelector(BaseEstimator, TransformerMixin):
         score : float
             The score of the estimator on the provided feature subset.
         """
-        self.estimator.fit(X_train[:, indices], y_train)
-        y_pred = self.estimator.predict(X_test[:, indices])
-        return self.scoring(y_test, y_pred)
+        return _fit_score_subset(self.estimator, X_train, X_test, y_train, 
+                                 y_test, indices, self.scoring)
 
     def _validate_params(self, X):
         """
@@ -798,6 +1118,14 @@ class SequentialBackwardSelector(BaseEstimator, TransformerMixin):
         params_str = ", ".join(f"{key}={value!r}" for key, value in params.items())
         return f"{class_name}({params_str})"
 
+def _fit_score_subset(estimator, X_train, X_test, y_train, y_test, indices, 
+                      scoring):
+    """Fit `estimator` on the feature subset `indices` and score it."""
+    indices = list(indices)
+    estimator.fit(X_train[:, indices], y_train)
+    return scoring(y_test, estimator.predict(X_test[:, indices]))
+
+
 class KMeansFeaturizer(BaseEstimator, TransformerMixin):
     """Transforms numeric data into k-means cluster memberships.
      
@@ -895,10 +1223,34 @@ class KMeansFeaturizer(BaseEstimator, TransformerMixin):
         - 'label': Label encoding of the cluster assignments.
         - 'frequency': Frequency encoding of the cluster assignments.
         - 'mean_target': Mean target encoding based on target values provided during fit.
+
+    batch_size : int, optional
+        Size of the mini-batches of the streaming mode. If set, `fit` uses 
+        :class:`~sklearn.cluster.MiniBatchKMeans` and, with `n_components`, 
+        :class:`~sklearn.decomposition.IncrementalPCA`, whose memory does not 
+        grow with the number of samples. :meth:`partial_fit` always runs in 
+        streaming mode, with the default mini-batch size of 
+        `MiniBatchKMeans` if `batch_size` is None.
     
     Attributes 
     -----------
-    km_model: KMeans featurization model used to transform
+    km_model_: KMeans or MiniBatchKMeans
+        KMeans featurization model used to transform.
+
+    pca_: PCA or IncrementalPCA
+        The projection applied before clustering when `n_components` is set.
+
+    cluster_centers_: ndarray of shape (n_clusters, n_features)
+        The cluster centers, in the projected space with `n_components`.
+
+    cluster_counts_: ndarray of shape (n_clusters,)
+        Number of training samples of each cluster, used by the 
+        'bin-counting' and 'frequency' encodings.
+
+    cluster_target_means_: ndarray of shape (n_clusters,)
+        Mean training target of each cluster, used by the 'mean_target' 
+        encoding. Only set when fitted with a numeric target; empty clusters 
+        take the overall mean.
 
     Examples 
     --------
@@ -950,7 +1302,8 @@ class KMeansFeaturizer(BaseEstimator, TransformerMixin):
         verbose=0, 
         algorithm='lloyd', 
         to_sparse=False,
-        encoding='onehot' 
+        encoding='onehot', 
+        batch_size=None, 
         ):
         self.n_clusters = n_clusters
         self.target_scale = target_scale
@@ -965,6 +1318,7 @@ class KMeansFeaturizer(BaseEstimator, TransformerMixin):
         self.algorithm = algorithm
         self.to_sparse = to_sparse
         self.encoding = encoding
+        self.batch_size = batch_size
 
     def fit(self, X, y=None):
         """
@@ -997,7 +1351,13 @@ class KMeansFeaturizer(BaseEstimator, TransformerMixin):
         clusters that are more informative with respect to the target variable.
     
         The KMeans algorithm is applied to the data, and the cluster centers are
-        adjusted if `y` is provided during fitting [2]_.
+        adjusted if `y` is provided during fitting [2]_. The cluster sizes 
+        and target means used by the encodings are computed once here, so 
+        that `transform` only gathers them.
+
+        With `batch_size`, the clustering runs on mini-batches, and the 
+        target-hinted centers are the mini-batch centers without their 
+        target coordinate.
     
         The mathematical formulation of the KMeans algorithm is as follows:
     
@@ -1038,23 +1398,159 @@ class KMeansFeaturizer(BaseEstimator, TransformerMixin):
         if y is not None:
             # Validate target array y
             y= np.asarray (y).ravel() # for consistency
-            X, y  = check_X_y(X, y, estimator =self )
+            X, y  = check_X_y(X, y, accept_sparse=True, estimator =self )
+        self._reset()
+        self._hinted = y is not None
 
         # Apply PCA if n_components is specified
         if self.n_components is not None:
-            pca = PCA(n_components=self.n_components)
-            X = pca.fit_transform(X)
+            self.pca_ = self._make_pca()
+            X_reduced = self.pca_.fit_transform(X)
+        else: 
+            X_reduced = X 
 
         # Scale target and concatenate with X if y is provided
         if y is not None:
-            self.y_ = np.asarray(y).copy()
             y_scaled = y[:, np.newaxis] * self.target_scale
-            data_for_clustering = np.hstack((X, y_scaled))
+            data_for_clustering = ( 
+                sparse.hstack((X_reduced, y_scaled), format='csr') 
+                if sparse.issparse(X_reduced) 
+                else np.hstack((X_reduced, y_scaled))
+                )
         else:
-            data_for_clustering = X
+            data_for_clustering = X_reduced
 
         # Fit the KMeans model on the data
-        self.km_model_ = KMeans(
+        self.km_model_ = self._make_kmeans().fit(data_for_clustering)
+
+        if y is not None and self.batch_size is not None: 
+            # Drop the target coordinate of the hinted centers
+            self.cluster_centers_ = self.km_model_.cluster_centers_[:, :-1]
+        else: 
+            # Adjust centroids if y was used during fit
+            if y is not None:
+                self.km_model_ = KMeans(
+                    n_clusters=self.n_clusters,
+                    init=self.km_model_.cluster_centers_[:, :-1],
+                    n_init=1,
+                    max_iter=1
+                )
+                self.km_model_.fit(X_reduced)
+            # Store cluster centers
+            self.cluster_centers_ = self.km_model_.cluster_centers_
+            
+        self._update_cluster_stats(self._assign(X_reduced), y)
+        return self
+
+    def partial_fit(self, X, y=None):
+        """
+        Update the KMeansFeaturizer with a mini-batch of samples.
+
+        The streaming counterpart of :meth:`fit`, for data that does not fit
+        in memory: each call updates the `IncrementalPCA` projection (with 
+        `n_components`), the `MiniBatchKMeans` centers, and the cluster sizes
+        and target sums used by the encodings.
+
+        Parameters
+        ----------
+        X : array-like or sparse matrix of shape (n_samples, n_features)
+            A mini-batch of training instances. The first one must hold at 
+            least `n_clusters` samples, and `n_components` with PCA.
+        y : array-like of shape (n_samples,), default=None
+            Target values of the batch. Either every batch or none has one.
+
+        Returns
+        -------
+        self : object
+            Returns the instance itself.
+
+        Notes
+        -----
+        The cluster statistics of a batch are computed with the centers 
+        right after its update, so they slightly lag the final centers; 
+        refit with :meth:`fit` when exact statistics matter.
+
+        Examples
+        --------
+        >>> from gofast.transformers.feature_engineering import KMeansFeaturizer
+        >>> from sklearn.datasets import make_blobs
+        >>> X, y = make_blobs(n_samples=10000, centers=3, random_state=42)
+        >>> featurizer = KMeansFeaturizer(n_clusters=3, batch_size=1000)
+        >>> for start in range(0, len(X), 1000):
+        ...     featurizer.partial_fit(X[start:start + 1000], 
+        ...                            y[start:start + 1000])
+        >>> X_transformed = featurizer.transform(X)
+        """
+        X = check_array(X, accept_sparse=True)
+        if y is not None:
+            y= np.asarray (y).ravel()
+            X, y  = check_X_y(X, y, accept_sparse=True, estimator =self )
+        # A full-batch fit is not updated but restarted in streaming mode.
+        first_call = not isinstance(
+            getattr(self, 'km_model_', None), MiniBatchKMeans)
+        if first_call: 
+            self._reset()
+            self._hinted = y is not None
+            if self.n_components is not None:
+                self.pca_ = self._make_pca(incremental=True) 
+            self.km_model_ = self._make_kmeans(streaming=True)
+        elif self._hinted != (y is not None): 
+            raise ValueError(
+                "The target must be given to every call of partial_fit or"
+                " to none of them.")
+
+        X_reduced = X 
+        if self.pca_ is not None:
+            X_reduced = self.pca_.partial_fit(X).transform(X)
+        if y is not None:
+            y_scaled = y[:, np.newaxis] * self.target_scale
+            data_for_clustering = ( 
+                sparse.hstack((X_reduced, y_scaled), format='csr') 
+                if sparse.issparse(X_reduced) 
+                else np.hstack((X_reduced, y_scaled))
+                )
+        else:
+            data_for_clustering = X_reduced
+        self.km_model_.partial_fit(data_for_clustering)
+        self.cluster_centers_ = ( 
+            self.km_model_.cluster_centers_[:, :-1] if self._hinted 
+            else self.km_model_.cluster_centers_
+            )
+        self._update_cluster_stats(
+            self._assign(X_reduced), y, reset=False)
+        return self
+
+    def _reset(self): 
+        """Forget the fitted models and cluster statistics."""
+        self.pca_ = None
+        self.cluster_counts_ = np.zeros(self.n_clusters, dtype=np.int64)
+        self._target_sums = None
+        for attr in ('km_model_', 'cluster_target_means_'): 
+            self.__dict__.pop(attr, None)
+
+    def _make_pca(self, incremental=False): 
+        """Return the unfitted projection of the (streaming) mode."""
+        if incremental or self.batch_size is not None: 
+            return IncrementalPCA(
+                n_components=self.n_components, batch_size=self.batch_size)
+        return PCA(n_components=self.n_components)
+
+    def _make_kmeans(self, streaming=False): 
+        """Return the unfitted clustering model of the (streaming) mode."""
+        if streaming or self.batch_size is not None: 
+            kws = {} if self.batch_size is None else dict(
+                batch_size=self.batch_size)
+            return MiniBatchKMeans(
+                n_clusters=self.n_clusters,
+                init=self.init,
+                n_init=self.n_init,
+                max_iter=self.max_iter,
+                tol=self.tol,
+                random_state=self.random_state, 
+                verbose=self.verbose, 
+                **kws
+            )
+        return KMeans(
             n_clusters=self.n_clusters,
             init=self.init,
             n_init=self.n_init,
@@ -1064,21 +1560,36 @@ class KMeansFeaturizer(BaseEstimator, TransformerMixin):
             tol=self.tol,
             random_state=self.random_state, 
             verbose=self.verbose, 
-        ).fit(data_for_clustering)
+        )
 
-        # Adjust centroids if y was used during fit
-        if y is not None:
-            self.km_model_ = KMeans(
-                n_clusters=self.n_clusters,
-                init=self.km_model_.cluster_centers_[:, :-1],
-                n_init=1,
-                max_iter=1
-            )
-            self.km_model_.fit(X)
-            
-        # Store cluster centers
-        self.cluster_centers_ = self.km_model_.cluster_centers_
-        return self
+    def _assign(self, X_reduced): 
+        """Return the closest cluster of each projected sample."""
+        return pairwise_distances_argmin(X_reduced, self.cluster_centers_)
+
+    def _update_cluster_stats(self, clusters, y=None, reset=True): 
+        """
+        Accumulate the cluster sizes and target sums of the samples assigned
+        to `clusters`, and update the target means.
+        """
+        if reset: 
+            self.cluster_counts_ = np.zeros(self.n_clusters, dtype=np.int64)
+            self._target_sums = None
+        self.cluster_counts_ += np.bincount(clusters, minlength=self.n_clusters)
+        if y is None: 
+            return 
+        try: 
+            y = np.asarray(y, dtype=float)
+        except (TypeError, ValueError): 
+            # Non-numeric targets have no mean.
+            return 
+        sums = np.bincount(clusters, weights=y, minlength=self.n_clusters)
+        self._target_sums = ( 
+            sums if self._target_sums is None else self._target_sums + sums)
+        counts = self.cluster_counts_
+        overall_mean = self._target_sums.sum() / max(counts.sum(), 1)
+        self.cluster_target_means_ = np.where(
+            counts > 0, self._target_sums / np.maximum(counts, 1), 
+            overall_mean)
     
     def transform(self, X):
         """
@@ -1144,68 +1655,50 @@ class KMeansFeaturizer(BaseEstimator, TransformerMixin):
         X = check_array(X, accept_sparse=True)
         
         # Predict the closest cluster for each sample
-        clusters = self.km_model_.predict(X)
-    
-        if self.encoding == 'bin-counting':
-            # Bin-counting encoding
-            n_clusters = len(set(clusters))
-            cluster_counts = np.bincount(clusters, minlength=n_clusters)
-            cluster_probabilities = cluster_counts / cluster_counts.sum()
-            clusters_bin_count = np.zeros((X.shape[0], n_clusters))
-            for idx, cluster_id in enumerate(clusters):
-                clusters_bin_count[idx, cluster_id] = cluster_probabilities[cluster_id]
-            if self.to_sparse:
-                clusters_sparse = sparse.csr_matrix(clusters_bin_count)
-                X_transformed = sparse.hstack((X, clusters_sparse), format='csr')
-            else:
-                X_transformed = np.hstack((X, clusters_bin_count))
-        elif self.encoding == 'onehot':
-            # One-hot encoding
-            n_clusters = len(set(clusters))
-            clusters_onehot = np.zeros((X.shape[0], n_clusters))
-            for idx, cluster_id in enumerate(clusters):
-                clusters_onehot[idx, cluster_id] = 1
+        X_reduced = X if self.pca_ is None else self.pca_.transform(X)
+        clusters = self._assign(X_reduced)
+        n_samples = X.shape[0]
+    
+        # The encodings gather the statistics precomputed at fit time.
+        if self.encoding in ('bin-counting', 'onehot'):
+            # One nonzero per sample: the cluster probability for 
+            # bin-counting, 1 for one-hot encoding
+            values = ( 
+                (self.cluster_counts_ / max(self.cluster_counts_.sum(), 1)
+                 )[clusters] if self.encoding == 'bin-counting' 
+                else np.ones(n_samples)
+            )
             if self.to_sparse:
-                clusters_sparse = sparse.csr_matrix(clusters_onehot)
-                X_transformed = sparse.hstack((X, clusters_sparse), format='csr')
+                encoded = sparse.csr_matrix(
+                    (values, clusters, np.arange(n_samples + 1)), 
+                    shape=(n_samples, self.n_clusters))
             else:
-                X_transformed = np.hstack((X, clusters_onehot))
+                encoded = np.zeros((n_samples, self.n_clusters))
+                encoded[np.arange(n_samples), clusters] = values
         elif self.encoding == 'frequency':
             # Frequency encoding
-            n_clusters = len(set(clusters))
-            cluster_counts = np.bincount(clusters, minlength=n_clusters)
-            cluster_frequencies = cluster_counts / len(clusters)
-            clusters_frequency = cluster_frequencies[clusters].reshape(-1, 1)
-            if self.to_sparse:
-                clusters_sparse = sparse.csr_matrix(clusters_frequency)
-                X_transformed = sparse.hstack((X, clusters_sparse), format='csr')
-            else:
-                X_transformed = np.hstack((X, clusters_frequency))
+            cluster_frequencies = ( 
+                self.cluster_counts_ / max(self.cluster_counts_.sum(), 1))
+            encoded = cluster_frequencies[clusters].reshape(-1, 1)
         elif self.encoding == 'mean_target':
             # Mean target encoding
-            if hasattr(self, 'y_'):
-                n_clusters = len(set(clusters))
-                target_means = np.zeros(n_clusters)
-                for cluster in range(n_clusters):
-                    target_means[cluster] = self.y_[clusters == cluster].mean()
-                clusters_mean_target = target_means[clusters].reshape(-1, 1)
-                if self.to_sparse:
-                    clusters_sparse = sparse.csr_matrix(clusters_mean_target)
-                    X_transformed = sparse.hstack((X, clusters_sparse), format='csr')
-                else:
-                    X_transformed = np.hstack((X, clusters_mean_target))
-            else:
+            if not hasattr(self, 'cluster_target_means_'):
                 raise ValueError(
-                    "Mean target encoding requires target values provided during fit.")
+                    "Mean target encoding requires numeric target values"
+                    " provided during fit.")
+            encoded = self.cluster_target_means_[clusters].reshape(-1, 1)
         else:
             # Label encoding
             # Default strategy: just add the cluster labels as a new feature
-            clusters_reshaped = clusters.reshape(-1, 1)
-            if self.to_sparse:
-                clusters_sparse = sparse.csr_matrix(clusters_reshaped)
-                X_transformed = sparse.hstack((X, clusters_sparse), format='csr')
-            else:
-                X_transformed = np.hstack((X, clusters_reshaped))
+            encoded = clusters.reshape(-1, 1)
+
+        if self.to_sparse:
+            X_transformed = sparse.hstack(
+                (X, sparse.csr_matrix(encoded)), format='csr')
+        elif sparse.issparse(X): 
+            X_transformed = sparse.hstack((X, encoded), format='csr')
+        else:
+            X_transformed = np.hstack((X, encoded))
     
         return X_transformed
 
@@ -3340,12 +3833,45 @@ class FeatureSelectorByModel(BaseEstimator, TransformerMixin):
     threshold : string, float, optional, default='mean'
         The threshold value to use for feature selection.
 
+    importance : {'auto', 'builtin', 'permutation'}, default='auto'
+        How the importance weights are computed. 'builtin' uses the 
+        ``coef_`` or ``feature_importances_`` of the estimator, 'permutation' 
+        the decrease of its score when each feature is shuffled, and 'auto' 
+        the built-in weights when the estimator has them and permutation 
+        importances otherwise.
+
+    n_repeats : int, default=5
+        Maximum number of shuffles of each feature for the permutation 
+        importances. A feature is no longer shuffled once the confidence 
+        interval of its importance is separated from those of the other 
+        features.
+
+    max_samples : int or float, default=None
+        Number (int) or fraction (float) of the samples drawn to compute 
+        the permutation importances. None uses all samples.
+
+    n_jobs : int, default=None
+        Number of workers shuffling features in parallel.
+
+    random_state : int, RandomState instance or None, default=None
+        Seed of the shuffles and of the subsample.
+
+    Attributes
+    ----------
+    permutation_importances_ : Bunch or None
+        The permutation importances, see 
+        :class:`FeatureImportanceSelector`; None when the built-in 
+        weights are used.
+
     Examples
     --------
     >>> from sklearn.datasets import make_classification
     >>> X, y = make_classification()
     >>> selector = FeatureSelectorByModel()
     >>> X_reduced = selector.fit_transform(X, y)
+    >>> from sklearn.neighbors import KNeighborsClassifier
+    >>> selector = FeatureSelectorByModel(KNeighborsClassifier(), n_jobs=2)
+    >>> X_reduced = selector.fit_transform(X, y)
 
     Methods
     -------
@@ -3357,7 +3883,9 @@ class FeatureSelectorByModel(BaseEstimator, TransformerMixin):
         importance weights.
 
     """
-    def __init__(self, estimator=None, threshold='mean'):
+    def __init__(self, estimator=None, threshold='mean', importance='auto', 
+                 n_repeats=5, max_samples=None, n_jobs=None, 
+                 random_state=None):
         """
         Initialize the FeatureSelectorByModel.
 
@@ -3372,6 +3900,11 @@ class FeatureSelectorByModel(BaseEstimator, TransformerMixin):
         """
         self.estimator =estimator 
         self.threshold = threshold 
+        self.importance = importance 
+        self.n_repeats = n_repeats 
+        self.max_samples = max_samples 
+        self.n_jobs = n_jobs 
+        self.random_state = random_state 
         
     def fit(self, X, y):
         """
@@ -3394,10 +3927,32 @@ class FeatureSelectorByModel(BaseEstimator, TransformerMixin):
         """
         if self.estimator is None:
             self.estimator = RandomForestClassifier()
+        self.permutation_importances_ = None
+        if self.importance == 'builtin':
+            self.selector = SelectFromModel(
+                self.estimator, threshold=self.threshold)
+            self.selector.fit(X, y)
+            return self
+        if self.importance not in ('auto', 'permutation'):
+            raise ValueError(
+                "importance must be 'auto', 'builtin' or 'permutation',"
+                f" got {self.importance!r}.")
+
+        estimator = clone(self.estimator).fit(X, y)
+        importance_getter = 'auto'
+        if self.importance == 'permutation' or not (
+                hasattr(estimator, 'coef_') 
+                or hasattr(estimator, 'feature_importances_')):
+            self.permutation_importances_ = _permutation_importances(
+                estimator, X, y, n_repeats=self.n_repeats, 
+                max_samples=self.max_samples, n_jobs=self.n_jobs, 
+                random_state=self.random_state)
+            importance_getter = partial(
+                _get_permutation_importances, 
+                self.permutation_importances_.importances_mean)
         self.selector = SelectFromModel(
-            self.estimator, threshold=self.threshold)
-        
-        self.selector.fit(X, y)
+            estimator, threshold=self.threshold, prefit=True, 
+            importance_getter=importance_getter)
         return self
     
     def transform(self, X, y=None):
@@ -24,6 +24,7 @@ from gofast.transformers.feature_engineering import (
     DataFrameSelector,
     FrameUnion,
     FeatureSelectorByModel,
+    FeatureImportanceSelector,
     DimensionalityReducer,
     PolynomialFeatureCombiner,
     BaseCategoricalEncoder,
@@ -36,6 +37,7 @@ from gofast.transformers.feature_engineering import (
     SequentialBackwardSelector,
     KMeansFeaturizer, 
     CategoryFrequencyEncoder,
+    _permutation_importances,
     ) 
 from gofast.transformers.text import  ( 
     TextFeatureExtractor, 
@@ -368,6 +370,25 @@ def test_sequential_backward_selection():
     # Ensure that the transformed data has the expected shape
     assert X_selected.shape == (df.shape[0], 3)
 
+def test_sequential_backward_selector_strategies():
+    X, y = make_classification(n_samples=200, n_features=8, n_informative=3,
+                               random_state=0)
+    knn = KNeighborsClassifier(n_neighbors=5)
+    serial = SequentialBackwardSelector(knn, k_features=2).fit(X, y)
+    parallel = SequentialBackwardSelector(knn, k_features=2, n_jobs=2).fit(X, y)
+    assert parallel.indices_ == serial.indices_
+    assert parallel.scores_ == serial.scores_
+    # Every subset is fit once: the full set, then 8 + 7 + ... + 3 subsets.
+    assert len(serial.subset_scores_) == 1 + sum(range(3, 9))
+    floating = SequentialBackwardSelector(knn, k_features=2, floating=True
+                                          ).fit(X, y)
+    assert len(floating.indices_) == 2
+    early = SequentialBackwardSelector(knn, k_features=1, early_stop_k=1
+                                       ).fit(X, y)
+    assert early.k_score_ == max(early.scores_)
+    assert len(early.subset_scores_) < len(
+        SequentialBackwardSelector(knn, k_features=1).fit(X, y).subset_scores_)
+
 # Test KMeansFeaturizer
 def test_kmeans_featurizer():
     # Generate a sample dataset for testing
@@ -384,6 +405,49 @@ def test_kmeans_featurizer():
     # Ensure that the transformed data has the expected shape
     assert X_kmeans.shape == (df.shape[0], n_features +1 )
 
+@pytest.mark.parametrize("encoding", ['onehot', 'bin-counting', 'frequency', 
+                                      'mean_target', 'label'])
+def test_kmeans_featurizer_encodings(encoding):
+    X, y = make_classification(n_samples=200, n_features=5, random_state=42)
+    featurizer = KMeansFeaturizer(n_clusters=4, n_components=3, random_state=0, 
+                                  encoding=encoding).fit(X, y)
+    dense = featurizer.transform(X)
+    featurizer.set_params(to_sparse=True)
+    np.testing.assert_allclose(featurizer.transform(X).toarray(), dense)
+    # The encodings use the statistics of the training clusters, whatever
+    # the samples transformed with them.
+    np.testing.assert_allclose(featurizer.transform(X[:7]).toarray(), dense[:7])
+    clusters = featurizer._assign(featurizer.pca_.transform(X))
+    assert featurizer.cluster_counts_.sum() == len(X)
+    np.testing.assert_allclose(featurizer.cluster_target_means_[clusters[0]],
+                               y[clusters == clusters[0]].mean())
+
+def test_kmeans_featurizer_partial_fit():
+    X, y = make_classification(n_samples=1000, n_features=5, random_state=42)
+    featurizer = KMeansFeaturizer(n_clusters=3, n_components=2, random_state=0,
+                                  batch_size=100, encoding='mean_target')
+    for start in range(0, len(X), 100):
+        featurizer.partial_fit(X[start:start + 100], y[start:start + 100])
+    assert featurizer.cluster_counts_.sum() == len(X)
+    assert featurizer.transform(X).shape == (len(X), 6)
+    with pytest.raises(ValueError):
+        featurizer.partial_fit(X[:100])
+
+def test_kmeans_featurizer_partial_fit_sparse():
+    from scipy import sparse
+    X, y = make_classification(n_samples=600, n_features=5, random_state=42)
+    X_sparse = sparse.csr_matrix(np.where(np.abs(X) < 0.5, 0., X))
+    featurizer = KMeansFeaturizer(n_clusters=3, random_state=0, 
+                                  batch_size=100, encoding='mean_target')
+    for start in range(0, X_sparse.shape[0], 100):
+        featurizer.partial_fit(X_sparse[start:start + 100], 
+                               y[start:start + 100])
+    assert featurizer.cluster_centers_.shape == (3, 5)
+    assert featurizer.cluster_counts_.sum() == X_sparse.shape[0]
+    # As does a full-batch fit
+    featurizer = KMeansFeaturizer(n_clusters=3, random_state=0).fit(X_sparse, y)
+    assert featurizer.cluster_centers_.shape == (3, 5)
+
 # Test StratifiedWithCategoryAdder
 def test_stratified_with_category_adder():
     # Generate a sample dataset for testing
@@ -558,6 +622,30 @@ def test_feature_selector_by_model():
     # Check the shape of the selected features
     assert X_selected.shape[1] <=5  # main two features selection applied
 
+def test_permutation_importances():
+    X, y = make_classification(n_samples=200, n_features=6, n_informative=3,
+                               n_redundant=0, shuffle=False, random_state=0)
+    knn = KNeighborsClassifier().fit(X, y)
+    serial = _permutation_importances(knn, X, y, confidence=None,
+                                      random_state=0)
+    parallel = _permutation_importances(knn, pd.DataFrame(X), y,
+                                        confidence=None, n_jobs=2,
+                                        random_state=0)
+    np.testing.assert_allclose(serial.importances, parallel.importances)
+    assert set(np.argsort(serial.importances_mean)[-3:]) == {0, 1, 2}
+    # The informative features are settled before the last shuffles
+    early = _permutation_importances(knn, X, y, n_repeats=10, threshold=0.05,
+                                     max_samples=0.5, random_state=0)
+    assert early.n_repeats.min() < 10
+    assert np.isnan(early.importances).any()
+
+    selector = FeatureSelectorByModel(KNeighborsClassifier(), random_state=0)
+    assert selector.fit_transform(X, y).shape[1] < 6
+    assert selector.permutation_importances_ is not None
+    selector = FeatureImportanceSelector(KNeighborsClassifier(), threshold=0.05,
+                                         random_state=0).fit(X, y)
+    np.testing.assert_array_equal(selector.important_indices_, [0, 1, 2])
+
 def test_categorical_encoder2():
     # Create a sample dataset
     X = [['Category A'], ['Category B'], ['Category C']]
@@ -174,7 +174,7 @@ setup_kwargs = {
         "pandas<2.0.3",
         "pyyaml>=5.0.0",
         "tqdm>=4.64.1",
-        "joblib>=1.2.0",
+        "joblib>=1.3.0",
         "threadpoolctl>=3.1.0",
         "matplotlib>=3.5.3",
         "statsmodels>=0.13.1",